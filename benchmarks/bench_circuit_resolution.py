@@ -0,0 +1,43 @@
+# Copyright 2021 The Cirq Developers
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from typing import List
+
+import sympy
+
+import cirq
+
+
+class ResolveCircuit:
+    """Benchmark resolving a large circuit with a few parameterized gates."""
+
+    params = [1000, 5000]
+    param_names = ["num_operations"]
+
+    def setup(self, num_operations: int):
+        qubits = cirq.LineQubit.range(10)
+        symbols = [sympy.Symbol(f't{i}') for i in range(40)]
+        operations: List[cirq.Operation] = []
+        for i in range(num_operations):
+            q = qubits[i % len(qubits)]
+            if i % (num_operations // len(symbols)) == 0:
+                operations.append(cirq.X(q) ** symbols[len(operations) % len(symbols)])
+            else:
+                operations.append(cirq.H(q))
+        self.circuit = cirq.Circuit(operations)
+        self.sweep = cirq.Zip(*[cirq.Linspace(str(s), 0, 1, 20) for s in symbols])
+
+    def time_resolve_sweep(self, num_operations: int):
+        for resolver in self.sweep:
+            cirq.resolve_parameters(self.circuit, resolver)
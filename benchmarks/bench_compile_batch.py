@@ -0,0 +1,78 @@
+# Copyright 2021 The Cirq Developers
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import pickle
+
+import cirq
+
+
+class CompileBatch:
+    """Benchmark compiling a batch of circuits, and the parts of one circuit."""
+
+    params = [[1, 2, 4]]
+    param_names = ["max_workers"]
+    timeout = 600
+
+    def setup(self, max_workers: int):
+        self.circuits = [
+            cirq.testing.random_circuit(
+                qubits=cirq.LineQubit.range(8),
+                n_moments=40,
+                op_density=0.8,
+                random_state=seed,
+            )
+            for seed in range(16)
+        ]
+        # Four independent blocks of qubits in one circuit.
+        self.blocks = cirq.Circuit.zip(
+            *[
+                cirq.testing.random_circuit(
+                    qubits=cirq.LineQubit.range(8 * i, 8 * (i + 1)),
+                    n_moments=40,
+                    op_density=0.8,
+                    random_state=i,
+                )
+                for i in range(4)
+            ]
+        )
+        self.optimizer = cirq.MergeInteractions()
+
+    def time_compile_batch(self, max_workers: int):
+        cirq.compile_batch(self.circuits, self.optimizer, max_workers=max_workers)
+
+    def time_compile_components(self, max_workers: int):
+        cirq.compile_batch(
+            [self.blocks], self.optimizer, max_workers=max_workers, split_components=True
+        )
+
+
+class PickleFrozenCircuit:
+    """Benchmark pickling frozen circuits as sent to worker processes."""
+
+    def setup(self):
+        self.circuit = cirq.testing.random_circuit(
+            qubits=cirq.LineQubit.range(20), n_moments=100, op_density=0.8, random_state=0
+        ).freeze()
+        self.pickled = pickle.dumps(self.circuit)
+
+    def time_dumps(self):
+        pickle.dumps(self.circuit)
+
+    def time_loads(self):
+        pickle.loads(self.pickled)
+
+    def track_pickled_bytes(self):
+        return len(self.pickled)
+
+    track_pickled_bytes.unit = "bytes"  # type: ignore
@@ -0,0 +1,72 @@
+# Copyright 2021 The Cirq Developers
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import numpy as np
+
+import cirq
+
+
+def _layered_circuit(num_qubits: int, num_operations: int) -> cirq.Circuit:
+    """A circuit of alternating single-qubit layers and CZ layers."""
+    qubits = cirq.LineQubit.range(num_qubits)
+    single_qubit_ops = [
+        [
+            cirq.Z(q) ** 0.25,
+            cirq.X(q) ** 0.5,
+            cirq.PhasedXPowGate(phase_exponent=0.3).on(q),
+            cirq.Y(q),
+        ]
+        for q in qubits
+    ]
+    cz_layers = [
+        [cirq.CZ(qubits[i], qubits[i + 1]) for i in range(start, num_qubits - 1, 2)]
+        for start in (0, 1)
+    ]
+    prng = np.random.RandomState(0)
+    moments = []
+    count = 0
+    while count < num_operations:
+        choices = prng.randint(len(single_qubit_ops[0]), size=num_qubits)
+        moments.append(cirq.Moment(ops[c] for ops, c in zip(single_qubit_ops, choices)))
+        moments.append(cirq.Moment(cz_layers[len(moments) // 2 % 2]))
+        count += len(moments[-2]) + len(moments[-1])
+    return cirq.Circuit(moments)
+
+
+class EjectZ:
+    """Benchmark ejecting Z gates from circuits of up to a million operations."""
+
+    params = [10 ** 4, 10 ** 5, 10 ** 6]
+    param_names = ["num_operations"]
+    timeout = 600
+
+    def setup(self, num_operations: int):
+        self.circuit = _layered_circuit(100, num_operations)
+
+    def time_eject_z(self, num_operations: int):
+        cirq.EjectZ().optimize_circuit(self.circuit.copy())
+
+
+class EjectPhasedPaulis:
+    """Benchmark ejecting Pauli gates from circuits of up to a million operations."""
+
+    params = [10 ** 4, 10 ** 5, 10 ** 6]
+    param_names = ["num_operations"]
+    timeout = 600
+
+    def setup(self, num_operations: int):
+        self.circuit = _layered_circuit(100, num_operations)
+
+    def time_eject_phased_paulis(self, num_operations: int):
+        cirq.EjectPhasedPaulis().optimize_circuit(self.circuit.copy())
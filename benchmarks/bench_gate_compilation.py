@@ -0,0 +1,45 @@
+# Copyright 2021 The Cirq Developers
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import numpy as np
+
+import cirq
+from cirq.google.optimizers.two_qubit_gates.gate_compilation import gate_product_tabulation
+
+
+class CompileTwoQubitGates:
+    """Benchmark compiling unitaries with a gate product tabulation."""
+
+    params = [[0.01, 0.001], [10, 1000]]
+    param_names = ["max_infidelity", "num_unitaries"]
+    timeout = 600
+
+    def setup(self, max_infidelity: float, num_unitaries: int):
+        self.tabulation = gate_product_tabulation(
+            cirq.unitary(cirq.FSimGate(np.pi / 2, np.pi / 6)),
+            max_infidelity,
+            random_state=np.random.RandomState(0),
+        )
+        self.unitaries = np.array(
+            [cirq.testing.random_special_unitary(4, random_state=i) for i in range(num_unitaries)]
+        )
+        # Build the nearest neighbor index outside of the timed code.
+        self.tabulation.compile_two_qubit_gate(self.unitaries[0])
+
+    def time_compile_two_qubit_gate(self, max_infidelity: float, num_unitaries: int):
+        for unitary in self.unitaries:
+            self.tabulation.compile_two_qubit_gate(unitary)
+
+    def time_compile_two_qubit_gates(self, max_infidelity: float, num_unitaries: int):
+        self.tabulation.compile_two_qubit_gates(self.unitaries)
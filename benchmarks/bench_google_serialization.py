@@ -0,0 +1,86 @@
+# Copyright 2021 The Cirq Developers
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from typing import List, cast
+
+import numpy as np
+
+import cirq
+import cirq.google as cg
+from cirq.google.api import v2
+
+
+def _sycamore_circuit(depth: int) -> cirq.Circuit:
+    return cirq.experiments.random_rotations_between_grid_interaction_layers_circuit(
+        qubits=cast(List[cirq.GridQubit], sorted(cg.Sycamore.qubits)),
+        depth=depth,
+        two_qubit_op_factory=lambda a, b, _: cg.SYC(a, b),
+        seed=1234,
+    )
+
+
+class SerializeSycamoreCircuit:
+    """Benchmark serialization of random Sycamore-sized circuits to v2 protos."""
+
+    params = [10, 100, 1000]
+    param_names = ["depth"]
+
+    def setup(self, depth: int):
+        self.circuit = _sycamore_circuit(depth)
+
+    def time_serialize(self, depth: int):
+        cg.SYC_GATESET.serialize(self.circuit)
+
+
+class DeserializeSycamoreCircuit:
+    """Benchmark deserialization of random Sycamore-sized v2 programs."""
+
+    params = [10, 100, 1000]
+    param_names = ["depth"]
+
+    def setup(self, depth: int):
+        self.proto = cg.SYC_GATESET.serialize(_sycamore_circuit(depth))
+
+    def time_deserialize(self, depth: int):
+        cg.SYC_GATESET.deserialize(self.proto)
+
+
+class DecodeResults:
+    """Benchmark decoding of v2 result protos for a 20 qubit measurement."""
+
+    params = [[100, 10_000], [1, 50]]
+    param_names = ["repetitions", "num_points"]
+
+    def setup(self, repetitions: int, num_points: int):
+        qubits = cirq.GridQubit.rect(4, 5)
+        self.measurements = [
+            v2.MeasureInfo('m', qubits, slot=0, invert_mask=[False] * len(qubits), tags=[])
+        ]
+        prng = np.random.RandomState(1234)
+        trial_results = [
+            [
+                cirq.Result.from_single_parameter_set(
+                    params=cirq.ParamResolver({'i': i}),
+                    measurements={'m': prng.randint(2, size=(repetitions, len(qubits))) == 1},
+                )
+                for i in range(num_points)
+            ]
+        ]
+        self.proto = v2.results_to_proto(trial_results, self.measurements)
+
+    def time_results_from_proto(self, repetitions: int, num_points: int):
+        v2.results_from_proto(self.proto, self.measurements)
+
+    def time_packed_results_from_proto(self, repetitions: int, num_points: int):
+        v2.packed_results_from_proto(self.proto, self.measurements)
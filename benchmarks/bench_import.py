@@ -0,0 +1,23 @@
+# Copyright 2021 The Cirq Developers
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+def timeraw_import_cirq():
+    """Benchmark `import cirq` in a fresh interpreter."""
+    return "import cirq"
+
+
+def timeraw_import_cirq_google():
+    """Benchmark importing the lazily loaded cirq.google in a fresh interpreter."""
+    return "import cirq.google"
@@ -0,0 +1,80 @@
+# Copyright 2021 The Cirq Developers
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import io
+
+import numpy as np
+
+import cirq
+
+
+class ArrayJson:
+    """Benchmark JSON round trips of a large numpy array."""
+
+    params = [False, True]
+    param_names = ["compact_arrays"]
+
+    def setup(self, compact_arrays: bool):
+        self.array = np.random.RandomState(1234).rand(500, 500)
+        self.text = cirq.to_json(self.array, compact_arrays=compact_arrays)
+
+    def time_to_json(self, compact_arrays: bool):
+        cirq.to_json(self.array, compact_arrays=compact_arrays)
+
+    def time_read_json(self, compact_arrays: bool):
+        cirq.read_json(json_text=self.text)
+
+
+class CircuitJsonStream:
+    """Benchmark streaming a list of random circuits through JSON."""
+
+    params = [10, 100]
+    param_names = ["num_circuits"]
+
+    def setup(self, num_circuits: int):
+        qubits = cirq.LineQubit.range(10)
+        self.circuits = [
+            cirq.testing.random_circuit(qubits, n_moments=20, op_density=0.8, random_state=i)
+            for i in range(num_circuits)
+        ]
+        buffer = io.StringIO()
+        cirq.to_json_stream(self.circuits, buffer)
+        self.text = buffer.getvalue()
+
+    def time_to_json_stream(self, num_circuits: int):
+        cirq.to_json_stream(self.circuits, io.StringIO())
+
+    def time_read_json_stream(self, num_circuits: int):
+        for _ in cirq.read_json_stream(io.StringIO(self.text)):
+            pass
+
+
+class CircuitReadJson:
+    """Benchmark reading large random circuits on 100 qubits from JSON."""
+
+    params = [10_000, 100_000]
+    param_names = ["num_operations"]
+    timeout = 300
+
+    def setup(self, num_operations: int):
+        circuit = cirq.testing.random_circuit(
+            cirq.GridQubit.rect(10, 10),
+            n_moments=num_operations // 100,
+            op_density=1.0,
+            random_state=1234,
+        )
+        self.text = cirq.to_json(circuit)
+
+    def time_read_json(self, num_operations: int):
+        cirq.read_json(json_text=self.text)
@@ -42,3 +42,25 @@ time_kak_decomposition.params = [  # type: ignore
     + [cirq.testing.random_unitary(4) for _ in range(10)]
 ]
 time_kak_decomposition.param_names = ["gate"]  # type: ignore
+
+
+class KakDecompositionBatch:
+    """Benchmark decomposing many unitaries one at a time and all at once."""
+
+    params = [1000, 10000, 100000]
+    param_names = ["num_unitaries"]
+    timeout = 600
+
+    def setup(self, num_unitaries: int):
+        unitaries = [cirq.testing.random_unitary(4) for _ in range(100)]
+        self.unitaries = np.array(unitaries * (num_unitaries // len(unitaries)))
+
+    def time_kak_decomposition(self, num_unitaries: int):
+        for unitary in self.unitaries:
+            cirq.kak_decomposition(unitary)
+
+    def time_kak_decomposition_batch(self, num_unitaries: int):
+        cirq.kak_decomposition_batch(self.unitaries)
+
+    def time_kak_vector(self, num_unitaries: int):
+        cirq.kak_vector(self.unitaries)
@@ -0,0 +1,49 @@
+# Copyright 2021 The Cirq Developers
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from typing import Any, Callable, Dict
+
+import cirq
+
+
+class MergeSingleQubitGates:
+    """Benchmark merging single-qubit gates of deep random circuits."""
+
+    params = [['phxz', 'phased_x_z', 'matrix'], [100, 500]]
+    param_names = ["merge_type", "depth"]
+
+    def setup(self, merge_type: str, depth: int):
+        self.circuit = cirq.testing.random_circuit(
+            qubits=cirq.LineQubit.range(20),
+            n_moments=depth,
+            op_density=0.8,
+            gate_domain={
+                cirq.X ** 0.3: 1,
+                cirq.Y ** 0.2: 1,
+                cirq.H: 1,
+                cirq.T: 1,
+                cirq.PhasedXPowGate(phase_exponent=0.2): 1,
+                cirq.CZ: 2,
+            },
+            random_state=0,
+        )
+        merges: Dict[str, Callable[[cirq.Circuit], Any]] = {
+            'phxz': cirq.merge_single_qubit_gates_into_phxz,
+            'phased_x_z': cirq.merge_single_qubit_gates_into_phased_x_z,
+            'matrix': cirq.MergeSingleQubitGates().optimize_circuit,
+        }
+        self.merge = merges[merge_type]
+
+    def time_merge_single_qubit_gates(self, merge_type: str, depth: int):
+        self.merge(self.circuit.copy())
@@ -0,0 +1,54 @@
+# Copyright 2021 The Cirq Developers
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from typing import Dict
+
+import cirq
+import cirq.google as cg
+
+
+class OptimizedForSycamore:
+    """Benchmark compiling random circuits on grids of 50 to 100 qubits."""
+
+    params = [['sqrt_iswap', 'sycamore', 'xmon'], [(5, 10), (10, 10)]]
+    param_names = ["optimizer_type", "grid_shape"]
+    timeout = 600
+
+    def setup(self, optimizer_type: str, grid_shape):
+        qubits = cirq.GridQubit.rect(*grid_shape)
+        self.circuit = cirq.testing.random_circuit(
+            qubits,
+            n_moments=20,
+            op_density=0.8,
+            gate_domain={
+                cirq.CZ: 2,
+                cirq.ISWAP ** 0.5: 2,
+                cirq.X ** 0.3: 1,
+                cirq.PhasedXPowGate(phase_exponent=0.2): 1,
+                cirq.Z ** 0.1: 1,
+                cirq.H: 1,
+            },
+            random_state=0,
+        )
+
+    def time_optimized_for_sycamore(self, optimizer_type: str, grid_shape):
+        cg.optimized_for_sycamore(self.circuit, optimizer_type=optimizer_type)
+
+    def track_operations_per_second(self, optimizer_type: str, grid_shape):
+        timings: Dict[str, float] = {}
+        cg.optimized_for_sycamore(self.circuit, optimizer_type=optimizer_type, pass_timings=timings)
+        total_seconds = sum(timings.values())
+        return len(list(self.circuit.all_operations())) / total_seconds
+
+    track_operations_per_second.unit = "operations/s"  # type: ignore
@@ -0,0 +1,56 @@
+# Copyright 2021 The Cirq Developers
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import sympy
+
+import cirq
+
+
+class MaterializeSweep:
+    """Benchmark materializing the points of a product of zipped sweeps."""
+
+    params = [10, 100]
+    param_names = ["points_per_factor"]
+
+    def setup(self, points_per_factor: int):
+        n = points_per_factor
+        self.sweep = (
+            (cirq.Linspace('a', 0, 1, n) + cirq.Points('b', list(range(n))))
+            * cirq.Linspace('c', -1, 1, n)
+            * cirq.Linspace('d', 0, 2, n)
+        )
+
+    def time_param_tuples(self, points_per_factor: int):
+        for _ in self.sweep.param_tuples():
+            pass
+
+    def time_param_array(self, points_per_factor: int):
+        self.sweep.param_array()
+
+
+class EvaluateFormula:
+    """Benchmark evaluating a formula at every point of a sweep."""
+
+    def setup(self):
+        a, b = sympy.Symbol('a'), sympy.Symbol('b')
+        self.formula = sympy.sin(sympy.pi * a) * b + a ** 2 / (b + 1)
+        self.sweep = cirq.Linspace('a', 0, 1, 100) * cirq.Linspace('b', 0, 1, 100)
+        self.resolvers = list(self.sweep)
+
+    def time_value_of(self):
+        for resolver in self.resolvers:
+            resolver.value_of(self.formula)
+
+    def time_values_of(self):
+        self.sweep.values_of(self.formula)
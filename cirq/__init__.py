@@ -12,6 +12,8 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+from typing import TYPE_CHECKING
+
 from cirq import _import
 
 # A module can only depend on modules imported earlier in this list of modules
@@ -51,11 +53,14 @@ from cirq import (
     interop,
     # Applications
     experiments,
-    google,
     # Extra (nothing should depend on these)
     testing,
 )
 
+# Vendor and contrib packages have heavy dependencies of their own, such as
+# protobuf and gRPC for `google`, and are only imported on first access.
+__getattr__ = _import.lazy_submodules('cirq', ['contrib', 'google', 'ionq', 'pasqal'])
+
 # End dependency order list of sub-modules
 
 from cirq._version import (
@@ -138,6 +143,7 @@ from cirq.linalg import (
     is_unitary,
     kak_canonicalize_vector,
     kak_decomposition,
+    kak_decomposition_batch,
     kak_vector,
     KakDecomposition,
     kron,
@@ -297,6 +303,7 @@ from cirq.ops import (
 from cirq.optimizers import (
     AlignLeft,
     AlignRight,
+    compile_batch,
     compute_cphase_exponents_for_fsim_decomposition,
     ConvertToCzAndSingleGates,
     decompose_cphase_into_two_fsim,
@@ -318,9 +325,11 @@ from cirq.optimizers import (
     single_qubit_matrix_to_pauli_rotations,
     single_qubit_matrix_to_phased_x_z,
     single_qubit_matrix_to_phxz,
+    single_qubit_matrix_to_phxz_batch,
     single_qubit_op_to_framed_phase_form,
     stratified_circuit,
     SynchronizeTerminalMeasurements,
+    TwoQubitDecompositionCache,
     two_qubit_matrix_to_operations,
     two_qubit_matrix_to_diagonal_and_operations,
     three_qubit_matrix_to_operations,
@@ -498,6 +507,7 @@ from cirq.protocols import (
     QuilFormatter,
     read_json_gzip,
     read_json,
+    read_json_stream,
     resolve_parameters,
     resolve_parameters_once,
     SupportsActOn,
@@ -527,6 +537,7 @@ from cirq.protocols import (
     SupportsUnitary,
     to_json_gzip,
     to_json,
+    to_json_stream,
     obj_to_dict_helper,
     trace_distance_bound,
     trace_distance_from_angle_list,
@@ -565,12 +576,15 @@ from cirq.work import (
 # Unflattened sub-modules.
 
 from cirq import (
-    google,
-    ionq,
-    pasqal,
     testing,
 )
 
+if TYPE_CHECKING:
+    # Type checkers do not follow module `__getattr__`, so they still need to
+    # see the lazily imported submodules.
+    from cirq import contrib, google, ionq, pasqal
+del TYPE_CHECKING
+
 
 def _register_resolver() -> None:
     """Registers the cirq module's public classes for JSON serialization."""
@@ -579,14 +593,13 @@ def _register_resolver() -> None:
 
     _internal_register_resolver(_class_resolver_dictionary)
 
+    def _google_class_resolver_dictionary():
+        # Imports cirq.google the first time a type is not found above.
+        from cirq.google.json_resolver_cache import _class_resolver_dictionary
 
-_register_resolver()
+        return _class_resolver_dictionary()
 
-# contrib's json resolver cache depends on cirq.DEFAULT_RESOLVER
+    _internal_register_resolver(_google_class_resolver_dictionary)
 
-# pylint: disable=wrong-import-position
-from cirq import (
-    contrib,
-)
 
-# pylint: enable=wrong-import-position
+_register_resolver()
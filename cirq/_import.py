@@ -12,7 +12,7 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
-from typing import Any, Callable, List, Optional
+from typing import Any, Callable, Iterable, List, Optional
 
 from contextlib import contextmanager
 import importlib
@@ -167,3 +167,33 @@ def delay_import(module_name: str):
     delay = False
     for module in execute_list:
         module.__loader__.exec_module(module)  # Calls back into wrap_func
+
+
+def lazy_submodules(package_name: str, submodules: Iterable[str]) -> Callable[[str], Any]:
+    """Returns a module `__getattr__` that imports submodules on first access.
+
+    Assign the result to `__getattr__` in a package's `__init__.py` to defer
+    importing the given submodules, and everything they depend on, until
+    `package.submodule` is first accessed. Explicit imports such as
+    `import package.submodule` work as usual.
+
+    Module `__getattr__` functions are only supported from Python 3.7 on. On
+    older versions the submodules are imported immediately instead.
+
+    Args:
+        package_name: The fully qualified name of the package, e.g. `'cirq'`.
+        submodules: The names of the submodules to defer, e.g. `['google']`.
+    """
+    lazy_names = frozenset(submodules)
+    if sys.version_info < (3, 7):
+        for name in lazy_names:  # coverage: ignore
+            importlib.import_module(f'{package_name}.{name}')
+
+    def __getattr__(name: str) -> Any:
+        if name not in lazy_names:
+            raise AttributeError(f'module {package_name!r} has no attribute {name!r}')
+        # Importing a submodule also sets it as an attribute of its package,
+        # so this is only called once per submodule.
+        return importlib.import_module(f'{package_name}.{name}')
+
+    return __getattr__
@@ -0,0 +1,74 @@
+# Copyright 2021 The Cirq Developers
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import subprocess
+import sys
+
+import pytest
+
+import cirq
+from cirq import _import
+
+
+def test_lazy_submodules():
+    module_getattr = _import.lazy_submodules('cirq', ['contrib'])
+    assert module_getattr('contrib') is sys.modules['cirq.contrib']
+    with pytest.raises(AttributeError, match="module 'cirq' has no attribute 'ops'"):
+        _ = module_getattr('ops')
+
+
+def test_lazy_cirq_submodules():
+    assert cirq.google.SYC is sys.modules['cirq.google'].SYC
+    assert cirq.contrib.quirk is sys.modules['cirq.contrib.quirk']
+    assert cirq.ionq.Service is sys.modules['cirq.ionq'].Service
+    assert cirq.pasqal.ThreeDQubit is sys.modules['cirq.pasqal'].ThreeDQubit
+    with pytest.raises(AttributeError, match="no attribute 'not_a_submodule'"):
+        _ = cirq.not_a_submodule
+
+
+# Modules that are slow to import and that `import cirq` should not import.
+DEFERRED_MODULES = [
+    'cirq.contrib',
+    'cirq.google',
+    'cirq.ionq',
+    'cirq.pasqal',
+    'google.protobuf',
+    'matplotlib',
+    'scipy.optimize',
+    'scipy.stats',
+]
+
+
+def test_import_cirq_defers_heavy_modules():
+    """Runs in a subprocess because cirq and its dependencies are already
+    imported by other tests.
+    """
+    code = (
+        'import sys\n'
+        'import cirq\n'
+        f'print(",".join(m for m in {DEFERRED_MODULES!r} if m in sys.modules))\n'
+    )
+    output = subprocess.check_output([sys.executable, '-c', code]).decode()
+    assert output.strip() == ''
+
+    # Reading JSON imports cirq.google once a type is not found in cirq.
+    code = (
+        'import sys\n'
+        'import cirq\n'
+        'assert cirq.read_json(json_text=cirq.to_json(cirq.X)) == cirq.X\n'
+        'assert "cirq.google" not in sys.modules\n'
+        'print(cirq.read_json(json_text=\'{"cirq_type": "SycamoreGate"}\'))\n'
+    )
+    output = subprocess.check_output([sys.executable, '-c', code]).decode()
+    assert output.strip() == 'SYC'
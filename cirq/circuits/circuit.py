@@ -2158,13 +2158,15 @@ class Circuit(AbstractCircuit):
     def _resolve_parameters_(
         self, param_resolver: 'cirq.ParamResolver', recursive: bool
     ) -> 'Circuit':
+        # Moments without parameterized operations are shared with the
+        # resolved circuit rather than copied.
         resolved_moments = []
         for moment in self:
-            resolved_operations = _resolve_operations(moment.operations, param_resolver, recursive)
-            new_moment = ops.Moment(resolved_operations)
-            resolved_moments.append(new_moment)
-        resolved_circuit = Circuit(resolved_moments, device=self.device)
-        return resolved_circuit
+            resolved_moment = protocols.resolve_parameters(moment, param_resolver, recursive)
+            if resolved_moment is not moment:
+                self.device.validate_moment(resolved_moment)
+            resolved_moments.append(resolved_moment)
+        return self._with_sliced_moments(resolved_moments)
 
     @property
     def moments(self):
@@ -2200,15 +2202,6 @@ def _get_op_circuit(op: ops.Operation) -> Optional['cirq.FrozenCircuit']:
     return op.circuit if isinstance(op, CircuitOperation) else None
 
 
-def _resolve_operations(
-    operations: Iterable['cirq.Operation'], param_resolver: 'cirq.ParamResolver', recursive: bool
-) -> List['cirq.Operation']:
-    resolved_operations = []  # type: List['cirq.Operation']
-    for op in operations:
-        resolved_operations.append(protocols.resolve_parameters(op, param_resolver, recursive))
-    return resolved_operations
-
-
 def _draw_moment_in_diagram(
     moment: 'cirq.Moment',
     use_unicode_characters: bool,
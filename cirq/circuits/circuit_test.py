@@ -2947,6 +2947,44 @@ def test_parameter_names(circuit_cls, resolve_fn):
     assert cirq.parameter_names(resolved_circuit) == set()
 
 
+@pytest.mark.parametrize('circuit_cls', [cirq.Circuit, cirq.FrozenCircuit])
+def test_resolve_parameters_shares_unparameterized_moments(circuit_cls):
+    a, b = cirq.LineQubit.range(2)
+    circuit = circuit_cls(
+        cirq.Moment([cirq.H(a), cirq.H(b)]),
+        cirq.Moment([cirq.X(a) ** sympy.Symbol('t'), cirq.Y(b)]),
+        cirq.Moment([cirq.CZ(a, b)]),
+    )
+    resolved = cirq.resolve_parameters(circuit, {'t': 0.5})
+    assert resolved == circuit_cls(
+        cirq.Moment([cirq.H(a), cirq.H(b)]),
+        cirq.Moment([cirq.X(a) ** 0.5, cirq.Y(b)]),
+        cirq.Moment([cirq.CZ(a, b)]),
+    )
+    assert resolved[0] is circuit[0]
+    assert resolved[1] is not circuit[1]
+    assert resolved[1].operations[1] is circuit[1].operations[1]
+    assert resolved[2] is circuit[2]
+
+
+def test_resolve_parameters_validates_resolved_moments():
+    class NoParameterizedOps(cirq.Device):
+        def validate_operation(self, operation):
+            pass
+
+        def validate_moment(self, moment):
+            assert not cirq.is_parameterized(moment)
+            validated.append(moment)
+
+    validated = []
+    a, b = cirq.LineQubit.range(2)
+    circuit = cirq.Circuit(cirq.H(a), cirq.X(b) ** sympy.Symbol('t'))
+    circuit._device = NoParameterizedOps()
+    resolved = cirq.resolve_parameters(circuit, {'t': 0.25})
+    assert resolved.device is circuit.device
+    assert validated == [resolved[0]]
+
+
 def test_items():
     a = cirq.NamedQubit('a')
     b = cirq.NamedQubit('b')
@@ -16,7 +16,9 @@ import functools
 from typing import (
     TYPE_CHECKING,
     AbstractSet,
+    Any,
     Callable,
+    Dict,
     FrozenSet,
     Iterator,
     Optional,
@@ -66,7 +68,9 @@ class FrozenCircuit(AbstractCircuit):
         base = Circuit(contents, strategy=strategy, device=device)
         self._moments = tuple(base.moments)
         self._device = base.device
+        self._clear_memoized_values()
 
+    def _clear_memoized_values(self) -> None:
         # These variables are memoized when first requested.
         self._num_qubits: Optional[int] = None
         self._unitary: Optional[Union[np.ndarray, NotImplementedType]] = None
@@ -77,6 +81,16 @@ class FrozenCircuit(AbstractCircuit):
         self._all_measurement_keys: Optional[AbstractSet[str]] = None
         self._are_all_measurements_terminal: Optional[bool] = None
 
+    def __getstate__(self) -> Dict[str, Any]:
+        # Memoized values, like the unitary, are recomputed when needed
+        # instead of being pickled.
+        return {'_moments': self._moments, '_device': self._device}
+
+    def __setstate__(self, state: Dict[str, Any]) -> None:
+        self._moments = state['_moments']
+        self._device = state['_device']
+        self._clear_memoized_values()
+
     @property
     def moments(self) -> Sequence['cirq.Moment']:
         return self._moments
@@ -16,6 +16,9 @@
 Behavior shared with Circuit is tested with parameters in circuit_test.py.
 """
 
+import pickle
+
+import numpy as np
 import pytest
 
 import cirq
@@ -56,3 +59,19 @@ def test_immutable():
 
     with pytest.raises(AttributeError, match="can't set attribute"):
         c.device = cirq.google.devices.Foxtail
+
+
+def test_pickle_drops_memoized_values():
+    q = cirq.LineQubit.range(4)
+    f = cirq.FrozenCircuit(
+        cirq.H.on_each(*q), cirq.CZ(q[0], q[1]), device=cirq.UNCONSTRAINED_DEVICE
+    )
+    size = len(pickle.dumps(f))
+    unitary = cirq.unitary(f)
+
+    restored = pickle.loads(pickle.dumps(f))
+    assert len(pickle.dumps(f)) == size
+    assert restored == f
+    assert restored.device == f.device
+    assert restored._unitary is None
+    np.testing.assert_allclose(cirq.unitary(restored), unitary)
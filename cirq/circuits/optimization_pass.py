@@ -83,14 +83,17 @@ class PointOptimizationSummary:
         )
 
 
+def _no_clean_up(op_list: Sequence['cirq.Operation']) -> ops.OP_TREE:
+    # A named function rather than a lambda, so that optimizers can be pickled.
+    return op_list
+
+
 class PointOptimizer:
     """Makes circuit improvements focused on a specific location."""
 
     def __init__(
         self,
-        post_clean_up: Callable[
-            [Sequence['cirq.Operation']], ops.OP_TREE
-        ] = lambda op_list: op_list,
+        post_clean_up: Callable[[Sequence['cirq.Operation']], ops.OP_TREE] = _no_clean_up,
     ) -> None:
         """
         Args:
@@ -18,6 +18,7 @@ https://arxiv.org/abs/2002.07730
 """
 
 import collections
+import copy
 import math
 from typing import Any, Dict, List, Iterator, Optional, Sequence, Set
 
@@ -77,6 +78,14 @@ class MPSSimulator(
         self.simulation_options = simulation_options
         self.grouping = grouping
 
+    def _random_state(self) -> np.random.RandomState:
+        return self._prng
+
+    def _reseeded(self, seed: int) -> 'MPSSimulator':
+        simulator = copy.copy(self)
+        simulator._prng = np.random.RandomState(seed)
+        return simulator
+
     def _base_iterator(
         self, circuit: circuits.Circuit, qubit_order: ops.QubitOrderOrList, initial_state: int
     ) -> Iterator['cirq.contrib.quimb.mps_simulator.MPSSimulatorStepResult']:
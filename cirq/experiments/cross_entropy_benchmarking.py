@@ -28,11 +28,12 @@ from typing import (
 )
 import dataclasses
 import numpy as np
-import scipy
-from matplotlib import pyplot as plt
 from cirq import circuits, devices, ops, protocols, sim, work
 
 if TYPE_CHECKING:
+    # matplotlib is slow to import, so it is only imported when plotting.
+    from matplotlib import pyplot as plt
+
     import cirq
 
 CrossEntropyPair = NamedTuple('CrossEntropyPair', [('num_cycle', int), ('xeb_fidelity', float)])
@@ -123,7 +124,7 @@ class CrossEntropyResult:
     repetitions: int
     purity_data: Optional[List[SpecklePurityPair]] = None
 
-    def plot(self, ax: Optional[plt.Axes] = None, **plot_kwargs: Any) -> plt.Axes:
+    def plot(self, ax: Optional['plt.Axes'] = None, **plot_kwargs: Any) -> 'plt.Axes':
         """Plots the average XEB fidelity vs the number of cycles.
 
         Args:
@@ -135,6 +136,8 @@ class CrossEntropyResult:
         """
         show_plot = not ax
         if not ax:
+            from matplotlib import pyplot as plt
+
             fig, ax = plt.subplots(1, 1, figsize=(8, 8))
         num_cycles = [d.num_cycle for d in self.data]
         fidelities = [d.xeb_fidelity for d in self.data]
@@ -223,6 +226,9 @@ def _fit_exponential_decay(x: Sequence[int], y: Sequence[float]) -> Tuple[np.nda
         two arrays. The first array contains the fitted parameters, and the
         second array is their estimated covariance.
     """
+    # scipy.optimize is slow to import, so it is only imported when fitting.
+    import scipy.optimize
+
     # Get initial guess by linear least squares with logarithm of model
     u = [a for a, b in zip(x, y) if b > 0]
     v = [np.log(b) for b in y if b > 0]
@@ -19,13 +19,12 @@ from typing import Any, Iterator, List, Optional, Sequence, Tuple, TYPE_CHECKING
 import numpy as np
 import sympy
 
-from matplotlib import pyplot as plt
-
-# this is for older systems with matplotlib <3.2 otherwise 3d projections fail
-from mpl_toolkits import mplot3d  # pylint: disable=unused-import
 from cirq import circuits, ops, protocols, study
 
 if TYPE_CHECKING:
+    # matplotlib is slow to import, so it is only imported when plotting.
+    from matplotlib import pyplot as plt
+
     import cirq
 
 
@@ -76,7 +75,7 @@ class RabiResult:
         """
         return [(angle, prob) for angle, prob in zip(self._rabi_angles, self._excited_state_probs)]
 
-    def plot(self, ax: Optional[plt.Axes] = None, **plot_kwargs: Any) -> plt.Axes:
+    def plot(self, ax: Optional['plt.Axes'] = None, **plot_kwargs: Any) -> 'plt.Axes':
         """Plots excited state probability vs the Rabi angle (angle of rotation
         around the x-axis).
 
@@ -89,6 +88,8 @@ class RabiResult:
         """
         show_plot = not ax
         if not ax:
+            from matplotlib import pyplot as plt
+
             fig, ax = plt.subplots(1, 1, figsize=(8, 8))
         ax.set_ylim([0, 1])
         ax.plot(self._rabi_angles, self._excited_state_probs, 'ro-', **plot_kwargs)
@@ -121,7 +122,7 @@ class RandomizedBenchMarkResult:
         """
         return [(num, prob) for num, prob in zip(self._num_cfds_seq, self._gnd_state_probs)]
 
-    def plot(self, ax: Optional[plt.Axes] = None, **plot_kwargs: Any) -> plt.Axes:
+    def plot(self, ax: Optional['plt.Axes'] = None, **plot_kwargs: Any) -> 'plt.Axes':
         """Plots the average ground state probability vs the number of
         Cliffords in the RB study.
 
@@ -134,6 +135,8 @@ class RandomizedBenchMarkResult:
         """
         show_plot = not ax
         if not ax:
+            from matplotlib import pyplot as plt
+
             fig, ax = plt.subplots(1, 1, figsize=(8, 8))
         ax.set_ylim([0, 1])
         ax.plot(self._num_cfds_seq, self._gnd_state_probs, 'ro-', **plot_kwargs)
@@ -161,7 +164,7 @@ class TomographyResult:
         """
         return self._density_matrix
 
-    def plot(self, axes: Optional[List[plt.Axes]] = None, **plot_kwargs: Any) -> List[plt.Axes]:
+    def plot(self, axes: Optional[List['plt.Axes']] = None, **plot_kwargs: Any) -> List['plt.Axes']:
         """Plots the real and imaginary parts of the density matrix as two
         3D bar plots.
 
@@ -177,6 +180,11 @@ class TomographyResult:
         """
         show_plot = axes is None
         if axes is None:
+            from matplotlib import pyplot as plt
+
+            # this is for older systems with matplotlib <3.2 otherwise 3d projections fail
+            from mpl_toolkits import mplot3d  # pylint: disable=unused-import
+
             fig, axes = plt.subplots(1, 2, figsize=(12.0, 5.0), subplot_kw={'projection': '3d'})
         elif len(axes) != 2:
             raise ValueError('A TomographyResult needs 2 axes to plot.')
@@ -623,7 +631,7 @@ def _find_inv_matrix(mat: np.ndarray, mat_sequence: np.ndarray) -> int:
 def _matrix_bar_plot(
     mat: np.ndarray,
     z_label: str,
-    ax: plt.Axes,
+    ax: 'plt.Axes',
     kets: Sequence[str] = None,
     title: str = None,
     ylim: Tuple[int, int] = (-1, 1),
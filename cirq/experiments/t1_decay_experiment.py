@@ -16,12 +16,14 @@ from typing import Any, Optional, TYPE_CHECKING
 
 import pandas as pd
 import sympy
-from matplotlib import pyplot as plt
 
 from cirq import circuits, ops, study, value
 from cirq._compat import proper_repr
 
 if TYPE_CHECKING:
+    # matplotlib is slow to import, so it is only imported when plotting.
+    from matplotlib import pyplot as plt
+
     import cirq
 
 
@@ -102,7 +104,7 @@ class T1DecayResult:
         """A data frame with delay_ns, false_count, true_count columns."""
         return self._data
 
-    def plot(self, ax: Optional[plt.Axes] = None, **plot_kwargs: Any) -> plt.Axes:
+    def plot(self, ax: Optional['plt.Axes'] = None, **plot_kwargs: Any) -> 'plt.Axes':
         """Plots the excited state probability vs the amount of delay.
 
         Args:
@@ -115,6 +117,8 @@ class T1DecayResult:
         """
         show_plot = not ax
         if show_plot:
+            from matplotlib import pyplot as plt
+
             fig, ax = plt.subplots(1, 1, figsize=(8, 8))
         assert ax is not None
         ax.set_ylim(ymin=0, ymax=1)
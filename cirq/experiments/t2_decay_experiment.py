@@ -17,12 +17,14 @@ from typing import Any, List, Optional, TYPE_CHECKING, Union
 
 import pandas as pd
 import sympy
-from matplotlib import pyplot as plt
 
 from cirq import circuits, ops, study, value
 from cirq._compat import proper_repr
 
 if TYPE_CHECKING:
+    # matplotlib is slow to import, so it is only imported when plotting.
+    from matplotlib import pyplot as plt
+
     import cirq
 
 
@@ -340,7 +342,7 @@ class T2DecayResult:
         """
         return self._expectation_pauli_y
 
-    def plot_expectations(self, ax: Optional[plt.Axes] = None, **plot_kwargs: Any) -> plt.Axes:
+    def plot_expectations(self, ax: Optional['plt.Axes'] = None, **plot_kwargs: Any) -> 'plt.Axes':
         """Plots the expectation values of Pauli operators versus delay time.
 
         Args:
@@ -353,6 +355,8 @@ class T2DecayResult:
         """
         show_plot = not ax
         if show_plot:
+            from matplotlib import pyplot as plt
+
             fig, ax = plt.subplots(1, 1, figsize=(8, 8))
         assert ax is not None
         ax.set_ylim(ymin=-2, ymax=2)
@@ -381,7 +385,7 @@ class T2DecayResult:
             fig.show()
         return ax
 
-    def plot_bloch_vector(self, ax: Optional[plt.Axes] = None, **plot_kwargs: Any) -> plt.Axes:
+    def plot_bloch_vector(self, ax: Optional['plt.Axes'] = None, **plot_kwargs: Any) -> 'plt.Axes':
         """Plots the estimated length of the Bloch vector versus time.
 
         This plot estimates the Bloch Vector by squaring the Pauli expectation
@@ -402,6 +406,8 @@ class T2DecayResult:
         """
         show_plot = not ax
         if show_plot:
+            from matplotlib import pyplot as plt
+
             fig, ax = plt.subplots(1, 1, figsize=(8, 8))
         assert ax is not None
         ax.set_ylim(ymin=0, ymax=1)
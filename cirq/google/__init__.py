@@ -64,6 +64,7 @@ from cirq.google.engine import (
     EngineProgram,
     EngineProcessor,
     EngineTimeSlot,
+    extract_template,
     ProtoVersion,
     QuantumEngineSampler,
     get_engine,
@@ -120,12 +121,5 @@ from cirq.google.serializable_gate_set import (
 from cirq.google import experimental
 
 
-def _register_resolver() -> None:
-    """Registers the cirq.google's public classes for JSON serialization."""
-    from cirq.protocols.json_serialization import _internal_register_resolver
-    from cirq.google.json_resolver_cache import _class_resolver_dictionary
-
-    _internal_register_resolver(_class_resolver_dictionary)
-
-
-_register_resolver()
+# The JSON resolver for cirq.google's public classes is registered by
+# cirq/__init__.py, so that reading JSON imports this package when needed.
@@ -36,6 +36,7 @@ from cirq.google.api.v2.results import (
     find_measurements,
     pack_bits,
     unpack_bits,
+    packed_results_from_proto,
     results_from_proto,
     results_to_proto,
 )
@@ -20,6 +20,7 @@ from typing import (
     List,
     Optional,
     Set,
+    Tuple,
     TYPE_CHECKING,
 )
 from collections import OrderedDict
@@ -116,11 +117,16 @@ def pack_bits(bits: np.ndarray) -> bytes:
     return byte_arr.tobytes()
 
 
+# The bits of each byte value in little-endian order, used to decode packed results.
+_LITTLE_ENDIAN_BITS = np.unpackbits(np.arange(256, dtype=np.uint8)[:, np.newaxis], axis=1)[
+    :, ::-1
+].astype(bool)
+
+
 def unpack_bits(data: bytes, repetitions: int) -> np.ndarray:
     """Unpack bits from a byte array into numpy array of bools."""
-    byte_arr = np.frombuffer(data, dtype='uint8').reshape((len(data), 1))
-    bits = np.unpackbits(byte_arr, axis=1)[:, ::-1].reshape(-1).astype(bool)
-    return bits[:repetitions]
+    byte_arr = np.frombuffer(data, dtype='uint8')
+    return _LITTLE_ENDIAN_BITS[byte_arr].reshape(-1)[:repetitions]
 
 
 def results_to_proto(
@@ -182,6 +188,50 @@ def results_from_proto(
     ]
 
 
+def packed_results_from_proto(
+    msg: result_pb2.Result,
+    measurements: List[MeasureInfo] = None,
+) -> List[List[Tuple[study.ParamResolver, Dict[str, np.ndarray]]]]:
+    """Converts a v2 result proto into packed measurement arrays.
+
+    This skips unpacking the bits, for consumers that work on packed data.
+    Each measurement key maps to a uint8 array of shape
+    `(num_qubits, ceil(repetitions / 8))`, where row `i` holds the results of
+    the i-th qubit of the measurement, packed in little-endian bit order as in
+    the proto. `np.unpackbits(data, axis=1, bitorder='little')` recovers the
+    bits.
+
+    Args:
+        msg: v2 Result message to convert.
+        measurements: List of info about expected measurements in the program,
+            used to order the qubits of each measurement as in
+            `results_from_proto`.
+
+    Returns:
+        A list containing, for each sweep, a list of parameter resolvers with
+        the packed measurements for that point of the sweep.
+    """
+    measure_map = {m.key: m for m in measurements} if measurements else None
+    sweeps = []
+    for sweep_result in msg.sweep_results:
+        qubits: Dict[str, devices.GridQubit] = {}
+        sweeps.append(
+            [
+                (
+                    study.ParamResolver(dict(pr.params.assignments)),
+                    {
+                        mr.key: _packed_measurement(
+                            mr, sweep_result.repetitions, measure_map, qubits
+                        )
+                        for mr in pr.measurement_results
+                    },
+                )
+                for pr in sweep_result.parameterized_results
+            ]
+        )
+    return sweeps
+
+
 def _trial_sweep_from_proto(
     msg: result_pb2.SweepResult,
     measure_map: Dict[str, MeasureInfo] = None,
@@ -200,20 +250,16 @@ def _trial_sweep_from_proto(
     """
 
     trial_sweep: List[study.Result] = []
+    qubits: Dict[str, devices.GridQubit] = {}
     for pr in msg.parameterized_results:
         m_data: Dict[str, np.ndarray] = {}
         for mr in pr.measurement_results:
-            qubit_results: OrderedDict[devices.GridQubit, np.ndarray] = OrderedDict()
-            for qmr in mr.qubit_measurement_results:
-                qubit = v2.grid_qubit_from_proto_id(qmr.qubit.id)
-                if qubit in qubit_results:
-                    raise ValueError('qubit already exists: {}'.format(qubit))
-                qubit_results[qubit] = unpack_bits(qmr.results, msg.repetitions)
-            if measure_map:
-                ordered_results = [qubit_results[qubit] for qubit in measure_map[mr.key].qubits]
-            else:
-                ordered_results = list(qubit_results.values())
-            m_data[mr.key] = np.array(ordered_results).transpose()
+            packed = _packed_measurement(mr, msg.repetitions, measure_map, qubits)
+            # Decode all qubits of the measurement at once. The bits of each
+            # qubit end up in one row, so the transpose is a view with one
+            # column per qubit.
+            bits = _LITTLE_ENDIAN_BITS[packed].reshape(len(packed), packed.shape[1] * 8)
+            m_data[mr.key] = bits[:, : msg.repetitions].T
         trial_sweep.append(
             study.Result.from_single_parameter_set(
                 params=study.ParamResolver(dict(pr.params.assignments)),
@@ -221,3 +267,45 @@ def _trial_sweep_from_proto(
             )
         )
     return trial_sweep
+
+
+def _packed_measurement(
+    mr: result_pb2.MeasurementResult,
+    repetitions: int,
+    measure_map: Optional[Dict[str, MeasureInfo]],
+    qubits: Dict[str, devices.GridQubit],
+) -> np.ndarray:
+    """Gathers the packed results of a measurement into one uint8 array.
+
+    Args:
+        mr: The measurement result proto.
+        repetitions: The number of repetitions in the sweep.
+        measure_map: Optional measurement configurations, used to order the
+            qubits of the measurement.
+        qubits: Cache of parsed qubit ids, shared between calls.
+
+    Returns:
+        An array with one row of packed bits per qubit.
+    """
+    num_bytes = (repetitions + 7) // 8
+    qubit_data: Dict[devices.GridQubit, bytes] = OrderedDict()
+    for qmr in mr.qubit_measurement_results:
+        qubit_id = qmr.qubit.id
+        qubit = qubits.get(qubit_id)
+        if qubit is None:
+            qubit = v2.grid_qubit_from_proto_id(qubit_id)
+            qubits[qubit_id] = qubit
+        if qubit in qubit_data:
+            raise ValueError('qubit already exists: {}'.format(qubit))
+        qubit_data[qubit] = qmr.results
+    if measure_map:
+        ordered = [qubit_data[qubit] for qubit in measure_map[mr.key].qubits]
+    else:
+        ordered = list(qubit_data.values())
+    if all(len(data) == num_bytes for data in ordered):
+        return np.frombuffer(b''.join(ordered), dtype=np.uint8).reshape(len(ordered), num_bytes)
+    packed = np.zeros((len(ordered), num_bytes), dtype=np.uint8)
+    for i, data in enumerate(ordered):
+        row = np.frombuffer(data, dtype=np.uint8)[:num_bytes]
+        packed[i, : len(row)] = row
+    return packed
@@ -309,3 +309,68 @@ def test_results_from_proto_default_ordering():
             dtype=bool,
         ),
     )
+
+
+def _random_result_proto(qubits, repetitions, num_points, seed):
+    prng = np.random.RandomState(seed)
+    measurements = [
+        v2.MeasureInfo('a', qubits[:2], slot=0, invert_mask=[False] * 2, tags=[]),
+        v2.MeasureInfo('b', qubits[2:], slot=1, invert_mask=[False] * (len(qubits) - 2), tags=[]),
+    ]
+    trial_results = [
+        [
+            cirq.Result.from_single_parameter_set(
+                params=cirq.ParamResolver({'i': i}),
+                measurements={
+                    m.key: prng.randint(2, size=(repetitions, len(m.qubits))).astype(bool)
+                    for m in measurements
+                },
+            )
+            for i in range(num_points)
+        ]
+    ]
+    return v2.results_to_proto(trial_results, measurements), measurements, trial_results
+
+
+@pytest.mark.parametrize('repetitions', [1, 8, 13, 100])
+def test_results_from_proto_round_trip(repetitions):
+    qubits = [q(0, i) for i in range(5)]
+    proto, measurements, expected = _random_result_proto(qubits, repetitions, 3, seed=1234)
+    for config in [measurements, None]:
+        actual = v2.results_from_proto(proto, config)
+        for trial_result, expected_trial_result in zip(actual[0], expected[0]):
+            assert trial_result.params == expected_trial_result.params
+            for key in ['a', 'b']:
+                measured = trial_result.measurements[key]
+                assert measured.dtype == bool
+                np.testing.assert_array_equal(measured, expected_trial_result.measurements[key])
+
+
+def test_packed_results_from_proto():
+    qubits = [q(0, i) for i in range(4)]
+    proto, measurements, expected = _random_result_proto(qubits, 13, 2, seed=1234)
+    packed = v2.packed_results_from_proto(proto, measurements)
+    assert len(packed) == 1
+    assert len(packed[0]) == 2
+    for (params, data), expected_trial_result in zip(packed[0], expected[0]):
+        assert params == expected_trial_result.params
+        assert data['a'].dtype == np.uint8
+        assert data['a'].shape == (2, 2)
+        for key in ['a', 'b']:
+            bits = np.unpackbits(data[key], axis=1)
+            bits = bits.reshape(-1, 8)[:, ::-1].reshape(len(data[key]), -1)[:, :13]
+            np.testing.assert_array_equal(bits.T, expected_trial_result.measurements[key])
+
+
+def test_results_from_proto_short_data():
+    proto = v2.result_pb2.Result()
+    sr = proto.sweep_results.add(repetitions=12)
+    mr = sr.parameterized_results.add().measurement_results.add(key='foo')
+    for qubit, data in [(q(0, 0), bytes([0b1111_0000, 0b1111])), (q(0, 1), bytes([0b1010_1010]))]:
+        qmr = mr.qubit_measurement_results.add(results=data)
+        qmr.qubit.id = v2.qubit_to_proto_id(qubit)
+    trial = v2.results_from_proto(proto)[0][0]
+    np.testing.assert_array_equal(
+        trial.measurements['foo'],
+        np.array([[0, 0, 0, 0, 1, 1, 1, 1, 1, 1, 1, 1], [0, 1, 0, 1, 0, 1, 0, 1, 0, 0, 0, 0]]).T,
+    )
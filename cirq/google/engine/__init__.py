@@ -41,6 +41,10 @@ from cirq.google.engine.engine_job import (
     EngineJob,
 )
 
+from cirq.google.engine.job_poller import (
+    JobPoller,
+)
+
 from cirq.google.engine.engine_processor import (
     EngineProcessor,
 )
@@ -58,6 +62,10 @@ from cirq.google.engine.engine_sampler import (
     QuantumEngineSampler,
 )
 
+from cirq.google.engine.program_template import (
+    extract_template,
+)
+
 from cirq.google.engine.env_config import (
     engine_from_environment,
 )
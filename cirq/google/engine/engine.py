@@ -23,8 +23,10 @@ In order to run on must have access to the Quantum Engine API. Access to this
 API is (as of June 22, 2018) restricted to invitation only.
 """
 
+import asyncio
 import datetime
 import enum
+import functools
 import os
 import random
 import string
@@ -43,6 +45,7 @@ from cirq.google.engine import (
     engine_job,
     engine_processor,
     engine_sampler,
+    program_template,
 )
 
 if TYPE_CHECKING:
@@ -297,6 +300,115 @@ class Engine:
             labels=job_labels,
         )
 
+    async def run_sweep_async(
+        self,
+        program: 'cirq.Circuit',
+        program_id: Optional[str] = None,
+        job_id: Optional[str] = None,
+        params: study.Sweepable = None,
+        repetitions: int = 1,
+        processor_ids: Sequence[str] = ('xmonsim',),
+        gate_set: Optional[sgs.SerializableGateSet] = None,
+        program_description: Optional[str] = None,
+        program_labels: Optional[Dict[str, str]] = None,
+        job_description: Optional[str] = None,
+        job_labels: Optional[Dict[str, str]] = None,
+    ) -> List[study.Result]:
+        """Asynchronously runs the supplied Circuit via Quantum Engine.
+
+        The program and job are created in the event loop's default executor,
+        then the job is waited on with `EngineJob.results_async`, which shares
+        one poller among all jobs on the loop. Many sweeps can thus be run
+        concurrently with `asyncio.gather`.
+
+        The arguments are the same as for `run_sweep`.
+
+        Returns:
+            The Results of the job, one for each parameter sweep.
+        """
+        job = await asyncio.get_event_loop().run_in_executor(
+            None,
+            functools.partial(
+                self.run_sweep,
+                program=program,
+                program_id=program_id,
+                job_id=job_id,
+                params=params,
+                repetitions=repetitions,
+                processor_ids=processor_ids,
+                gate_set=gate_set,
+                program_description=program_description,
+                program_labels=program_labels,
+                job_description=job_description,
+                job_labels=job_labels,
+            ),
+        )
+        return await job.results_async()
+
+    def run_template(
+        self,
+        programs: Sequence['cirq.Circuit'],
+        program_id: Optional[str] = None,
+        job_id: Optional[str] = None,
+        repetitions: int = 1,
+        processor_ids: Sequence[str] = ('xmonsim',),
+        gate_set: Optional[sgs.SerializableGateSet] = None,
+        program_description: Optional[str] = None,
+        program_labels: Optional[Dict[str, str]] = None,
+        job_description: Optional[str] = None,
+        job_labels: Optional[Dict[str, str]] = None,
+    ) -> engine_job.EngineJob:
+        """Runs circuits that only differ in gate angles as one template.
+
+        The varying gate arguments are extracted into symbols with
+        `cirq.google.extract_template`. The symbolic circuit is serialized
+        once and the values for each circuit are sent as a parameter sweep
+        in the run context, which is much smaller than a batch of full
+        circuits. Note that sweep points are sent in single precision.
+
+        This method does not block until a result is returned.
+
+        Args:
+            programs: The structurally identical circuits to execute.
+            program_id: A user-provided identifier for the program. This must
+                be unique within the Google Cloud project being used. If this
+                parameter is not provided, a random id of the format
+                'prog-################YYMMDD' will be generated, where # is
+                alphanumeric and YYMMDD is the current year, month, and day.
+            job_id: Job identifier to use. If this is not provided, a random id
+                of the format 'job-################YYMMDD' will be generated,
+                where # is alphanumeric and YYMMDD is the current year, month,
+                and day.
+            repetitions: The number of repetitions of each circuit to run.
+            processor_ids: The engine processors that should be candidates
+                to run the program. Only one of these will be scheduled for
+                execution.
+            gate_set: The gate set used to serialize the circuit. The gate set
+                must be supported by the selected processor.
+            program_description: An optional description to set on the program.
+            program_labels: Optional set of labels to set on the program.
+            job_description: An optional description to set on the job.
+            job_labels: Optional set of labels to set on the job.
+
+        Returns:
+            An EngineJob. If this is iterated over it returns a list of
+            TrialResults, one for each circuit in `programs`, in order.
+        """
+        template, sweep = program_template.extract_template(programs)
+        return self.run_sweep(
+            program=template,
+            program_id=program_id,
+            job_id=job_id,
+            params=sweep,
+            repetitions=repetitions,
+            processor_ids=processor_ids,
+            gate_set=gate_set,
+            program_description=program_description,
+            program_labels=program_labels,
+            job_description=job_description,
+            job_labels=job_labels,
+        )
+
     def run_batch(
         self,
         programs: List['cirq.Circuit'],
@@ -12,6 +12,7 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 """A helper for jobs that have been created on the Quantum Engine."""
+import asyncio
 import datetime
 import time
 
@@ -29,6 +30,7 @@ if TYPE_CHECKING:
     import cirq.google.engine.engine as engine_base
     from cirq.google.engine.engine import engine_program
     from cirq.google.engine.engine import engine_processor
+    from cirq.google.engine import job_poller
 
 TERMINAL_STATES = [
     quantum.enums.ExecutionStatus.State.SUCCESS,
@@ -304,31 +306,54 @@ class EngineJob:
 
     def results(self) -> List[study.Result]:
         """Returns the job results, blocking until the job is complete."""
-        import cirq.google.engine.engine as engine_base
+        if not self._results:
+            self._results = self._parse_results(self._wait_for_result())
+        return self._results
+
+    async def results_async(
+        self, *, poller: Optional['job_poller.JobPoller'] = None
+    ) -> List[study.Result]:
+        """Returns the job results, waiting asynchronously for completion.
+
+        Args:
+            poller: The poller that checks the status of the job. By default
+                the poller shared by all jobs on the running event loop is
+                used, so waiting on many jobs concurrently costs one
+                background task rather than one polling loop per job.
+        """
+        import cirq.google.engine.job_poller as job_poller
 
         if not self._results:
-            result = self._wait_for_result()
-            result_type = result.type_url[len(engine_base.TYPE_PREFIX) :]
-            if (
-                result_type == 'cirq.google.api.v1.Result'
-                or result_type == 'cirq.api.google.v1.Result'
-            ):
-                v1_parsed_result = v1.program_pb2.Result.FromString(result.value)
-                self._results = self._get_job_results_v1(v1_parsed_result)
-            elif (
-                result_type == 'cirq.google.api.v2.Result'
-                or result_type == 'cirq.api.google.v2.Result'
-            ):
-                v2_parsed_result = v2.result_pb2.Result.FromString(result.value)
-                self._results = self._get_job_results_v2(v2_parsed_result)
-            elif result.Is(v2.batch_pb2.BatchResult.DESCRIPTOR):
-                v2_parsed_result = v2.batch_pb2.BatchResult.FromString(result.value)
-                self._batched_results = self._get_batch_results_v2(v2_parsed_result)
-                self._results = self._flatten(self._batched_results)
-            else:
-                raise ValueError('invalid result proto version: {}'.format(result_type))
+            if poller is None:
+                poller = job_poller.JobPoller.for_running_loop()
+            job = await poller.wait(self)
+            self._raise_on_failure(job)
+            response = await asyncio.get_event_loop().run_in_executor(
+                None,
+                self.context.client.get_job_results,
+                self.project_id,
+                self.program_id,
+                self.job_id,
+            )
+            self._results = self._parse_results(response.result)
         return self._results
 
+    def _parse_results(self, result: 'quantum.types.any_pb2.Any') -> List[study.Result]:
+        import cirq.google.engine.engine as engine_base
+
+        result_type = result.type_url[len(engine_base.TYPE_PREFIX) :]
+        if result_type == 'cirq.google.api.v1.Result' or result_type == 'cirq.api.google.v1.Result':
+            v1_parsed_result = v1.program_pb2.Result.FromString(result.value)
+            return self._get_job_results_v1(v1_parsed_result)
+        if result_type == 'cirq.google.api.v2.Result' or result_type == 'cirq.api.google.v2.Result':
+            v2_parsed_result = v2.result_pb2.Result.FromString(result.value)
+            return self._get_job_results_v2(v2_parsed_result)
+        if result.Is(v2.batch_pb2.BatchResult.DESCRIPTOR):
+            v2_parsed_result = v2.batch_pb2.BatchResult.FromString(result.value)
+            self._batched_results = self._get_batch_results_v2(v2_parsed_result)
+            return self._flatten(self._batched_results)
+        raise ValueError('invalid result proto version: {}'.format(result_type))
+
     def calibration_results(self):
         """Returns the results of a run_calibration() call.
 
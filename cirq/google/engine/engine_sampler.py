@@ -11,6 +11,8 @@
 # WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 # See the License for the specific language governing permissions and
 # limitations under the License.
+import asyncio
+import functools
 from typing import List, TYPE_CHECKING, Union, Optional, cast
 
 from cirq import work, circuits
@@ -65,6 +67,31 @@ class QuantumEngineSampler(work.Sampler):
             )
         return job.results()
 
+    async def run_sweep_async(
+        self,
+        program: Union['cirq.Circuit', 'cirq.google.EngineProgram'],
+        params: 'cirq.Sweepable',
+        repetitions: int = 1,
+    ) -> List['cirq.Result']:
+        if isinstance(program, engine.EngineProgram):
+            job = await asyncio.get_event_loop().run_in_executor(
+                None,
+                functools.partial(
+                    program.run_sweep,
+                    params=params,
+                    repetitions=repetitions,
+                    processor_ids=self._processor_ids,
+                ),
+            )
+            return await job.results_async()
+        return await self._engine.run_sweep_async(
+            program=cast(circuits.Circuit, program),
+            params=params,
+            repetitions=repetitions,
+            processor_ids=self._processor_ids,
+            gate_set=self._gate_set,
+        )
+
     def run_batch(
         self,
         programs: List['cirq.Circuit'],
@@ -42,6 +42,31 @@ def test_run_engine_program():
     engine.run_sweep.assert_not_called()
 
 
+@pytest.mark.asyncio
+async def test_run_circuit_async():
+    engine = mock.Mock()
+    engine.run_sweep_async = mock.AsyncMock(return_value=['result'])
+    sampler = cg.QuantumEngineSampler(engine=engine, processor_id='tmp', gate_set=cg.XMON)
+    circuit = cirq.Circuit()
+    params = [cirq.ParamResolver({'a': 1})]
+    assert await sampler.run_sweep_async(circuit, params, 5) == ['result']
+    engine.run_sweep_async.assert_called_with(
+        gate_set=cg.XMON, params=params, processor_ids=['tmp'], program=circuit, repetitions=5
+    )
+
+
+@pytest.mark.asyncio
+async def test_run_engine_program_async():
+    engine = mock.Mock()
+    sampler = cg.QuantumEngineSampler(engine=engine, processor_id='tmp', gate_set=cg.XMON)
+    program = mock.Mock(spec=cg.EngineProgram)
+    program.run_sweep.return_value.results_async = mock.AsyncMock(return_value=['result'])
+    params = [cirq.ParamResolver({'a': 1})]
+    assert await sampler.run_sweep_async(program, params, 5) == ['result']
+    program.run_sweep.assert_called_with(params=params, processor_ids=['tmp'], repetitions=5)
+    engine.run_sweep_async.assert_not_called()
+
+
 def test_run_batch():
     engine = mock.Mock()
     sampler = cg.QuantumEngineSampler(engine=engine, processor_id='tmp', gate_set=cg.XMON)
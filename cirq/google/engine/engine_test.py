@@ -609,6 +609,53 @@ def test_run_sweep_v2(client):
     client().get_job_results.assert_called_once()
 
 
+@mock.patch('cirq.google.engine.engine_client.EngineClient')
+@pytest.mark.asyncio
+async def test_run_sweep_async(client):
+    setup_run_circuit_with_result_(client, _RESULTS_V2)
+
+    engine = cg.Engine(project_id='proj')
+    results = await engine.run_sweep_async(
+        program=_CIRCUIT, job_id='job-id', params=cirq.Points('a', [1, 2]), gate_set=cg.XMON
+    )
+    assert len(results) == 2
+    for i, v in enumerate([1, 2]):
+        assert results[i].params.param_dict == {'a': v}
+        assert results[i].measurements == {'q': np.array([[0]], dtype='uint8')}
+    client().create_program.assert_called_once()
+    client().create_job.assert_called_once()
+    client().get_job.assert_called_once()
+    client().get_job_results.assert_called_once()
+
+
+@mock.patch('cirq.google.engine.engine_client.EngineClient')
+def test_run_template(client):
+    setup_run_circuit_with_result_(client, _RESULTS_V2)
+
+    engine = cg.Engine(
+        project_id='proj',
+        proto_version=cg.engine.engine.ProtoVersion.V2,
+    )
+    q = cirq.GridQubit(5, 2)
+    programs = [cirq.Circuit(cirq.X(q) ** t, cirq.measure(q, key='q')) for t in (0.25, 0.5)]
+    job = engine.run_template(programs=programs, job_id='job-id', gate_set=cg.XMON)
+    assert len(job.results()) == 2
+
+    client().create_program.assert_called_once()
+    program = v2.program_pb2.Program()
+    client().create_program.call_args[1]['code'].Unpack(program)
+    template = cg.XMON.deserialize(program)
+    assert cirq.parameter_names(template) == {'theta_0'}
+
+    client().create_job.assert_called_once()
+    run_context = v2.run_context_pb2.RunContext()
+    client().create_job.call_args[1]['run_context'].Unpack(run_context)
+    sweeps = run_context.parameter_sweeps
+    assert len(sweeps) == 1
+    sweep = v2.sweep_from_proto(sweeps[0].sweep)
+    assert [cirq.resolve_parameters(template, r) for r in sweep] == programs
+
+
 @mock.patch('cirq.google.engine.engine_client.EngineClient')
 def test_run_batch(client):
     setup_run_circuit_with_result_(client, _BATCH_RESULTS_V2)
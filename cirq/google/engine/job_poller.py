@@ -0,0 +1,218 @@
+# Copyright 2021 The Cirq Developers
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Waits for many Quantum Engine jobs from a single asyncio task."""
+
+import asyncio
+import concurrent.futures
+import weakref
+from typing import Any, Dict, List, Optional, Tuple, TYPE_CHECKING
+
+from cirq import value
+from cirq.google.engine import engine_job
+from cirq.google.engine.client import quantum
+
+if TYPE_CHECKING:
+    import cirq
+
+
+class _PollEntry:
+    def __init__(
+        self,
+        job: 'cirq.google.EngineJob',
+        future: 'asyncio.Future[quantum.types.QuantumJob]',
+        due: float,
+        delay: float,
+        deadline: Optional[float],
+    ) -> None:
+        self.job = job
+        self.future = future
+        self.due = due
+        self.delay = delay
+        self.deadline = deadline
+
+
+class JobPoller:
+    """Polls the status of outstanding EngineJobs until they finish.
+
+    All jobs waited on through a poller are checked by one background task
+    on the event loop. Jobs that are due at about the same time are checked
+    together, with the blocking client calls running concurrently in an
+    executor. After each check of a job that is still running, the delay
+    until its next check grows exponentially up to `max_delay`, and is
+    randomly stretched or shrunk by up to `jitter` so that many jobs
+    submitted together do not keep hitting the service in lockstep.
+
+    A poller is bound to the event loop it is first used on. Use
+    `JobPoller.for_running_loop()` to get the poller shared by all jobs on
+    the current loop.
+    """
+
+    def __init__(
+        self,
+        *,
+        initial_delay: float = 0.5,
+        max_delay: float = 30.0,
+        backoff_factor: float = 2.0,
+        jitter: float = 0.1,
+        executor: Optional[concurrent.futures.Executor] = None,
+        seed: 'cirq.RANDOM_STATE_OR_SEED_LIKE' = None,
+    ) -> None:
+        """Inits JobPoller.
+
+        Args:
+            initial_delay: Seconds between the first and second status check
+                of a job.
+            max_delay: Upper bound on the seconds between status checks.
+            backoff_factor: Factor by which the delay grows after each check.
+            jitter: Relative amount by which each delay is randomized, so a
+                delay `d` becomes a uniform value in `d * (1 +- jitter)`.
+            executor: Executor for the blocking client calls. Defaults to the
+                event loop's default executor.
+            seed: Seed for the jitter.
+        """
+        if initial_delay <= 0 or max_delay < initial_delay:
+            raise ValueError(
+                'Need 0 < initial_delay <= max_delay, '
+                f'got initial_delay={initial_delay} and max_delay={max_delay}.'
+            )
+        if backoff_factor < 1:
+            raise ValueError(f'backoff_factor must be at least 1, got {backoff_factor}.')
+        if not 0 <= jitter < 1:
+            raise ValueError(f'jitter must be in [0, 1), got {jitter}.')
+        self._initial_delay = initial_delay
+        self._max_delay = max_delay
+        self._backoff_factor = backoff_factor
+        self._jitter = jitter
+        self._executor = executor
+        self._prng = value.parse_random_state(seed)
+        self._entries: Dict[Tuple[str, str, str], _PollEntry] = {}
+        self._task: Optional['asyncio.Task[None]'] = None
+        self._wakeup: Optional[asyncio.Event] = None
+        self.num_status_checks = 0
+
+    @classmethod
+    def for_running_loop(cls) -> 'JobPoller':
+        """Returns the poller shared by all jobs on the running event loop."""
+        loop = asyncio.get_event_loop()
+        poller = _POLLERS.get(loop)
+        if poller is None:
+            poller = cls()
+            _POLLERS[loop] = poller
+        return poller
+
+    @property
+    def num_outstanding(self) -> int:
+        """The number of jobs that are still being polled."""
+        return len(self._entries)
+
+    async def wait(self, job: 'cirq.google.EngineJob') -> quantum.types.QuantumJob:
+        """Waits until the job reaches a terminal state or times out.
+
+        The job times out after `job.context.timeout` seconds, if set.
+
+        Returns:
+            The last QuantumJob seen for the job. This is in a non-terminal
+            state only if the job timed out.
+        """
+        current = job._job
+        if current is not None and current.execution_status.state in engine_job.TERMINAL_STATES:
+            return current
+
+        loop = asyncio.get_event_loop()
+        key = (job.project_id, job.program_id, job.job_id)
+        entry = self._entries.get(key)
+        if entry is None:
+            now = loop.time()
+            timeout = job.context.timeout
+            entry = _PollEntry(
+                job=job,
+                future=loop.create_future(),
+                due=now,
+                delay=self._initial_delay,
+                deadline=now + timeout if timeout else None,
+            )
+            self._entries[key] = entry
+            if self._task is None:
+                self._wakeup = asyncio.Event()
+                self._task = loop.create_task(self._run())
+            else:
+                assert self._wakeup is not None
+                self._wakeup.set()
+        # Several callers may wait on the same job, so one of them being
+        # cancelled must not cancel the shared future.
+        return await asyncio.shield(entry.future)
+
+    async def _run(self) -> None:
+        loop = asyncio.get_event_loop()
+        assert self._wakeup is not None
+        try:
+            while self._entries:
+                now = loop.time()
+                next_due = min(entry.due for entry in self._entries.values())
+                if next_due > now:
+                    self._wakeup.clear()
+                    try:
+                        await asyncio.wait_for(self._wakeup.wait(), next_due - now)
+                    except asyncio.TimeoutError:
+                        pass
+                    continue
+
+                # Check jobs that are due soon together with the ones that
+                # are due now, so checks are batched into fewer rounds.
+                horizon = now + self._initial_delay / 2
+                due = [(k, e) for k, e in self._entries.items() if e.due <= horizon]
+                checks: List[Any] = await asyncio.gather(
+                    *[
+                        loop.run_in_executor(self._executor, entry.job._refresh_job)
+                        for _, entry in due
+                    ],
+                    return_exceptions=True,
+                )
+                self.num_status_checks += len(due)
+                now = loop.time()
+                for (key, entry), result in zip(due, checks):
+                    if isinstance(result, BaseException):
+                        del self._entries[key]
+                        if not entry.future.done():
+                            entry.future.set_exception(result)
+                    elif result.execution_status.state in engine_job.TERMINAL_STATES or (
+                        entry.deadline is not None and now >= entry.deadline
+                    ):
+                        del self._entries[key]
+                        if not entry.future.done():
+                            entry.future.set_result(result)
+                    else:
+                        spread = self._prng.uniform(1 - self._jitter, 1 + self._jitter)
+                        entry.due = now + entry.delay * spread
+                        if entry.deadline is not None:
+                            entry.due = min(entry.due, entry.deadline)
+                        entry.delay = min(entry.delay * self._backoff_factor, self._max_delay)
+        except BaseException as ex:
+            # Do not leave waiters hanging if polling itself breaks down.
+            for entry in self._entries.values():
+                if entry.future.done():
+                    continue
+                if isinstance(ex, Exception):
+                    entry.future.set_exception(ex)
+                else:
+                    entry.future.cancel()
+            self._entries.clear()
+            raise
+        finally:
+            self._task = None
+
+
+_POLLERS: 'weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, JobPoller]' = (
+    weakref.WeakKeyDictionary()
+)
@@ -0,0 +1,154 @@
+# Copyright 2021 The Cirq Developers
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import asyncio
+import time
+from typing import Dict, List
+
+import pytest
+
+import cirq.google as cg
+from cirq.google.api import v2
+from cirq.google.engine.client.quantum_v1alpha1 import types as qtypes
+from cirq.google.engine.engine import EngineContext
+
+_STATE = qtypes.ExecutionStatus.State
+
+
+def _result(value: int) -> qtypes.QuantumResult:
+    proto = v2.result_pb2.Result()
+    sweep_result = proto.sweep_results.add(repetitions=1)
+    measurement = sweep_result.parameterized_results.add().measurement_results.add(key='q')
+    qubit_result = measurement.qubit_measurement_results.add(results=bytes([value]))
+    qubit_result.qubit.id = '1_1'
+    any_proto = qtypes.any_pb2.Any()
+    any_proto.Pack(proto)
+    return qtypes.QuantumResult(result=any_proto)
+
+
+class _FakeEngineClient:
+    """Jobs finish in `final_state` after a fixed number of status checks."""
+
+    def __init__(self, checks_until_done: Dict[str, int], final_state=_STATE.SUCCESS):
+        self.checks_until_done = checks_until_done
+        self.final_state = final_state
+        self.check_times: Dict[str, List[float]] = {job_id: [] for job_id in checks_until_done}
+
+    def get_job(self, project_id, program_id, job_id, return_run_context):
+        times = self.check_times[job_id]
+        times.append(time.monotonic())
+        if len(times) >= self.checks_until_done[job_id]:
+            state = self.final_state
+        else:
+            state = _STATE.RUNNING
+        return qtypes.QuantumJob(
+            name=f'projects/{project_id}/programs/{program_id}/jobs/{job_id}',
+            execution_status=qtypes.ExecutionStatus(state=state),
+        )
+
+    def get_job_results(self, project_id, program_id, job_id):
+        return _result(int(job_id))
+
+
+def _job(client, job_id, timeout=None):
+    return cg.EngineJob('proj', 'prog', job_id, EngineContext(client=client, timeout=timeout))
+
+
+@pytest.mark.asyncio
+async def test_poller_waits_for_many_jobs():
+    client = _FakeEngineClient({str(i): i + 1 for i in range(5)})
+    poller = cg.engine.JobPoller(initial_delay=0.001, max_delay=0.004, seed=1234)
+    jobs = [_job(client, str(i)) for i in range(5)]
+    results = await asyncio.gather(*[job.results_async(poller=poller) for job in jobs])
+
+    for i, result in enumerate(results):
+        assert len(result) == 1
+        assert result[0].measurements['q'][0, 0] == i & 1
+        assert len(client.check_times[str(i)]) == i + 1
+    assert poller.num_status_checks == 15
+    assert poller.num_outstanding == 0
+
+    # Results are cached, so waiting again does not poll.
+    assert await jobs[4].results_async(poller=poller) == results[4]
+    assert poller.num_status_checks == 15
+
+
+@pytest.mark.asyncio
+async def test_poller_backs_off():
+    client = _FakeEngineClient({'0': 5})
+    poller = cg.engine.JobPoller(initial_delay=0.01, max_delay=0.04, jitter=0.5, seed=1234)
+    await poller.wait(_job(client, '0'))
+    times = client.check_times['0']
+    intervals = [b - a for a, b in zip(times, times[1:])]
+    for interval, delay in zip(intervals, [0.01, 0.02, 0.04, 0.04]):
+        assert interval >= delay * 0.5
+
+
+@pytest.mark.asyncio
+async def test_poller_shares_waits_on_same_job():
+    client = _FakeEngineClient({'0': 3})
+    poller = cg.engine.JobPoller(initial_delay=0.001)
+    first = asyncio.ensure_future(poller.wait(_job(client, '0')))
+    second = asyncio.ensure_future(poller.wait(_job(client, '0')))
+    await asyncio.sleep(0)
+    assert poller.num_outstanding == 1
+    second.cancel()
+    job = await first
+    assert job.execution_status.state == _STATE.SUCCESS
+    assert len(client.check_times['0']) == 3
+
+
+@pytest.mark.asyncio
+async def test_poller_for_running_loop():
+    assert cg.engine.JobPoller.for_running_loop() is cg.engine.JobPoller.for_running_loop()
+
+
+@pytest.mark.asyncio
+async def test_results_async_failure():
+    client = _FakeEngineClient({'0': 2}, final_state=_STATE.CANCELLED)
+    poller = cg.engine.JobPoller(initial_delay=0.001)
+    with pytest.raises(RuntimeError, match='CANCELLED'):
+        await _job(client, '0').results_async(poller=poller)
+
+
+@pytest.mark.asyncio
+async def test_results_async_timeout():
+    client = _FakeEngineClient({'0': 1000})
+    poller = cg.engine.JobPoller(initial_delay=0.001, max_delay=1)
+    with pytest.raises(RuntimeError, match='Timed out'):
+        await _job(client, '0', timeout=0.01).results_async(poller=poller)
+    assert poller.num_outstanding == 0
+
+
+@pytest.mark.asyncio
+async def test_results_async_client_error():
+    class _BrokenClient(_FakeEngineClient):
+        def get_job(self, project_id, program_id, job_id, return_run_context):
+            raise cg.engine.EngineException('unavailable')
+
+    poller = cg.engine.JobPoller(initial_delay=0.001)
+    with pytest.raises(cg.engine.EngineException, match='unavailable'):
+        await _job(_BrokenClient({'0': 1}), '0').results_async(poller=poller)
+    assert poller.num_outstanding == 0
+
+
+def test_poller_invalid_args():
+    with pytest.raises(ValueError, match='initial_delay'):
+        cg.engine.JobPoller(initial_delay=0)
+    with pytest.raises(ValueError, match='initial_delay'):
+        cg.engine.JobPoller(initial_delay=2, max_delay=1)
+    with pytest.raises(ValueError, match='backoff_factor'):
+        cg.engine.JobPoller(backoff_factor=0.5)
+    with pytest.raises(ValueError, match='jitter'):
+        cg.engine.JobPoller(jitter=1)
@@ -0,0 +1,161 @@
+# Copyright 2021 The Cirq Developers
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Tools for submitting many structurally identical circuits as one template.
+
+Circuits that only differ in the angles of their gates can be sent to the
+Quantum Engine as a single symbolic circuit plus a table of parameter values,
+instead of one full circuit proto per instance.
+"""
+
+import numbers
+from typing import Any, Callable, Dict, List, Sequence, Set, Tuple, TYPE_CHECKING, cast
+
+import sympy
+
+from cirq import circuits, ops, protocols, study
+
+if TYPE_CHECKING:
+    import cirq
+
+
+def extract_template(
+    programs: Sequence['cirq.Circuit'], *, prefix: str = 'theta_'
+) -> Tuple['cirq.Circuit', 'cirq.Sweep']:
+    """Factors circuits that only differ in gate angles into a template.
+
+    All circuits must have the same moments, with the same gate types acting
+    on the same qubits in the same order. Every numeric gate argument (as
+    reported by the gate's `_json_dict_`) that varies between the circuits is
+    replaced by a symbol. Arguments that vary identically share a symbol.
+
+    Args:
+        programs: The circuits to factor. The first circuit provides the
+            structure and the device of the template.
+        prefix: Prefix of the names of the generated symbols. Names already
+            used by parameters of the circuits are skipped.
+
+    Returns:
+        A tuple of the symbolic template circuit and a sweep with one point
+        per circuit, in order, such that resolving the template with the
+        i-th point gives the i-th circuit.
+
+    Raises:
+        ValueError: if no circuits are given, if the circuits are not
+            structurally identical, if a varying gate cannot be rebuilt with
+            symbolic arguments, or if several circuits are all identical.
+    """
+    if not programs:
+        raise ValueError('At least one circuit is required.')
+    first = programs[0]
+    for index, program in enumerate(programs[1:], start=1):
+        if len(program) != len(first):
+            raise ValueError(
+                f'Circuit {index} has {len(program)} moments but circuit 0 has {len(first)}.'
+            )
+
+    used_names: Set[str] = set()
+    for program in programs:
+        used_names |= protocols.parameter_names(program)
+    symbols: Dict[Tuple[Any, ...], sympy.Symbol] = {}
+
+    def symbol_for(values: Tuple[Any, ...]) -> sympy.Symbol:
+        if values not in symbols:
+            name = f'{prefix}{len(symbols)}'
+            while name in used_names:
+                name = '_' + name
+            used_names.add(name)
+            symbols[values] = sympy.Symbol(name)
+        return symbols[values]
+
+    moments = []
+    for i, moment in enumerate(first):
+        instances = [program[i].operations for program in programs]
+        template_ops = []
+        for j in range(len(moment.operations)):
+            column = []
+            for index, operations in enumerate(instances):
+                if len(operations) != len(moment.operations):
+                    raise ValueError(
+                        f'Circuit {index} has a different number of operations in moment {i}.'
+                    )
+                column.append(operations[j])
+            template_ops.append(_template_op(column, symbol_for, i))
+        moments.append(ops.Moment(template_ops))
+    template = circuits.Circuit(moments, device=first.device)
+
+    if not symbols:
+        if len(programs) > 1:
+            raise ValueError(
+                'All circuits are identical. Run the circuit once with more repetitions instead.'
+            )
+        return template, study.UnitSweep
+    return (
+        template,
+        study.Zip(*[study.Points(str(symbol), list(values)) for values, symbol in symbols.items()]),
+    )
+
+
+def _template_op(
+    column: List['cirq.Operation'],
+    symbol_for: Callable[[Tuple[Any, ...]], sympy.Symbol],
+    moment_index: int,
+) -> 'cirq.Operation':
+    """Returns an operation with symbols for the arguments varying in column."""
+    op = column[0]
+    if all(other == op for other in column[1:]):
+        return op
+
+    gates: List['cirq.Gate'] = []
+    for other in column:
+        if (
+            not isinstance(other, ops.GateOperation)
+            or other.qubits != op.qubits
+            or type(other.gate) is not type(op.gate)
+        ):
+            raise ValueError(
+                f'Operations differ in more than their angles in moment {moment_index}: '
+                f'{op!r} and {other!r}.'
+            )
+        gates.append(other.gate)
+    gate = gates[0]
+
+    arg_dicts = [other_gate._json_dict_() for other_gate in gates]
+    kwargs = {}
+    resolved = {}
+    for name, arg in arg_dicts[0].items():
+        if name == 'cirq_type':
+            continue
+        values = tuple(d[name] for d in arg_dicts)
+        if all(v == arg for v in values):
+            kwargs[name] = arg
+        elif all(_is_number(v) for v in values):
+            symbol = symbol_for(values)
+            kwargs[name] = symbol
+            resolved[symbol] = arg
+        else:
+            raise ValueError(
+                f'Argument {name!r} of {op!r} in moment {moment_index} varies but is not numeric.'
+            )
+
+    try:
+        template_gate = cast(Callable[..., 'cirq.Gate'], type(gate))(**kwargs)
+    except TypeError as ex:
+        raise ValueError(f'Cannot rebuild {gate!r} with symbolic arguments.') from ex
+    if protocols.resolve_parameters(template_gate, resolved) != gate:
+        raise ValueError(f'Cannot rebuild {gate!r} with symbolic arguments.')
+    return template_gate.on(*op.qubits)
+
+
+def _is_number(value: Any) -> bool:
+    return isinstance(value, numbers.Real) and not isinstance(value, bool)
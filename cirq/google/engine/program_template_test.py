@@ -0,0 +1,119 @@
+# Copyright 2021 The Cirq Developers
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import pytest
+import sympy
+
+import cirq
+import cirq.google as cg
+
+
+def _circuit(a, b, c):
+    q0, q1 = cirq.GridQubit.rect(1, 2)
+    return cirq.Circuit(
+        [cirq.X(q0) ** a, cirq.PhasedXPowGate(phase_exponent=b, exponent=a).on(q1)],
+        cg.SYC(q0, q1),
+        [cirq.Z(q0) ** c, cirq.Z(q1) ** 0.5],
+        cirq.measure(q0, q1, key='m'),
+    )
+
+
+def test_extract_template():
+    programs = [_circuit(0.1, 0.2, 0.3), _circuit(0.4, 0.2, 0.5), _circuit(0.6, 0.2, 0.7)]
+    template, sweep = cg.extract_template(programs)
+
+    assert len(template) == 4
+    # The exponent of X and of PhasedX vary identically, so share a symbol.
+    assert cirq.parameter_names(template) == {'theta_0', 'theta_1'}
+    assert template[0].operations[0].gate == cirq.X ** sympy.Symbol('theta_0')
+    assert template[0].operations[1].gate.phase_exponent == 0.2
+    assert template[2].operations[1] == programs[0][2].operations[1]
+    assert [cirq.resolve_parameters(template, r) for r in sweep] == programs
+
+    # Sweep protos hold single precision points.
+    round_trip = cg.api.v2.sweep_from_proto(cg.api.v2.sweep_to_proto(sweep))
+    assert round_trip.keys == sweep.keys
+    for actual, expected in zip(round_trip, sweep):
+        for key in sweep.keys:
+            assert actual.value_of(key) == pytest.approx(expected.value_of(key), abs=1e-7)
+
+
+def test_extract_template_single_circuit():
+    program = _circuit(0.1, 0.2, 0.3)
+    template, sweep = cg.extract_template([program])
+    assert template == program
+    assert sweep == cirq.UnitSweep
+
+
+def test_extract_template_skips_used_names():
+    q = cirq.LineQubit(0)
+    programs = [
+        cirq.Circuit(cirq.X(q) ** sympy.Symbol('theta_0'), cirq.Y(q) ** t) for t in (0.1, 0.2)
+    ]
+    template, sweep = cg.extract_template(programs)
+    assert cirq.parameter_names(template) == {'theta_0', '_theta_0'}
+    assert list(sweep.keys) == ['_theta_0']
+
+    template, _ = cg.extract_template(programs, prefix='y')
+    assert cirq.parameter_names(template) == {'theta_0', 'y0'}
+
+
+def test_extract_template_invalid():
+    q0, q1 = cirq.LineQubit.range(2)
+    with pytest.raises(ValueError, match='At least one'):
+        cg.extract_template([])
+    with pytest.raises(ValueError, match='moments'):
+        cg.extract_template([cirq.Circuit(cirq.X(q0)), cirq.Circuit(cirq.X(q0), cirq.X(q0))])
+    with pytest.raises(ValueError, match='number of operations'):
+        cg.extract_template([cirq.Circuit(cirq.X(q0)), cirq.Circuit([cirq.X(q0), cirq.X(q1)])])
+    with pytest.raises(ValueError, match='more than their angles'):
+        cg.extract_template([cirq.Circuit(cirq.X(q0)), cirq.Circuit(cirq.X(q1))])
+    with pytest.raises(ValueError, match='more than their angles'):
+        cg.extract_template([cirq.Circuit(cirq.X(q0)), cirq.Circuit(cirq.Y(q0))])
+    with pytest.raises(ValueError, match='not numeric'):
+        cg.extract_template(
+            [cirq.Circuit(cirq.measure(q0, key='a')), cirq.Circuit(cirq.measure(q0, key='b'))]
+        )
+    with pytest.raises(ValueError, match='identical'):
+        cg.extract_template([cirq.Circuit(cirq.X(q0)), cirq.Circuit(cirq.X(q0))])
+
+
+class _UnbuildableGate(cirq.SingleQubitGate):
+    def __init__(self, angle):
+        self.angle = angle
+
+    def _json_dict_(self):
+        return {'cirq_type': '_UnbuildableGate', 'theta': self.angle}
+
+    def _value_equality_values_(self):
+        return self.angle
+
+    def __eq__(self, other):
+        return isinstance(other, _UnbuildableGate) and self.angle == other.angle
+
+
+class _LossyGate(_UnbuildableGate):
+    def _json_dict_(self):
+        return {'cirq_type': '_LossyGate', 'angle': self.angle, 'scale': 1}
+
+    def __init__(self, angle, scale=2):
+        super().__init__(angle * scale)
+
+
+def test_extract_template_unbuildable_gate():
+    q = cirq.LineQubit(0)
+    with pytest.raises(ValueError, match='Cannot rebuild'):
+        cg.extract_template([cirq.Circuit(_UnbuildableGate(a).on(q)) for a in (0.1, 0.2)])
+    with pytest.raises(ValueError, match='Cannot rebuild'):
+        cg.extract_template([cirq.Circuit(_LossyGate(a).on(q)) for a in (0.1, 0.2)])
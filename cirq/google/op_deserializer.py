@@ -16,9 +16,11 @@ from typing import (
     Any,
     Callable,
     Dict,
+    Hashable,
     List,
     Optional,
     Sequence,
+    Tuple,
     TYPE_CHECKING,
 )
 from dataclasses import dataclass
@@ -110,10 +112,46 @@ class GateOpDeserializer:
     ) -> 'cirq.Operation':
         """Turns a cirq.google.api.v2.Operation proto into a GateOperation."""
         qubits = [v2.qubit_from_proto_id(q.id) for q in proto.qubits]
+        gate = self._gate_from_proto(
+            proto, num_qubits=len(qubits), arg_function_language=arg_function_language
+        )
+        return self._op_from_gate(gate, qubits, proto, constants=constants)
+
+    def _gate_from_proto(
+        self, proto: v2.program_pb2.Operation, *, num_qubits: int, arg_function_language: str
+    ) -> 'cirq.Gate':
         args = self._args_from_proto(proto, arg_function_language=arg_function_language)
         if self.num_qubits_param is not None:
-            args[self.num_qubits_param] = len(qubits)
-        gate = self.gate_constructor(**args)
+            args[self.num_qubits_param] = num_qubits
+        return self.gate_constructor(**args)
+
+    def _gate_key(
+        self, proto: v2.program_pb2.Operation, *, num_qubits: int, arg_function_language: str
+    ) -> Hashable:
+        """A key such that protos with equal keys deserialize to equal gates.
+
+        The gate only depends on the serialized args, on the arg function
+        language and, for some gates, on the number of qubits.
+        """
+        args: Tuple[Tuple[str, bytes], ...] = tuple(
+            (name, proto.args[name].SerializeToString(deterministic=True))
+            for name in sorted(proto.args)
+        )
+        return (
+            self.serialized_gate_id,
+            num_qubits if self.num_qubits_param is not None else None,
+            arg_function_language,
+            args,
+        )
+
+    def _op_from_gate(
+        self,
+        gate: 'cirq.Gate',
+        qubits: Sequence['cirq.Qid'],
+        proto: v2.program_pb2.Operation,
+        *,
+        constants: Optional[List[v2.program_pb2.Constant]] = None,
+    ) -> 'cirq.Operation':
         op = self.op_wrapper(gate.on(*qubits), proto)
         if self.deserialize_tokens:
             which = proto.WhichOneof('token')
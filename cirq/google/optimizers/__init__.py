@@ -15,8 +15,11 @@
 Package for optimizers and gate compilers related to Google-specific devices.
 """
 from cirq.google.optimizers.two_qubit_gates import (
+    cached_gate_product_tabulation,
     gate_product_tabulation,
     GateTabulation,
+    load_gate_tabulation,
+    save_gate_tabulation,
 )
 
 from cirq.google.optimizers.convert_to_sycamore_gates import (
@@ -12,14 +12,16 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 """A combination of several optimizations targeting XmonDevice."""
+import time
 from functools import lru_cache
-from typing import Callable, cast, List, Optional, TYPE_CHECKING
+from typing import Callable, cast, Dict, List, NamedTuple, Optional, Sequence, Tuple, TYPE_CHECKING
 
 import numpy as np
 
-from cirq import circuits, devices, optimizers, protocols
+from cirq import circuits, devices, ops, optimizers, protocols
 from cirq.google import ops as cg_ops
 from cirq.google.optimizers import (
+    cached_gate_product_tabulation,
     convert_to_xmon_gates,
     ConvertToSycamoreGates,
     ConvertToSqrtIswapGates,
@@ -31,62 +33,159 @@ if TYPE_CHECKING:
     import cirq
 
 
-def _get_common_cleanup_optimizers(tolerance: float) -> List[Callable[['cirq.Circuit'], None]]:
+class _OptimizationPass(NamedTuple):
+    """A named step of the optimization pipeline.
+
+    A pass either optimizes the whole circuit in place, or, if map_operation
+    is set, rewrites every operation on its own without looking at the rest
+    of the circuit. Consecutive passes of the latter kind are run together in
+    a single sweep over the circuit.
+    """
+
+    name: str
+    optimize_circuit: Optional[Callable[['cirq.Circuit'], None]] = None
+    map_operation: Optional[Callable[['cirq.Operation'], 'cirq.OP_TREE']] = None
+
+
+def _point_optimizer_pass(name: str, optimizer: circuits.PointOptimizer) -> _OptimizationPass:
+    """A pass running a point optimizer that only looks at one operation.
+
+    The optimizer must rewrite a gate the same way on any qubits. The rewrite
+    of each gate is only computed once, and moved onto the qubits of later
+    operations with the same gate.
+    """
+    rewrites: Dict['cirq.Gate', Tuple[Tuple['cirq.Qid', ...], Tuple['cirq.Operation', ...]]] = {}
+
+    def rewrite(op: 'cirq.Operation') -> Tuple['cirq.Operation', ...]:
+        opt = optimizer.optimization_at(circuits.Circuit(op), 0, op)
+        if opt is None:
+            return (op,)
+        new_operations = optimizer.post_clean_up(cast(Tuple[ops.Operation], opt.new_operations))
+        return tuple(ops.flatten_to_ops(new_operations))
+
+    def map_operation(op: 'cirq.Operation') -> 'cirq.OP_TREE':
+        if type(op) is not ops.GateOperation:
+            return rewrite(op)
+        gate = cast(ops.GateOperation, op).gate
+        try:
+            cached = rewrites.get(gate)
+        except TypeError:  # Unhashable gate.
+            return rewrite(op)
+        if cached is None:
+            new_operations = rewrite(op)
+            rewrites[gate] = (op.qubits, new_operations)
+            return new_operations
+        qubits, new_operations = cached
+        if qubits == op.qubits:
+            return new_operations
+        qubit_map = dict(zip(qubits, op.qubits))
+        return [
+            new_op.with_qubits(*(qubit_map[q] for q in new_op.qubits)) for new_op in new_operations
+        ]
+
+    return _OptimizationPass(name, map_operation=map_operation)
+
+
+def _drop_negligible_pass(tolerance: float) -> _OptimizationPass:
+    def map_operation(op: 'cirq.Operation') -> 'cirq.OP_TREE':
+        return [] if protocols.trace_distance_bound(op) <= tolerance else op
+
+    return _OptimizationPass('drop_negligible', map_operation=map_operation)
+
+
+def _get_common_cleanup_optimizers(tolerance: float) -> List[_OptimizationPass]:
     return [
-        optimizers.EjectPhasedPaulis(tolerance=tolerance).optimize_circuit,
-        optimizers.EjectZ(tolerance=tolerance).optimize_circuit,
-        optimizers.DropNegligible(tolerance=tolerance).optimize_circuit,
+        _OptimizationPass(
+            'eject_phased_paulis',
+            optimizers.EjectPhasedPaulis(tolerance=tolerance).optimize_circuit,
+        ),
+        _OptimizationPass('eject_z', optimizers.EjectZ(tolerance=tolerance).optimize_circuit),
+        _drop_negligible_pass(tolerance),
     ]
 
 
+def _merge_single_qubit_gates_pass(tolerance: float) -> _OptimizationPass:
+    return _OptimizationPass(
+        'merge_single_qubit_gates',
+        lambda c: optimizers.merge_single_qubit_gates_into_phxz(c, tolerance),
+    )
+
+
+def _convert_to_xmon_gates_pass() -> _OptimizationPass:
+    # MergeInteractions, which runs next, depends on how the converted
+    # operations are placed into moments, so this is not run as a local pass.
+    return _OptimizationPass(
+        'convert_to_xmon_gates', convert_to_xmon_gates.ConvertToXmonGates().optimize_circuit
+    )
+
+
 def _get_xmon_optimizers(
-    tolerance: float, tabulation: Optional[GateTabulation]
-) -> List[Callable[['cirq.Circuit'], None]]:
+    circuit: 'cirq.Circuit', tolerance: float, tabulation: Optional[GateTabulation]
+) -> List[_OptimizationPass]:
     if tabulation is not None:
         # coverage: ignore
         raise ValueError("Gate tabulation not supported for xmon")
 
     return [
-        convert_to_xmon_gates.ConvertToXmonGates().optimize_circuit,
-        optimizers.MergeInteractions(tolerance=tolerance, allow_partial_czs=False).optimize_circuit,
-        lambda c: optimizers.merge_single_qubit_gates_into_phxz(c, tolerance),
+        _convert_to_xmon_gates_pass(),
+        _OptimizationPass(
+            'merge_interactions',
+            optimizers.MergeInteractions(
+                tolerance=tolerance, allow_partial_czs=False
+            ).optimize_circuit,
+        ),
+        _merge_single_qubit_gates_pass(tolerance),
         *_get_common_cleanup_optimizers(tolerance=tolerance),
     ]
 
 
 def _get_xmon_optimizers_part_cz(
-    tolerance: float, tabulation: Optional[GateTabulation]
-) -> List[Callable[['cirq.Circuit'], None]]:
+    circuit: 'cirq.Circuit', tolerance: float, tabulation: Optional[GateTabulation]
+) -> List[_OptimizationPass]:
     if tabulation is not None:
         # coverage: ignore
         raise ValueError("Gate tabulation not supported for xmon")
     return [
-        convert_to_xmon_gates.ConvertToXmonGates().optimize_circuit,
-        optimizers.MergeInteractions(tolerance=tolerance, allow_partial_czs=True).optimize_circuit,
-        lambda c: optimizers.merge_single_qubit_gates_into_phxz(c, tolerance),
+        _convert_to_xmon_gates_pass(),
+        _OptimizationPass(
+            'merge_interactions',
+            optimizers.MergeInteractions(
+                tolerance=tolerance, allow_partial_czs=True
+            ).optimize_circuit,
+        ),
+        _merge_single_qubit_gates_pass(tolerance),
         *_get_common_cleanup_optimizers(tolerance=tolerance),
     ]
 
 
 def _get_sycamore_optimizers(
-    tolerance: float, tabulation: Optional[GateTabulation]
-) -> List[Callable[['cirq.Circuit'], None]]:
+    circuit: 'cirq.Circuit', tolerance: float, tabulation: Optional[GateTabulation]
+) -> List[_OptimizationPass]:
+    converter = ConvertToSycamoreGates(tabulation=tabulation)
+    # The converter merges a SWAP with a neighboring ZZPowGate, so it only
+    # looks at one operation at a time if there are no such gates.
+    if any(
+        isinstance(op.gate, ops.ZZPowGate) or op.gate == ops.SWAP for op in circuit.all_operations()
+    ):
+        convert = _OptimizationPass('convert_to_sycamore_gates', converter.optimize_circuit)
+    else:
+        convert = _point_optimizer_pass('convert_to_sycamore_gates', converter)
     return [
-        ConvertToSycamoreGates(tabulation=tabulation).optimize_circuit,
-        lambda c: optimizers.merge_single_qubit_gates_into_phxz(c, tolerance),
+        convert,
+        _merge_single_qubit_gates_pass(tolerance),
         *_get_common_cleanup_optimizers(tolerance=tolerance),
     ]
 
 
 def _get_sqrt_iswap_optimizers(
-    tolerance: float, tabulation: Optional[GateTabulation]
-) -> List[Callable[['cirq.Circuit'], None]]:
+    circuit: 'cirq.Circuit', tolerance: float, tabulation: Optional[GateTabulation]
+) -> List[_OptimizationPass]:
     if tabulation is not None:
         # coverage: ignore
         raise ValueError("Gate tabulation not supported for sqrt_iswap")
     return [
-        ConvertToSqrtIswapGates().optimize_circuit,
-        lambda c: optimizers.merge_single_qubit_gates_into_phxz(c, tolerance),
+        _point_optimizer_pass('convert_to_sqrt_iswap_gates', ConvertToSqrtIswapGates()),
+        _merge_single_qubit_gates_pass(tolerance),
         *_get_common_cleanup_optimizers(tolerance=tolerance),
     ]
 
@@ -99,14 +198,95 @@ _OPTIMIZER_TYPES = {
 }
 
 
+def _run_passes(
+    circuit: 'cirq.Circuit',
+    passes: Sequence[_OptimizationPass],
+    device: 'cirq.Device',
+    timings: Dict[str, float],
+) -> 'cirq.Circuit':
+    """Runs optimization passes, sweeping once over consecutive local passes.
+
+    Args:
+        circuit: The circuit to optimize. It may be mutated.
+        passes: The passes to run, in order.
+        device: The device of the returned circuit.
+        timings: Seconds spent in each pass are added to this dictionary,
+            keyed by the pass name. The time spent assembling circuits from
+            the output of local passes is added under 'build_circuit'.
+
+    Returns:
+        The optimized circuit, with its operations pushed to the earliest
+        possible moments.
+    """
+    i = 0
+    while i < len(passes):
+        if passes[i].map_operation is None:
+            start = time.perf_counter()
+            cast(Callable[['cirq.Circuit'], None], passes[i].optimize_circuit)(circuit)
+            _add_time(timings, passes[i].name, time.perf_counter() - start)
+            i += 1
+            continue
+        j = i
+        while j < len(passes) and passes[j].map_operation is not None:
+            j += 1
+        circuit = _sweep(circuit, passes[i:j], None if j < len(passes) else device, timings)
+        i = j
+    if not passes or passes[-1].map_operation is None:
+        circuit = _sweep(circuit, [], device, timings)
+    return circuit
+
+
+def _sweep(
+    circuit: 'cirq.Circuit',
+    passes: Sequence[_OptimizationPass],
+    device: Optional['cirq.Device'],
+    timings: Dict[str, float],
+) -> 'cirq.Circuit':
+    """Runs local passes on all operations of a circuit in one sweep."""
+    maps = [
+        (
+            optimization.name,
+            cast(Callable[['cirq.Operation'], 'cirq.OP_TREE'], optimization.map_operation),
+        )
+        for optimization in passes
+    ]
+    operations: List['cirq.Operation'] = []
+    for op in circuit.all_operations():
+        pending = [op]
+        for name, map_operation in maps:
+            start = time.perf_counter()
+            pending = [
+                new_op for old_op in pending for new_op in ops.flatten_to_ops(map_operation(old_op))
+            ]
+            _add_time(timings, name, time.perf_counter() - start)
+        operations.extend(pending)
+    start = time.perf_counter()
+    result = circuits.Circuit(
+        operations,
+        strategy=circuits.InsertStrategy.EARLIEST,
+        device=device or devices.UNCONSTRAINED_DEVICE,
+    )
+    _add_time(timings, 'build_circuit', time.perf_counter() - start)
+    return result
+
+
+def _add_time(timings: Dict[str, float], name: str, seconds: float) -> None:
+    timings[name] = timings.get(name, 0.0) + seconds
+
+
 @lru_cache()
 def _gate_product_tabulation_cached(
-    optimizer_type: str, tabulation_resolution: float
+    optimizer_type: str, tabulation_resolution: float, cache_dir: Optional[str] = None
 ) -> GateTabulation:
-    random_state = np.random.RandomState(51)
     if optimizer_type == 'sycamore':
+        if cache_dir is not None:
+            return cached_gate_product_tabulation(
+                protocols.unitary(cg_ops.SYC), tabulation_resolution, cache_dir=cache_dir, seed=51
+            )
         return gate_product_tabulation(
-            protocols.unitary(cg_ops.SYC), tabulation_resolution, random_state=random_state
+            protocols.unitary(cg_ops.SYC),
+            tabulation_resolution,
+            random_state=np.random.RandomState(51),
         )
     else:
         raise NotImplementedError(f"Gate tabulation not supported for {optimizer_type}")
@@ -120,6 +300,8 @@ def optimized_for_sycamore(
     optimizer_type: str = 'sqrt_iswap',
     tolerance: float = 1e-5,
     tabulation_resolution: Optional[float] = None,
+    tabulation_cache_dir: Optional[str] = None,
+    pass_timings: Optional[Dict[str, float]] = None,
 ) -> 'cirq.Circuit':
     """Optimizes a circuit for Google devices.
 
@@ -128,6 +310,11 @@ def optimized_for_sycamore(
     compress the gate depth down as much as is easily algorithmically possible
     by merging rotations, ejecting Z gates, etc.
 
+    Consecutive passes that rewrite each operation on its own, such as the
+    gate conversions (in the absence of SWAP and ZZ gates for 'sycamore'),
+    dropping negligible operations and mapping the qubits, run together in a
+    single sweep over the operations of the circuit.
+
     Args:
         circuit: The circuit to optimize.
         new_device: The device the optimized circuit should be targeted at. If
@@ -142,10 +329,14 @@ def optimized_for_sycamore(
             with the specified resolution and use it to approximately
             compile arbitrary two-qubit gates for which an analytic compilation
             is not known.
+        tabulation_cache_dir: If provided, the gateset tabulation is saved in
+            this directory, and loaded from it by later calls, including ones
+            in other processes, instead of being computed again.
+        pass_timings: If provided, the seconds spent in each optimization pass
+            are added to this dictionary, keyed by the name of the pass.
     Returns:
         The optimized circuit.
     """
-    copy = circuit.copy()
     if optimizer_type not in _OPTIMIZER_TYPES:
         raise ValueError(
             f'{optimizer_type} is not an allowed type.  Allowed '
@@ -154,14 +345,17 @@ def optimized_for_sycamore(
 
     tabulation: Optional[GateTabulation] = None
     if tabulation_resolution is not None:
-        tabulation = _gate_product_tabulation_cached(optimizer_type, tabulation_resolution)
-
-    opts = _OPTIMIZER_TYPES[optimizer_type](tolerance=tolerance, tabulation=tabulation)
-    for optimizer in opts:
-        optimizer(copy)
+        tabulation = _gate_product_tabulation_cached(
+            optimizer_type, tabulation_resolution, tabulation_cache_dir
+        )
 
-    return circuits.Circuit(
-        (op.transform_qubits(qubit_map) for op in copy.all_operations()),
-        strategy=circuits.InsertStrategy.EARLIEST,
-        device=new_device or copy.device,
+    passes = _OPTIMIZER_TYPES[optimizer_type](circuit, tolerance=tolerance, tabulation=tabulation)
+    passes.append(
+        _OptimizationPass('map_qubits', map_operation=lambda op: op.transform_qubits(qubit_map))
+    )
+    return _run_passes(
+        circuit.copy(),
+        passes,
+        new_device or circuit.device,
+        {} if pass_timings is None else pass_timings,
     )
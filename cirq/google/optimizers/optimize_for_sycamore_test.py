@@ -17,6 +17,7 @@ import pytest
 
 import cirq
 import cirq.google as cg
+from cirq.google.optimizers import optimize_for_sycamore
 
 
 @pytest.mark.parametrize(
@@ -67,6 +68,26 @@ def test_tabulation():
     assert len(circuit3) == 7
 
 
+def test_tabulation_cache_dir(tmp_path):
+    q0, q1 = cirq.LineQubit.range(2)
+    u = cirq.testing.random_special_unitary(4, random_state=np.random.RandomState(52))
+    circuit = cirq.Circuit(cirq.MatrixGate(u).on(q0, q1))
+
+    circuit2 = cg.optimized_for_sycamore(
+        circuit, optimizer_type='sycamore', tabulation_resolution=0.1
+    )
+    circuit3 = cg.optimized_for_sycamore(
+        circuit,
+        optimizer_type='sycamore',
+        tabulation_resolution=0.1,
+        tabulation_cache_dir=str(tmp_path),
+    )
+    assert len(list(tmp_path.iterdir())) == 1
+    cirq.testing.assert_allclose_up_to_global_phase(
+        cirq.unitary(circuit2), cirq.unitary(circuit3), atol=1e-8
+    )
+
+
 def test_no_tabulation():
     circuit = cirq.Circuit(cirq.X(cirq.LineQubit(0)))
     with pytest.raises(NotImplementedError):
@@ -101,3 +122,99 @@ def test_one_q_matrix_gate():
             assert cg.SYC_GATESET.is_supported_operation(op)
             # single qubit gates shared between gatesets, so:
             assert cg.SQRT_ISWAP_GATESET.is_supported_operation(op)
+
+
+@pytest.mark.parametrize('optimizer_type', ['sqrt_iswap', 'sycamore', 'xmon', 'xmon_partial_cz'])
+def test_pass_timings(optimizer_type):
+    q0, q1 = cirq.LineQubit.range(2)
+    circuit = cirq.Circuit(
+        cirq.CZ(q0, q1), cirq.X(q0) ** 0.2, cirq.Z(q1) ** 0.2, cirq.measure(q0, q1, key='m')
+    )
+    timings = {}
+    cg.optimized_for_sycamore(circuit, optimizer_type=optimizer_type, pass_timings=timings)
+
+    assert {'merge_single_qubit_gates', 'eject_z', 'drop_negligible', 'map_qubits'} <= set(timings)
+    assert all(seconds >= 0 for seconds in timings.values())
+
+
+@pytest.mark.parametrize('with_swap_zz', [False, True])
+def test_sycamore_conversion_with_and_without_swap_zz(with_swap_zz):
+    qubits = cirq.GridQubit.rect(2, 3)
+    circuit = cirq.Circuit(
+        [cirq.ISWAP(a, b) ** 0.3 for a, b in zip(qubits, qubits[1:])],
+        [cirq.X(q) ** 0.25 for q in qubits],
+        [cirq.ISWAP(b, a) ** 0.3 for a, b in zip(qubits, qubits[1:])],
+    )
+    if with_swap_zz:
+        circuit.append([cirq.SWAP(qubits[0], qubits[1]), cirq.ZZ(qubits[0], qubits[1]) ** 0.5])
+
+    optimized = cg.optimized_for_sycamore(circuit, optimizer_type='sycamore')
+
+    for op in optimized.all_operations():
+        assert cg.SYC_GATESET.is_supported_operation(op)
+    cirq.testing.assert_allclose_up_to_global_phase(
+        cirq.unitary(circuit), cirq.unitary(optimized), atol=1e-6
+    )
+    # The SWAP and ZZ gates are merged into fewer Sycamore gates.
+    num_syc = sum(op.gate == cg.SYC for op in optimized.all_operations())
+    assert num_syc == 40 + (3 if with_swap_zz else 0)
+
+
+def test_point_optimizer_pass_reuses_rewrites():
+    class CountingConverter(cg.ConvertToSycamoreGates):
+        num_calls = 0
+
+        def optimization_at(self, circuit, index, op):
+            CountingConverter.num_calls += 1
+            return super().optimization_at(circuit, index, op)
+
+    class UnhashableCZ(cirq.TwoQubitGate):
+        __hash__ = None
+
+        def _unitary_(self):
+            return cirq.unitary(cirq.CZ)
+
+    optimization = optimize_for_sycamore._point_optimizer_pass('convert', CountingConverter())
+    a, b, c = cirq.LineQubit.range(3)
+    operations = [
+        cirq.CZ(a, b),
+        cirq.CZ(b, c),
+        cirq.CZ(a, b),
+        cirq.CZ(c, a) ** 0.5,
+        cirq.CZ(a, b).with_tags('tag'),
+        UnhashableCZ().on(a, b),
+        UnhashableCZ().on(a, b),
+    ]
+
+    rewrites = [list(cirq.flatten_to_ops(optimization.map_operation(op))) for op in operations]
+
+    # Tagged operations and unhashable gates are rewritten each time.
+    assert CountingConverter.num_calls == 5
+    for op, rewrite in zip(operations, rewrites):
+        assert set(q for new_op in rewrite for q in new_op.qubits) == set(op.qubits)
+        cirq.testing.assert_allclose_up_to_global_phase(
+            cirq.unitary(cirq.Circuit(rewrite)),
+            cirq.unitary(cirq.Circuit(op)),
+            atol=1e-8,
+        )
+    assert rewrites[2] == rewrites[0]
+
+
+def test_run_passes_ending_with_global_pass():
+    q0, q1 = cirq.LineQubit.range(2)
+    circuit = cirq.Circuit(cirq.X(q0), cirq.Moment(), cirq.CZ(q0, q1))
+    timings = {}
+
+    def reverse(c):
+        c[:] = c[::-1]
+
+    passes = [
+        optimize_for_sycamore._OptimizationPass(
+            'drop_x', map_operation=lambda op: [] if op.gate == cirq.X else op
+        ),
+        optimize_for_sycamore._OptimizationPass('reverse', optimize_circuit=reverse),
+    ]
+    result = optimize_for_sycamore._run_passes(circuit, passes, cirq.UNCONSTRAINED_DEVICE, timings)
+
+    assert result == cirq.Circuit(cirq.CZ(q0, q1))
+    assert set(timings) == {'drop_x', 'reverse', 'build_circuit'}
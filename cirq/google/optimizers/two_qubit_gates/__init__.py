@@ -2,3 +2,9 @@ from cirq.google.optimizers.two_qubit_gates.gate_compilation import (
     gate_product_tabulation,
     GateTabulation,
 )
+
+from cirq.google.optimizers.two_qubit_gates.tabulation_cache import (
+    cached_gate_product_tabulation,
+    load_gate_tabulation,
+    save_gate_tabulation,
+)
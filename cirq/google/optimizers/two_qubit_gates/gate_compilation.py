@@ -1,9 +1,11 @@
 """Attempt to tabulate single qubit gates required to generate a target 2Q gate
 with a product A k A."""
+import concurrent.futures
+import functools
 from functools import reduce
-from typing import Tuple, Sequence, List, NamedTuple, TYPE_CHECKING
+from typing import Any, Tuple, Sequence, List, NamedTuple, Optional, TYPE_CHECKING
 
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 import numpy as np
 from cirq._compat import proper_repr, proper_eq
 
@@ -67,6 +69,38 @@ class GateTabulation:
     # Any KAK vectors which are expected to be compilable (within infidelity
     # max_expected_infidelity) using 2 or 3 base gates.
     missed_points: Tuple[np.ndarray, ...]
+    # Spatial index of kak_vecs, built on first use.
+    _kak_index: Any = field(default=None, init=False, repr=False, compare=False)
+
+    def _nearest_kak_vecs(self, kak_vecs: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        """Finds the closest tabulated KAK vectors to the given ones.
+
+        Closeness is measured by `kak_vector_infidelity`, which for nearby
+        vectors grows like their squared Euclidean distance. So only the
+        Euclidean nearest neighbors of each vector, found with a KD-tree, are
+        compared.
+
+        Args:
+            kak_vecs: KAK vectors with shape (N, 3).
+
+        Returns:
+            The indices into self.kak_vecs of the closest tabulated vectors,
+            and the infidelities between them and the given vectors.
+        """
+        if self._kak_index is None:
+            from scipy import spatial
+
+            self._kak_index = spatial.cKDTree(np.real(self.kak_vecs))
+        k = min(_NUM_NEAREST_CANDIDATES, len(self.kak_vecs))
+        _, candidates = self._kak_index.query(kak_vecs, k=k)
+        # Sorted, so that ties are broken in favor of the first tabulated vector.
+        candidates = np.sort(np.reshape(candidates, (len(kak_vecs), k)), axis=1)
+        infidelities = kak_vector_infidelity(
+            kak_vecs[:, np.newaxis, :], self.kak_vecs[candidates], ignore_equivalent_vectors=True
+        )
+        nearest = infidelities.argmin(axis=1)
+        rows = np.arange(len(kak_vecs))
+        return candidates[rows, nearest], infidelities[rows, nearest]
 
     def compile_two_qubit_gate(self, unitary: np.ndarray) -> TwoQubitGateCompilation:
         r"""Compute single qubit gates required to compile a desired unitary.
@@ -87,29 +121,88 @@ class GateTabulation:
         """
         unitary = np.asarray(unitary)
         kak_vec = linalg.kak_vector(unitary, check_preconditions=False)
-        infidelities = kak_vector_infidelity(kak_vec, self.kak_vecs, ignore_equivalent_vectors=True)
-        nearest_ind = infidelities.argmin()
+        nearest, infidelities = self._nearest_kak_vecs(kak_vec[np.newaxis])
+        nearest_ind = nearest[0]
+
+        success = infidelities[0] < self.max_expected_infidelity
+
+        inner_product = self._inner_product(nearest_ind)
+        kR, kL, actual = _outer_locals_for_unitary(unitary, inner_product)
+        return self._compilation(unitary, nearest_ind, kR, kL, actual, success)
+
+    def compile_two_qubit_gates(
+        self, unitaries: Sequence[np.ndarray]
+    ) -> List[TwoQubitGateCompilation]:
+        """Computes the single qubit gates required to compile many unitaries.
 
-        success = infidelities[nearest_ind] < self.max_expected_infidelity
+        Gives the same kind of result as calling `compile_two_qubit_gate` on
+        each of the unitaries, but finds their KAK vectors, the closest
+        tabulated products and their KAK decompositions for all of them at
+        once.
 
+        Args:
+            unitaries: The unitaries to compile, as a sequence of 4x4 arrays or
+                an array of shape (N, 4, 4).
+
+        Returns:
+            A TwoQubitGateCompilation for each of the unitaries.
+        """
+        unitaries = np.asarray(unitaries)
+        if len(unitaries) == 0:
+            return []
+        kak_vecs = linalg.kak_vector(unitaries, check_preconditions=False)
+        nearest, infidelities = self._nearest_kak_vecs(kak_vecs)
+
+        # Each distinct inner product only needs to be decomposed once.
+        inner_inds, inner_of_target = np.unique(nearest, return_inverse=True)
+        inner_products = [self._inner_product(ind) for ind in inner_inds]
+        inner_decomps = linalg.kak_decomposition_batch(inner_products, check_preconditions=False)
+        target_decomps = linalg.kak_decomposition_batch(unitaries, check_preconditions=False)
+
+        compilations = []
+        for i, unitary in enumerate(unitaries):
+            j = inner_of_target[i]
+            kR, kL, actual = _outer_locals_for_decompositions(
+                target_decomps[i], inner_decomps[j], inner_products[j]
+            )
+            compilations.append(
+                self._compilation(
+                    unitary,
+                    nearest[i],
+                    kR,
+                    kL,
+                    actual,
+                    infidelities[i] < self.max_expected_infidelity,
+                )
+            )
+        return compilations
+
+    def _inner_product(self, ind: int) -> np.ndarray:
+        """The product of base gates and tabulated 1-local unitaries at ind."""
         # shape (n,2,2,2)
-        inner_gates = np.array(self.single_qubit_gates[nearest_ind])
+        inner_gates = np.array(self.single_qubit_gates[ind])
 
         if inner_gates.size == 0:  # Only need base gate
-            kR, kL, actual = _outer_locals_for_unitary(unitary, self.base_gate)
-            return TwoQubitGateCompilation(self.base_gate, unitary, (kR, kL), actual, success)
+            return self.base_gate
 
         # reshape to operators on 2 qubits, (n,4,4)
         inner_gates = vector_kron(inner_gates[..., 0, :, :], inner_gates[..., 1, :, :])
 
         assert inner_gates.ndim == 3
-        inner_product = reduce(lambda a, b: self.base_gate @ b @ a, inner_gates, self.base_gate)
-        kR, kL, actual = _outer_locals_for_unitary(unitary, inner_product)
-
+        return reduce(lambda a, b: self.base_gate @ b @ a, inner_gates, self.base_gate)
+
+    def _compilation(
+        self,
+        unitary: np.ndarray,
+        ind: int,
+        kR: _SingleQubitGatePair,
+        kL: _SingleQubitGatePair,
+        actual: np.ndarray,
+        success: bool,
+    ) -> TwoQubitGateCompilation:
         out = [kR]
-        out.extend(self.single_qubit_gates[nearest_ind])
+        out.extend(self.single_qubit_gates[ind])
         out.append(kL)
-
         return TwoQubitGateCompilation(self.base_gate, unitary, tuple(out), actual, success)
 
     def _json_dict_(self):
@@ -207,7 +300,13 @@ def _outer_locals_for_unitary(
     """
     target_decomp = linalg.kak_decomposition(target)
     base_decomp = linalg.kak_decomposition(base)
+    return _outer_locals_for_decompositions(target_decomp, base_decomp, base)
+
 
+def _outer_locals_for_decompositions(
+    target_decomp: 'cirq.KakDecomposition', base_decomp: 'cirq.KakDecomposition', base: np.ndarray
+) -> Tuple[_SingleQubitGatePair, _SingleQubitGatePair, np.ndarray]:
+    """Like `_outer_locals_for_unitary`, given the KAK decompositions."""
     # From the KAK decomposition, we have
     # kLt At kRt = kL kLb Ab KRb kR
     # If At=Ab, we can solve for kL and kR as
@@ -230,6 +329,62 @@ def _outer_locals_for_unitary(
     return kR, kL, actual
 
 
+# Number of Euclidean nearest neighbors among which GateTabulation looks for
+# the tabulated KAK vector with the smallest infidelity.
+_NUM_NEAREST_CANDIDATES = 8
+
+# Number of gate products per task when tabulating with an executor.
+_PARALLEL_CHUNK_SIZE = 4096
+
+
+def _product_kak_vectors(base_gate: np.ndarray, local_cycles: np.ndarray) -> np.ndarray:
+    """KAK vectors of products of a base gate interleaved with local unitaries.
+
+    Args:
+        base_gate: The base 2 qubit gate used in the gate product.
+        local_cycles: The 2-local unitaries between the base gates, with shape
+            (num_cycles, N, 4, 4).
+
+    Returns:
+        The KAK vectors of the N products
+        base_gate @ local_cycles[-1, i] @ ... @ base_gate @ local_cycles[0, i] @ base_gate.
+    """
+    prods = np.einsum('ab,...bc,cd', base_gate, local_cycles[0], base_gate)
+    for local_cycle in local_cycles[1:]:
+        np.einsum('ab,...bc,...cd', base_gate, local_cycle, prods, out=prods)
+    return linalg.kak_vector(prods, check_preconditions=False)
+
+
+def _kak_vectors(
+    unitaries: np.ndarray, executor: Optional[concurrent.futures.Executor]
+) -> np.ndarray:
+    """KAK vectors of unitaries of shape (N, 4, 4), split into chunks run by the executor."""
+    if executor is None or len(unitaries) <= _PARALLEL_CHUNK_SIZE:
+        return linalg.kak_vector(unitaries, check_preconditions=False)
+    chunks = [
+        unitaries[start : start + _PARALLEL_CHUNK_SIZE]
+        for start in range(0, len(unitaries), _PARALLEL_CHUNK_SIZE)
+    ]
+    kak_vector = functools.partial(linalg.kak_vector, check_preconditions=False)
+    return np.concatenate(list(executor.map(kak_vector, chunks)))
+
+
+def _kak_vectors_of_products(
+    base_gate: np.ndarray,
+    local_cycles: np.ndarray,
+    executor: Optional[concurrent.futures.Executor],
+) -> np.ndarray:
+    """Like `_product_kak_vectors`, split into chunks run by the executor."""
+    num_products = local_cycles.shape[1]
+    if executor is None or num_products <= _PARALLEL_CHUNK_SIZE:
+        return _product_kak_vectors(base_gate, local_cycles)
+    starts = range(0, num_products, _PARALLEL_CHUNK_SIZE)
+    chunks = [local_cycles[:, start : start + _PARALLEL_CHUNK_SIZE] for start in starts]
+    return np.concatenate(
+        list(executor.map(_product_kak_vectors, [base_gate] * len(chunks), chunks))
+    )
+
+
 class _TabulationStepResult(NamedTuple):
     # Generated KAK vectors that are uniquely close to at least one mesh point.
     kept_kaks: List[np.ndarray]
@@ -245,6 +400,7 @@ def _tabulate_kak_vectors(
     max_dist: float,
     kak_mesh: np.ndarray,
     local_unitary_pairs: Sequence[_SingleQubitGatePair],
+    executor: Optional[concurrent.futures.Executor] = None,
 ) -> _TabulationStepResult:
     """Tabulate KAK vectors from products of local unitaries with a base gate.
 
@@ -258,6 +414,8 @@ def _tabulate_kak_vectors(
             nearest neighbor distance is about 2*max_error.
         local_unitary_pairs: Sequence of 2-tuples of single qubit unitary
             tensors, each of shape (N,2,2).
+        executor: If given, the gate products are computed in chunks submitted
+            to this executor.
 
     Returns:
         The newly tabulated KAK vectors and the local unitaries used to generate
@@ -272,29 +430,34 @@ def _tabulate_kak_vectors(
     # Generate products
     local_cycles = np.array([vector_kron(*pairs) for pairs in local_unitary_pairs])
 
-    prods = np.einsum('ab,...bc,cd', base_gate, local_cycles[0], base_gate)
-    for local_cycle in local_cycles[1:]:
-        np.einsum('ab,...bc,...cd', base_gate, local_cycle, prods, out=prods)
-
-    kak_vectors = linalg.kak_vector(prods, check_preconditions=False)
+    kak_vectors = _kak_vectors_of_products(base_gate, local_cycles, executor)
 
-    kept_kaks = []
-    kept_cycles = []
+    # The L2 distance is an upper bound to the locally invariant distance,
+    # but it's much faster to compute. Mesh points are about 2*max_dist apart,
+    # so looking up the two nearest ones is enough to find all close ones.
+    from scipy import spatial
 
-    for ind, vec in enumerate(kak_vectors):
-        # The L2 distance is an upper bound to the locally invariant distance,
-        # but it's much faster to compute.
-        dists = np.sqrt(np.sum((kak_mesh - vec) ** 2, axis=-1))
-        close = (dists < max_dist).nonzero()[0]
-        assert close.shape[0] in (0, 1), f'close.shape: {close.shape}'
-        cycles_for_gate = tuple((k_0[ind], k_1[ind]) for k_0, k_1 in local_unitary_pairs)
-
-        # Add the vector and its cycles to the tabulation if it's not already
-        # tabulated.
-        if not np.all(already_tabulated[close]):
-            already_tabulated[close] = True
-            kept_kaks.append(vec)
-            kept_cycles.append(cycles_for_gate)
+    all_dists, all_close = spatial.cKDTree(kak_mesh).query(
+        kak_vectors, k=min(2, len(kak_mesh)), distance_upper_bound=max_dist
+    )
+    all_dists = np.reshape(all_dists, (len(kak_vectors), -1))
+    all_close = np.reshape(all_close, (len(kak_vectors), -1))
+    is_close = all_dists < max_dist
+    assert np.all(is_close.sum(axis=1) <= 1), 'A vector is close to several mesh points.'
+
+    # Each mesh point that was not already tabulated gets the first of the
+    # vectors close to it.
+    close_inds = is_close.any(axis=1).nonzero()[0]
+    close_points = all_close[close_inds, is_close[close_inds].argmax(axis=1)]
+    points, first = np.unique(close_points, return_index=True)
+    new = np.logical_not(already_tabulated[points])
+    already_tabulated[points[new]] = True
+    kept_inds = np.sort(close_inds[first[new]])
+
+    kept_kaks = list(kak_vectors[kept_inds])
+    kept_cycles = [
+        tuple((k_0[ind], k_1[ind]) for k_0, k_1 in local_unitary_pairs) for ind in kept_inds
+    ]
 
     return _TabulationStepResult(kept_kaks, kept_cycles)
 
@@ -306,6 +469,7 @@ def gate_product_tabulation(
     sample_scaling: int = 50,
     allow_missed_points: bool = True,
     random_state: 'cirq.RANDOM_STATE_OR_SEED_LIKE' = None,
+    executor: Optional[concurrent.futures.Executor] = None,
 ) -> GateTabulation:
     r"""Generate a GateTabulation for a base two qubit unitary.
 
@@ -323,6 +487,10 @@ def gate_product_tabulation(
             even if not all points in the Weyl chamber are expected to be
             compilable using 2 or 3 base gates. Otherwise an error is raised
             in this case.
+        executor: If given, the KAK vectors of the sampled gate products are
+            computed in chunks submitted to this executor, e.g. a
+            `concurrent.futures.ProcessPoolExecutor`. The result does not
+            depend on whether or how the work is split.
 
     Returns:
         A GateTabulation object used to compile new two-qubit gates from
@@ -358,6 +526,7 @@ def gate_product_tabulation(
         max_dist=tabulation_cutoff,
         kak_mesh=mesh_points,
         local_unitary_pairs=[(u_locals_0, u_locals_1)],
+        executor=executor,
     )
     kak_vecs.extend(out.kept_kaks)
     sq_cycles.extend(out.kept_cycles)
@@ -379,6 +548,7 @@ def gate_product_tabulation(
         max_dist=tabulation_cutoff,
         kak_mesh=mesh_points,
         local_unitary_pairs=[(u_locals_0, u_locals_1)] * 2,
+        executor=executor,
     )
 
     kak_vecs.extend(out.kept_kaks)
@@ -418,16 +588,15 @@ def gate_product_tabulation(
     #    KAK vector.
     missed_points = []
     base_gate_dag = base_gate.conj().T
-    for ind in missing_vec_inds:
+    # Unitaries A we wish to solve for
+    missing_unitaries = kak_vector_to_unitary(mesh_points[missing_vec_inds])
+    # Products of the from base_gate^\dagger k A
+    all_products = np.einsum('ab,...bc,jcd->j...ad', base_gate_dag, u_locals, missing_unitaries)
+    # KAK vectors for these products
+    all_kaks = _kak_vectors(all_products.reshape(-1, 4, 4), executor)
+    all_kaks = all_kaks.reshape(all_products.shape[:2] + (1, 3))
+    for ind, products, kaks in zip(missing_vec_inds, all_products, all_kaks):
         missing_vec = mesh_points[ind]
-        # Unitary A we wish to solve for
-        missing_unitary = kak_vector_to_unitary(missing_vec)
-
-        # Products of the from base_gate^\dagger k A
-        products = np.einsum('ab,...bc,cd', base_gate_dag, u_locals, missing_unitary)
-        # KAK vectors for these products
-        kaks = linalg.kak_vector(products, check_preconditions=False)
-        kaks = kaks[..., np.newaxis, :]
 
         # Check if any of the product KAK vectors are close to a previously
         # tabulated KAK vector
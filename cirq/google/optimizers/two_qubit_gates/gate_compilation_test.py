@@ -1,13 +1,19 @@
 """Tests for gate_compilation.py"""
+import concurrent.futures
+
 import numpy as np
 import pytest
 
-from cirq import unitary, FSimGate, value
+from cirq import linalg, unitary, FSimGate, value
+from cirq.google.optimizers.two_qubit_gates import gate_compilation
 from cirq.google.optimizers.two_qubit_gates.gate_compilation import (
     gate_product_tabulation,
     GateTabulation,
 )
-from cirq.google.optimizers.two_qubit_gates.math_utils import unitary_entanglement_fidelity
+from cirq.google.optimizers.two_qubit_gates.math_utils import (
+    kak_vector_infidelity,
+    unitary_entanglement_fidelity,
+)
 from cirq.testing import random_special_unitary, assert_equivalent_repr
 
 _rng = value.parse_random_state(11)  # for determinism
@@ -88,3 +94,46 @@ def test_sycamore_gate_tabulation_eq():
     assert sycamore_tabulation == sycamore_tabulation
     assert sycamore_tabulation != sqrt_iswap_tabulation
     assert sycamore_tabulation != 1
+
+
+@pytest.mark.parametrize('tabulation', [sycamore_tabulation, sqrt_iswap_tabulation])
+def test_gate_compilation_finds_nearest_tabulated_vector(tabulation):
+    kak_vecs = linalg.kak_vector(_random_2Q_unitaries)
+    nearest, infidelities = tabulation._nearest_kak_vecs(kak_vecs)
+
+    for kak_vec, ind, infidelity in zip(kak_vecs, nearest, infidelities):
+        expected = kak_vector_infidelity(
+            kak_vec, tabulation.kak_vecs, ignore_equivalent_vectors=True
+        )
+        assert infidelity == expected[ind]
+        assert infidelity < expected.min() + 1e-3
+
+
+@pytest.mark.parametrize('tabulation', [sycamore_tabulation, sqrt_iswap_tabulation])
+def test_gate_compilation_batch(tabulation):
+    targets = np.concatenate([_random_2Q_unitaries[:20], [tabulation.base_gate]])
+
+    results = tabulation.compile_two_qubit_gates(targets)
+
+    assert len(results) == len(targets)
+    for target, result in zip(targets, results):
+        expected = tabulation.compile_two_qubit_gate(target)
+        assert result.success == expected.success
+        assert len(result.local_unitaries) == len(expected.local_unitaries)
+        np.testing.assert_allclose(result.target_gate, target)
+        max_error = tabulation.max_expected_infidelity
+        assert 1 - unitary_entanglement_fidelity(target, result.actual_gate) < max_error
+    assert tabulation.compile_two_qubit_gates([]) == []
+
+
+def test_gate_product_tabulation_with_executor(monkeypatch):
+    base_gate = unitary(FSimGate(np.pi / 2, np.pi / 6))
+    expected = gate_product_tabulation(base_gate, 0.1, random_state=np.random.RandomState(3))
+
+    monkeypatch.setattr(gate_compilation, '_PARALLEL_CHUNK_SIZE', 100)
+    with concurrent.futures.ThreadPoolExecutor(max_workers=2) as executor:
+        tabulation = gate_product_tabulation(
+            base_gate, 0.1, random_state=np.random.RandomState(3), executor=executor
+        )
+
+    assert tabulation == expected
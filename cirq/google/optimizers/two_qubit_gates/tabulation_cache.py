@@ -0,0 +1,209 @@
+# Copyright 2021 The Cirq Developers
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Storing gate product tabulations on disk, so they are only generated once.
+
+A tabulation is saved as a directory of NumPy `.npy` files, which can be
+memory-mapped when loaded, and a small JSON file with the remaining fields and
+the version of the format.
+"""
+
+import concurrent.futures
+import hashlib
+import json
+import os
+import shutil
+import tempfile
+from typing import Optional
+
+import numpy as np
+
+from cirq.google.optimizers.two_qubit_gates.gate_compilation import (
+    gate_product_tabulation,
+    GateTabulation,
+)
+
+# Version of the layout of saved tabulations. Increase it whenever the layout
+# or the way tabulations are generated changes.
+_FORMAT_VERSION = 1
+_METADATA_FILE = 'metadata.json'
+
+
+def save_gate_tabulation(tabulation: GateTabulation, path: str) -> None:
+    """Saves a gate tabulation to a directory.
+
+    Args:
+        tabulation: The tabulation to save.
+        path: The directory to save the tabulation in. It is created if it does
+            not exist, and files of a previously saved tabulation in it are
+            overwritten.
+    """
+    num_gates = np.array([len(cycle) for cycle in tabulation.single_qubit_gates], dtype=np.int64)
+    single_qubit_gates = np.zeros(
+        (len(num_gates), max(num_gates, default=0), 2, 2, 2), dtype=np.complex128
+    )
+    for i, cycle in enumerate(tabulation.single_qubit_gates):
+        for j, pair in enumerate(cycle):
+            single_qubit_gates[i, j] = pair
+
+    os.makedirs(path, exist_ok=True)
+    np.save(os.path.join(path, 'base_gate.npy'), tabulation.base_gate)
+    np.save(os.path.join(path, 'kak_vecs.npy'), tabulation.kak_vecs)
+    np.save(os.path.join(path, 'single_qubit_gates.npy'), single_qubit_gates)
+    np.save(os.path.join(path, 'num_single_qubit_gates.npy'), num_gates)
+    np.save(
+        os.path.join(path, 'missed_points.npy'),
+        np.reshape(np.array(tabulation.missed_points, dtype=np.float64), (-1, 3)),
+    )
+    metadata = {
+        'version': _FORMAT_VERSION,
+        'max_expected_infidelity': tabulation.max_expected_infidelity,
+        'summary': tabulation.summary,
+    }
+    with open(os.path.join(path, _METADATA_FILE), 'w') as f:
+        json.dump(metadata, f)
+
+
+def load_gate_tabulation(path: str, *, mmap_mode: Optional[str] = 'r') -> GateTabulation:
+    """Loads a gate tabulation saved with `save_gate_tabulation`.
+
+    Args:
+        path: The directory the tabulation was saved in.
+        mmap_mode: How to memory-map the large arrays of the tabulation, as
+            for `numpy.load`. By default they are mapped read-only, so that
+            loading is fast and processes share the memory. If None, the
+            arrays are read into memory.
+
+    Returns:
+        The loaded tabulation.
+
+    Raises:
+        ValueError: If the tabulation was saved in a different format version.
+    """
+    with open(os.path.join(path, _METADATA_FILE)) as f:
+        metadata = json.load(f)
+    if metadata.get('version') != _FORMAT_VERSION:
+        raise ValueError(
+            f'Gate tabulation in {path!r} has format version {metadata.get("version")!r}, '
+            f'expected {_FORMAT_VERSION}.'
+        )
+
+    def load(name: str, mmap: bool = False) -> np.ndarray:
+        return np.load(
+            os.path.join(path, f'{name}.npy'),
+            mmap_mode=mmap_mode if mmap else None,
+            allow_pickle=False,
+        )
+
+    # Plain ndarray views of the mapped memory, like the gates of a generated
+    # tabulation.
+    gates = np.asarray(load('single_qubit_gates', mmap=True))
+    num_gates = load('num_single_qubit_gates')
+    single_qubit_gates = [
+        tuple((gates[i, j, 0], gates[i, j, 1]) for j in range(n)) for i, n in enumerate(num_gates)
+    ]
+    return GateTabulation(
+        base_gate=load('base_gate'),
+        kak_vecs=load('kak_vecs', mmap=True),
+        single_qubit_gates=single_qubit_gates,
+        max_expected_infidelity=metadata['max_expected_infidelity'],
+        summary=metadata['summary'],
+        missed_points=tuple(load('missed_points')),
+    )
+
+
+def cached_gate_product_tabulation(
+    base_gate: np.ndarray,
+    max_infidelity: float,
+    *,
+    cache_dir: str,
+    sample_scaling: int = 50,
+    allow_missed_points: bool = True,
+    seed: int = 0,
+    executor: Optional[concurrent.futures.Executor] = None,
+) -> GateTabulation:
+    """Loads a gate product tabulation from a cache directory, or generates it.
+
+    The first call for some arguments generates the tabulation with
+    `cirq.google.optimizers.gate_product_tabulation` and saves it in
+    `cache_dir`. Later calls, from any process, load the saved tabulation.
+    Several processes may generate the same tabulation at the same time; the
+    first one to finish saves it.
+
+    Args:
+        base_gate: The base gate of the tabulation.
+        max_infidelity: Sets the desired density of tabulated product unitaries.
+        cache_dir: The directory the tabulations are saved in. It is created
+            if it does not exist.
+        sample_scaling: Relative number of random gate products to use in the
+            tabulation.
+        allow_missed_points: If False, an error is raised if some points in
+            the Weyl chamber are not expected to be compilable.
+        seed: Seed of the random gate products.
+        executor: Used to parallelize generating the tabulation, see
+            `gate_product_tabulation`.
+
+    Returns:
+        The tabulation.
+    """
+    path = os.path.join(
+        cache_dir,
+        _cache_key(base_gate, max_infidelity, sample_scaling, allow_missed_points, seed),
+    )
+    if _is_saved(path):
+        return load_gate_tabulation(path)
+
+    tabulation = gate_product_tabulation(
+        base_gate,
+        max_infidelity,
+        sample_scaling=sample_scaling,
+        allow_missed_points=allow_missed_points,
+        random_state=np.random.RandomState(seed),
+        executor=executor,
+    )
+    os.makedirs(cache_dir, exist_ok=True)
+    # Save into a fresh directory and move it into place when complete, so
+    # other processes never see a partially saved tabulation.
+    tmp_path = tempfile.mkdtemp(dir=cache_dir, prefix='.tmp_')
+    try:
+        save_gate_tabulation(tabulation, tmp_path)
+        os.rename(tmp_path, path)
+    except OSError:
+        # Another process saved the tabulation first.
+        shutil.rmtree(tmp_path, ignore_errors=True)
+        if not _is_saved(path):
+            raise
+    return tabulation
+
+
+def _is_saved(path: str) -> bool:
+    return os.path.exists(os.path.join(path, _METADATA_FILE))
+
+
+def _cache_key(
+    base_gate: np.ndarray,
+    max_infidelity: float,
+    sample_scaling: int,
+    allow_missed_points: bool,
+    seed: int,
+) -> str:
+    digest = hashlib.sha256()
+    # Adding zero turns negative zeros into positive ones.
+    gate = np.round(np.asarray(base_gate, dtype=np.complex128), 12) + 0.0
+    digest.update(gate.tobytes())
+    digest.update(
+        repr(
+            (_FORMAT_VERSION, float(max_infidelity), sample_scaling, allow_missed_points, seed)
+        ).encode()
+    )
+    return f'gate_tabulation_{digest.hexdigest()[:32]}'
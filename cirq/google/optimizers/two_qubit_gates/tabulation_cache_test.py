@@ -0,0 +1,110 @@
+"""Tests for tabulation_cache.py"""
+import json
+import os
+
+import numpy as np
+import pytest
+
+import cirq
+from cirq.google.optimizers.two_qubit_gates import (
+    cached_gate_product_tabulation,
+    gate_product_tabulation,
+    load_gate_tabulation,
+    save_gate_tabulation,
+)
+from cirq.google.optimizers.two_qubit_gates import gate_compilation, tabulation_cache
+
+_sycamore_gate = cirq.unitary(cirq.FSimGate(np.pi / 2, np.pi / 6))
+
+
+@pytest.mark.parametrize('mmap_mode', ['r', None])
+def test_save_load_round_trip(tmp_path, mmap_mode):
+    tabulation = gate_product_tabulation(_sycamore_gate, 0.2, random_state=np.random.RandomState(1))
+    save_gate_tabulation(tabulation, str(tmp_path))
+
+    loaded = load_gate_tabulation(str(tmp_path), mmap_mode=mmap_mode)
+
+    assert loaded == tabulation
+    assert isinstance(loaded.kak_vecs, np.memmap) == (mmap_mode is not None)
+    target = cirq.testing.random_special_unitary(4, random_state=2)
+    np.testing.assert_allclose(
+        loaded.compile_two_qubit_gate(target).actual_gate,
+        tabulation.compile_two_qubit_gate(target).actual_gate,
+    )
+
+
+def test_save_load_without_missed_points(tmp_path):
+    tabulation = gate_compilation.GateTabulation(
+        np.eye(4, dtype=np.complex128),
+        np.zeros((1, 3)),
+        [()],
+        0.49,
+        'Sample string',
+        (),
+    )
+    save_gate_tabulation(tabulation, str(tmp_path))
+
+    assert load_gate_tabulation(str(tmp_path)) == tabulation
+
+
+def test_load_other_version_raises_error(tmp_path):
+    tabulation = gate_product_tabulation(np.eye(4), 0.25, random_state=1)
+    save_gate_tabulation(tabulation, str(tmp_path))
+    metadata_path = os.path.join(str(tmp_path), 'metadata.json')
+    with open(metadata_path) as f:
+        metadata = json.load(f)
+    metadata['version'] = -1
+    with open(metadata_path, 'w') as f:
+        json.dump(metadata, f)
+
+    with pytest.raises(ValueError, match='format version'):
+        load_gate_tabulation(str(tmp_path))
+
+
+def test_cached_gate_product_tabulation(tmp_path, monkeypatch):
+    cache_dir = str(tmp_path / 'cache')
+    tabulation = cached_gate_product_tabulation(_sycamore_gate, 0.2, cache_dir=cache_dir, seed=3)
+    assert tabulation == gate_product_tabulation(
+        _sycamore_gate, 0.2, random_state=np.random.RandomState(3)
+    )
+    assert len(os.listdir(cache_dir)) == 1
+
+    def fail(*args, **kwargs):
+        raise AssertionError('Tabulation generated again.')
+
+    monkeypatch.setattr(tabulation_cache, 'gate_product_tabulation', fail)
+    assert cached_gate_product_tabulation(_sycamore_gate, 0.2, cache_dir=cache_dir, seed=3) == (
+        tabulation
+    )
+    with pytest.raises(AssertionError, match='generated again'):
+        cached_gate_product_tabulation(_sycamore_gate, 0.2, cache_dir=cache_dir, seed=4)
+    with pytest.raises(AssertionError, match='generated again'):
+        cached_gate_product_tabulation(_sycamore_gate, 0.1, cache_dir=cache_dir, seed=3)
+
+
+def test_cached_gate_product_tabulation_saved_concurrently(tmp_path, monkeypatch):
+    cache_dir = str(tmp_path)
+    tabulation = cached_gate_product_tabulation(np.eye(4), 0.25, cache_dir=cache_dir)
+    (saved,) = os.listdir(cache_dir)
+
+    # Simulate another process finishing while this one generates the tabulation.
+    checks = []
+
+    def is_saved(path):
+        checks.append(path)
+        return len(checks) > 1
+
+    monkeypatch.setattr(tabulation_cache, '_is_saved', is_saved)
+    assert cached_gate_product_tabulation(np.eye(4), 0.25, cache_dir=cache_dir) == tabulation
+    assert len(checks) == 2
+    assert os.listdir(cache_dir) == [saved]
+
+
+def test_cached_gate_product_tabulation_save_error(tmp_path, monkeypatch):
+    def rename(src, dst):
+        raise OSError('Disk full.')
+
+    monkeypatch.setattr(os, 'rename', rename)
+    with pytest.raises(OSError, match='Disk full'):
+        cached_gate_product_tabulation(np.eye(4), 0.25, cache_dir=str(tmp_path))
+    assert os.listdir(str(tmp_path)) == []
@@ -15,6 +15,7 @@
 
 from typing import (
     Dict,
+    Hashable,
     Iterable,
     List,
     Optional,
@@ -61,6 +62,8 @@ class SerializableGateSet:
         for s in serializers:
             self.serializers.setdefault(s.gate_type, []).append(s)
         self.deserializers = {d.serialized_gate_id: d for d in deserializers}
+        # Concrete gate type to the serializers to try for it, in order.
+        self._serializer_dispatch: Dict[Type, List[op_serializer.GateOpSerializer]] = {}
 
     def with_added_gates(
         self,
@@ -98,10 +101,25 @@ class SerializableGateSet:
         """Whether or not the given gate can be serialized by this gate set."""
         return any(
             serializer.can_serialize_operation(op)
-            for gate_type in type(op.gate).mro()
-            for serializer in self.serializers.get(gate_type, [])
+            for serializer in self._serializers_for_gate_type(type(op.gate))
         )
 
+    def _serializers_for_gate_type(self, gate_type: Type) -> List[op_serializer.GateOpSerializer]:
+        """The serializers that may serialize gates of the given concrete type.
+
+        These are the serializers registered for the type and all of its super
+        classes, in method resolution order. The list is computed once per type.
+        """
+        result = self._serializer_dispatch.get(gate_type)
+        if result is None:
+            result = [
+                serializer
+                for gate_type_mro in gate_type.mro()
+                for serializer in self.serializers.get(gate_type_mro, [])
+            ]
+            self._serializer_dispatch[gate_type] = result
+        return result
+
     def serialize(
         self,
         program: 'cirq.Circuit',
@@ -156,17 +174,14 @@ class SerializableGateSet:
             A dictionary corresponds to the cirq.google.api.v2.Operation proto.
         """
         gate_type = type(op.gate)
-        for gate_type_mro in gate_type.mro():
-            # Check all super classes in method resolution order.
-            if gate_type_mro in self.serializers:
-                # Check each serializer in turn, if serializer proto returns
-                # None, then skip.
-                for serializer in self.serializers[gate_type_mro]:
-                    proto_msg = serializer.to_proto(
-                        op, msg, arg_function_language=arg_function_language, constants=constants
-                    )
-                    if proto_msg is not None:
-                        return proto_msg
+        # Check each serializer in turn, if serializer proto returns None,
+        # then skip.
+        for serializer in self._serializers_for_gate_type(gate_type):
+            proto_msg = serializer.to_proto(
+                op, msg, arg_function_language=arg_function_language, constants=constants
+            )
+            if proto_msg is not None:
+                return proto_msg
         raise ValueError('Cannot serialize op {!r} of type {}'.format(op, gate_type))
 
     def deserialize(
@@ -224,6 +239,13 @@ class SerializableGateSet:
         Returns:
             The deserialized Operation.
         """
+        return self._deserializer_for(operation_proto).from_proto(
+            operation_proto, arg_function_language=arg_function_language, constants=constants
+        )
+
+    def _deserializer_for(
+        self, operation_proto: v2.program_pb2.Operation
+    ) -> op_deserializer.GateOpDeserializer:
         if not operation_proto.gate.id:
             raise ValueError('Operation proto does not have a gate.')
 
@@ -233,10 +255,7 @@ class SerializableGateSet:
                 'Unsupported serialized gate with id "{}".'
                 '\n\noperation_proto:\n{}'.format(gate_id, operation_proto)
             )
-
-        return self.deserializers[gate_id].from_proto(
-            operation_proto, arg_function_language=arg_function_language, constants=constants
-        )
+        return self.deserializers[gate_id]
 
     def _serialize_circuit(
         self,
@@ -247,15 +266,28 @@ class SerializableGateSet:
         constants: Optional[List[v2.program_pb2.Constant]] = None,
     ) -> None:
         msg.scheduling_strategy = v2.program_pb2.Circuit.MOMENT_BY_MOMENT
+        # Programs repeat the same operations many times. The proto of a gate
+        # operation only depends on its gate, qubits and tags (and on the
+        # constants table, which is shared by the whole program), so protos of
+        # repeated operations are copied from their first serialization.
+        serialized_ops: Dict[Tuple, v2.program_pb2.Operation] = {}
         for moment in circuit:
             moment_proto = msg.moments.add()
             for op in moment:
+                op_proto = moment_proto.operations.add()
+                key = _serialization_key(op)
+                template = None if key is None else serialized_ops.get(key)
+                if template is not None:
+                    op_proto.MergeFrom(template)
+                    continue
                 self.serialize_op(
                     op,
-                    moment_proto.operations.add(),
+                    op_proto,
                     arg_function_language=arg_function_language,
                     constants=constants,
                 )
+                if key is not None:
+                    serialized_ops[key] = op_proto
 
     def _deserialize_circuit(
         self,
@@ -264,15 +296,38 @@ class SerializableGateSet:
         arg_function_language: str,
         constants: List[v2.program_pb2.Constant],
     ) -> 'cirq.Circuit':
+        # Programs repeat a handful of distinct gates on a handful of qubits
+        # many times, so equal gates and qubits are only constructed once.
+        gates: Dict[Hashable, 'cirq.Gate'] = {}
+        qubits: Dict[str, 'cirq.Qid'] = {}
         moments = []
         for i, moment_proto in enumerate(circuit_proto.moments):
             moment_ops = []
             for op in moment_proto.operations:
                 try:
-                    moment_ops.append(
-                        self.deserialize_op(
-                            op, arg_function_language=arg_function_language, constants=constants
+                    deserializer = self._deserializer_for(op)
+                    op_qubits = []
+                    for qubit_proto in op.qubits:
+                        qubit = qubits.get(qubit_proto.id)
+                        if qubit is None:
+                            qubit = v2.qubit_from_proto_id(qubit_proto.id)
+                            qubits[qubit_proto.id] = qubit
+                        op_qubits.append(qubit)
+                    gate_key = deserializer._gate_key(
+                        op,
+                        num_qubits=len(op_qubits),
+                        arg_function_language=arg_function_language,
+                    )
+                    gate = gates.get(gate_key)
+                    if gate is None:
+                        gate = deserializer._gate_from_proto(
+                            op,
+                            num_qubits=len(op_qubits),
+                            arg_function_language=arg_function_language,
                         )
+                        gates[gate_key] = gate
+                    moment_ops.append(
+                        deserializer._op_from_gate(gate, op_qubits, op, constants=constants)
                     )
                 except ValueError as ex:
                     raise ValueError(
@@ -282,7 +337,9 @@ class SerializableGateSet:
                         f'following proto:\n{op}'
                     ) from ex
             moments.append(ops.Moment(moment_ops))
-        return circuits.Circuit(moments)
+        # The moments were validated on construction, and deserialized
+        # operations are always on qubits, so they are not validated again.
+        return circuits.Circuit()._with_sliced_moments(moments)
 
     def _deserialize_schedule(
         self,
@@ -301,3 +358,24 @@ class SerializableGateSet:
                 )
             )
         return circuits.Circuit(result, device=device)
+
+
+def _serialization_key(op: 'cirq.Operation') -> Optional[Tuple]:
+    """A hashable key determining the serialization of an operation.
+
+    Gates are keyed on their type and repr rather than on equality, since
+    equal gates may serialize differently (e.g. `cirq.X**0.5` and
+    `cirq.X**2.5` are equal, but have different exponents).
+
+    Returns None if the operation is not a (possibly tagged) `GateOperation`
+    or if it is not hashable.
+    """
+    if type(op.untagged) is not ops.GateOperation:
+        return None
+    gate = op.gate
+    key = (type(gate), repr(gate), op.qubits, op.tags)
+    try:
+        hash(key)
+    except TypeError:
+        return None
+    return key
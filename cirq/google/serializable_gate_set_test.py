@@ -176,6 +176,63 @@ def test_serialize_deserialize_circuit_with_tokens():
     assert MY_GATE_SET.deserialize(proto) == circuit
 
 
+def test_serialize_circuit_repeated_operations():
+    q0 = cirq.GridQubit(1, 1)
+    q1 = cirq.GridQubit(1, 2)
+    tag = cg.CalibrationTag('abc123')
+    moment = cirq.Moment([cirq.X(q0).with_tags(tag), cirq.X(q1) ** 0.5])
+    circuit = cirq.Circuit([moment] * 3 + [cirq.Moment([cirq.X(q0)])])
+    # Serializing each operation independently gives the same protos.
+    proto = MY_GATE_SET.serialize(circuit)
+    constants = []
+    expected = v2.program_pb2.Program()
+    expected.language.gate_set = 'my_gate_set'
+    expected.circuit.scheduling_strategy = v2.program_pb2.Circuit.MOMENT_BY_MOMENT
+    for moment in circuit:
+        moment_proto = expected.circuit.moments.add()
+        for op in moment:
+            MY_GATE_SET.serialize_op(op, moment_proto.operations.add(), constants=constants)
+    expected.constants.extend(constants)
+    assert proto == expected
+    assert len(proto.constants) == 1
+    assert MY_GATE_SET.deserialize(proto) == circuit
+
+
+def test_serialize_circuit_equal_gates_with_different_args():
+    q0 = cirq.GridQubit(1, 1)
+    circuit = cirq.Circuit(cirq.X(q0) ** 0.5, cirq.X(q0) ** 2.5)
+    assert circuit[0] == circuit[1]
+    proto = MY_GATE_SET.serialize(circuit)
+    for moment, moment_proto in zip(circuit, proto.circuit.moments):
+        assert moment_proto.operations[0] == X_SERIALIZER.to_proto(moment.operations[0])
+    assert proto.circuit.moments[0] != proto.circuit.moments[1]
+
+
+def test_serialize_circuit_unhashable_operation():
+    q0 = cirq.GridQubit(1, 1)
+
+    class UnhashableTag:
+        __hash__ = None
+
+    circuit = cirq.Circuit([cirq.X(q0).with_tags(UnhashableTag())] * 2)
+    proto = MY_GATE_SET.serialize(circuit)
+    assert proto.circuit.moments[0] == proto.circuit.moments[1]
+    assert proto.circuit.moments[0].operations[0] == X_SERIALIZER.to_proto(cirq.X(q0))
+
+
+def test_serializer_dispatch_is_cached_per_gate_type():
+    gate_set = cg.SerializableGateSet(
+        gate_set_name='my_gate_set',
+        serializers=[X_SERIALIZER, Y_SERIALIZER],
+        deserializers=[X_DESERIALIZER],
+    )
+    assert gate_set._serializers_for_gate_type(cirq.XPowGate) == [X_SERIALIZER]
+    assert gate_set._serializers_for_gate_type(cirq.XPowGate) is (
+        gate_set._serializers_for_gate_type(cirq.XPowGate)
+    )
+    assert gate_set._serializers_for_gate_type(cirq.ZPowGate) == []
+
+
 def test_deserialize_bad_operation_id():
     proto = v2.program_pb2.Program(
         language=v2.program_pb2.Language(arg_function_language='', gate_set='my_gate_set'),
@@ -512,3 +569,32 @@ def test_deserialize_no_operation():
     )
     with pytest.raises(ValueError, match='operation'):
         MY_GATE_SET.deserialize(proto, cirq.google.Bristlecone)
+
+
+def test_deserialize_circuit_reuses_equal_gates():
+    q0 = cirq.GridQubit(1, 1)
+    q1 = cirq.GridQubit(1, 2)
+    circuit = cirq.Circuit(
+        [cirq.X(q0) ** 0.5, cirq.X(q1) ** 0.5],
+        [cirq.X(q0) ** 0.25, cirq.X(q1) ** 0.5],
+        cirq.X(q0) ** 0.5,
+    )
+    result = MY_GATE_SET.deserialize(MY_GATE_SET.serialize(circuit))
+    assert result == circuit
+
+    half = result[0].operations[0].gate
+    assert result[0].operations[1].gate is half
+    assert result[1].operations[1].gate is half
+    assert result[2].operations[0].gate is half
+    assert result[1].operations[0].gate is not half
+    assert result[0].operations[0].qubits[0] is result[2].operations[0].qubits[0]
+
+
+def test_deserialize_circuit_reused_gates_keep_tokens():
+    q0 = cirq.GridQubit(1, 1)
+    tag = cg.CalibrationTag('abc123')
+    circuit = cirq.Circuit(cirq.X(q0) ** 0.5, (cirq.X(q0) ** 0.5).with_tags(tag), cirq.X(q0) ** 0.5)
+    result = MY_GATE_SET.deserialize(MY_GATE_SET.serialize(circuit))
+    assert result == circuit
+    assert result[1].operations[0].tags == (tag,)
+    assert result[0].operations[0].untagged.gate is result[1].operations[0].untagged.gate
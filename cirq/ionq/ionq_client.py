@@ -18,6 +18,7 @@ import time
 import urllib
 from typing import Any, Callable, cast, Dict, List, Optional, TYPE_CHECKING
 import requests
+import requests.adapters
 
 from cirq.ionq import ionq_exceptions
 
@@ -48,6 +49,7 @@ class _IonQClient:
         api_version: str = 'v0.1',
         max_retry_seconds: int = 3600,  # 1 hour
         verbose: bool = False,
+        max_connections: int = 16,
     ):
         """Creates the IonQClient.
 
@@ -67,6 +69,9 @@ class _IonQClient:
                 which is the default.
             max_retry_seconds: The time to continue retriable responses. Defaults to 3600.
             verbose: Whether to print to stderr and stdio any retriable errors that are encountered.
+            max_connections: The number of connections to the host kept open for reuse. Requests
+                share one session, so concurrent requests beyond this number wait for a free
+                connection instead of opening a new one per request.
         """
         url = urllib.parse.urlparse(remote_host)
         assert url.scheme and url.netloc, (
@@ -80,12 +85,23 @@ class _IonQClient:
             default_target is None or default_target in self.SUPPORTED_TARGETS
         ), f'Target can only be one of {self.SUPPORTED_TARGETS} but was {default_target}.'
         assert max_retry_seconds >= 0, 'Negative retry not possible without time machine.'
+        assert max_connections > 0, f'max_connections must be positive but was {max_connections}.'
 
         self.url = f'{url.scheme}://{url.netloc}/{api_version}'
         self.headers = {'Authorization': f'apiKey {api_key}', 'Content-Type': 'application/json'}
         self.default_target = default_target
         self.max_retry_seconds = max_retry_seconds
         self.verbose = verbose
+        self.max_connections = max_connections
+
+        # A single session keeps connections alive between requests, which saves a TCP and TLS
+        # handshake per call.
+        self._session = requests.Session()
+        adapter = requests.adapters.HTTPAdapter(
+            pool_connections=1, pool_maxsize=max_connections, pool_block=True
+        )
+        self._session.mount('http://', adapter)
+        self._session.mount('https://', adapter)
 
     def create_job(
         self,
@@ -131,7 +147,7 @@ class _IonQClient:
         json['metadata']['shots'] = str(repetitions)
 
         def request():
-            return requests.post(f'{self.url}/jobs', json=json, headers=self.headers)
+            return self._session.post(f'{self.url}/jobs', json=json, headers=self.headers)
 
         return self._make_request(request).json()
 
@@ -150,7 +166,7 @@ class _IonQClient:
         """
 
         def request():
-            return requests.get(f'{self.url}/jobs/{job_id}', headers=self.headers)
+            return self._session.get(f'{self.url}/jobs/{job_id}', headers=self.headers)
 
         return self._make_request(request).json()
 
@@ -189,7 +205,9 @@ class _IonQClient:
         """
 
         def request():
-            return requests.put(f'{self.url}/jobs/{job_id}/status/cancel', headers=self.headers)
+            return self._session.put(
+                f'{self.url}/jobs/{job_id}/status/cancel', headers=self.headers
+            )
 
         return self._make_request(request).json()
 
@@ -204,7 +222,7 @@ class _IonQClient:
         """
 
         def request():
-            return requests.delete(f'{self.url}/jobs/{job_id}', headers=self.headers)
+            return self._session.delete(f'{self.url}/jobs/{job_id}', headers=self.headers)
 
         return self._make_request(request).json()
 
@@ -215,7 +233,7 @@ class _IonQClient:
         """
 
         def request():
-            return requests.get(f'{self.url}/calibrations/current', headers=self.headers)
+            return self._session.get(f'{self.url}/calibrations/current', headers=self.headers)
 
         return self._make_request(request).json()
 
@@ -338,7 +356,7 @@ class _IonQClient:
                 full_params['next'] = token
 
             def request():
-                return requests.get(
+                return self._session.get(
                     f'{self.url}/{resource_path}',
                     headers=self.headers,
                     json=json,
@@ -87,7 +87,22 @@ def test_ionq_client_attributes():
     assert client.verbose == True
 
 
-@mock.patch('requests.post')
+def test_ionq_client_connection_pool():
+    client = ionq.ionq_client._IonQClient(
+        remote_host='http://example.com', api_key='a', max_connections=3
+    )
+    assert client.max_connections == 3
+    for prefix in ('http://', 'https://'):
+        adapter = client._session.get_adapter(prefix + 'example.com')
+        assert adapter._pool_maxsize == 3
+        assert adapter._pool_block
+    with pytest.raises(AssertionError, match='max_connections'):
+        _ = ionq.ionq_client._IonQClient(
+            remote_host='http://example.com', api_key='a', max_connections=0
+        )
+
+
+@mock.patch('requests.Session.post')
 def test_ionq_client_create_job(mock_post):
     mock_post.return_value.status_code.return_value = requests.codes.ok
     mock_post.return_value.json.return_value = {'foo': 'bar'}
@@ -113,7 +128,7 @@ def test_ionq_client_create_job(mock_post):
     )
 
 
-@mock.patch('requests.post')
+@mock.patch('requests.Session.post')
 def test_ionq_client_create_job_default_target(mock_post):
     mock_post.return_value.status_code.return_value = requests.codes.ok
     mock_post.return_value.json.return_value = {'foo'}
@@ -125,7 +140,7 @@ def test_ionq_client_create_job_default_target(mock_post):
     assert mock_post.call_args[1]['json']['target'] == 'simulator'
 
 
-@mock.patch('requests.post')
+@mock.patch('requests.Session.post')
 def test_ionq_client_create_job_target_overrides_default_target(mock_post):
     mock_post.return_value.status_code.return_value = requests.codes.ok
     mock_post.return_value.json.return_value = {'foo'}
@@ -149,7 +164,7 @@ def test_ionq_client_create_job_no_targets():
         )
 
 
-@mock.patch('requests.post')
+@mock.patch('requests.Session.post')
 def test_ionq_client_create_job_unauthorized(mock_post):
     mock_post.return_value.ok = False
     mock_post.return_value.status_code = requests.codes.unauthorized
@@ -163,7 +178,7 @@ def test_ionq_client_create_job_unauthorized(mock_post):
         )
 
 
-@mock.patch('requests.post')
+@mock.patch('requests.Session.post')
 def test_ionq_client_create_job_not_found(mock_post):
     mock_post.return_value.ok = False
     mock_post.return_value.status_code = requests.codes.not_found
@@ -177,7 +192,7 @@ def test_ionq_client_create_job_not_found(mock_post):
         )
 
 
-@mock.patch('requests.post')
+@mock.patch('requests.Session.post')
 def test_ionq_client_create_job_not_retriable(mock_post):
     mock_post.return_value.ok = False
     mock_post.return_value.status_code = requests.codes.not_implemented
@@ -191,7 +206,7 @@ def test_ionq_client_create_job_not_retriable(mock_post):
         )
 
 
-@mock.patch('requests.post')
+@mock.patch('requests.Session.post')
 def test_ionq_client_create_job_retry(mock_post):
     response1 = mock.MagicMock()
     response2 = mock.MagicMock()
@@ -214,7 +229,7 @@ def test_ionq_client_create_job_retry(mock_post):
     assert mock_post.call_count == 2
 
 
-@mock.patch('requests.post')
+@mock.patch('requests.Session.post')
 def test_ionq_client_create_job_retry_request_error(mock_post):
     response2 = mock.MagicMock()
     mock_post.side_effect = [requests.exceptions.ConnectionError(), response2]
@@ -228,7 +243,7 @@ def test_ionq_client_create_job_retry_request_error(mock_post):
     assert mock_post.call_count == 2
 
 
-@mock.patch('requests.post')
+@mock.patch('requests.Session.post')
 def test_ionq_client_create_job_timeout(mock_post):
     mock_post.return_value.ok = False
     mock_post.return_value.status_code = requests.codes.service_unavailable
@@ -245,7 +260,7 @@ def test_ionq_client_create_job_timeout(mock_post):
         )
 
 
-@mock.patch('requests.get')
+@mock.patch('requests.Session.get')
 def test_ionq_client_get_job(mock_get):
     mock_get.return_value.ok = True
     mock_get.return_value.json.return_value = {'foo': 'bar'}
@@ -257,7 +272,7 @@ def test_ionq_client_get_job(mock_get):
     mock_get.assert_called_with('http://example.com/v0.1/jobs/job_id', headers=expected_headers)
 
 
-@mock.patch('requests.get')
+@mock.patch('requests.Session.get')
 def test_ionq_client_get_job_unauthorized(mock_get):
     mock_get.return_value.ok = False
     mock_get.return_value.status_code = requests.codes.unauthorized
@@ -269,7 +284,7 @@ def test_ionq_client_get_job_unauthorized(mock_get):
         _ = client.get_job('job_id')
 
 
-@mock.patch('requests.get')
+@mock.patch('requests.Session.get')
 def test_ionq_client_get_job_not_found(mock_get):
     (mock_get.return_value).ok = False
     (mock_get.return_value).status_code = requests.codes.not_found
@@ -281,7 +296,7 @@ def test_ionq_client_get_job_not_found(mock_get):
         _ = client.get_job('job_id')
 
 
-@mock.patch('requests.get')
+@mock.patch('requests.Session.get')
 def test_ionq_client_get_job_not_retriable(mock_get):
     mock_get.return_value.ok = False
     mock_get.return_value.status_code = requests.codes.not_implemented
@@ -293,7 +308,7 @@ def test_ionq_client_get_job_not_retriable(mock_get):
         _ = client.get_job('job_id')
 
 
-@mock.patch('requests.get')
+@mock.patch('requests.Session.get')
 def test_ionq_client_get_job_retry(mock_get):
     response1 = mock.MagicMock()
     response2 = mock.MagicMock()
@@ -308,7 +323,7 @@ def test_ionq_client_get_job_retry(mock_get):
     assert mock_get.call_count == 2
 
 
-@mock.patch('requests.get')
+@mock.patch('requests.Session.get')
 def test_ionq_client_list_jobs(mock_get):
     mock_get.return_value.ok = True
     mock_get.return_value.json.return_value = {'jobs': [{'id': '1'}, {'id': '2'}]}
@@ -322,7 +337,7 @@ def test_ionq_client_list_jobs(mock_get):
     )
 
 
-@mock.patch('requests.get')
+@mock.patch('requests.Session.get')
 def test_ionq_client_list_jobs_status(mock_get):
     mock_get.return_value.ok = True
     mock_get.return_value.json.return_value = {'jobs': [{'id': '1'}, {'id': '2'}]}
@@ -339,7 +354,7 @@ def test_ionq_client_list_jobs_status(mock_get):
     )
 
 
-@mock.patch('requests.get')
+@mock.patch('requests.Session.get')
 def test_ionq_client_list_jobs_limit(mock_get):
     mock_get.return_value.ok = True
     mock_get.return_value.json.return_value = {'jobs': [{'id': '1'}, {'id': '2'}, {'id': 3}]}
@@ -353,7 +368,7 @@ def test_ionq_client_list_jobs_limit(mock_get):
     )
 
 
-@mock.patch('requests.get')
+@mock.patch('requests.Session.get')
 def test_ionq_client_list_jobs_batches(mock_get):
     mock_get.return_value.ok = True
     mock_get.return_value.json.side_effect = [
@@ -379,7 +394,7 @@ def test_ionq_client_list_jobs_batches(mock_get):
     )
 
 
-@mock.patch('requests.get')
+@mock.patch('requests.Session.get')
 def test_ionq_client_list_jobs_batches_does_not_divide_total(mock_get):
     mock_get.return_value.ok = True
     mock_get.return_value.json.side_effect = [
@@ -402,7 +417,7 @@ def test_ionq_client_list_jobs_batches_does_not_divide_total(mock_get):
     )
 
 
-@mock.patch('requests.get')
+@mock.patch('requests.Session.get')
 def test_ionq_client_list_jobs_unauthorized(mock_get):
     mock_get.return_value.ok = False
     mock_get.return_value.status_code = requests.codes.unauthorized
@@ -411,7 +426,7 @@ def test_ionq_client_list_jobs_unauthorized(mock_get):
         _ = client.list_jobs()
 
 
-@mock.patch('requests.get')
+@mock.patch('requests.Session.get')
 def test_ionq_client_list_jobs_not_retriable(mock_get):
     mock_get.return_value.ok = False
     mock_get.return_value.status_code = requests.codes.not_implemented
@@ -420,7 +435,7 @@ def test_ionq_client_list_jobs_not_retriable(mock_get):
         _ = client.list_jobs()
 
 
-@mock.patch('requests.get')
+@mock.patch('requests.Session.get')
 def test_ionq_client_list_jobs_retry(mock_get):
     response1 = mock.MagicMock()
     response2 = mock.MagicMock()
@@ -435,7 +450,7 @@ def test_ionq_client_list_jobs_retry(mock_get):
     assert mock_get.call_count == 2
 
 
-@mock.patch('requests.put')
+@mock.patch('requests.Session.put')
 def test_ionq_client_cancel_job(mock_put):
     mock_put.return_value.ok = True
     mock_put.return_value.json.return_value = {'foo': 'bar'}
@@ -449,7 +464,7 @@ def test_ionq_client_cancel_job(mock_put):
     )
 
 
-@mock.patch('requests.put')
+@mock.patch('requests.Session.put')
 def test_ionq_client_cancel_job_unauthorized(mock_put):
     mock_put.return_value.ok = False
     mock_put.return_value.status_code = requests.codes.unauthorized
@@ -461,7 +476,7 @@ def test_ionq_client_cancel_job_unauthorized(mock_put):
         client.cancel_job('job_id')
 
 
-@mock.patch('requests.put')
+@mock.patch('requests.Session.put')
 def test_ionq_client_cancel_job_not_found(mock_put):
     (mock_put.return_value).ok = False
     (mock_put.return_value).status_code = requests.codes.not_found
@@ -473,7 +488,7 @@ def test_ionq_client_cancel_job_not_found(mock_put):
         client.cancel_job('job_id')
 
 
-@mock.patch('requests.put')
+@mock.patch('requests.Session.put')
 def test_ionq_client_cancel_job_not_retriable(mock_get):
     mock_get.return_value.ok = False
     mock_get.return_value.status_code = requests.codes.not_implemented
@@ -485,7 +500,7 @@ def test_ionq_client_cancel_job_not_retriable(mock_get):
         client.cancel_job('job_id')
 
 
-@mock.patch('requests.put')
+@mock.patch('requests.Session.put')
 def test_ionq_client_cancel_job_retry(mock_put):
     response1 = mock.MagicMock()
     response2 = mock.MagicMock()
@@ -500,7 +515,7 @@ def test_ionq_client_cancel_job_retry(mock_put):
     assert mock_put.call_count == 2
 
 
-@mock.patch('requests.delete')
+@mock.patch('requests.Session.delete')
 def test_ionq_client_delete_job(mock_delete):
     mock_delete.return_value.ok = True
     mock_delete.return_value.json.return_value = {'foo': 'bar'}
@@ -512,7 +527,7 @@ def test_ionq_client_delete_job(mock_delete):
     mock_delete.assert_called_with('http://example.com/v0.1/jobs/job_id', headers=expected_headers)
 
 
-@mock.patch('requests.delete')
+@mock.patch('requests.Session.delete')
 def test_ionq_client_delete_job_unauthorized(mock_delete):
     mock_delete.return_value.ok = False
     mock_delete.return_value.status_code = requests.codes.unauthorized
@@ -524,7 +539,7 @@ def test_ionq_client_delete_job_unauthorized(mock_delete):
         client.delete_job('job_id')
 
 
-@mock.patch('requests.delete')
+@mock.patch('requests.Session.delete')
 def test_ionq_client_delete_job_not_found(mock_put):
     (mock_put.return_value).ok = False
     (mock_put.return_value).status_code = requests.codes.not_found
@@ -536,7 +551,7 @@ def test_ionq_client_delete_job_not_found(mock_put):
         client.delete_job('job_id')
 
 
-@mock.patch('requests.delete')
+@mock.patch('requests.Session.delete')
 def test_ionq_client_delete_job_not_retriable(mock_delete):
     mock_delete.return_value.ok = False
     mock_delete.return_value.status_code = requests.codes.not_implemented
@@ -548,7 +563,7 @@ def test_ionq_client_delete_job_not_retriable(mock_delete):
         client.delete_job('job_id')
 
 
-@mock.patch('requests.delete')
+@mock.patch('requests.Session.delete')
 def test_ionq_client_delete_job_retry(mock_put):
     response1 = mock.MagicMock()
     response2 = mock.MagicMock()
@@ -563,7 +578,7 @@ def test_ionq_client_delete_job_retry(mock_put):
     assert mock_put.call_count == 2
 
 
-@mock.patch('requests.get')
+@mock.patch('requests.Session.get')
 def test_ionq_client_get_current_calibrations(mock_get):
     mock_get.return_value.ok = True
     mock_get.return_value.json.return_value = {'foo': 'bar'}
@@ -577,7 +592,7 @@ def test_ionq_client_get_current_calibrations(mock_get):
     )
 
 
-@mock.patch('requests.get')
+@mock.patch('requests.Session.get')
 def test_ionq_client_get_current_calibration_unauthorized(mock_get):
     mock_get.return_value.ok = False
     mock_get.return_value.status_code = requests.codes.unauthorized
@@ -587,7 +602,7 @@ def test_ionq_client_get_current_calibration_unauthorized(mock_get):
         _ = client.get_current_calibration()
 
 
-@mock.patch('requests.get')
+@mock.patch('requests.Session.get')
 def test_ionq_client_get_current_calibration_not_found(mock_get):
     (mock_get.return_value).ok = False
     (mock_get.return_value).status_code = requests.codes.not_found
@@ -597,7 +612,7 @@ def test_ionq_client_get_current_calibration_not_found(mock_get):
         _ = client.get_current_calibration()
 
 
-@mock.patch('requests.get')
+@mock.patch('requests.Session.get')
 def test_ionq_client_get_current_calibration_not_retriable(mock_get):
     mock_get.return_value.ok = False
     mock_get.return_value.status_code = requests.codes.not_implemented
@@ -607,7 +622,7 @@ def test_ionq_client_get_current_calibration_not_retriable(mock_get):
         _ = client.get_current_calibration()
 
 
-@mock.patch('requests.get')
+@mock.patch('requests.Session.get')
 def test_ionq_client_get_calibration_retry(mock_get):
     response1 = mock.MagicMock()
     response2 = mock.MagicMock()
@@ -620,7 +635,7 @@ def test_ionq_client_get_calibration_retry(mock_get):
     assert mock_get.call_count == 2
 
 
-@mock.patch('requests.get')
+@mock.patch('requests.Session.get')
 def test_ionq_client_list_calibrations(mock_get):
     mock_get.return_value.ok = True
     mock_get.return_value.json.return_value = {'calibrations': [{'id': '1'}, {'id': '2'}]}
@@ -637,7 +652,7 @@ def test_ionq_client_list_calibrations(mock_get):
     )
 
 
-@mock.patch('requests.get')
+@mock.patch('requests.Session.get')
 def test_ionq_client_list_calibrations_dates(mock_get):
     mock_get.return_value.ok = True
     mock_get.return_value.json.return_value = {'calibrations': [{'id': '1'}, {'id': '2'}]}
@@ -657,7 +672,7 @@ def test_ionq_client_list_calibrations_dates(mock_get):
     )
 
 
-@mock.patch('requests.get')
+@mock.patch('requests.Session.get')
 def test_ionq_client_list_calibrations_limit(mock_get):
     mock_get.return_value.ok = True
     mock_get.return_value.json.return_value = {
@@ -676,7 +691,7 @@ def test_ionq_client_list_calibrations_limit(mock_get):
     )
 
 
-@mock.patch('requests.get')
+@mock.patch('requests.Session.get')
 def test_ionq_client_list_calibrations_batches(mock_get):
     mock_get.return_value.ok = True
     mock_get.return_value.json.side_effect = [
@@ -702,7 +717,7 @@ def test_ionq_client_list_calibrations_batches(mock_get):
     )
 
 
-@mock.patch('requests.get')
+@mock.patch('requests.Session.get')
 def test_ionq_client_list_calibrations_batches_does_not_divide_total(mock_get):
     mock_get.return_value.ok = True
     mock_get.return_value.json.side_effect = [
@@ -725,7 +740,7 @@ def test_ionq_client_list_calibrations_batches_does_not_divide_total(mock_get):
     )
 
 
-@mock.patch('requests.get')
+@mock.patch('requests.Session.get')
 def test_ionq_client_list_calibrations_unauthorized(mock_get):
     mock_get.return_value.ok = False
     mock_get.return_value.status_code = requests.codes.unauthorized
@@ -734,7 +749,7 @@ def test_ionq_client_list_calibrations_unauthorized(mock_get):
         _ = client.list_calibrations()
 
 
-@mock.patch('requests.get')
+@mock.patch('requests.Session.get')
 def test_ionq_client_list_calibrations_not_retriable(mock_get):
     mock_get.return_value.ok = False
     mock_get.return_value.status_code = requests.codes.not_implemented
@@ -743,7 +758,7 @@ def test_ionq_client_list_calibrations_not_retriable(mock_get):
         _ = client.list_calibrations()
 
 
-@mock.patch('requests.get')
+@mock.patch('requests.Session.get')
 def test_ionq_client_list_calibrations_retry(mock_get):
     response1 = mock.MagicMock()
     response2 = mock.MagicMock()
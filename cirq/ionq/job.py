@@ -13,6 +13,7 @@
 # limitations under the License.
 """Represents a job created via the IonQ API."""
 
+import concurrent.futures
 import time
 from typing import Dict, Sequence, TYPE_CHECKING, Union
 
@@ -240,3 +241,42 @@ class Job:
 
     def __str__(self) -> str:
         return f'cirq.ionq.Job(job_id={self.job_id()})'
+
+
+def wait_for_jobs(
+    jobs: Sequence[Job],
+    timeout_seconds: int = 7200,
+    polling_seconds: int = 1,
+    max_workers: int = 16,
+) -> None:
+    """Polls the IonQ api until all of the given jobs are in a terminal state.
+
+    Instead of each job sleeping and polling on its own, all jobs that are not yet done are
+    refreshed together once per polling interval, with up to `max_workers` requests in flight.
+    Waiting for many jobs thus takes about as long as waiting for the slowest one.
+
+    Afterwards, `results` on the jobs returns without further polling, unless the timeout was
+    reached first.
+
+    Args:
+        jobs: The jobs to wait for.
+        timeout_seconds: The total number of seconds to poll for.
+        polling_seconds: The interval with which to poll.
+        max_workers: The maximum number of concurrent requests.
+
+    Raises:
+        IonQException: If unable to get the status of a job from the API.
+    """
+    pending = [job for job in jobs if job._job['status'] not in Job.TERMINAL_STATES]
+    if not pending:
+        return
+    time_waited_seconds = 0
+    with concurrent.futures.ThreadPoolExecutor(max_workers=max_workers) as executor:
+        while True:
+            # Consuming the iterator re-raises the first error of any refresh.
+            list(executor.map(Job._refresh_job, pending))
+            pending = [job for job in pending if job._job['status'] not in Job.TERMINAL_STATES]
+            if not pending or time_waited_seconds >= timeout_seconds:
+                return
+            time.sleep(polling_seconds)
+            time_waited_seconds += polling_seconds
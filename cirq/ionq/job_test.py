@@ -255,3 +255,43 @@ def test_job_fields_update_status():
     assert job.name() == 'bacon'
     assert job.num_qubits() == 5
     assert job.repetitions() == 1000
+
+
+@mock.patch('time.sleep', return_value=None)
+def test_wait_for_jobs(mock_sleep):
+    gets = {'a': 0, 'b': 0, 'c': 0}
+
+    def get_job(job_id):
+        gets[job_id] += 1
+        done = gets[job_id] >= {'a': 1, 'b': 3, 'c': 0}[job_id]
+        return {'id': job_id, 'status': 'completed' if done else 'running'}
+
+    mock_client = mock.MagicMock()
+    mock_client.get_job.side_effect = get_job
+    jobs = [
+        ionq.Job(mock_client, {'id': 'a', 'status': 'ready'}),
+        ionq.Job(mock_client, {'id': 'b', 'status': 'submitted'}),
+        ionq.Job(mock_client, {'id': 'c', 'status': 'completed'}),
+    ]
+    ionq.job.wait_for_jobs(jobs, polling_seconds=0.5, max_workers=2)
+    assert [job.status() for job in jobs] == ['completed'] * 3
+    assert gets == {'a': 1, 'b': 3, 'c': 0}
+    assert mock_sleep.call_count == 2
+
+
+@mock.patch('time.sleep', return_value=None)
+def test_wait_for_jobs_timeout(mock_sleep):
+    mock_client = mock.MagicMock()
+    mock_client.get_job.return_value = {'id': 'a', 'status': 'running'}
+    job = ionq.Job(mock_client, {'id': 'a', 'status': 'ready'})
+    ionq.job.wait_for_jobs([job], timeout_seconds=1, polling_seconds=0.25)
+    assert mock_sleep.call_count == 4
+    assert mock_client.get_job.call_count == 5
+
+
+def test_wait_for_jobs_error():
+    mock_client = mock.MagicMock()
+    mock_client.get_job.side_effect = ionq.IonQException('out of ions', status_code=500)
+    job = ionq.Job(mock_client, {'id': 'a', 'status': 'ready'})
+    with pytest.raises(ionq.IonQException, match='out of ions'):
+        ionq.job.wait_for_jobs([job])
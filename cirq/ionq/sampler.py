@@ -12,10 +12,11 @@
 # limitations under the License.
 """A `cirq.Sampler` implementation for the IonQ API."""
 
+import concurrent.futures
 from typing import List, Optional, TYPE_CHECKING
 
 from cirq import protocols, study, work
-from cirq.ionq import results
+from cirq.ionq import job, results
 
 if TYPE_CHECKING:
     import cirq
@@ -44,6 +45,7 @@ class Sampler(work.Sampler):
         service: 'cirq.ionq.Service',
         target: Optional[str],
         seed: 'cirq.RANDOM_STATE_OR_SEED_LIKE' = None,
+        max_workers: int = 16,
     ):
         """Construct the sampler.
 
@@ -56,10 +58,13 @@ class Sampler(work.Sampler):
             seed: If the target is `simulation` the seed for generating results. If None, this
                 will be `np.random`, if an int, will be `np.random.RandomState(int)`, otherwise
                 must be a modulate similar to `np.random`.
+            max_workers: The maximum number of concurrent requests when creating and polling the
+                jobs of a sweep.
         """
         self._service = service
         self._target = target
         self._seed = seed
+        self._max_workers = max_workers
 
     def run_sweep(
         self,
@@ -70,22 +75,26 @@ class Sampler(work.Sampler):
         """Runs a sweep for the given Circuit.
 
         Note that this creates jobs for each of the sweeps in the given sweepable, and then
-        blocks until all of the jobs are complete.
+        blocks until all of the jobs are complete. The jobs are created concurrently and polled
+        together, so a sweep takes about as long as its slowest job.
 
         See `cirq.Sampler` for documentation on args.
 
         For use of the `sample` method, see the documentation of `cirq.Sampler`.
         """
         resolvers = [r for r in study.to_resolvers(params)]
-        jobs = [
-            self._service.create_job(
+
+        def create_job(resolver: 'cirq.ParamResolver') -> 'cirq.ionq.Job':
+            return self._service.create_job(
                 circuit=protocols.resolve_parameters(program, resolver),
                 repetitions=repetitions,
                 target=self._target,
             )
-            for resolver in resolvers
-        ]
-        job_results = [job.results() for job in jobs]
+
+        with concurrent.futures.ThreadPoolExecutor(max_workers=self._max_workers) as executor:
+            jobs = list(executor.map(create_job, resolvers))
+        job.wait_for_jobs(jobs, max_workers=self._max_workers)
+        job_results = [j.results() for j in jobs]
         cirq_results = []
         for result, params in zip(job_results, resolvers):
             if isinstance(result, results.QPUResult):
@@ -11,8 +11,12 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import http.server
+import json
+import threading
 from unittest import mock
 
+import numpy as np
 import pandas as pd
 import sympy as sp
 
@@ -91,10 +95,15 @@ def test_sampler_multiple_jobs():
 
     job0 = ionq.Job(client=mock_service, job_dict=job_dict0)
     job1 = ionq.Job(client=mock_service, job_dict=job_dict1)
-    mock_service.create_job.side_effect = [job0, job1]
+    q0 = cirq.LineQubit(0)
+    circuit0 = cirq.Circuit(cirq.X(q0) ** 0.5, cirq.measure(q0, key='a'))
+    circuit1 = cirq.Circuit(cirq.X(q0) ** 0.6, cirq.measure(q0, key='a'))
+    # Jobs are created concurrently, so match them by circuit rather than by call order.
+    mock_service.create_job.side_effect = lambda circuit, **kwargs: (
+        job0 if circuit == circuit0 else job1
+    )
 
     sampler = ionq.Sampler(service=mock_service, target='qpu')
-    q0 = cirq.LineQubit(0)
     x = sp.Symbol('x')
     circuit = cirq.Circuit(cirq.X(q0) ** x, cirq.measure(q0, key='a'))
     results = sampler.sample(
@@ -110,12 +119,93 @@ def test_sampler_multiple_jobs():
             data=[[0.5, 0], [0.5, 1], [0.5, 1], [0.5, 1], [0.6, 0], [0.6, 0], [0.6, 1], [0.6, 1]],
         ),
     )
-    circuit0 = cirq.Circuit(cirq.X(q0) ** 0.5, cirq.measure(q0, key='a'))
-    circuit1 = cirq.Circuit(cirq.X(q0) ** 0.6, cirq.measure(q0, key='a'))
     mock_service.create_job.assert_has_calls(
         [
             mock.call(circuit=circuit0, repetitions=4, target='qpu'),
             mock.call(circuit=circuit1, repetitions=4, target='qpu'),
-        ]
+        ],
+        any_order=True,
     )
     assert mock_service.create_job.call_count == 2
+
+
+class _StubIonQHandler(http.server.BaseHTTPRequestHandler):
+    """Serves jobs that complete after a fixed number of gets."""
+
+    protocol_version = 'HTTP/1.1'
+
+    def _reply(self, body):
+        data = json.dumps(body).encode()
+        self.send_response(200)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+    def do_POST(self):
+        request = json.loads(self.rfile.read(int(self.headers['Content-Length'])))
+        server = self.server
+        with server.lock:
+            job_id = str(len(server.jobs))
+            server.jobs[job_id] = {'request': request, 'gets': 0}
+            server.ports.add(self.client_address[1])
+        self._reply({'id': job_id, 'status': 'ready'})
+
+    def do_GET(self):
+        job_id = self.path.split('/')[-1]
+        server = self.server
+        with server.lock:
+            entry = server.jobs[job_id]
+            entry['gets'] += 1
+            server.ports.add(self.client_address[1])
+        request = entry['request']
+        done = entry['gets'] > server.gets_until_done
+        body = {'id': job_id, 'status': 'completed' if done else 'running'}
+        body.update(
+            target=request['target'],
+            qubits='1',
+            metadata=request['metadata'],
+            data={'histogram': {'1': '1'}},
+        )
+        self._reply(body)
+
+    def log_message(self, *args):
+        pass
+
+
+def test_sampler_sweep_against_stub_server():
+    server = http.server.ThreadingHTTPServer(('127.0.0.1', 0), _StubIonQHandler)
+    server.lock = threading.Lock()
+    server.jobs = {}
+    server.ports = set()
+    server.gets_until_done = 2
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    try:
+        service = ionq.Service(
+            remote_host=f'http://127.0.0.1:{server.server_port}',
+            api_key='key',
+            default_target='qpu',
+            max_workers=4,
+        )
+        q0 = cirq.LineQubit(0)
+        x = sp.Symbol('x')
+        circuit = cirq.Circuit(cirq.X(q0) ** x, cirq.measure(q0, key='a'))
+        with mock.patch('time.sleep') as sleep:
+            results = service.sampler().run_sweep(
+                circuit, params=cirq.Linspace(x, 0, 1, 20), repetitions=3
+            )
+    finally:
+        server.shutdown()
+        server.server_close()
+
+    assert len(results) == 20
+    for result, resolver in zip(results, cirq.Linspace(x, 0, 1, 20)):
+        assert result.params == resolver
+        np.testing.assert_array_equal(result.measurements['a'], [[1], [1], [1]])
+    assert len(server.jobs) == 20
+    # One get when the job is created, then one per shared polling round.
+    assert all(entry['gets'] == 3 for entry in server.jobs.values())
+    assert sleep.call_count == 1
+    # Requests reuse pooled connections.
+    assert len(server.ports) <= 4
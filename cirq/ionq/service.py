@@ -42,6 +42,7 @@ class Service:
         api_version='v0.1',
         max_retry_seconds: int = 3600,
         verbose=False,
+        max_workers: int = 16,
     ):
         """Creates the Service to access IonQ's API.
 
@@ -59,6 +60,9 @@ class Service:
             api_version: Version of the api. Defaults to 'v0.1'.
             max_retry_seconds: The number of seconds to retry calls for. Defaults to one hour.
             verbose: Whether to print to stdio and stderr on retriable errors.
+            max_workers: The maximum number of concurrent requests made when running many jobs,
+                for example from a sampler sweep. This is also the number of connections to the
+                API that are kept open for reuse.
 
         Raises:
             EnvironmentError: if `remote_host` or `api_key` are None and have no corresponding
@@ -84,7 +88,9 @@ class Service:
             api_version=api_version,
             max_retry_seconds=max_retry_seconds,
             verbose=verbose,
+            max_connections=max_workers,
         )
+        self.max_workers = max_workers
 
     def run(
         self,
@@ -131,7 +137,7 @@ class Service:
         Returns:
             A `cirq.Sampler` for the IonQ API.
         """
-        return sampler.Sampler(service=self, target=target, seed=seed)
+        return sampler.Sampler(service=self, target=target, seed=seed, max_workers=self.max_workers)
 
     def create_job(
         self,
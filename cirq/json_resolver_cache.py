@@ -26,6 +26,7 @@ if TYPE_CHECKING:
 def _class_resolver_dictionary() -> Dict[str, ObjectFactory]:
     import cirq
     from cirq.ops import raw_types
+    from cirq.protocols import json_serialization
     import pandas as pd
     import numpy as np
     from cirq.devices.noise_model import _NoNoiseModel
@@ -143,6 +144,7 @@ def _class_resolver_dictionary() -> Dict[str, ObjectFactory]:
         'ZPowGate': cirq.ZPowGate,
         'ZZPowGate': cirq.ZZPowGate,
         # not a cirq class, but treated as one:
+        'numpy.ndarray': json_serialization._ndarray_from_json_dict,
         'pandas.DataFrame': pd.DataFrame,
         'pandas.Index': pd.Index,
         'pandas.MultiIndex': pd.MultiIndex.from_tuples,
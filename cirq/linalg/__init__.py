@@ -32,6 +32,7 @@ from cirq.linalg.decompositions import (
     extract_right_diag,
     kak_canonicalize_vector,
     kak_decomposition,
+    kak_decomposition_batch,
     kak_vector,
     KakDecomposition,
     kron_factor_4x4_to_2x2s,
@@ -31,18 +31,16 @@ from typing import (
     Union,
 )
 
-import matplotlib.pyplot as plt
-
-# this is for older systems with matplotlib <3.2 otherwise 3d projections fail
-from mpl_toolkits import mplot3d  # pylint: disable=unused-import
 import numpy as np
-import scipy
+import scipy.linalg
 
 from cirq import value, protocols
 from cirq._compat import proper_repr
 from cirq.linalg import combinators, diagonalize, predicates, transformations
 
 if TYPE_CHECKING:
+    import matplotlib.pyplot as plt
+
     import cirq
 
 T = TypeVar('T')
@@ -540,7 +538,7 @@ def scatter_plot_normalized_kak_interaction_coefficients(
     interactions: Iterable[Union[np.ndarray, 'cirq.SupportsUnitary', 'KakDecomposition']],
     *,
     include_frame: bool = True,
-    ax: Optional[plt.Axes] = None,
+    ax: Optional['plt.Axes'] = None,
     **kwargs,
 ):
     r"""Plots the interaction coefficients of many two-qubit operations.
@@ -615,6 +613,12 @@ def scatter_plot_normalized_kak_interaction_coefficients(
         >>> import matplotlib.pyplot as plt
         >>> plt.show()
     """
+    # Imported here because matplotlib is slow to import.
+    import matplotlib.pyplot as plt
+
+    # this is for older systems with matplotlib <3.2 otherwise 3d projections fail
+    from mpl_toolkits import mplot3d  # pylint: disable=unused-import
+
     show_plot = not ax
     if not ax:
         fig = plt.figure()
@@ -665,6 +669,23 @@ def scatter_plot_normalized_kak_interaction_coefficients(
     return ax
 
 
+# These special-unitary matrices flip the X, Y, and Z axes respectively.
+_KAK_FLIPPERS = [
+    np.array([[0, 1], [1, 0]]) * 1j,
+    np.array([[0, -1j], [1j, 0]]) * 1j,
+    np.array([[1, 0], [0, -1]]) * 1j,
+]
+
+# Each of these special-unitary matrices swaps two the roles of two axes.
+# The matrix at index k swaps the *other two* axes (e.g. swappers[1] is a
+# Hadamard operation that swaps X and Z).
+_KAK_SWAPPERS = [
+    np.array([[1, -1j], [1j, -1]]) * 1j * np.sqrt(0.5),
+    np.array([[1, 1], [1, -1]]) * 1j * np.sqrt(0.5),
+    np.array([[0, 1 - 1j], [1 + 1j, 0]]) * 1j * np.sqrt(0.5),
+]
+
+
 def kak_canonicalize_vector(x: float, y: float, z: float, atol: float = 1e-9) -> KakDecomposition:
     """Canonicalizes an XX/YY/ZZ interaction by swap/negate/shift-ing axes.
 
@@ -695,21 +716,8 @@ def kak_canonicalize_vector(x: float, y: float, z: float, atol: float = 1e-9) ->
     right = [np.eye(2)] * 2  # Per-qubit right factors.
     v = [x, y, z]  # Remaining XX/YY/ZZ interaction vector.
 
-    # These special-unitary matrices flip the X, Y, and Z axes respectively.
-    flippers = [
-        np.array([[0, 1], [1, 0]]) * 1j,
-        np.array([[0, -1j], [1j, 0]]) * 1j,
-        np.array([[1, 0], [0, -1]]) * 1j,
-    ]
-
-    # Each of these special-unitary matrices swaps two the roles of two axes.
-    # The matrix at index k swaps the *other two* axes (e.g. swappers[1] is a
-    # Hadamard operation that swaps X and Z).
-    swappers = [
-        np.array([[1, -1j], [1j, -1]]) * 1j * np.sqrt(0.5),
-        np.array([[1, 1], [1, -1]]) * 1j * np.sqrt(0.5),
-        np.array([[0, 1 - 1j], [1 + 1j, 0]]) * 1j * np.sqrt(0.5),
-    ]
+    flippers = _KAK_FLIPPERS
+    swappers = _KAK_SWAPPERS
 
     # Shifting strength by ½π is equivalent to local ops (e.g. exp(i½π XX)∝XX).
     def shift(k, step):
@@ -866,6 +874,219 @@ def kak_decomposition(
     )
 
 
+def kak_decomposition_batch(
+    unitaries: Union[Iterable[np.ndarray], np.ndarray],
+    *,
+    rtol: float = 1e-5,
+    atol: float = 1e-8,
+    check_preconditions: bool = True,
+) -> List[KakDecomposition]:
+    """Computes the KAK decompositions of many 4x4 unitaries at once.
+
+    Gives the same canonical interaction coefficients as calling
+    `cirq.kak_decomposition` on each unitary, but does the linear algebra for
+    all of them together with vectorized numpy operations. The single-qubit
+    factors may differ from the ones of `cirq.kak_decomposition`, since they
+    are not unique.
+
+    Args:
+        unitaries: A sequence of 4x4 unitary matrices, or an array of them
+            with shape (N, 4, 4).
+        rtol: Per-matrix-entry relative tolerance on equality.
+        atol: Per-matrix-entry absolute tolerance on equality.
+        check_preconditions: If set, verifies that the input consists of 4x4
+            unitaries before decomposing.
+
+    Returns:
+        A list with the `cirq.KakDecomposition` of each unitary, canonicalized
+        like the result of `cirq.kak_decomposition`.
+
+    Raises:
+        ValueError: Bad matrices.
+    """
+    mats = np.asarray(unitaries, dtype=np.complex128)
+    if len(mats) == 0:
+        return []
+    if mats.ndim != 3 or mats.shape[1:] != (4, 4):
+        raise ValueError(f'Expected input unitaries to have shape (N,4,4), but got {mats.shape}.')
+    if check_preconditions:
+        actual = np.einsum('...ba,...bc', mats.conj(), mats)
+        if not np.allclose(actual, np.eye(4), rtol=rtol, atol=atol):
+            raise ValueError(
+                f'Input must correspond to 4x4 unitary matrices. Received input:\n{mats}'
+            )
+
+    # In the magic basis, a unitary is K1 @ diag(s) @ K2 with K1, K2 special
+    # orthogonal. K2.T diagonalizes the symmetric unitary m = x.T @ x, and so
+    # simultaneously diagonalizes its commuting real and imaginary parts. A
+    # generic real combination of them separates all distinct eigenvalues.
+    x = KAK_MAGIC_DAG @ mats @ KAK_MAGIC
+    m = np.swapaxes(x, -1, -2) @ x
+    _, right = np.linalg.eigh(m.real + _KAK_EIGH_MIXING * m.imag)
+    right[np.linalg.det(right) < 0, :, 0] *= -1
+    s = np.sqrt(np.einsum('nji,njk,nki->ni', right, m, right))
+    # Only unitaries can be decomposed this way. Anything else (which is only
+    # possible without checking preconditions) is handled by the fallback.
+    not_unitary = ~np.all(np.isclose(np.abs(s), 1, rtol, atol), axis=1)
+    s[not_unitary] = 1
+    left = x @ right / s[:, np.newaxis, :]
+    flip = np.linalg.det(left).real < 0
+    s[flip, 0] *= -1
+    left[flip, :, 0] *= -1
+    left = left.real
+    # When the real combination has a repeated eigenvalue that m does not,
+    # the factors are not real. Such unitaries fall back to the
+    # one-at-a-time method.
+    fallback = not_unitary | ~np.all(
+        np.isclose((left * s[:, np.newaxis, :]) @ np.swapaxes(right, -1, -2), x, rtol, atol),
+        axis=(1, 2),
+    )
+
+    # Recover pieces.
+    a1, a0 = _so4_to_magic_su2s_batch(left)
+    b1, b0 = _so4_to_magic_su2s_batch(np.swapaxes(right, -1, -2))
+    wxyz = np.angle(s) @ KAK_GAMMA.T
+    g = np.exp(1j * wxyz[:, 0])
+
+    # Canonicalize.
+    phase, after, vectors, before = _kak_canonicalize_vectors(wxyz[:, 1:], atol=1e-9)
+    b1 = before[1] @ b1
+    b0 = before[0] @ b0
+    a1 = a1 @ after[1]
+    a0 = a0 @ after[0]
+    g = g * phase
+
+    return [
+        kak_decomposition(mats[i], rtol=rtol, atol=atol, check_preconditions=False)
+        if fallback[i]
+        else KakDecomposition(
+            interaction_coefficients=(
+                float(vectors[i, 0]),
+                float(vectors[i, 1]),
+                float(vectors[i, 2]),
+            ),
+            global_phase=g[i],
+            single_qubit_operations_before=(b1[i], b0[i]),
+            single_qubit_operations_after=(a1[i], a0[i]),
+        )
+        for i in range(len(mats))
+    ]
+
+
+# Weight of the imaginary part when diagonalizing symmetric unitaries. Any
+# value works, except for a measure zero set that depends on the eigenvalues.
+_KAK_EIGH_MIXING = 0.5772156649015329
+
+
+def _so4_to_magic_su2s_batch(mats: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """Vectorized `so4_to_magic_su2s` for an (N, 4, 4) array of matrices."""
+    ab = MAGIC @ mats @ MAGIC_CONJ_T
+    n = len(ab)
+    rows = np.arange(n)
+
+    # Use the entry with the largest magnitude as a reference point.
+    a, b = np.divmod(np.argmax(np.abs(ab).reshape((n, 16)), axis=1), 4)
+
+    # Extract sub-factors touching the reference cell.
+    f1 = np.zeros((n, 2, 2), dtype=np.complex128)
+    f2 = np.zeros((n, 2, 2), dtype=np.complex128)
+    for i in range(2):
+        for j in range(2):
+            f1[rows, (a >> 1) ^ i, (b >> 1) ^ j] = ab[rows, a ^ (i << 1), b ^ (j << 1)]
+            f2[rows, (a & 1) ^ i, (b & 1) ^ j] = ab[rows, a ^ i, b ^ j]
+
+    # Rescale factors to have unit determinants.
+    for f in (f1, f2):
+        det = np.sqrt(np.linalg.det(f))
+        det[det == 0] = 1
+        f /= det[:, np.newaxis, np.newaxis]
+
+    # Make the implied global phase have a non-negative real part, as done by
+    # kron_factor_4x4_to_2x2s.
+    g = ab[rows, a, b] * np.conj(f1[rows, a >> 1, b >> 1] * f2[rows, a & 1, b & 1])
+    f1[np.real(g) < 0] *= -1
+
+    return f1, f2
+
+
+def _kak_canonicalize_vectors(
+    vectors: np.ndarray, atol: float
+) -> Tuple[np.ndarray, Tuple[np.ndarray, np.ndarray], np.ndarray, Tuple[np.ndarray, np.ndarray]]:
+    """Vectorized `kak_canonicalize_vector` for an (N, 3) array of vectors.
+
+    Applies the same sequence of steps as `kak_canonicalize_vector` to each
+    vector, on all the vectors needing a step at once.
+
+    Returns:
+        A tuple (phase, (left0, left1), vectors, (right0, right1)) of arrays
+        with the global phases, per-qubit left factors, canonical vectors and
+        per-qubit right factors. The implied decomposition of the i-th vector
+        is the one returned by `kak_canonicalize_vector`, with
+        single_qubit_operations_after=(left1[i], left0[i]) and
+        single_qubit_operations_before=(right1[i], right0[i]).
+    """
+    n = len(vectors)
+    phase = np.ones(n, dtype=np.complex128)
+    left = [np.tile(np.eye(2, dtype=np.complex128), (n, 1, 1)) for _ in range(2)]
+    right = [np.tile(np.eye(2, dtype=np.complex128), (n, 1, 1)) for _ in range(2)]
+    v = np.array(vectors, dtype=np.float64)
+
+    def shift(mask, k, step):
+        v[mask, k] += step * np.pi / 2
+        phase[mask] *= 1j ** step
+        flipper = _KAK_FLIPPERS[k] ** (step % 4)
+        right[0][mask] = flipper @ right[0][mask]
+        right[1][mask] = flipper @ right[1][mask]
+
+    def negate(mask, k1, k2):
+        v[mask, k1] *= -1
+        v[mask, k2] *= -1
+        phase[mask] *= -1
+        flipper = _KAK_FLIPPERS[3 - k1 - k2]
+        left[1][mask] = left[1][mask] @ flipper
+        right[1][mask] = flipper @ right[1][mask]
+
+    def swap(mask, k1, k2):
+        v[mask, k1], v[mask, k2] = v[mask, k2], v[mask, k1]
+        swapper = _KAK_SWAPPERS[3 - k1 - k2]
+        left[0][mask] = left[0][mask] @ swapper
+        left[1][mask] = left[1][mask] @ swapper
+        right[0][mask] = swapper @ right[0][mask]
+        right[1][mask] = swapper @ right[1][mask]
+
+    def canonical_shift(k):
+        while True:
+            mask = v[:, k] <= -np.pi / 4
+            if not mask.any():
+                break
+            shift(mask, k, +1)
+        while True:
+            mask = v[:, k] > np.pi / 4
+            if not mask.any():
+                break
+            shift(mask, k, -1)
+
+    def sort():
+        swap(np.abs(v[:, 0]) < np.abs(v[:, 1]), 0, 1)
+        swap(np.abs(v[:, 1]) < np.abs(v[:, 2]), 1, 2)
+        swap(np.abs(v[:, 0]) < np.abs(v[:, 1]), 0, 1)
+
+    canonical_shift(0)
+    canonical_shift(1)
+    canonical_shift(2)
+    sort()
+
+    negate(v[:, 0] < 0, 0, 2)
+    negate(v[:, 1] < 0, 1, 2)
+    canonical_shift(2)
+
+    mask = (v[:, 0] > np.pi / 4 - atol) & (v[:, 2] < 0)
+    shift(mask, 0, -1)
+    negate(mask, 0, 2)
+
+    return phase, (left[0], left[1]), v, (right[0], right[1])
+
+
 def kak_vector(
     unitary: Union[Iterable[np.ndarray], np.ndarray],
     *,
@@ -745,6 +745,89 @@ def test_kak_decompose(unitary: np.ndarray):
     assert len(list(circuit.all_operations())) == 8
 
 
+def _assert_same_kak_decompositions(actual, unitaries):
+    assert len(actual) == len(unitaries)
+    for kak, unitary in zip(actual, unitaries):
+        np.testing.assert_allclose(cirq.unitary(kak), unitary, atol=1e-8)
+        np.testing.assert_allclose(
+            kak.interaction_coefficients,
+            cirq.kak_decomposition(unitary).interaction_coefficients,
+            atol=1e-8,
+        )
+
+
+def test_kak_decomposition_batch():
+    unitaries = np.array(
+        [
+            np.eye(4),
+            SWAP,
+            SWAP * 1j,
+            CZ,
+            CNOT,
+            SWAP @ CZ,
+            np.kron(X, Y),
+            cirq.unitary(cirq.ISWAP ** 0.5),
+            cirq.unitary(cirq.FSimGate(theta=0.3, phi=-0.2)),
+        ]
+        + [cirq.testing.random_unitary(4) for _ in range(10)]
+    )
+    _assert_same_kak_decompositions(cirq.kak_decomposition_batch(unitaries), unitaries)
+    _assert_same_kak_decompositions(
+        cirq.kak_decomposition_batch(list(unitaries[:3])), unitaries[:3]
+    )
+
+    kaks = cirq.kak_decomposition_batch(_random_unitaries)
+    np.testing.assert_allclose(
+        [kak.interaction_coefficients for kak in kaks], cirq.kak_vector(_random_unitaries)
+    )
+    assert cirq.kak_decomposition_batch([]) == []
+
+
+def test_kak_decomposition_batch_fallback(monkeypatch):
+    # The magic basis eigenvalues exp(iθ) and exp(i(2φ - θ)) with
+    # tan(φ) = _KAK_EIGH_MIXING cannot be told apart by the batched method.
+    phi = np.arctan(cirq.linalg.decompositions._KAK_EIGH_MIXING)
+    theta = np.array([0.1, 2 * phi - 0.1, 1.0, -1.1 - 2 * phi])
+    magic = cirq.linalg.decompositions.KAK_MAGIC
+    interaction = magic @ np.diag(np.exp(0.5j * theta)) @ magic.conj().T
+    # Local factors with unit determinant keep the eigenvalues unchanged.
+    locals_before = np.kron(
+        cirq.testing.random_special_unitary(2), cirq.testing.random_special_unitary(2)
+    )
+    locals_after = np.kron(
+        cirq.testing.random_special_unitary(2), cirq.testing.random_special_unitary(2)
+    )
+    unitary = locals_after @ interaction @ locals_before
+
+    calls = []
+    kak_decomposition = cirq.linalg.decompositions.kak_decomposition
+
+    def counting_kak_decomposition(*args, **kwargs):
+        calls.append(args)
+        return kak_decomposition(*args, **kwargs)
+
+    monkeypatch.setattr(cirq.linalg.decompositions, 'kak_decomposition', counting_kak_decomposition)
+    kaks = cirq.kak_decomposition_batch([unitary, CZ])
+    assert len(calls) == 1
+    monkeypatch.undo()
+    _assert_same_kak_decompositions(kaks, [unitary, CZ])
+
+
+def test_kak_decomposition_batch_invalid_input():
+    with pytest.raises(ValueError, match='to have shape'):
+        _ = cirq.kak_decomposition_batch(np.eye(4))
+    with pytest.raises(ValueError, match='to have shape'):
+        _ = cirq.kak_decomposition_batch([np.eye(8)])
+    with pytest.raises(ValueError, match='4x4 unitary matrices'):
+        _ = cirq.kak_decomposition_batch([np.eye(4), np.ones((4, 4))])
+
+    nil, eye = cirq.kak_decomposition_batch(
+        [np.zeros((4, 4)), np.eye(4)], check_preconditions=False
+    )
+    np.testing.assert_allclose(cirq.unitary(nil), np.eye(4), atol=1e-8)
+    np.testing.assert_allclose(cirq.unitary(eye), np.eye(4), atol=1e-8)
+
+
 def test_num_two_qubit_gates_required():
     for i in range(4):
         assert (
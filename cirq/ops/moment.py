@@ -15,6 +15,7 @@
 """A simplified time-slice of operations within a sequenced circuit."""
 
 from typing import (
+    AbstractSet,
     Any,
     Callable,
     Dict,
@@ -98,6 +99,20 @@ class Moment:
 
         self._qubits = frozenset(self._qubit_to_op.keys())
 
+        # Positions of the parameterized operations, computed on first use.
+        self._parameterized_indices: Optional[Tuple[int, ...]] = None
+
+    def __getstate__(self) -> Dict[str, Any]:
+        # The indices by qubit are rebuilt when unpickling, which is about as
+        # fast as loading them and makes pickles smaller.
+        return {'_operations': self._operations}
+
+    def __setstate__(self, state: Dict[str, Any]) -> None:
+        self._operations = state['_operations']
+        self._qubit_to_op = {q: op for op in self._operations for q in op.qubits}
+        self._qubits = frozenset(self._qubit_to_op.keys())
+        self._parameterized_indices = None
+
     @property
     def operations(self) -> Tuple['cirq.Operation', ...]:
         return self._operations
@@ -219,6 +234,34 @@ class Moment:
             for op in self.operations
         )
 
+    def _parameterized_operation_indices(self) -> Tuple[int, ...]:
+        if self._parameterized_indices is None:
+            self._parameterized_indices = tuple(
+                i for i, op in enumerate(self._operations) if protocols.is_parameterized(op)
+            )
+        return self._parameterized_indices
+
+    def _is_parameterized_(self) -> bool:
+        return bool(self._parameterized_operation_indices())
+
+    def _parameter_names_(self) -> AbstractSet[str]:
+        return {
+            name
+            for i in self._parameterized_operation_indices()
+            for name in protocols.parameter_names(self._operations[i])
+        }
+
+    def _resolve_parameters_(
+        self, resolver: 'cirq.ParamResolver', recursive: bool
+    ) -> 'cirq.Moment':
+        indices = self._parameterized_operation_indices()
+        if not indices:
+            return self
+        operations = list(self._operations)
+        for i in indices:
+            operations[i] = protocols.resolve_parameters(operations[i], resolver, recursive)
+        return Moment(operations)
+
     def __copy__(self):
         return type(self)(self.operations)
 
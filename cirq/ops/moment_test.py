@@ -12,7 +12,10 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import pickle
+
 import pytest
+import sympy
 
 import cirq
 import cirq.testing
@@ -435,6 +438,26 @@ def test_deprecated_operations_parameter():
     assert m == cirq.Moment(op)
 
 
+def test_parameterized():
+    a, b, c = cirq.LineQubit.range(3)
+    moment = cirq.Moment(
+        [cirq.X(a) ** sympy.Symbol('s'), cirq.H(b), cirq.Z(c) ** (2 * sympy.Symbol('t'))]
+    )
+    assert cirq.is_parameterized(moment)
+    assert cirq.parameter_names(moment) == {'s', 't'}
+    assert not cirq.is_parameterized(cirq.Moment([cirq.H(b)]))
+    assert not cirq.is_parameterized(cirq.Moment())
+
+    resolved = cirq.resolve_parameters(moment, {'s': 0.5, 't': 0.125})
+    assert resolved == cirq.Moment([cirq.X(a) ** 0.5, cirq.H(b), cirq.Z(c) ** 0.25])
+    assert resolved.operations[1] is moment.operations[1]
+    assert not cirq.is_parameterized(resolved)
+
+    unparameterized = cirq.Moment([cirq.H(a)]).with_operation(cirq.X(b))
+    assert cirq.resolve_parameters(unparameterized, {'s': 0.5}) is unparameterized
+    assert cirq.is_parameterized(unparameterized.with_operation(cirq.Y(c) ** sympy.Symbol('s')))
+
+
 def test_indexes_by_qubit():
     a, b, c = cirq.LineQubit.range(3)
     moment = cirq.Moment([cirq.H(a), cirq.CNOT(b, c)])
@@ -595,3 +618,18 @@ def test_transform_qubits():
     with cirq.testing.assert_logs('Use qubit_map instead'):
         # pylint: disable=no-value-for-parameter,unexpected-keyword-arg
         assert original.transform_qubits(func=lambda q: cirq.GridQubit(10 + q.x, 20)) == modified
+
+
+def test_pickle():
+    a, b, c = cirq.LineQubit.range(3)
+    moment = cirq.Moment([cirq.CZ(a, b), cirq.X(c) ** sympy.Symbol('t')])
+    assert cirq.is_parameterized(moment)
+
+    restored = pickle.loads(pickle.dumps(moment))
+    assert restored == moment
+    assert restored.qubits == moment.qubits
+    assert restored.operation_at(b) == cirq.CZ(a, b)
+    assert cirq.is_parameterized(restored)
+    assert restored.with_operation(cirq.Y(cirq.LineQubit(3))).operations[-1] == cirq.Y(
+        cirq.LineQubit(3)
+    )
@@ -22,6 +22,10 @@ from cirq.optimizers.align_right import (
     AlignRight,
 )
 
+from cirq.optimizers.compile_batch import (
+    compile_batch,
+)
+
 from cirq.optimizers.cphase_to_fsim import (
     compute_cphase_exponents_for_fsim_decomposition,
     decompose_cphase_into_two_fsim,
@@ -66,12 +70,17 @@ from cirq.optimizers.merge_single_qubit_gates import (
     MergeSingleQubitGates,
 )
 
+from cirq.optimizers.decomposition_cache import (
+    TwoQubitDecompositionCache,
+)
+
 from cirq.optimizers.decompositions import (
     is_negligible_turn,
     single_qubit_matrix_to_gates,
     single_qubit_matrix_to_pauli_rotations,
     single_qubit_matrix_to_phased_x_z,
     single_qubit_matrix_to_phxz,
+    single_qubit_matrix_to_phxz_batch,
     single_qubit_op_to_framed_phase_form,
 )
 
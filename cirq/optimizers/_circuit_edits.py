@@ -0,0 +1,193 @@
+# Copyright 2021 The Cirq Developers
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Edits of a circuit that are collected during a scan and applied at once."""
+
+from typing import Dict, List, Optional, Set, Tuple, Union, TYPE_CHECKING
+
+from cirq import devices, ops
+
+if TYPE_CHECKING:
+    import cirq
+
+
+class CircuitEdits:
+    """Removals, replacements and insertions to apply to a circuit at once.
+
+    Optimizers that scan a circuit once record their edits here and apply them
+    at the end. Recording an edit takes constant time and `apply` rebuilds the
+    moments of the circuit once, so the whole optimization takes time linear in
+    the number of operations. The result is the same as that of calling
+    `batch_remove`, `batch_replace`, `batch_insert_into` and `batch_insert` on
+    the circuit, in that order, which take quadratic time when there are many
+    edits or insertions.
+
+    The rebuild requires that every operation inserted before a moment acts on
+    a qubit that the (edited) moment acts on, that operations inserted before
+    the same moment act on different qubits, and that the circuit has no
+    device. Otherwise the edits are applied with the batch methods.
+    """
+
+    def __init__(self, circuit: 'cirq.Circuit') -> None:
+        self._circuit = circuit
+        # For each moment, the removed or replaced operations by their id.
+        self._changes: Dict[
+            int, Dict[int, Tuple['cirq.Operation', Optional['cirq.Operation']]]
+        ] = {}
+        self._insert_intos: Dict[int, List['cirq.Operation']] = {}
+        self._insertions: List[Tuple[int, 'cirq.Operation']] = []
+
+    def remove(self, moment_index: int, op: 'cirq.Operation') -> None:
+        """Removes an operation from a moment of the circuit."""
+        self._changes.setdefault(moment_index, {})[id(op)] = (op, None)
+
+    def replace(self, moment_index: int, op: 'cirq.Operation', new_op: 'cirq.Operation') -> None:
+        """Replaces an operation of a moment, overriding earlier replacements."""
+        self._changes.setdefault(moment_index, {})[id(op)] = (op, new_op)
+
+    def insert_into(self, moment_index: int, op: 'cirq.Operation') -> None:
+        """Adds an operation to an existing moment, as `batch_insert_into`."""
+        self._insert_intos.setdefault(moment_index, []).append(op)
+
+    def insert(self, index: int, op: 'cirq.Operation') -> None:
+        """Inserts an operation before a moment, as `batch_insert`.
+
+        Index `len(circuit)` inserts the operation at the end of the circuit.
+        """
+        self._insertions.append((index, op))
+
+    def apply(self) -> None:
+        """Applies all recorded edits to the circuit."""
+        moments = None
+        if self._circuit.device == devices.UNCONSTRAINED_DEVICE:
+            moments = self._rebuilt_moments()
+        if moments is None:
+            self._apply_in_batches()
+        else:
+            self._circuit[:] = moments
+
+    def _apply_in_batches(self) -> None:
+        circuit = self._circuit
+        removals = []
+        replacements = []
+        for i, changes in self._changes.items():
+            for op, new_op in changes.values():
+                if new_op is None:
+                    removals.append((i, op))
+                else:
+                    replacements.append((i, op, new_op))
+        if removals:
+            circuit.batch_remove(removals)
+        if replacements:
+            circuit.batch_replace(replacements)
+        if self._insert_intos:
+            circuit.batch_insert_into(self._insert_intos.items())
+        if self._insertions:
+            circuit.batch_insert(self._insertions)
+
+    def _rebuilt_moments(self) -> Optional[List['cirq.Moment']]:
+        """Returns the edited moments, or None if the edits need the batch methods."""
+        old_moments = self._circuit.moments
+        n = len(old_moments)
+
+        # The operations and qubits of the moments that change.
+        edited: Dict[int, List['cirq.Operation']] = {}
+        edited_qubits: Dict[int, Set['cirq.Qid']] = {}
+
+        def edit(i: int) -> List['cirq.Operation']:
+            if i not in edited:
+                edited[i] = list(old_moments[i].operations)
+                edited_qubits[i] = set(old_moments[i].qubits)
+            return edited[i]
+
+        def operates_on(i: int, op: 'cirq.Operation') -> bool:
+            qubits = edited_qubits[i] if i in edited else old_moments[i].qubits
+            return any(q in qubits for q in op.qubits)
+
+        for i, changes in self._changes.items():
+            operations = []
+            matched = 0
+            for op in old_moments[i].operations:
+                change = changes.get(id(op))
+                if change is None:
+                    operations.append(op)
+                    continue
+                matched += 1
+                if change[1] is not None:
+                    operations.append(change[1])
+            if matched != len(changes):
+                # Some edited operation isn't in the moment; let the batch
+                # methods raise the error.
+                return None
+            edited[i] = operations
+            edited_qubits[i] = {q for op in operations for q in op.qubits}
+        for i, operations in self._insert_intos.items():
+            edit(i).extend(operations)
+            edited_qubits[i].update(q for op in operations for q in op.qubits)
+
+        groups: Dict[int, List['cirq.Operation']] = {}
+        for i, op in self._insertions:
+            if not 0 <= i <= n:
+                return None
+            groups.setdefault(i, []).append(op)
+
+        # Like `batch_insert`, later insertions at an index end up first. The
+        # moment before the index takes the inserted operations until one of
+        # them doesn't fit, and the rest go into one new moment.
+        new_moments: Dict[int, List['cirq.Operation']] = {}
+        for i in sorted(groups):
+            if i == n:
+                continue
+            new_moment: Optional[List['cirq.Operation']] = None
+            new_qubits: Set['cirq.Qid'] = set()
+            for op in reversed(groups[i]):
+                if not operates_on(i, op):
+                    return None
+                if new_moment is None and i > 0 and not operates_on(i - 1, op):
+                    edit(i - 1).append(op)
+                    edited_qubits[i - 1].update(op.qubits)
+                    continue
+                if any(q in new_qubits for q in op.qubits):
+                    return None
+                if new_moment is None:
+                    new_moment = new_moments[i] = []
+                new_moment.append(op)
+                new_qubits.update(op.qubits)
+
+        result: List[Union['cirq.Moment', List['cirq.Operation']]] = []
+        for i in range(n):
+            if i in new_moments:
+                result.append(new_moments[i])
+            result.append(edited[i] if i in edited else old_moments[i])
+
+        # Operations inserted at the end go into the earliest moment after
+        # the last operation on their qubits.
+        if n in groups:
+            last: Dict['cirq.Qid', int] = {}
+            for k, moment in enumerate(result):
+                for op in moment.operations if isinstance(moment, ops.Moment) else moment:
+                    for q in op.qubits:
+                        last[q] = k
+            for op in reversed(groups[n]):
+                k = max((last.get(q, -1) for q in op.qubits), default=-1) + 1
+                if k == len(result):
+                    result.append([])
+                moment = result[k]
+                if isinstance(moment, ops.Moment):
+                    moment = result[k] = list(moment.operations)
+                moment.append(op)
+                for q in op.qubits:
+                    last[q] = k
+
+        return [m if isinstance(m, ops.Moment) else ops.Moment(m) for m in result]
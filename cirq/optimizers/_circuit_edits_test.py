@@ -0,0 +1,129 @@
+# Copyright 2021 The Cirq Developers
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import random
+
+import pytest
+
+import cirq
+from cirq.optimizers._circuit_edits import CircuitEdits
+
+
+def _apply_in_batches(circuit, removals, replacements, insert_intos, insertions):
+    circuit.batch_remove(removals)
+    circuit.batch_replace(replacements)
+    circuit.batch_insert_into(insert_intos)
+    circuit.batch_insert(insertions)
+
+
+def _random_edits(circuit, rng):
+    removals = []
+    replacements = []
+    insert_intos = []
+    insertions = []
+    for i, moment in enumerate(circuit):
+        for op in moment.operations:
+            r = rng.random()
+            if r < 0.2:
+                removals.append((i, op))
+            elif r < 0.3:
+                replacements.append((i, op, cirq.Y.on_each(*op.qubits)[0]))
+            elif r < 0.5:
+                # Insertions before a moment act on a qubit of the moment.
+                insertions.append((i, cirq.Z(rng.choice(op.qubits)) ** 0.5))
+        free = sorted(set(circuit.all_qubits()) - moment.qubits)
+        if free and rng.random() < 0.3:
+            insert_intos.append((i, cirq.X(rng.choice(free))))
+    for q in sorted(circuit.all_qubits()):
+        if rng.random() < 0.5:
+            insertions.append((len(circuit), cirq.S(q)))
+    return removals, replacements, insert_intos, insertions
+
+
+def test_apply_matches_batch_methods():
+    rng = random.Random(1234)
+    qubits = cirq.LineQubit.range(4)
+    for seed in range(100):
+        circuit = cirq.testing.random_circuit(
+            qubits, n_moments=6, op_density=0.6, random_state=seed
+        )
+        removals, replacements, insert_intos, insertions = _random_edits(circuit, rng)
+
+        expected = circuit.copy()
+        _apply_in_batches(expected, removals, replacements, insert_intos, insertions)
+        edits = CircuitEdits(circuit)
+        for i, op in removals:
+            edits.remove(i, op)
+        for i, op, new_op in replacements:
+            edits.replace(i, op, new_op)
+        for i, op in insert_intos:
+            edits.insert_into(i, op)
+        for i, op in insertions:
+            edits.insert(i, op)
+        edits.apply()
+
+        assert circuit == expected
+
+
+def test_insertions():
+    a, b, c = cirq.LineQubit.range(3)
+    circuit = cirq.Circuit(
+        cirq.Moment([cirq.X(a)]),
+        cirq.Moment([cirq.CZ(a, b)]),
+        cirq.Moment([cirq.CZ(b, c)]),
+    )
+    edits = CircuitEdits(circuit)
+    # Later insertions go first, into the previous moment while they fit.
+    edits.insert(1, cirq.Z(a))
+    edits.insert(1, cirq.Z(b))
+    edits.insert(2, cirq.Z(c))
+    edits.insert(3, cirq.Y(a))
+    edits.insert(3, cirq.Y(c))
+    edits.apply()
+    assert circuit == cirq.Circuit(
+        cirq.Moment([cirq.X(a), cirq.Z(b)]),
+        cirq.Moment([cirq.Z(a)]),
+        cirq.Moment([cirq.CZ(a, b), cirq.Z(c)]),
+        cirq.Moment([cirq.CZ(b, c), cirq.Y(a)]),
+        cirq.Moment([cirq.Y(c)]),
+    )
+
+
+def test_falls_back_to_batch_methods():
+    a, b = cirq.LineQubit.range(2)
+
+    # The inserted operation doesn't act on the qubits of the moment.
+    circuit = cirq.Circuit(cirq.Moment([cirq.X(a)]), cirq.Moment([cirq.Y(a)]), cirq.Moment())
+    edits = CircuitEdits(circuit)
+    edits.insert(2, cirq.Z(b))
+    edits.apply()
+    assert circuit == cirq.Circuit(
+        cirq.Moment([cirq.X(a), cirq.Z(b)]), cirq.Moment([cirq.Y(a)]), cirq.Moment()
+    )
+
+    # The circuit has a device.
+    q = cirq.GridQubit(0, 0)
+    circuit = cirq.Circuit(cirq.X(q), cirq.Y(q), device=cirq.google.Foxtail)
+    edits = CircuitEdits(circuit)
+    edits.remove(0, cirq.X(q))
+    edits.insert(1, cirq.Z(q))
+    edits.apply()
+    assert circuit == cirq.Circuit(cirq.Z(q), cirq.Y(q), device=cirq.google.Foxtail)
+
+    # The edited operation isn't in the circuit.
+    circuit = cirq.Circuit(cirq.X(a))
+    edits = CircuitEdits(circuit)
+    edits.remove(0, cirq.Y(a))
+    with pytest.raises(ValueError, match="doesn't exist"):
+        edits.apply()
@@ -0,0 +1,166 @@
+# Copyright 2021 The Cirq Developers
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Compiling many circuits, or independent parts of circuits, in parallel."""
+
+import concurrent.futures
+import functools
+from typing import Callable, Dict, Iterable, List, Optional, TYPE_CHECKING
+
+from cirq import circuits, ops
+
+if TYPE_CHECKING:
+    import cirq
+
+# Compiles a circuit, either by changing it in place and returning None, or by
+# returning a new circuit.
+Optimizer = Callable[['cirq.Circuit'], Optional['cirq.Circuit']]
+
+
+def compile_batch(
+    circuits_to_compile: Iterable['cirq.AbstractCircuit'],
+    optimizer: Optimizer,
+    *,
+    max_workers: Optional[int] = None,
+    split_components: bool = False,
+    executor: Optional[concurrent.futures.Executor] = None,
+) -> List['cirq.Circuit']:
+    """Compiles circuits in parallel processes.
+
+    The circuits are sent to the worker processes as `cirq.FrozenCircuit`s,
+    which pickle compactly, and the largest circuits are started first.
+
+    If `split_components` is set, every circuit is also split into parts
+    acting on disjoint sets of qubits, where two qubits are in the same part
+    whenever some multi-qubit operation acts on both of them. The parts are
+    compiled independently and combined again with `cirq.Circuit.zip`, so a
+    single large circuit made of independent parts is compiled in parallel
+    too. This is only valid for optimizers that act on each part in isolation
+    and keep its operations on its own qubits.
+
+    Args:
+        circuits_to_compile: The circuits to compile. They are not changed.
+        optimizer: Compiles a circuit, either by changing it in place and
+            returning None, like `cirq.PointOptimizer`s do, or by returning
+            the compiled circuit, like `cirq.google.optimized_for_sycamore`
+            does. It must be picklable, so e.g. use `functools.partial`
+            instead of a lambda to fix some arguments of a function.
+        max_workers: The maximum number of processes to use. Defaults to the
+            number of processors. If 1, the circuits are compiled one after
+            the other in this process.
+        split_components: Whether to compile the parts of each circuit acting
+            on disjoint sets of qubits separately.
+        executor: An executor to compile the circuits with instead of a new
+            pool of `max_workers` processes.
+
+    Returns:
+        The compiled circuits, in the order of the given circuits.
+
+    Raises:
+        ValueError: If `max_workers` is not positive, or if compiled parts of
+            a circuit act on the same qubits at the same moment.
+    """
+    if max_workers is not None and max_workers <= 0:
+        raise ValueError(f'max_workers must be positive, got {max_workers}.')
+
+    parts: List[List['cirq.FrozenCircuit']] = []
+    for circuit in circuits_to_compile:
+        frozen = circuit.freeze()
+        parts.append(_qubit_components(frozen) if split_components else [frozen])
+    tasks = [part for circuit_parts in parts for part in circuit_parts]
+    # Starting the largest tasks first keeps all workers busy until the end.
+    order = sorted(range(len(tasks)), key=lambda i: -_num_operations(tasks[i]))
+    compile_task = functools.partial(_compile, optimizer)
+
+    if executor is not None:
+        results = list(executor.map(compile_task, [tasks[i] for i in order]))
+    elif max_workers == 1 or len(tasks) <= 1:
+        results = [compile_task(tasks[i]) for i in order]
+    else:
+        with concurrent.futures.ProcessPoolExecutor(max_workers=max_workers) as pool:
+            results = list(pool.map(compile_task, [tasks[i] for i in order]))
+    compiled = list(tasks)
+    for i, result in zip(order, results):
+        compiled[i] = result
+
+    outputs = []
+    start = 0
+    for circuit_parts in parts:
+        compiled_parts = [part.unfreeze() for part in compiled[start : start + len(circuit_parts)]]
+        start += len(circuit_parts)
+        if len(compiled_parts) == 1:
+            outputs.append(compiled_parts[0])
+        else:
+            outputs.append(
+                circuits.Circuit(
+                    circuits.Circuit.zip(*compiled_parts).moments,
+                    device=compiled_parts[0].device,
+                )
+            )
+    return outputs
+
+
+def _compile(optimizer: Optimizer, circuit: 'cirq.FrozenCircuit') -> 'cirq.FrozenCircuit':
+    result = circuit.unfreeze()
+    compiled = optimizer(result)
+    return (result if compiled is None else compiled).freeze()
+
+
+def _num_operations(circuit: 'cirq.AbstractCircuit') -> int:
+    return sum(len(moment) for moment in circuit.moments)
+
+
+def _qubit_components(circuit: 'cirq.FrozenCircuit') -> List['cirq.FrozenCircuit']:
+    """Splits a circuit into parts acting on disjoint sets of qubits.
+
+    Two qubits are in the same part if an operation acts on both of them.
+    Every part has all moments of the circuit, restricted to its qubits, so
+    zipping the parts gives back the circuit. Operations without qubits are
+    kept in the first part.
+    """
+    parent: Dict['cirq.Qid', 'cirq.Qid'] = {}
+
+    def find(q: 'cirq.Qid') -> 'cirq.Qid':
+        root = q
+        while parent[root] != root:
+            root = parent[root]
+        while parent[q] != root:
+            parent[q], q = root, parent[q]
+        return root
+
+    for moment in circuit.moments:
+        for op in moment.operations:
+            for q in op.qubits:
+                parent.setdefault(q, q)
+            for q in op.qubits[1:]:
+                a, b = find(op.qubits[0]), find(q)
+                if a != b:
+                    parent[b] = a
+
+    # Number the parts in the order their qubits first appear.
+    part_of_root: Dict['cirq.Qid', int] = {}
+    for q in parent:
+        part_of_root.setdefault(find(q), len(part_of_root))
+    if len(part_of_root) <= 1:
+        return [circuit]
+
+    part_moments: List[List['cirq.Moment']] = [[] for _ in part_of_root]
+    for moment in circuit.moments:
+        part_ops: List[List['cirq.Operation']] = [[] for _ in part_of_root]
+        for op in moment.operations:
+            part = part_of_root[find(op.qubits[0])] if op.qubits else 0
+            part_ops[part].append(op)
+        for moments, operations in zip(part_moments, part_ops):
+            moments.append(ops.Moment(operations))
+    return [circuits.FrozenCircuit(moments, device=circuit.device) for moments in part_moments]
@@ -0,0 +1,131 @@
+# Copyright 2021 The Cirq Developers
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import concurrent.futures
+
+import pytest
+
+import cirq
+from cirq.optimizers.compile_batch import _qubit_components
+
+
+def _random_circuits(num_circuits):
+    return [
+        cirq.testing.random_circuit(
+            qubits=cirq.LineQubit.range(5), n_moments=8, op_density=0.7, random_state=seed
+        )
+        for seed in range(num_circuits)
+    ]
+
+
+def _serial(circuits, optimizer):
+    results = []
+    for circuit in circuits:
+        circuit = circuit.copy()
+        compiled = optimizer(circuit)
+        results.append(circuit if compiled is None else compiled)
+    return results
+
+
+def _without_z(circuit):
+    return cirq.Circuit(
+        op for op in circuit.all_operations() if not isinstance(op.gate, cirq.ZPowGate)
+    )
+
+
+@pytest.mark.parametrize('max_workers', [1, 2])
+def test_compile_batch_matches_serial(max_workers):
+    circuits = _random_circuits(4)
+    originals = [c.copy() for c in circuits]
+    optimizer = cirq.MergeSingleQubitGates()
+
+    compiled = cirq.compile_batch(circuits, optimizer, max_workers=max_workers)
+
+    assert circuits == originals
+    assert compiled == _serial(circuits, optimizer)
+    assert all(type(c) is cirq.Circuit for c in compiled)
+
+
+def test_compile_batch_returned_circuits_and_executor():
+    circuits = _random_circuits(3)
+    with concurrent.futures.ThreadPoolExecutor(max_workers=2) as executor:
+        compiled = cirq.compile_batch(circuits, _without_z, executor=executor)
+    assert compiled == _serial(circuits, _without_z)
+
+
+def test_compile_batch_frozen_circuits_and_devices():
+    q = cirq.GridQubit.rect(1, 2)
+    circuit = cirq.Circuit(cirq.X(q[0]) ** 0.5, cirq.CZ(*q), device=cirq.google.Foxtail)
+    (compiled,) = cirq.compile_batch([circuit.freeze()], cirq.ConvertToCzAndSingleGates())
+    assert compiled.device is cirq.google.Foxtail
+    cirq.testing.assert_same_circuits(compiled, circuit)
+
+
+def test_compile_batch_split_components():
+    a, b, c, d, e = cirq.LineQubit.range(5)
+    circuit = cirq.Circuit(
+        cirq.X(a) ** 0.5,
+        cirq.Y(b) ** 0.25,
+        cirq.CNOT(a, c),
+        cirq.ISWAP(b, d),
+        cirq.Z(e),
+        cirq.Y(a) ** 0.5,
+        cirq.Y(d),
+        cirq.GlobalPhaseOperation(1j),
+    )
+    optimizer = cirq.MergeSingleQubitGates()
+
+    (compiled,) = cirq.compile_batch([circuit], optimizer, split_components=True, max_workers=1)
+
+    parts = _qubit_components(circuit.freeze())
+    assert [p.all_qubits() for p in parts] == [{a, c}, {b, d}, {e}]
+    expected = cirq.Circuit.zip(*_serial([p.unfreeze() for p in parts], optimizer))
+    assert compiled == expected
+    cirq.testing.assert_circuits_with_terminal_measurements_are_equivalent(
+        compiled, circuit, atol=1e-8
+    )
+
+
+def test_qubit_components():
+    a, b, c = cirq.LineQubit.range(3)
+    assert _qubit_components(cirq.FrozenCircuit()) == [cirq.FrozenCircuit()]
+    connected = cirq.FrozenCircuit(cirq.CZ(a, b), cirq.CZ(b, c))
+    assert _qubit_components(connected) == [connected]
+
+    circuit = cirq.FrozenCircuit(
+        cirq.Moment([cirq.X(c)]), cirq.Moment(), cirq.Moment([cirq.measure(a, b)])
+    )
+    parts = _qubit_components(circuit)
+    assert parts == [
+        cirq.FrozenCircuit(cirq.Moment([cirq.X(c)]), cirq.Moment(), cirq.Moment()),
+        cirq.FrozenCircuit(cirq.Moment(), cirq.Moment(), cirq.Moment([cirq.measure(a, b)])),
+    ]
+    assert cirq.Circuit.zip(*parts) == circuit.unfreeze()
+
+
+def test_compile_batch_split_components_overlap():
+    a, b = cirq.LineQubit.range(2)
+    circuit = cirq.Circuit(cirq.X(a), cirq.Y(b))
+
+    def move_to_a(circuit):
+        return circuit.transform_qubits(lambda q: a)
+
+    with pytest.raises(ValueError, match='Overlapping'):
+        _ = cirq.compile_batch([circuit], move_to_a, max_workers=1, split_components=True)
+
+
+def test_compile_batch_invalid_max_workers():
+    with pytest.raises(ValueError, match='max_workers'):
+        _ = cirq.compile_batch([cirq.Circuit()], cirq.DropEmptyMoments(), max_workers=0)
+    assert cirq.compile_batch([], cirq.DropEmptyMoments()) == []
@@ -0,0 +1,133 @@
+# Copyright 2021 The Cirq Developers
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""A cache for decompositions of two-qubit unitaries."""
+
+import collections
+from typing import Callable, Hashable, List, Sequence, Tuple, TYPE_CHECKING
+
+import numpy as np
+
+if TYPE_CHECKING:
+    import cirq
+
+# The unitary, the qubits and the operations of a cached decomposition.
+_Entry = Tuple[np.ndarray, Tuple['cirq.Qid', ...], Tuple['cirq.Operation', ...]]
+
+
+class TwoQubitDecompositionCache:
+    """Remembers the decompositions of recently seen two-qubit unitaries.
+
+    Compiling a large circuit often decomposes the same few unitaries many
+    times, e.g. the same gate acting on different pairs of qubits. Passing a
+    cache to a decomposition function (such as
+    `cirq.two_qubit_matrix_to_operations`) lets it reuse the operations found
+    for an earlier unitary, moved onto the new qubits.
+
+    Unitaries are looked up by their entries rounded to the tolerance of the
+    cache, and a cached decomposition is only reused if the unitary it was
+    computed for is within that tolerance of the new one. The least recently
+    used decompositions are evicted once the cache holds `maxsize` of them.
+
+    Attributes:
+        hits: The number of lookups that reused a cached decomposition.
+        misses: The number of lookups that computed a new decomposition.
+    """
+
+    def __init__(self, maxsize: int = 1024, atol: float = 1e-8) -> None:
+        """Inits TwoQubitDecompositionCache.
+
+        Args:
+            maxsize: The maximum number of decompositions to keep.
+            atol: How close, per matrix entry, two unitaries must be for the
+                decomposition of one to be reused for the other.
+
+        Raises:
+            ValueError: If `maxsize` or `atol` is not positive.
+        """
+        if maxsize <= 0:
+            raise ValueError(f'maxsize must be positive, got {maxsize}.')
+        if atol <= 0:
+            raise ValueError(f'atol must be positive, got {atol}.')
+        self._maxsize = maxsize
+        self._atol = atol
+        self._decimals = int(np.ceil(-np.log10(atol)))
+        self._entries: 'collections.OrderedDict[Hashable, _Entry]' = collections.OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    @property
+    def maxsize(self) -> int:
+        return self._maxsize
+
+    @property
+    def atol(self) -> float:
+        return self._atol
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def clear(self) -> None:
+        """Removes all cached decompositions and resets the counters."""
+        self._entries.clear()
+        self.hits = 0
+        self.misses = 0
+
+    def decompose(
+        self,
+        key: Hashable,
+        qubits: Sequence['cirq.Qid'],
+        mat: np.ndarray,
+        compute: Callable[[], Sequence['cirq.Operation']],
+    ) -> List['cirq.Operation']:
+        """Returns the cached decomposition of a unitary, computing it if needed.
+
+        Args:
+            key: Identifies the kind of decomposition and all the options it
+                depends on, other than the unitary and the qubits.
+            qubits: The qubits the decomposition should act on.
+            mat: The unitary to decompose.
+            compute: Computes the decomposition of `mat` on `qubits`, in case
+                no suitable one is cached.
+
+        Returns:
+            The operations of the decomposition, acting on `qubits`.
+        """
+        mat = np.asarray(mat)
+        full_key = (key, mat.shape, self._fingerprint(mat))
+        entry = self._entries.get(full_key)
+        if entry is not None and np.allclose(entry[0], mat, rtol=0, atol=self._atol):
+            self._entries.move_to_end(full_key)
+            self.hits += 1
+            cached_qubits, operations = entry[1], entry[2]
+            if tuple(qubits) == cached_qubits:
+                return list(operations)
+            qubit_map = dict(zip(cached_qubits, qubits))
+            return [op.with_qubits(*(qubit_map[q] for q in op.qubits)) for op in operations]
+
+        self.misses += 1
+        operations = tuple(compute())
+        self._entries[full_key] = (mat.copy(), tuple(qubits), operations)
+        self._entries.move_to_end(full_key)
+        if len(self._entries) > self._maxsize:
+            self._entries.popitem(last=False)
+        return list(operations)
+
+    def _fingerprint(self, mat: np.ndarray) -> bytes:
+        # Adding zero turns negative zeros into positive ones.
+        parts = mat.astype(np.complex128).view(np.float64)
+        return (np.round(parts, self._decimals) + 0.0).tobytes()
+
+    def __repr__(self) -> str:
+        return f'cirq.TwoQubitDecompositionCache(maxsize={self._maxsize!r}, atol={self._atol!r})'
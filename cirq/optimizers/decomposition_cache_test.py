@@ -0,0 +1,146 @@
+# Copyright 2021 The Cirq Developers
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import numpy as np
+import pytest
+
+import cirq
+
+
+def test_init():
+    cache = cirq.TwoQubitDecompositionCache()
+    assert cache.maxsize == 1024
+    assert cache.atol == 1e-8
+    assert len(cache) == 0
+    assert cache.hits == cache.misses == 0
+    assert repr(cirq.TwoQubitDecompositionCache(maxsize=3, atol=1e-6)) == (
+        'cirq.TwoQubitDecompositionCache(maxsize=3, atol=1e-06)'
+    )
+
+    with pytest.raises(ValueError, match='maxsize'):
+        _ = cirq.TwoQubitDecompositionCache(maxsize=0)
+    with pytest.raises(ValueError, match='atol'):
+        _ = cirq.TwoQubitDecompositionCache(atol=0)
+
+
+def test_decompose_retargets_operations():
+    a, b, c, d = cirq.LineQubit.range(4)
+    mat = cirq.unitary(cirq.FSimGate(theta=0.4, phi=0.1))
+    cache = cirq.TwoQubitDecompositionCache()
+    calls = []
+
+    def compute(q0, q1):
+        calls.append((q0, q1))
+        return [cirq.X(q0), cirq.CZ(q0, q1), cirq.Y(q1), cirq.GlobalPhaseOperation(1j)]
+
+    assert cache.decompose('key', (a, b), mat, lambda: compute(a, b)) == compute(a, b)
+    assert cache.decompose('key', (a, b), mat, lambda: compute(a, b)) == compute(a, b)
+    assert cache.decompose('key', (d, c), mat, lambda: compute(d, c)) == compute(d, c)
+    assert len(calls) == 1 + 3
+    assert cache.hits == 2
+    assert cache.misses == 1
+    assert len(cache) == 1
+
+    # Different keys do not share decompositions.
+    assert cache.decompose('other', (c, d), mat, lambda: compute(c, d)) == compute(c, d)
+    assert cache.misses == 2
+
+    cache.clear()
+    assert len(cache) == 0
+    assert cache.hits == cache.misses == 0
+
+
+def test_decompose_tolerance():
+    a, b = cirq.LineQubit.range(2)
+    cache = cirq.TwoQubitDecompositionCache(atol=1e-6)
+    mat = cirq.unitary(cirq.CZ ** 0.3)
+    cache.decompose('key', (a, b), mat, lambda: [cirq.CZ(a, b) ** 0.3])
+
+    # Rounds the same way, and negative zeros are the same as positive ones.
+    nearby = mat + 1e-9
+    nearby[0, 1] = -0.0
+    assert cache.decompose('key', (a, b), nearby, lambda: []) == [cirq.CZ(a, b) ** 0.3]
+    assert cache.hits == 1
+
+    far = cirq.unitary(cirq.CZ ** 0.30001)
+    assert cache.decompose('key', (a, b), far, lambda: []) == []
+    assert cache.misses == 2
+
+
+def test_decompose_evicts_least_recently_used():
+    a, b = cirq.LineQubit.range(2)
+    cache = cirq.TwoQubitDecompositionCache(maxsize=2)
+    mats = [cirq.unitary(cirq.CZ ** t) for t in [0.1, 0.2, 0.3]]
+    for mat in mats[:2]:
+        cache.decompose('key', (a, b), mat, lambda: [])
+    cache.decompose('key', (a, b), mats[0], lambda: [])
+    cache.decompose('key', (a, b), mats[2], lambda: [])
+    assert len(cache) == 2
+    assert (cache.hits, cache.misses) == (1, 3)
+
+    cache.decompose('key', (a, b), mats[0], lambda: [])
+    assert cache.hits == 2
+    cache.decompose('key', (a, b), mats[1], lambda: [])
+    assert cache.misses == 4
+
+
+def test_two_qubit_matrix_to_operations_with_cache():
+    a, b, c, d = cirq.LineQubit.range(4)
+    mat = cirq.testing.random_unitary(4)
+    cache = cirq.TwoQubitDecompositionCache()
+    for allow_partial_czs in [False, True]:
+        expected = cirq.two_qubit_matrix_to_operations(a, b, mat, allow_partial_czs)
+        for q0, q1 in [(a, b), (c, d), (a, b)]:
+            actual = cirq.two_qubit_matrix_to_operations(
+                q0, q1, mat, allow_partial_czs, cache=cache
+            )
+            assert cirq.Circuit(actual) == cirq.Circuit(expected).transform_qubits(
+                lambda q: {a: q0, b: q1}[q]
+            )
+    assert (cache.hits, cache.misses) == (4, 2)
+
+
+def test_decompose_two_qubit_interaction_into_four_fsim_gates_with_cache():
+    a, b, c, d = cirq.LineQubit.range(4)
+    fsim_gate = cirq.FSimGate(theta=np.pi / 2, phi=np.pi / 6)
+    cache = cirq.TwoQubitDecompositionCache()
+    expected = cirq.decompose_two_qubit_interaction_into_four_fsim_gates(
+        cirq.CZ(a, b) ** 0.4, fsim_gate=fsim_gate
+    )
+    assert (
+        cirq.decompose_two_qubit_interaction_into_four_fsim_gates(
+            cirq.CZ(a, b) ** 0.4, fsim_gate=fsim_gate, cache=cache
+        )
+        == expected
+    )
+    actual = cirq.decompose_two_qubit_interaction_into_four_fsim_gates(
+        cirq.unitary(cirq.CZ ** 0.4), fsim_gate=fsim_gate, qubits=(c, d), cache=cache
+    )
+    assert actual == expected.transform_qubits(lambda q: {a: c, b: d}[q])
+    assert (cache.hits, cache.misses) == (1, 1)
+
+
+def test_merge_interactions_with_cache():
+    qubits = cirq.LineQubit.range(6)
+    circuit = cirq.Circuit(
+        [cirq.CNOT(q0, q1), cirq.X(q0) ** 0.3, cirq.CNOT(q0, q1)]
+        for q0, q1 in zip(qubits[::2], qubits[1::2])
+    )
+    expected = circuit.copy()
+    cirq.MergeInteractions().optimize_circuit(expected)
+
+    cache = cirq.TwoQubitDecompositionCache()
+    cirq.MergeInteractions(cache=cache).optimize_circuit(circuit)
+    assert circuit == expected
+    assert (cache.hits, cache.misses) == (2, 1)
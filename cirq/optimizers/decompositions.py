@@ -15,7 +15,7 @@
 """Utility methods related to optimizing quantum circuits."""
 
 import math
-from typing import List, Optional, Tuple, cast
+from typing import Iterable, List, Optional, Tuple, Union, cast
 
 import numpy as np
 import sympy
@@ -166,6 +166,43 @@ def _deconstruct_single_qubit_matrix_into_gate_turns(mat: np.ndarray) -> Tuple[f
     return (_signed_mod_1(xy_turn), _signed_mod_1(xy_phase_turn), _signed_mod_1(total_z_turn))
 
 
+def _deconstruct_single_qubit_matrices_into_gate_turns(
+    mats: np.ndarray,
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Vectorized version of `_deconstruct_single_qubit_matrix_into_gate_turns`.
+
+    Follows the steps of `cirq.deconstruct_single_qubit_matrix_into_angles`
+    for an array of matrices with shape (N, 2, 2).
+    """
+    m00, m01, m10, m11 = mats[:, 0, 0], mats[:, 0, 1], mats[:, 1, 0], mats[:, 1, 1]
+
+    # Anti-cancel left-vs-right phase along top row.
+    right_phase = np.angle(m01 * np.conj(m00)) + np.pi
+    m11 = m11 * np.exp(-1j * right_phase)
+    m01 = m01 * np.exp(-1j * right_phase)
+
+    # Cancel top-vs-bottom phase along left column.
+    bottom_phase = np.angle(m10 * np.conj(m00))
+    m10 = m10 * np.exp(-1j * bottom_phase)
+    m11 = m11 * np.exp(-1j * bottom_phase)
+
+    # Lined up for a rotation. Clear the off-diagonal cells with one.
+    rotation = np.arctan2(np.abs(m10), np.abs(m00))
+    c, s = np.cos(rotation), np.sin(rotation)
+    m00, m11 = c * m00 + s * m10, c * m11 - s * m01
+
+    # Cancel top-left-vs-bottom-right phase.
+    diagonal_phase = np.angle(m11 * np.conj(m00))
+    pre_phase = right_phase + diagonal_phase
+    post_phase = bottom_phase
+
+    tau = 2 * np.pi
+    xy_turn = 2 * rotation / tau
+    xy_phase_turn = 0.25 - pre_phase / tau
+    total_z_turn = (post_phase + pre_phase) / tau
+    return (_signed_mod_1(xy_turn), _signed_mod_1(xy_phase_turn), _signed_mod_1(total_z_turn))
+
+
 def single_qubit_matrix_to_phased_x_z(
     mat: np.ndarray, atol: float = 0
 ) -> List[ops.SingleQubitGate]:
@@ -241,3 +278,79 @@ def single_qubit_matrix_to_phxz(
         )
 
     return g
+
+
+# An upper bound on the round-off error of trace distance bounds computed from
+# 2x2 unitaries, which is about the square root of the machine epsilon.
+_NEGLIGIBLE_MARGIN = 1e-7
+
+
+def single_qubit_matrix_to_phxz_batch(
+    mats: Union[Iterable[np.ndarray], np.ndarray],
+    atol: float = 0,
+) -> List[Optional[ops.PhasedXZGate]]:
+    """Implements many single-qubit operations with PhasedXZ gates.
+
+    Gives the same gates as calling `cirq.single_qubit_matrix_to_phxz` on each
+    matrix, but computes the angles of all of them together with vectorized
+    numpy operations.
+
+    Args:
+        mats: A sequence of 2x2 unitary matrices, or an array of them with
+            shape (N, 2, 2).
+        atol: A limit on the amount of error introduced by the
+            construction.
+
+    Returns:
+        A list with a PhasedXZ gate implementing each matrix, or None for the
+        matrices that are close to identity (trace distance <= atol).
+
+    Raises:
+        ValueError: If the matrices do not have shape (2, 2).
+    """
+    mats = np.asarray(mats, dtype=np.complex128)
+    if len(mats) == 0:
+        return []
+    if mats.ndim != 3 or mats.shape[1:] != (2, 2):
+        raise ValueError(f'Expected matrices with shape (N,2,2), but got {mats.shape}.')
+
+    xy_turns, xy_phase_turns, total_z_turns = _deconstruct_single_qubit_matrices_into_gate_turns(
+        mats
+    )
+    # For a PhasedXZ gate, |tr(U)/2| = |cos(πx/2)·cos(πz/2)|, which gives its
+    # trace distance bound without the round-off of 1 - |tr(U)/2|^2.
+    sin_xy = np.sin(np.pi * xy_turns)
+    cos_xy_sin_z = np.cos(np.pi * xy_turns) * np.sin(np.pi * total_z_turns)
+    trace_distances = np.sqrt(sin_xy ** 2 + cos_xy_sin_z ** 2)
+    half_turns = np.isclose(np.abs(xy_turns), 0.5, rtol=0, atol=atol)
+
+    result: List[Optional[ops.PhasedXZGate]] = []
+    for xy_turn, xy_phase_turn, total_z_turn, distance, half_turn in zip(
+        xy_turns.tolist(),
+        xy_phase_turns.tolist(),
+        total_z_turns.tolist(),
+        trace_distances.tolist(),
+        half_turns.tolist(),
+    ):
+        g = ops.PhasedXZGate(
+            axis_phase_exponent=2 * xy_phase_turn,
+            x_exponent=2 * xy_turn,
+            z_exponent=2 * total_z_turn,
+        )
+        # The scalar version computes the bound from the unitary of the gate,
+        # which is only accurate to about 1e-8. Near the tolerance, use the
+        # same computation so that the same gates are dropped.
+        if distance <= atol + _NEGLIGIBLE_MARGIN and protocols.trace_distance_bound(g) <= atol:
+            result.append(None)
+        elif half_turn:
+            # XY half-turns can absorb Z rotations.
+            result.append(
+                ops.PhasedXZGate(
+                    axis_phase_exponent=2 * xy_phase_turn + total_z_turn,
+                    x_exponent=1,
+                    z_exponent=0,
+                )
+            )
+        else:
+            result.append(g)
+    return result
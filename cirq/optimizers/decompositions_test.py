@@ -356,3 +356,42 @@ def test_single_qubit_matrix_to_phxz_tolerance_half_turn_phasing():
 
     kept = cirq.single_qubit_matrix_to_phxz(phased_nearly_x, atol=0.0001)
     assert kept.z_exponent != 0
+
+
+def test_single_qubit_matrix_to_phxz_batch():
+    a = np.pi / 2 + 0.01
+    c, s = np.cos(a), np.sin(a)
+    phased_nearly_x = np.diag([1, np.exp(1j * 1.2)]) @ np.array([[c, -s], [s, c]])
+    mats = [
+        np.eye(2),
+        np.diag([1, np.exp(1j * 0.01)]),
+        cirq.unitary(cirq.X),
+        cirq.unitary(cirq.Y),
+        cirq.unitary(cirq.H),
+        phased_nearly_x,
+        *[cirq.testing.random_unitary(2, random_state=i) for i in range(20)],
+    ]
+    for atol in [0, 1e-6, 0.1]:
+        gates = cirq.single_qubit_matrix_to_phxz_batch(np.array(mats), atol=atol)
+        assert len(gates) == len(mats)
+        for gate, mat in zip(gates, mats):
+            expected = cirq.single_qubit_matrix_to_phxz(mat, atol=atol)
+            if expected is None:
+                assert gate is None
+            else:
+                assert cirq.approx_eq(gate, expected, atol=1e-10)
+
+    # Round-off in products of gates that cancel out is negligible.
+    g = cirq.unitary(cirq.PhasedXPowGate(phase_exponent=0.1))
+    cancelling = [g @ g] + [
+        u @ u.conj().T for u in (cirq.testing.random_unitary(2, random_state=i) for i in range(50))
+    ]
+    assert cirq.single_qubit_matrix_to_phxz_batch(cancelling, atol=1e-8) == [None] * 51
+    nearly_negligible = [cirq.unitary(cirq.rx(k * 1e-9)) for k in range(1, 40)]
+    assert cirq.single_qubit_matrix_to_phxz_batch(nearly_negligible, atol=1e-8) == [
+        cirq.single_qubit_matrix_to_phxz(mat, atol=1e-8) for mat in nearly_negligible
+    ]
+
+    assert cirq.single_qubit_matrix_to_phxz_batch([]) == []
+    with pytest.raises(ValueError, match='shape'):
+        _ = cirq.single_qubit_matrix_to_phxz_batch([np.eye(4)])
@@ -15,25 +15,23 @@
 """Pushes 180 degree rotations around axes in the XY plane later in the circuit.
 """
 
-from typing import Optional, cast, TYPE_CHECKING, Iterable, Tuple, Dict, List
+from typing import Optional, cast, TYPE_CHECKING, Iterable, Tuple, Dict
 import sympy
 
 from cirq import circuits, ops, value, protocols
-from cirq.optimizers import decompositions
+from cirq.optimizers import _circuit_edits, decompositions
 
 if TYPE_CHECKING:
     import cirq
 
 
 class _OptimizerState:
-    def __init__(self):
+    def __init__(self, circuit: circuits.Circuit):
         # The phases of the W gates currently being pushed along each qubit.
         self.held_w_phases: Dict[ops.Qid, value.TParamVal] = {}
 
-        # Accumulated commands to batch-apply to the circuit later.
-        self.deletions: List[Tuple[int, ops.Operation]] = []
-        self.inline_intos: List[Tuple[int, ops.Operation]] = []
-        self.insertions: List[Tuple[int, ops.Operation]] = []
+        # Accumulated commands to apply to the circuit at once later.
+        self.edits = _circuit_edits.CircuitEdits(circuit)
 
 
 class EjectPhasedPaulis:
@@ -59,7 +57,7 @@ class EjectPhasedPaulis:
         self.eject_parameterized = eject_parameterized
 
     def optimize_circuit(self, circuit: circuits.Circuit):
-        state = _OptimizerState()
+        state = _OptimizerState(circuit)
 
         for moment_index, moment in enumerate(circuit):
             for op in moment.operations:
@@ -104,9 +102,7 @@ class EjectPhasedPaulis:
         # Put anything that's still held at the end of the circuit.
         _dump_held(state.held_w_phases.keys(), len(circuit), state)
 
-        circuit.batch_remove(state.deletions)
-        circuit.batch_insert_into(state.inline_intos)
-        circuit.batch_insert(state.insertions)
+        state.edits.apply()
 
 
 def _absorb_z_into_w(moment_index: int, op: ops.Operation, state: _OptimizerState) -> None:
@@ -125,7 +121,7 @@ def _absorb_z_into_w(moment_index: int, op: ops.Operation, state: _OptimizerStat
     t = cast(value.TParamVal, _try_get_known_z_half_turns(op))
     q = op.qubits[0]
     state.held_w_phases[q] += t / 2
-    state.deletions.append((moment_index, op))
+    state.edits.remove(moment_index, op)
 
 
 def _dump_held(qubits: Iterable[ops.Qid], moment_index: int, state: _OptimizerState):
@@ -134,7 +130,7 @@ def _dump_held(qubits: Iterable[ops.Qid], moment_index: int, state: _OptimizerSt
         p = state.held_w_phases.get(q)
         if p is not None:
             dump_op = ops.PhasedXPowGate(phase_exponent=p).on(q)
-            state.insertions.append((moment_index, dump_op))
+            state.edits.insert(moment_index, dump_op)
         state.held_w_phases.pop(q, None)
 
 
@@ -145,8 +141,8 @@ def _dump_into_measurement(moment_index: int, op: ops.Operation, state: _Optimiz
     ).on(*op.qubits)
     for q in op.qubits:
         state.held_w_phases.pop(q, None)
-    state.deletions.append((moment_index, op))
-    state.inline_intos.append((moment_index, new_measurement))
+    state.edits.remove(moment_index, op)
+    state.edits.insert_into(moment_index, new_measurement)
 
 
 def _potential_cross_whole_w(
@@ -163,7 +159,7 @@ def _potential_cross_whole_w(
         ≡ ───Z^-a───Z^-a───Z^b───Z^b───
         ≡ ───Z^2(b-a)───
     """
-    state.deletions.append((moment_index, op))
+    state.edits.remove(moment_index, op)
 
     _, phase_exponent = cast(
         Tuple[value.TParamVal, value.TParamVal], _try_get_known_phased_pauli(op)
@@ -181,7 +177,7 @@ def _potential_cross_whole_w(
         t = 2 * (b - a)
         if not decompositions.is_negligible_turn(t / 2, tolerance):
             leftover_phase = ops.Z(q) ** t
-            state.inline_intos.append((moment_index, leftover_phase))
+            state.edits.insert_into(moment_index, leftover_phase)
 
 
 def _potential_cross_partial_w(
@@ -208,8 +204,8 @@ def _potential_cross_partial_w(
     new_op = ops.PhasedXPowGate(exponent=exponent, phase_exponent=2 * a - phase_exponent).on(
         op.qubits[0]
     )
-    state.deletions.append((moment_index, op))
-    state.inline_intos.append((moment_index, new_op))
+    state.edits.remove(moment_index, op)
+    state.edits.insert_into(moment_index, new_op)
 
 
 def _single_cross_over_cz(
@@ -251,9 +247,9 @@ def _single_cross_over_cz(
     negated_cz = ops.CZ(*op.qubits) ** -t
     kickback = ops.Z(other_qubit) ** t
 
-    state.deletions.append((moment_index, op))
-    state.inline_intos.append((moment_index, negated_cz))
-    state.insertions.append((moment_index, kickback))
+    state.edits.remove(moment_index, op)
+    state.edits.insert_into(moment_index, negated_cz)
+    state.edits.insert(moment_index, kickback)
 
 
 def _double_cross_over_cz(op: ops.Operation, state: _OptimizerState) -> None:
@@ -536,3 +536,24 @@ def test_blocked_by_unknown_and_symbols(sym):
         ),
         compare_unitaries=False,
     )
+
+
+def test_circuit_with_device():
+    qubits = cirq.GridQubit.rect(1, 3)
+    circuit = cirq.Circuit(
+        cirq.X(qubits[0]),
+        cirq.Y(qubits[1]) ** 0.5,
+        cirq.CZ(*qubits[:2]) ** 0.5,
+        cirq.Y(qubits[1]),
+        cirq.X(qubits[2]),
+        cirq.CZ(*qubits[1:]),
+        cirq.measure(qubits[2]),
+    )
+    on_device = circuit.copy()
+    on_device.device = cirq.google.Foxtail
+
+    cirq.EjectPhasedPaulis().optimize_circuit(circuit)
+    cirq.EjectPhasedPaulis().optimize_circuit(on_device)
+
+    assert on_device.device is cirq.google.Foxtail
+    assert on_device.moments == circuit.moments
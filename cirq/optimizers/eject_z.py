@@ -14,13 +14,13 @@
 
 """An optimization pass that pushes Z gates later and later in the circuit."""
 
-from typing import cast, Dict, Iterable, List, Optional, Tuple
+from typing import cast, Dict, Iterable, Optional, Tuple
 from collections import defaultdict
 import numpy as np
 import sympy
 
 from cirq import circuits, ops, protocols
-from cirq.optimizers import decompositions
+from cirq.optimizers import _circuit_edits, decompositions
 
 
 def _is_integer(n):
@@ -63,10 +63,11 @@ class EjectZ:
     def optimize_circuit(self, circuit: circuits.Circuit):
         # Tracks qubit phases (in half turns; multiply by pi to get radians).
         qubit_phase: Dict[ops.Qid, float] = defaultdict(lambda: 0)
-        deletions: List[Tuple[int, ops.Operation]] = []
-        replacements: List[Tuple[int, ops.Operation, ops.Operation]] = []
-        insertions: List[Tuple[int, ops.Operation]] = []
-        phased_xz_replacements: Dict[Tuple[int, ops.Qid], int] = {}
+        # The last operation on each qubit so far, and the index of its moment.
+        last_ops: Dict[ops.Qid, Tuple[int, ops.Operation]] = {}
+        # The replacements of PhasedXZ gates, which dumped phases can join.
+        phased_xz_replacements: Dict[Tuple[int, ops.Qid], ops.Operation] = {}
+        edits = _circuit_edits.CircuitEdits(circuit)
 
         def dump_tracked_phase(qubits: Iterable[ops.Qid], index: int) -> None:
             """Zeroes qubit_phase entries by emitting Z gates."""
@@ -75,22 +76,18 @@ class EjectZ:
                 qubit_phase[q] = 0
                 if decompositions.is_negligible_turn(p, self.tolerance):
                     continue
-                dumped = False
-                moment_index = circuit.prev_moment_operating_on([q], index)
-                if moment_index is not None:
-                    op = circuit.moments[moment_index][q]
-                    if op and isinstance(op.gate, ops.PhasedXZGate):
+                if q in last_ops:
+                    moment_index, op = last_ops[q]
+                    repl_op = phased_xz_replacements.get((moment_index, q))
+                    if repl_op is not None:
                         # Attach z-rotation to replacing PhasedXZ gate.
-                        idx = phased_xz_replacements[moment_index, q]
-                        _, _, repl_op = replacements[idx]
                         gate = cast(ops.PhasedXZGate, repl_op.gate)
                         repl_op = gate.with_z_exponent(p * 2).on(q)
-                        replacements[idx] = (moment_index, op, repl_op)
-                        dumped = True
-                if not dumped:
-                    # Add a new Z gate
-                    dump_op = ops.Z(q) ** (p * 2)
-                    insertions.append((index, dump_op))
+                        phased_xz_replacements[moment_index, q] = repl_op
+                        edits.replace(moment_index, op, repl_op)
+                        continue
+                # Add a new Z gate
+                edits.insert(index, ops.Z(q) ** (p * 2))
 
         for moment_index, moment in enumerate(circuit):
             for op in moment.operations:
@@ -99,7 +96,7 @@ class EjectZ:
                 if h is not None:
                     q = op.qubits[0]
                     qubit_phase[q] += h / 2
-                    deletions.append((moment_index, op))
+                    edits.remove(moment_index, op)
                     continue
 
                 # Z gate before measurement is a no-op. Drop tracked phase.
@@ -132,16 +129,17 @@ class EjectZ:
                         qubit = phased_op.qubits[0]
                         qubit_phase[qubit] += gate.z_exponent / 2
                         phased_op = gate.with_z_exponent(0).on(qubit)
-                        repl_idx = len(replacements)
-                        phased_xz_replacements[moment_index, qubit] = repl_idx
-                    replacements.append((moment_index, op, phased_op))
+                        phased_xz_replacements[moment_index, qubit] = phased_op
+                    edits.replace(moment_index, op, phased_op)
                 else:
                     dump_tracked_phase(op.qubits, moment_index)
 
+            for op in moment.operations:
+                for q in op.qubits:
+                    last_ops[q] = (moment_index, op)
+
         dump_tracked_phase(qubit_phase.keys(), len(circuit))
-        circuit.batch_remove(deletions)
-        circuit.batch_replace(replacements)
-        circuit.batch_insert(insertions)
+        edits.apply()
 
 
 def _try_get_known_z_half_turns(op: ops.Operation, eject_parameterized: bool) -> Optional[float]:
@@ -428,3 +428,44 @@ def test_swap_iswap(exponent):
     cirq.testing.assert_allclose_up_to_global_phase(
         cirq.unitary(original), cirq.unitary(optimized), atol=1e-8
     )
+
+
+def test_dump_after_parameterized_phased_xz():
+    q = cirq.NamedQubit('q')
+    gate = cirq.PhasedXZGate(axis_phase_exponent=0.2, x_exponent=0.3, z_exponent=sympy.Symbol('a'))
+    assert_optimizes(
+        before=cirq.Circuit([cirq.Moment([cirq.Z(q) ** 0.5]), cirq.Moment([gate(q)])]),
+        expected=cirq.Circuit(
+            [
+                cirq.Moment(),
+                cirq.Moment(
+                    [
+                        cirq.PhasedXZGate(
+                            axis_phase_exponent=-0.3, x_exponent=0.3, z_exponent=sympy.Symbol('a')
+                        ).on(q)
+                    ]
+                ),
+                cirq.Moment([cirq.Z(q) ** 0.5]),
+            ]
+        ),
+    )
+
+
+def test_circuit_with_device():
+    qubits = cirq.GridQubit.rect(1, 3)
+    circuit = cirq.Circuit(
+        cirq.Z(qubits[0]) ** 0.25,
+        cirq.Z(qubits[1]) ** 0.5,
+        cirq.CZ(*qubits[:2]),
+        cirq.X(qubits[0]) ** 0.5,
+        cirq.measure(qubits[2]),
+        cirq.Z(qubits[1]) ** 0.25,
+    )
+    on_device = circuit.copy()
+    on_device.device = cirq.google.Foxtail
+
+    cirq.EjectZ().optimize_circuit(circuit)
+    cirq.EjectZ().optimize_circuit(on_device)
+
+    assert on_device.device is cirq.google.Foxtail
+    assert on_device.moments == circuit.moments
@@ -33,11 +33,27 @@ class MergeInteractions(circuits.PointOptimizer):
         self,
         tolerance: float = 1e-8,
         allow_partial_czs: bool = True,
-        post_clean_up: Callable[[Sequence[ops.Operation]], ops.OP_TREE] = lambda op_list: op_list,
+        post_clean_up: Callable[
+            [Sequence[ops.Operation]], ops.OP_TREE
+        ] = circuits.optimization_pass._no_clean_up,
+        cache: Optional['cirq.TwoQubitDecompositionCache'] = None,
     ) -> None:
+        """Inits MergeInteractions.
+
+        Args:
+            tolerance: A limit on the amount of absolute error introduced by
+                the decompositions.
+            allow_partial_czs: Enables the use of Partial-CZ gates.
+            post_clean_up: This function is called on each set of optimized
+                operations before they are put into the circuit to replace the
+                old operations.
+            cache: If set, the decompositions of the merged two-qubit
+                unitaries are looked up in and added to this cache.
+        """
         super().__init__(post_clean_up=post_clean_up)
         self.tolerance = tolerance
         self.allow_partial_czs = allow_partial_czs
+        self.cache = cache
 
     def optimization_at(
         self, circuit: circuits.Circuit, index: int, op: ops.Operation
@@ -72,7 +88,13 @@ class MergeInteractions(circuits.PointOptimizer):
 
         # Find a max-3-cz construction.
         new_operations = two_qubit_decompositions.two_qubit_matrix_to_operations(
-            op.qubits[0], op.qubits[1], matrix, self.allow_partial_czs, self.tolerance, False
+            op.qubits[0],
+            op.qubits[1],
+            matrix,
+            self.allow_partial_czs,
+            self.tolerance,
+            False,
+            cache=self.cache,
         )
         new_interaction_count = len(
             [new_op for new_op in new_operations if len(new_op.qubits) == 2]
@@ -14,7 +14,8 @@
 
 """An optimization pass that combines adjacent single-qubit rotations."""
 
-from typing import Optional, Callable, List, TYPE_CHECKING
+import heapq
+from typing import Any, Callable, Dict, List, NamedTuple, Optional, Sequence, TYPE_CHECKING, cast
 
 import numpy as np
 
@@ -25,8 +26,30 @@ if TYPE_CHECKING:
     import cirq
 
 
+class _Run(NamedTuple):
+    """A maximal run of adjacent unitary operations on one qubit."""
+
+    qubit: 'cirq.Qid'
+    # The moment index of each operation of the run.
+    indices: List[int]
+    # The position of each operation in the circuit, counting operations
+    # moment by moment.
+    positions: List[int]
+    operations: List['cirq.Operation']
+    unitaries: List[np.ndarray]
+    # The index of the moment with the operation that ends the run, or None
+    # if the run lasts until the end of the circuit.
+    end: Optional[int]
+
+
 class MergeSingleQubitGates(circuits.PointOptimizer):
-    """Optimizes runs of adjacent unitary 1-qubit operations."""
+    """Optimizes runs of adjacent unitary 1-qubit operations.
+
+    `optimize_circuit` finds all runs in a single scan of the circuit and
+    multiplies the unitaries of the runs on qubits together, as stacks of 2x2
+    matrices. The circuit is changed as if `optimization_at` was applied to
+    each run in turn.
+    """
 
     def __init__(
         self,
@@ -73,6 +96,25 @@ class MergeSingleQubitGates(circuits.PointOptimizer):
         # Just use the default.
         return ops.MatrixGate(unitary).on(q)
 
+    def optimize_circuit(self, circuit: circuits.Circuit) -> None:
+        runs = _single_qubit_runs(circuit)
+        if self._rewriter is not None:
+            rewriter = self._rewriter
+            _replace_runs(circuit, runs, lambda run: rewriter(run.operations), self.post_clean_up)
+            return
+
+        products = {run.positions[0]: u for run, u in zip(runs, _run_unitaries(runs))}
+
+        def rewrite(run: _Run) -> Optional[ops.OP_TREE]:
+            unitary = products.get(run.positions[0])
+            if unitary is None:
+                unitary = linalg.dot(*run.unitaries[::-1])
+            if self._synthesizer is not None:
+                return self._synthesizer(run.qubit, unitary)
+            return ops.MatrixGate(unitary).on(run.qubit)
+
+        _replace_runs(circuit, runs, rewrite, self.post_clean_up)
+
     def optimization_at(
         self, circuit: circuits.Circuit, index: int, op: ops.Operation
     ) -> Optional[circuits.PointOptimizationSummary]:
@@ -132,8 +174,171 @@ def merge_single_qubit_gates_into_phxz(
             negligible gates to be dropped, smaller values increase accuracy.
     """
 
-    def synth(qubit: 'cirq.Qid', matrix: np.ndarray) -> List[ops.Operation]:
-        gate = decompositions.single_qubit_matrix_to_phxz(matrix, atol)
-        return [gate(qubit)] if gate else []
+    runs = _single_qubit_runs(circuit)
+    unitaries = _run_unitaries(runs)
+    on_qubit = [unitary.shape == (2, 2) for unitary in unitaries]
+    batch = iter(
+        decompositions.single_qubit_matrix_to_phxz_batch(
+            np.reshape([u for u, q in zip(unitaries, on_qubit) if q], (-1, 2, 2)), atol
+        )
+    )
+    gate_of_run = {
+        run.positions[0]: next(batch) if q else decompositions.single_qubit_matrix_to_phxz(u, atol)
+        for run, u, q in zip(runs, unitaries, on_qubit)
+    }
 
-    MergeSingleQubitGates(synthesizer=synth).optimize_circuit(circuit)
+    def rewrite(run: _Run) -> List[ops.Operation]:
+        gate = gate_of_run[run.positions[0]]
+        return [gate(run.qubit)] if gate else []
+
+    _replace_runs(circuit, runs, rewrite)
+
+
+def _single_qubit_runs(circuit: 'cirq.Circuit') -> List[_Run]:
+    """Finds the runs of adjacent unitary operations on single qubits.
+
+    The runs are returned in the order `cirq.PointOptimizer` visits their first
+    operations.
+    """
+    runs: List[_Run] = []
+    # The index in runs of the run continuing on each qubit.
+    open_runs: Dict['cirq.Qid', int] = {}
+    # Unitaries of gates, which are usually shared by many operations.
+    gate_unitaries: Dict['cirq.Gate', Any] = {}
+
+    position = 0
+    for i, moment in enumerate(circuit):
+        for op in moment.operations:
+            position += 1
+            qubits = op.qubits
+            if len(qubits) == 1:
+                unitary = _unitary(op, gate_unitaries)
+                if unitary is not None:
+                    r = open_runs.get(qubits[0])
+                    if r is None:
+                        r = open_runs[qubits[0]] = len(runs)
+                        runs.append(_Run(qubits[0], [], [], [], [], None))
+                    runs[r].indices.append(i)
+                    runs[r].positions.append(position)
+                    runs[r].operations.append(op)
+                    runs[r].unitaries.append(unitary)
+                    continue
+            for q in qubits:
+                r = open_runs.pop(q, None)
+                if r is not None:
+                    runs[r] = runs[r]._replace(end=i)
+    return runs
+
+
+def _run_unitaries(runs: Sequence[_Run]) -> List[np.ndarray]:
+    """Multiplies the unitaries of the operations of each run.
+
+    The products of runs on qubits are computed together, one operation of
+    each run at a time, with stacked 2x2 matrix products. The factors are
+    multiplied in the same order as by `cirq.dot`.
+    """
+    products: List[np.ndarray] = [np.empty(0)] * len(runs)
+    on_qubits = []
+    for r, run in enumerate(runs):
+        if all(u.shape == (2, 2) for u in run.unitaries):
+            on_qubits.append(r)
+        else:
+            products[r] = linalg.dot(*run.unitaries[::-1])
+    if not on_qubits:
+        return products
+
+    # Longest runs first, so the runs still being multiplied are a prefix.
+    on_qubits.sort(key=lambda r: -len(runs[r].unitaries))
+    lengths = np.array([len(runs[r].unitaries) for r in on_qubits])
+    ends = np.cumsum(lengths)
+    flat = np.array([u for r in on_qubits for u in runs[r].unitaries], dtype=np.complex128)
+    num_active = np.searchsorted(-lengths, -np.arange(lengths[0]), side='left')
+
+    stacked = flat[ends - 1]
+    for k in range(1, lengths[0]):
+        n = num_active[k]
+        stacked[:n] = stacked[:n] @ flat[ends[:n] - 1 - k]
+    for r, product in zip(on_qubits, stacked):
+        products[r] = product
+    return products
+
+
+def _replace_runs(
+    circuit: 'cirq.Circuit',
+    runs: Sequence[_Run],
+    rewrite: Callable[[_Run], Optional['cirq.OP_TREE']],
+    post_clean_up: Optional[Callable[[Sequence['cirq.Operation']], 'cirq.OP_TREE']] = None,
+) -> None:
+    """Replaces the operations of runs, like `cirq.PointOptimizer` does.
+
+    Runs are rewritten in the order of their first operations. The new
+    operations of a run are placed one after the other from the moment of the
+    first operation of the run, and empty moments are inserted in front of the
+    operation ending the run if they do not fit before it. If a run is not
+    rewritten, because `rewrite` returns None, the run without its first
+    operation is tried next.
+    """
+    moments: List[Any] = list(circuit)
+    # Where the original moments are now, after inserting moments.
+    moment_index = list(range(len(moments) + 1))
+    changed = set()
+
+    def edit(i: int) -> List['cirq.Operation']:
+        if i not in changed:
+            moments[i] = list(moments[i].operations)
+            changed.add(i)
+        return moments[i]
+
+    queue = [(run.positions[0], r, run) for r, run in enumerate(runs)]
+    while queue:
+        _, r, run = heapq.heappop(queue)
+        replacement = rewrite(run)
+        if replacement is None:
+            if len(run.operations) > 1:
+                suffix = run._replace(
+                    indices=run.indices[1:],
+                    positions=run.positions[1:],
+                    operations=run.operations[1:],
+                    unitaries=run.unitaries[1:],
+                )
+                heapq.heappush(queue, (suffix.positions[0], r, suffix))
+            continue
+        if post_clean_up is not None:
+            replacement = post_clean_up(cast(Sequence['cirq.Operation'], replacement))
+        new_operations = tuple(ops.flatten_to_ops(replacement))
+        if any(q != run.qubit for op in new_operations for q in op.qubits):
+            raise ValueError('New operations in PointOptimizer should not act on new qubits.')
+
+        for i, run_op in zip(run.indices, run.operations):
+            i = moment_index[i]
+            moments[i] = [op for op in edit(i) if op is not run_op]
+
+        start = moment_index[run.indices[0]]
+        end = moment_index[len(moment_index) - 1 if run.end is None else run.end]
+        num_new_moments = start + len(new_operations) - end
+        if num_new_moments > 0:
+            moments[end:end] = [[] for _ in range(num_new_moments)]
+            changed = {i if i < end else i + num_new_moments for i in changed}
+            changed.update(range(end, end + num_new_moments))
+            moment_index = [i if i < end else i + num_new_moments for i in moment_index]
+        for k, op in enumerate(new_operations):
+            edit(start + k if op.qubits else start).append(op)
+
+    if changed:
+        circuit[:] = [ops.Moment(m) if i in changed else m for i, m in enumerate(moments)]
+
+
+def _unitary(op: 'cirq.Operation', gate_unitaries: Dict['cirq.Gate', Any]) -> Optional[np.ndarray]:
+    if type(op) is not ops.GateOperation:
+        return protocols.unitary(op, None)
+    # Exactly a GateOperation, so there is a gate.
+    gate = cast('cirq.Gate', op.gate)
+    try:
+        if gate in gate_unitaries:
+            return gate_unitaries[gate]
+    except TypeError:
+        # Not hashable.
+        return protocols.unitary(op, None)
+    unitary = protocols.unitary(gate, None)
+    gate_unitaries[gate] = unitary
+    return unitary
@@ -15,6 +15,7 @@ from typing import Callable, Optional
 
 import numpy as np
 import pytest
+import sympy
 
 import cirq
 
@@ -208,3 +209,90 @@ def test_merge_single_qubit_gates_into_phxz():
         ),
         optimizer=cirq.merge_single_qubit_gates_into_phxz,
     )
+
+
+def test_merge_single_qubit_gates_into_phxz_removes_cancelling_runs():
+    a, b = cirq.LineQubit.range(2)
+    g = cirq.PhasedXPowGate(phase_exponent=0.1)
+    circuit = cirq.Circuit(g(a), g(a), cirq.CZ(a, b), g(b), g(b))
+    cirq.merge_single_qubit_gates_into_phxz(circuit)
+    assert list(circuit.all_operations()) == [cirq.CZ(a, b)]
+
+
+def _random_circuit(seed):
+    circuit = cirq.testing.random_circuit(
+        qubits=cirq.LineQubit.range(4),
+        n_moments=12,
+        op_density=0.8,
+        gate_domain={
+            cirq.X ** 0.3: 1,
+            cirq.Y: 1,
+            cirq.H: 1,
+            cirq.T: 1,
+            cirq.CZ: 2,
+            cirq.MeasurementGate(1, 'm'): 1,
+        },
+        random_state=seed,
+    )
+    circuit.insert(3, cirq.X(cirq.LineQubit(0)) ** sympy.Symbol('t'))
+    return circuit
+
+
+@pytest.mark.parametrize('seed', range(5))
+def test_optimize_circuit_matches_point_optimizer(seed):
+    def varying_rewriter(operations):
+        # Skips some runs and needs more moments than others have.
+        if len(operations) == 2:
+            return None
+        return [cirq.X(operations[0].qubits[0])] * (len(operations) * 7 % 5)
+
+    for optimizer in [
+        cirq.MergeSingleQubitGates(),
+        cirq.MergeSingleQubitGates(rewriter=varying_rewriter),
+        cirq.MergeSingleQubitGates(
+            synthesizer=lambda q, u: None if np.allclose(u, np.eye(2)) else cirq.Y(q)
+        ),
+    ]:
+        expected = _random_circuit(seed)
+        cirq.PointOptimizer.optimize_circuit(optimizer, expected)
+        actual = _random_circuit(seed)
+        optimizer.optimize_circuit(actual)
+        assert cirq.approx_eq(actual, expected, atol=1e-10)
+
+
+@pytest.mark.parametrize('seed', range(5))
+def test_merge_single_qubit_gates_into_phxz_matches_point_optimizer(seed):
+    def synth(q, u):
+        gate = cirq.single_qubit_matrix_to_phxz(u, 1e-8)
+        return [gate(q)] if gate else []
+
+    expected = _random_circuit(seed)
+    cirq.PointOptimizer.optimize_circuit(cirq.MergeSingleQubitGates(synthesizer=synth), expected)
+    actual = _random_circuit(seed)
+    cirq.merge_single_qubit_gates_into_phxz(actual)
+    assert cirq.approx_eq(actual, expected, atol=1e-10)
+
+
+def test_rewrite_inserts_moments():
+    a, b = cirq.LineQubit.range(2)
+    circuit = cirq.Circuit(cirq.X(a), cirq.Y(b), cirq.CZ(a, b), cirq.Z(a))
+    cirq.MergeSingleQubitGates(
+        rewriter=lambda ops: [cirq.H(ops[0].qubits[0])] * 3
+    ).optimize_circuit(circuit)
+    cirq.testing.assert_same_circuits(
+        circuit,
+        cirq.Circuit(
+            cirq.Moment([cirq.H(a), cirq.H(b)]),
+            cirq.Moment([cirq.H(a), cirq.H(b)]),
+            cirq.Moment([cirq.H(a), cirq.H(b)]),
+            cirq.Moment([cirq.CZ(a, b)]),
+            cirq.Moment([cirq.H(a)]),
+            cirq.Moment([cirq.H(a)]),
+            cirq.Moment([cirq.H(a)]),
+        ),
+    )
+
+    with pytest.raises(ValueError, match='new qubits'):
+        cirq.MergeSingleQubitGates(rewriter=lambda ops: cirq.X(b)).optimize_circuit(
+            cirq.Circuit(cirq.X(a))
+        )
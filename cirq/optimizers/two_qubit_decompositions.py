@@ -40,6 +40,7 @@ def two_qubit_matrix_to_operations(
     allow_partial_czs: bool,
     atol: float = 1e-8,
     clean_operations: bool = True,
+    cache: Optional['cirq.TwoQubitDecompositionCache'] = None,
 ) -> List[ops.Operation]:
     """Decomposes a two-qubit operation into Z/XY/CZ gates.
 
@@ -52,10 +53,21 @@ def two_qubit_matrix_to_operations(
             construction.
         clean_operations: Enables optimizing resulting operation list by
             merging operations and ejecting phased Paulis and Z operations.
+        cache: If set, decompositions are looked up in and added to this
+            cache.
 
     Returns:
         A list of operations implementing the matrix.
     """
+    if cache is not None:
+        return cache.decompose(
+            ('two_qubit_matrix_to_operations', allow_partial_czs, atol, clean_operations),
+            (q0, q1),
+            mat,
+            lambda: two_qubit_matrix_to_operations(
+                q0, q1, mat, allow_partial_czs, atol, clean_operations
+            ),
+        )
     kak = linalg.kak_decomposition(mat, atol=atol)
     operations = _kak_decomposition_to_operations(q0, q1, kak, allow_partial_czs, atol=atol)
     if clean_operations:
@@ -11,7 +11,7 @@ from typing import (
 
 import numpy as np
 
-from cirq import ops, linalg, circuits, devices
+from cirq import ops, linalg, circuits, devices, protocols
 from cirq.optimizers import merge_single_qubit_gates, drop_empty_moments
 from cirq._compat import deprecated
 
@@ -39,6 +39,7 @@ def decompose_two_qubit_interaction_into_four_fsim_gates(
     *,
     fsim_gate: Union['cirq.FSimGate', 'cirq.ISwapPowGate'],
     qubits: Sequence['cirq.Qid'] = None,
+    cache: Optional['cirq.TwoQubitDecompositionCache'] = None,
 ) -> 'cirq.Circuit':
     """Decomposes operations into an FSimGate near theta=pi/2, phi=0.
 
@@ -61,6 +62,8 @@ def decompose_two_qubit_interaction_into_four_fsim_gates(
             desired interaction to. If not set then defaults to either the
             qubits of the given interaction (if it is a `cirq.Operation`) or
             else to `cirq.LineQubit.range(2)`.
+        cache: If set, decompositions are looked up in and added to this
+            cache.
 
     Returns:
         A list of operations implementing the desired two qubit unitary. The
@@ -82,6 +85,20 @@ def decompose_two_qubit_interaction_into_four_fsim_gates(
             qubits = devices.LineQubit.range(2)
     if len(qubits) != 2:
         raise ValueError(f'Expected a pair of qubits, but got {qubits!r}.')
+    if cache is not None:
+        mat = interaction if isinstance(interaction, np.ndarray) else protocols.unitary(interaction)
+        return circuits.Circuit(
+            cache.decompose(
+                ('decompose_two_qubit_interaction_into_four_fsim_gates', fsim_gate),
+                qubits,
+                mat,
+                lambda: list(
+                    decompose_two_qubit_interaction_into_four_fsim_gates(
+                        mat, fsim_gate=fsim_gate, qubits=qubits
+                    ).all_operations()
+                ),
+            )
+        )
     kak = linalg.kak_decomposition(interaction)
 
     result_using_b_gates = _decompose_two_qubit_interaction_into_two_b_gates(kak, qubits=qubits)
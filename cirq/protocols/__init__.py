@@ -83,6 +83,8 @@ from cirq.protocols.json_serialization import (
     read_json_gzip,
     to_json,
     read_json,
+    to_json_stream,
+    read_json_stream,
     obj_to_dict_helper,
     SupportsJSON,
 )
@@ -11,11 +11,13 @@
 # WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 # See the License for the specific language governing permissions and
 # limitations under the License.
+import base64
 import dataclasses
 import gzip
 import json
 import numbers
 import pathlib
+import re
 from typing import (
     Any,
     Callable,
@@ -23,11 +25,13 @@ from typing import (
     Dict,
     IO,
     Iterable,
+    Iterator,
     List,
     Optional,
     overload,
     Sequence,
     Set,
+    Tuple,
     Type,
     Union,
 )
@@ -92,7 +96,8 @@ def _internal_register_resolver(dict_factory: Callable[[], Dict[str, ObjectFacto
     Cirq modules are the ones referred in cirq/__init__.py. If a Cirq module
     wants to expose JSON serializable objects, it should register itself using
     this method to be supported by the protocol. See for example
-    cirq/__init__.py or cirq/google/__init__.py.
+    cirq/__init__.py, which also registers cirq.google's resolver so that
+    cirq.google is only imported once a type is not found in cirq itself.
 
     As Cirq modules are imported by cirq/__init__.py, they are different from
     3rd party packages, and as such SHOULD NEVER rely on storing a
@@ -298,35 +303,168 @@ class CirqEncoder(json.JSONEncoder):
         return super().default(o)  # coverage: ignore
 
 
-def _cirq_object_hook(d, resolvers: Sequence[JsonResolver], context_map: Dict[str, Any]):
-    if 'cirq_type' not in d:
-        return d
+def _ndarray_to_json_dict(a: np.ndarray) -> Dict[str, Any]:
+    """Encodes an array as base64 of its raw bytes, with dtype and shape.
 
-    if d['cirq_type'] == '_SerializedKey':
-        return _SerializedKey.read_from_context(context_map, **d)
+    Boolean arrays are bit-packed first, which makes them 8 times smaller.
+    """
+    if a.dtype == np.bool_:
+        data = np.packbits(a.reshape(-1)).tobytes()
+    else:
+        data = np.ascontiguousarray(a).tobytes()
+    d = {
+        'cirq_type': 'numpy.ndarray',
+        'dtype': a.dtype.str,
+        'shape': list(a.shape),
+        'data': base64.b64encode(data).decode('ascii'),
+    }
+    if a.dtype == np.bool_:
+        d['bitpacked'] = True
+    return d
 
-    if d['cirq_type'] == '_SerializedContext':
-        _SerializedContext.update_context(context_map, **d)
-        return None
 
-    if d['cirq_type'] == '_ContextualSerialization':
-        return _ContextualSerialization.deserialize_with_context(**d)
+def _ndarray_from_json_dict(
+    dtype: str, shape: Sequence[int], data: str, bitpacked: bool = False
+) -> np.ndarray:
+    raw = bytearray(base64.b64decode(data))
+    if bitpacked:
+        size = int(np.prod(shape, dtype=np.int64))
+        return np.unpackbits(np.frombuffer(raw, dtype=np.uint8))[:size].astype(bool).reshape(shape)
+    return np.frombuffer(raw, dtype=np.dtype(dtype)).reshape(shape)
 
-    for resolver in resolvers:
-        cls = resolver(d['cirq_type'])
-        if cls is not None:
-            break
-    else:
-        raise ValueError(
-            "Could not resolve type '{}' during deserialization".format(d['cirq_type'])
+
+def _with_compact_arrays(cls: Type[json.JSONEncoder]) -> Type[json.JSONEncoder]:
+    class CompactArrayEncoder(cls):  # type: ignore
+        """An encoder that writes numpy arrays as base64 strings."""
+
+        def default(self, o):
+            if isinstance(o, np.ndarray) and not o.dtype.hasobject and o.dtype.fields is None:
+                return _ndarray_to_json_dict(o)
+            return super().default(o)
+
+    return CompactArrayEncoder
+
+
+class _CirqObjectHook:
+    """The `object_hook` for decoding one JSON document.
+
+    Looking up a `cirq_type` goes through every resolver in turn, so the
+    factory found for each type is remembered for the rest of the document.
+
+    Repeated immutable objects, such as the qubits and gates of a large
+    circuit, are constructed only once and then shared. Only qubits, gates,
+    `cirq.GateOperation`s and `cirq.TaggedOperation`s whose JSON dicts contain
+    only primitive values, lists and other shared objects are shared. Other
+    value types, such as `cirq.CliffordState`, may be mutable.
+    """
+
+    def __init__(self, resolvers: Sequence[JsonResolver]) -> None:
+        self._resolvers = resolvers
+        self._context_map: Dict[str, Any] = {}
+        self._factories: Dict[str, Tuple[ObjectFactory, bool]] = {}
+        self._interned: Dict[Any, Any] = {}
+        # Maps the ids of the shared objects to themselves. They are kept
+        # alive by `_interned`, so their ids are not reused while decoding.
+        self._interned_ids: Dict[int, Any] = {}
+
+    def __call__(self, d: Dict[str, Any]) -> Any:
+        cirq_type = d.get('cirq_type')
+        if cirq_type is None:
+            return d
+
+        if cirq_type == '_SerializedKey':
+            return _SerializedKey.read_from_context(self._context_map, **d)
+
+        if cirq_type == '_SerializedContext':
+            _SerializedContext.update_context(self._context_map, **d)
+            return None
+
+        if cirq_type == '_ContextualSerialization':
+            return _ContextualSerialization.deserialize_with_context(**d)
+
+        entry = self._factories.get(cirq_type)
+        if entry is None:
+            entry = self._factories[cirq_type] = self._resolve(cirq_type)
+        factory, internable = entry
+        if not internable:
+            return _construct(factory, d)
+
+        key = self._intern_key(d)
+        if key is None:
+            return _construct(factory, d)
+        obj = self._interned.get(key)
+        if obj is None:
+            obj = _construct(factory, d)
+            self._interned[key] = obj
+            self._interned_ids[id(obj)] = obj
+        return obj
+
+    def _resolve(self, cirq_type: str) -> Tuple[ObjectFactory, bool]:
+        for resolver in self._resolvers:
+            factory = resolver(cirq_type)
+            if factory is not None:
+                break
+        else:
+            raise ValueError("Could not resolve type '{}' during deserialization".format(cirq_type))
+        return factory, _is_internable(factory)
+
+    def _intern_key(self, d: Dict[str, Any]) -> Any:
+        """Returns a hashable key for a JSON dict, or None if it has none.
+
+        Numbers are keyed together with their type, so that `1`, `1.0` and
+        `True` are told apart. Nested objects are keyed by identity, and only
+        if they are shared objects themselves.
+        """
+        try:
+            return tuple(d), tuple([self._value_key(v) for v in d.values()])
+        except _NotInternable:
+            return None
+
+    def _value_key(self, value: Any) -> Any:
+        value_type = type(value)
+        if value_type is str:
+            return value
+        if value_type in _JSON_NUMBERS:
+            return value_type, value
+        if value_type is list:
+            return tuple([self._value_key(v) for v in value])
+        if id(value) in self._interned_ids:
+            return id(value)
+        raise _NotInternable()
+
+
+def _is_internable(factory: ObjectFactory) -> bool:
+    """Whether decoded instances of a type can be shared.
+
+    This is an explicit list of immutable types, since value equality alone
+    does not make a type immutable.
+    """
+    from cirq import ops
+
+    return (
+        isinstance(factory, type)
+        and getattr(factory, '__hash__', None) is not None
+        and (
+            issubclass(factory, (ops.Qid, ops.Gate))
+            or factory in (ops.GateOperation, ops.TaggedOperation)
         )
+    )
+
+
+class _NotInternable(Exception):
+    pass
+
+
+_JSON_NUMBERS = frozenset([int, float, bool, type(None)])
 
-    from_json_dict = getattr(cls, '_from_json_dict_', None)
+
+def _construct(factory: ObjectFactory, d: Dict[str, Any]) -> Any:
+    from_json_dict = getattr(factory, '_from_json_dict_', None)
     if from_json_dict is not None:
         return from_json_dict(**d)
 
     del d['cirq_type']
-    return cls(**d)
+    return factory(**d)
 
 
 class SerializableByKey(SupportsJSON):
@@ -433,6 +571,9 @@ def has_serializable_by_keys(obj: Any) -> bool:
         return any(has_serializable_by_keys(v) for v in json_dict.values())
 
     # Handle primitive container types.
+    if isinstance(obj, np.ndarray):
+        # Only object arrays can hold such objects; don't walk numeric data.
+        return obj.dtype.hasobject and any(has_serializable_by_keys(e) for e in obj.flat)
     if isinstance(obj, Dict):
         return any(has_serializable_by_keys(elem) for pair in obj.items() for elem in pair)
     if hasattr(obj, '__iter__') and not isinstance(obj, str):
@@ -457,6 +598,11 @@ def get_serializable_by_keys(obj: Any) -> List[SerializableByKey]:
         return result
 
     # Handle primitive container types.
+    if isinstance(obj, np.ndarray):
+        # Only object arrays can hold such objects; don't walk numeric data.
+        if not obj.dtype.hasobject:
+            return []
+        return [sbk for e in obj.flat for sbk in get_serializable_by_keys(e)]
     if isinstance(obj, Dict):
         return [sbk for pair in obj.items() for sbk in get_serializable_by_keys(pair)]
     if hasattr(obj, '__iter__') and not isinstance(obj, str):
@@ -467,13 +613,20 @@ def get_serializable_by_keys(obj: Any) -> List[SerializableByKey]:
 # pylint: disable=function-redefined
 @overload
 def to_json(
-    obj: Any, file_or_fn: Union[IO, pathlib.Path, str], *, indent=2, cls=CirqEncoder
+    obj: Any,
+    file_or_fn: Union[IO, pathlib.Path, str],
+    *,
+    indent=2,
+    cls=CirqEncoder,
+    compact_arrays=False,
 ) -> None:
     pass
 
 
 @overload
-def to_json(obj: Any, file_or_fn: None = None, *, indent=2, cls=CirqEncoder) -> str:
+def to_json(
+    obj: Any, file_or_fn: None = None, *, indent=2, cls=CirqEncoder, compact_arrays=False
+) -> str:
     pass
 
 
@@ -481,8 +634,9 @@ def to_json(
     obj: Any,
     file_or_fn: Union[None, IO, pathlib.Path, str] = None,
     *,
-    indent: int = 2,
+    indent: Optional[int] = 2,
     cls: Type[json.JSONEncoder] = CirqEncoder,
+    compact_arrays: bool = False,
 ) -> Optional[str]:
     """Write a JSON file containing a representation of obj.
 
@@ -502,7 +656,17 @@ def to_json(
             the SupportsJSON protocol. To support serialization of 3rd
             party classes, prefer adding the _json_dict_ magic method
             to your classes rather than overriding this default.
+        compact_arrays: If true, numpy arrays are written as base64 strings
+            of their raw bytes with their dtype and shape, instead of as
+            nested lists. This is much smaller and faster for large arrays.
+            `read_json` reads both forms.
+
+    When writing to a file, the JSON text is written piece by piece as the
+    object is traversed (circuits, for example, one moment at a time), so the
+    whole text is never held in memory.
     """
+    if compact_arrays:
+        cls = _with_compact_arrays(cls)
     if has_serializable_by_keys(obj):
         obj = _ContextualSerialization(obj)
 
@@ -573,10 +737,7 @@ def read_json(
     if resolvers is None:
         resolvers = DEFAULT_RESOLVERS
 
-    context_map: Dict[str, 'SerializableByKey'] = {}
-
-    def obj_hook(x):
-        return _cirq_object_hook(x, resolvers, context_map)
+    obj_hook = _CirqObjectHook(resolvers)
 
     if json_text is not None:
         return json.loads(json_text, object_hook=obj_hook)
@@ -588,6 +749,157 @@ def read_json(
     return json.load(cast(IO, file_or_fn), object_hook=obj_hook)
 
 
+def to_json_stream(
+    objs: Iterable[Any],
+    file_or_fn: Union[IO, pathlib.Path, str],
+    *,
+    cls: Type[json.JSONEncoder] = CirqEncoder,
+    compact_arrays: bool = True,
+) -> None:
+    """Writes objects one at a time as the elements of a JSON array.
+
+    Each object is encoded and written before the next one is taken from
+    `objs`, so `objs` can be a generator producing objects that would not fit
+    in memory all at once. The result can be read with `read_json`, or element
+    by element with `read_json_stream`.
+
+    Args:
+        objs: The objects to serialize.
+        file_or_fn: A filename (if a string or `pathlib.Path`) to write to, or
+            an IO object (such as a file or buffer) to write to.
+        cls: The encoder class, see `to_json`.
+        compact_arrays: Whether to write numpy arrays as base64 strings, see
+            `to_json`. Defaults to true.
+    """
+    if isinstance(file_or_fn, (str, pathlib.Path)):
+        with open(file_or_fn, 'w') as actually_a_file:
+            to_json_stream(objs, actually_a_file, cls=cls, compact_arrays=compact_arrays)
+            return
+
+    file_or_fn.write('[')
+    for i, obj in enumerate(objs):
+        file_or_fn.write(',\n' if i else '\n')
+        to_json(obj, file_or_fn, indent=None, cls=cls, compact_arrays=compact_arrays)
+    file_or_fn.write('\n]\n')
+
+
+def read_json_stream(
+    file_or_fn: Union[IO, pathlib.Path, str],
+    *,
+    resolvers: Optional[Sequence[JsonResolver]] = None,
+    chunk_size: int = 1 << 16,
+) -> Iterator[Any]:
+    """Reads a JSON array one element at a time.
+
+    Unlike `read_json`, this does not read the whole document before decoding
+    it. The file is read in chunks, and each element of the top-level array
+    is decoded and yielded as soon as it is complete, so memory use is bounded
+    by the size of the largest element. If the document is not an array, its
+    single value is yielded.
+
+    Args:
+        file_or_fn: A filename (if a string or `pathlib.Path`) to read from,
+            or an IO object (such as a file or buffer) to read from.
+        resolvers: The resolvers for cirq types, see `read_json`.
+        chunk_size: The number of characters read from the file at a time.
+
+    Raises:
+        ValueError: If the document is not valid JSON.
+    """
+    if isinstance(file_or_fn, (str, pathlib.Path)):
+        with open(file_or_fn, 'r') as file:
+            yield from read_json_stream(file, resolvers=resolvers, chunk_size=chunk_size)
+            return
+
+    if resolvers is None:
+        resolvers = DEFAULT_RESOLVERS
+    active_resolvers = resolvers
+
+    def decoder() -> json.JSONDecoder:
+        # Each element gets its own context, as written by `to_json_stream`.
+        return json.JSONDecoder(object_hook=_CirqObjectHook(active_resolvers))
+
+    reader = _JsonStreamReader(cast(IO, file_or_fn), chunk_size)
+    if reader.peek() != '[':
+        yield reader.decode(decoder())
+        reader.expect('')
+        return
+    reader.expect('[')
+    if reader.peek() == ']':
+        reader.expect(']')
+    else:
+        while True:
+            yield reader.decode(decoder())
+            if reader.expect(',]') == ']':
+                break
+    reader.expect('')
+
+
+_JSON_WHITESPACE = re.compile(r'[ \t\n\r]*')
+
+
+class _JsonStreamReader:
+    """Decodes consecutive JSON values from a file, reading it in chunks."""
+
+    def __init__(self, file: IO, chunk_size: int) -> None:
+        self._file = file
+        self._chunk_size = chunk_size
+        self._buffer = ''
+        self._pos = 0
+        self._eof = False
+
+    def _read(self, size: int) -> bool:
+        chunk = self._file.read(size)
+        if not chunk:
+            self._eof = True
+            return False
+        self._buffer = self._buffer[self._pos :] + chunk
+        self._pos = 0
+        return True
+
+    def peek(self) -> str:
+        """Skips whitespace and returns the next character, or '' at the end."""
+        while True:
+            self._pos = _JSON_WHITESPACE.match(self._buffer, self._pos).end()  # type: ignore
+            if self._pos < len(self._buffer):
+                return self._buffer[self._pos]
+            if not self._read(self._chunk_size):
+                return ''
+
+    def expect(self, chars: str) -> str:
+        """Consumes the next character, which must be one of `chars`.
+
+        An empty `chars` expects the end of the file.
+        """
+        c = self.peek()
+        if (c == '') != (chars == '') or c not in chars:
+            found = repr(c) if c else 'the end of the file'
+            wanted = ' or '.join(repr(e) for e in chars) if chars else 'the end of the file'
+            raise ValueError(f'Invalid JSON stream: expected {wanted} but found {found}.')
+        self._pos += len(c)
+        return c
+
+    def decode(self, decoder: json.JSONDecoder) -> Any:
+        """Decodes the next value, reading more of the file as needed."""
+        self.peek()
+        # Read geometrically more on each retry, so a large value is parsed
+        # a logarithmic number of times rather than once per chunk.
+        read_size = self._chunk_size
+        while True:
+            try:
+                obj, end = decoder.raw_decode(self._buffer, self._pos)
+                # A value that ends with the buffer may continue in the file,
+                # for example a number.
+                if end < len(self._buffer) or self._eof:
+                    self._pos = end
+                    return obj
+            except json.JSONDecodeError:
+                if self._eof:
+                    raise
+            self._read(read_size)
+            read_size *= 2
+
+
 def to_json_gzip(
     obj: Any,
     file_or_fn: Union[None, IO, pathlib.Path, str] = None,
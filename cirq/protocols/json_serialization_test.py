@@ -147,6 +147,65 @@ def test_fail_to_resolve():
     assert e.match("Could not resolve type 'MyCustomClass' during deserialization")
 
 
+def test_read_json_resolves_each_type_once():
+    calls = []
+
+    def counting_resolver(cirq_type):
+        calls.append(cirq_type)
+        return None
+
+    q = cirq.GridQubit.rect(3, 3)
+    circuit = cirq.Circuit(cirq.H.on_each(*q), cirq.CZ(q[0], q[1]), cirq.CZ(q[2], q[3]))
+    text = cirq.to_json(circuit)
+    actual = cirq.read_json(json_text=text, resolvers=[counting_resolver] + cirq.DEFAULT_RESOLVERS)
+    assert actual == circuit
+    assert sorted(calls) == sorted(set(calls))
+    assert 'GridQubit' in calls
+
+
+def test_read_json_shares_immutable_objects():
+    q0, q1 = cirq.LineQubit.range(2)
+    circuit = cirq.Circuit(
+        cirq.H(q0), cirq.CZ(q0, q1), cirq.H(q0), cirq.CZ(q0, q1), cirq.measure(q0, q1, key='m')
+    )
+    actual = cirq.read_json(json_text=cirq.to_json(circuit))
+    assert actual == circuit
+    ops = list(actual.all_operations())
+    assert ops[0] is ops[2]
+    assert ops[1] is ops[3]
+    assert ops[1].qubits[0] is ops[0].qubits[0]
+
+    # Equal objects of different types, or built from numbers of different
+    # types, are kept apart.
+    objs = [
+        cirq.X,
+        cirq.XPowGate(),
+        cirq.XPowGate(exponent=1.0),
+        cirq.XPowGate(exponent=True),
+        cirq.X(q0),
+        cirq.XPowGate()(q0),
+    ]
+    actual = cirq.read_json(json_text=cirq.to_json(objs))
+    assert [type(o) for o in actual] == [type(o) for o in objs]
+    assert [type(o.exponent) for o in actual[:4]] == [type(o.exponent) for o in objs[:4]]
+    assert [type(o.gate) for o in actual[4:]] == [type(o.gate) for o in objs[4:]]
+
+    # Mutable objects are never shared.
+    actual = cirq.read_json(json_text=cirq.to_json([cirq.Circuit(cirq.H(q0))] * 2))
+    assert actual[0] == actual[1]
+    assert actual[0] is not actual[1]
+
+    # Neither are other value types, which may be mutable.
+    state = cirq.CliffordState({q0: 0, q1: 1})
+    actual = cirq.read_json(json_text=cirq.to_json([state, state]))
+    assert actual[0] is not actual[1]
+    actual[0].apply_unitary(cirq.X(q0))
+    np.testing.assert_allclose(
+        actual[0].state_vector(), cirq.one_hot(index=2, shape=(4,), dtype=np.complex64)
+    )
+    np.testing.assert_allclose(actual[1].state_vector(), state.state_vector())
+
+
 QUBITS = cirq.LineQubit.range(5)
 Q0, Q1, Q2, Q3, Q4 = QUBITS
 
@@ -251,6 +310,87 @@ def test_numpy():
     assert_json_roundtrip_works(np.arange(3))
 
 
+def test_compact_arrays():
+    arrays = [
+        np.arange(24, dtype=np.int8).reshape((2, 3, 4)),
+        np.linspace(0, 1, 7),
+        np.array([1 + 2j, 3 - 4j], dtype=np.complex64),
+        np.array([[True, False, True], [False, False, True]]),
+        np.zeros((0, 3), dtype=np.uint16),
+        np.array(5.0),
+        np.arange(12).reshape((3, 4)).T,
+    ]
+    for a in arrays:
+        text = cirq.to_json(a, compact_arrays=True)
+        assert '"numpy.ndarray"' in text
+        b = cirq.read_json(json_text=text)
+        assert b.dtype == a.dtype
+        assert b.shape == a.shape
+        np.testing.assert_array_equal(a, b)
+        b[...] = 0
+
+    big = np.random.RandomState(1234).randint(2, size=10000).astype(bool)
+    assert len(cirq.to_json(big, compact_arrays=True)) < 2000
+    np.testing.assert_array_equal(
+        cirq.read_json(json_text=cirq.to_json(big, compact_arrays=True)), big
+    )
+
+    # Object arrays cannot be packed and are still written as lists.
+    objects = np.array([cirq.LineQubit(0), cirq.LineQubit(1)])
+    assert cirq.read_json(json_text=cirq.to_json(objects, compact_arrays=True)) == list(objects)
+
+
+def test_json_stream():
+    q0, q1 = cirq.LineQubit.range(2)
+    objs = [
+        cirq.Circuit(cirq.H(q0), cirq.CNOT(q0, q1), cirq.measure(q0, q1, key='m')),
+        np.arange(1000, dtype=np.float64).reshape((10, 100)),
+        12345,
+        'a string with [brackets], {braces} and "quotes"',
+        cirq.X ** sympy.Symbol('t'),
+        [],
+    ]
+    buffer = io.StringIO()
+    cirq.to_json_stream(iter(objs), buffer)
+    text = buffer.getvalue()
+    assert proper_eq(cirq.read_json(json_text=text), objs)
+
+    for chunk_size in [1, 7, 1 << 16]:
+        actual = list(cirq.read_json_stream(io.StringIO(text), chunk_size=chunk_size))
+        assert proper_eq(actual, objs)
+
+    buffer = io.StringIO()
+    cirq.to_json_stream([], buffer)
+    assert list(cirq.read_json_stream(io.StringIO(buffer.getvalue()))) == []
+
+
+def test_json_stream_contextual(tmpdir):
+    def custom_resolver(name):
+        if name == 'SBKImpl':
+            return SBKImpl
+
+    sbki_empty = SBKImpl('sbki_empty')
+    sbki_list = SBKImpl('sbki_list', data_list=[sbki_empty, sbki_empty])
+    objs = [sbki_list, SBKImpl('sbki_dict', data_dict={'a': sbki_list}), sbki_list]
+    path = pathlib.Path(tmpdir) / 'stream.json'
+    cirq.to_json_stream(objs, path)
+    test_resolvers = [custom_resolver] + cirq.DEFAULT_RESOLVERS
+    assert list(cirq.read_json_stream(path, resolvers=test_resolvers, chunk_size=5)) == objs
+    assert list(cirq.read_json_stream(str(path), resolvers=test_resolvers)) == objs
+
+
+def test_read_json_stream_single_value():
+    assert list(cirq.read_json_stream(io.StringIO(' 12 '), chunk_size=1)) == [12]
+    text = cirq.to_json(cirq.LineQubit(3))
+    assert list(cirq.read_json_stream(io.StringIO(text), chunk_size=3)) == [cirq.LineQubit(3)]
+
+
+@pytest.mark.parametrize('text', ['', '[1, 2', '[1 2]', '[1,]', '[1] 2', '{"a": 1', '[', '1 2'])
+def test_read_json_stream_invalid(text):
+    with pytest.raises(ValueError):
+        _ = list(cirq.read_json_stream(io.StringIO(text), chunk_size=2))
+
+
 def test_pandas():
     assert_json_roundtrip_works(
         pd.DataFrame(data=[[1, 2, 3], [4, 5, 6]], columns=['x', 'y', 'z'], index=[2, 5])
@@ -388,6 +528,23 @@ def test_context_serialization():
     assert_json_roundtrip_works(sbki_other_list, resolvers=test_resolvers)
 
 
+def test_context_serialization_with_arrays():
+    def custom_resolver(name):
+        if name == 'SBKImpl':
+            return SBKImpl
+
+    test_resolvers = [custom_resolver] + cirq.DEFAULT_RESOLVERS
+
+    sbki = SBKImpl('sbki')
+    assert json_serialization.get_serializable_by_keys({'a': np.zeros(3)}) == []
+    assert json_serialization.get_serializable_by_keys(np.array([sbki, 1], dtype=object)) == [sbki]
+
+    text = cirq.to_json([sbki, np.zeros(2)])
+    restored = cirq.read_json(json_text=text, resolvers=test_resolvers)
+    assert restored[0] == sbki
+    np.testing.assert_array_equal(restored[1], np.zeros(2))
+
+
 def test_internal_serializer_types():
     sbki = SBKImpl('test_key')
     key = f'{sbki._serialization_name_()}_1'
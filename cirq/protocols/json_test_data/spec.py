@@ -101,6 +101,8 @@ TestSpec = ModuleJsonTestSpec(
         'MergeSingleQubitGates',
         'PointOptimizer',
         'SynchronizeTerminalMeasurements',
+        # Caches are mutable local state.
+        'TwoQubitDecompositionCache',
         # global objects
         'CONTROL_TAG',
         'PAULI_BASIS',
@@ -159,6 +161,7 @@ TestSpec = ModuleJsonTestSpec(
         'ParamDictType',
         # utility:
         'CliffordSimulator',
+        'CollectionStats',
         'Simulator',
         'StabilizerSampler',
         'Unique',
@@ -16,8 +16,8 @@
 from typing import Optional, TYPE_CHECKING, Tuple
 
 import numpy as np
-import scipy
-import scipy.stats
+import scipy.linalg
+
 from cirq import value
 from cirq._compat import deprecated_parameter
 from cirq.qis.states import (
@@ -271,6 +271,9 @@ def von_neumann_entropy(
             if qid_shape is None:
                 qid_shape = (state.shape[0],)
             validate_density_matrix(state, qid_shape=qid_shape, dtype=state.dtype, atol=atol)
+        # Imported here because scipy.stats is slow to import.
+        import scipy.stats
+
         eigenvalues = np.linalg.eigvalsh(state)
         return scipy.stats.entropy(np.abs(eigenvalues), base=2)
     if validate:
@@ -29,6 +29,7 @@ The quantum state is specified in two forms:
     to state vector amplitudes.
 """
 
+import copy
 from typing import Any, Dict, List, Iterator, Sequence
 
 import numpy as np
@@ -59,6 +60,14 @@ class CliffordSimulator(
         self.init = True
         self._prng = value.parse_random_state(seed)
 
+    def _random_state(self) -> np.random.RandomState:
+        return self._prng
+
+    def _reseeded(self, seed: int) -> 'cirq.CliffordSimulator':
+        simulator = copy.copy(self)
+        simulator._prng = np.random.RandomState(seed)
+        return simulator
+
     @staticmethod
     def is_supported_operation(op: 'cirq.Operation') -> bool:
         """Checks whether given operation can be simulated by this simulator."""
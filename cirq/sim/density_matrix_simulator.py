@@ -14,6 +14,7 @@
 """Simulator for density matrices that simulates noisy quantum circuits."""
 
 import collections
+import copy
 
 from typing import Any, Dict, Iterator, List, TYPE_CHECKING, Tuple, Type, Union
 
@@ -165,6 +166,14 @@ class DensityMatrixSimulator(
         self.noise = devices.NoiseModel.from_noise_model_like(noise)
         self._ignore_measurement_results = ignore_measurement_results
 
+    def _random_state(self) -> np.random.RandomState:
+        return self._prng
+
+    def _reseeded(self, seed: int) -> 'cirq.DensityMatrixSimulator':
+        simulator = copy.copy(self)
+        simulator._prng = np.random.RandomState(seed)
+        return simulator
+
     def _run(
         self, circuit: circuits.Circuit, param_resolver: study.ParamResolver, repetitions: int
     ) -> Dict[str, np.ndarray]:
@@ -46,6 +46,8 @@ from typing import (
 
 import abc
 import collections
+import concurrent.futures
+import os
 
 import numpy as np
 
@@ -72,16 +74,36 @@ class SimulatesSamples(work.Sampler, metaclass=abc.ABCMeta):
         program: 'cirq.Circuit',
         params: study.Sweepable,
         repetitions: int = 1,
+        *,
+        max_workers: Optional[int] = None,
+        executor: Optional[concurrent.futures.Executor] = None,
     ) -> List[study.Result]:
         """Runs the supplied Circuit, mimicking quantum hardware.
 
         In contrast to run, this allows for sweeping over different parameter
         values.
 
+        By default the sweep points are simulated one after the other. If
+        `max_workers` or `executor` is given, the points are instead sharded
+        across workers: each shard is sent the circuit once along with the
+        parameter dictionaries of its points. In that mode, every point is
+        simulated with its own random state, derived in sweep order from the
+        random state of this simulator, so that results do not depend on the
+        number of workers or on scheduling. Simulators that can't be reseeded
+        (see `_random_state`) are always simulated one point after the other.
+
         Args:
             program: The circuit to simulate.
             params: Parameters to run with the program.
             repetitions: The number of repetitions to simulate.
+            max_workers: If given, the sweep is run on this many worker
+                processes (or, if `executor` is also given, split into this
+                many shards). Defaults to the number of CPUs when only an
+                `executor` is given.
+            executor: An optional executor, e.g. a
+                `concurrent.futures.ProcessPoolExecutor`, on which to run the
+                shards. If not given but `max_workers` is, a temporary
+                process pool is used.
 
         Returns:
             Result list for this run; one for each possible parameter
@@ -92,6 +114,9 @@ class SimulatesSamples(work.Sampler, metaclass=abc.ABCMeta):
 
         _verify_unique_measurement_keys(program)
 
+        if (max_workers is not None or executor is not None) and self._random_state() is not None:
+            return self._run_sweep_sharded(program, params, repetitions, max_workers, executor)
+
         trial_results = []  # type: List[study.Result]
         for param_resolver in study.to_resolvers(params):
             measurements = self._run(
@@ -104,6 +129,102 @@ class SimulatesSamples(work.Sampler, metaclass=abc.ABCMeta):
             )
         return trial_results
 
+    def _run_sweep_sharded(
+        self,
+        program: 'cirq.Circuit',
+        params: study.Sweepable,
+        repetitions: int,
+        max_workers: Optional[int],
+        executor: Optional[concurrent.futures.Executor],
+    ) -> List[study.Result]:
+        if max_workers is not None and max_workers < 1:
+            raise ValueError(f'max_workers must be positive. Got {max_workers}.')
+        resolvers = list(study.to_resolvers(params))
+        points = [
+            (index, resolver.param_dict, self._derive_seed())
+            for index, resolver in enumerate(resolvers)
+        ]
+        num_shards = min(max_workers or os.cpu_count() or 1, len(points))
+        shards = [points[i::num_shards] for i in range(num_shards)]
+
+        def run_shards(pool: concurrent.futures.Executor) -> List[Dict[str, np.ndarray]]:
+            futures = [
+                pool.submit(_run_sweep_shard, self, program, repetitions, shard) for shard in shards
+            ]
+            measurements: List[Dict[str, np.ndarray]] = [{} for _ in points]
+            for future in concurrent.futures.as_completed(futures):
+                for index, point_measurements in future.result():
+                    measurements[index] = point_measurements
+            return measurements
+
+        if executor is None:
+            with concurrent.futures.ProcessPoolExecutor(max_workers=max_workers) as pool:
+                all_measurements = run_shards(pool)
+        else:
+            all_measurements = run_shards(executor)
+
+        return [
+            study.Result.from_single_parameter_set(params=resolver, measurements=measurements)
+            for resolver, measurements in zip(resolvers, all_measurements)
+        ]
+
+    def _random_state(self) -> Optional[np.random.RandomState]:
+        """The random state that this simulator samples from.
+
+        Simulators that sample from an internal random state should return it
+        here and override `_reseeded`, so that work sent to other workers can
+        be simulated with independent random states derived from this one.
+        Simulators that return None, as by default, can't be reseeded, and
+        `run_sweep` and `run_batch_async` simulate their work one item after
+        the other in this process instead.
+        """
+        return None
+
+    def _reseeded(self, seed: int) -> 'SimulatesSamples':
+        """Returns a copy of this simulator whose random state is seeded by `seed`.
+
+        Only called if `_random_state` does not return None.
+        """
+        raise NotImplementedError()
+
+    def _derive_seed(self) -> int:
+        """Draws a seed for an independent random state from this simulator's."""
+        random_state = self._random_state()
+        assert random_state is not None
+        return random_state.randint(2 ** 31)
+
+    async def run_batch_async(
+        self,
+        programs: List['cirq.Circuit'],
+        params_list: Optional[List['cirq.Sweepable']] = None,
+        repetitions: Union[int, List[int]] = 1,
+        *,
+        max_concurrency: Optional[int] = None,
+        executor: Optional[concurrent.futures.Executor] = None,
+    ) -> List[List['cirq.Result']]:
+        """Asynchronously runs the supplied circuits.
+
+        If an `executor` is given, e.g. a
+        `concurrent.futures.ProcessPoolExecutor`, each circuit is simulated on
+        it with its own random state, derived in order from the random state
+        of this simulator, so seeded simulators give reproducible results.
+        Simulators that can't be reseeded ignore the `executor` and simulate
+        the circuits in this process. See `cirq.Sampler.run_batch_async` for
+        the arguments.
+        """
+        if self._random_state() is None:
+            executor = None
+        return await super().run_batch_async(
+            programs,
+            params_list,
+            repetitions,
+            max_concurrency=max_concurrency,
+            executor=executor,
+        )
+
+    def _batch_item_sampler(self) -> 'SimulatesSamples':
+        return self._reseeded(self._derive_seed())
+
     @abc.abstractmethod
     def _run(
         self, circuit: circuits.Circuit, param_resolver: study.ParamResolver, repetitions: int
@@ -125,6 +246,29 @@ class SimulatesSamples(work.Sampler, metaclass=abc.ABCMeta):
         raise NotImplementedError()
 
 
+def _run_sweep_shard(
+    simulator: SimulatesSamples,
+    circuit: 'cirq.Circuit',
+    repetitions: int,
+    shard: List[Tuple[int, Dict[Any, Any], int]],
+) -> List[Tuple[int, Dict[str, np.ndarray]]]:
+    """Simulates one shard of a sweep given as (index, param dict, seed) points.
+
+    Module level so that it can be pickled and sent to process pools.
+    """
+    return [
+        (
+            index,
+            simulator._reseeded(seed)._run(
+                circuit=circuit,
+                param_resolver=study.ParamResolver(param_dict),
+                repetitions=repetitions,
+            ),
+        )
+        for index, param_dict, seed in shard
+    ]
+
+
 class SimulatesAmplitudes(metaclass=abc.ABCMeta):
     """Simulator that computes final amplitudes of given bitstrings.
 
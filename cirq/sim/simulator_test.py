@@ -13,10 +13,12 @@
 # limitations under the License.
 """Tests for simulator.py"""
 import abc
+import concurrent.futures
 from typing import Generic, Dict, Any
 from unittest import mock
 import numpy as np
 import pytest
+import sympy
 
 import cirq
 from cirq import study
@@ -367,6 +369,123 @@ async def test_async_sample():
     np.testing.assert_equal(result.measurements, m)
 
 
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    'simulator_type', [cirq.Simulator, cirq.DensityMatrixSimulator, cirq.CliffordSimulator]
+)
+async def test_run_batch_async_process_pool(simulator_type):
+    q0, q1 = cirq.LineQubit.range(2)
+    circuits = [
+        cirq.Circuit(cirq.H(q0), cirq.CNOT(q0, q1), cirq.measure(q0, q1, key='m')),
+        cirq.Circuit(cirq.X(q0), cirq.measure(q0, q1, key='m')),
+    ] * 2
+    with concurrent.futures.ProcessPoolExecutor(max_workers=2) as pool:
+        results = await simulator_type(seed=1234).run_batch_async(
+            circuits, repetitions=20, executor=pool
+        )
+    assert len(results) == 4
+    for result_list in results:
+        assert len(result_list) == 1
+    bell = results[0][0].measurements['m']
+    assert np.all(bell[:, 0] == bell[:, 1])
+    np.testing.assert_equal(results[1][0].measurements['m'], [[1, 0]] * 20)
+
+    # Each circuit draws its own randomness, reproducibly.
+    assert not np.array_equal(results[0][0].measurements['m'], results[2][0].measurements['m'])
+    with concurrent.futures.ThreadPoolExecutor(max_workers=3) as pool:
+        again = await simulator_type(seed=1234).run_batch_async(
+            circuits, repetitions=20, executor=pool
+        )
+    assert again == results
+
+
+@pytest.mark.asyncio
+async def test_run_batch_async_in_process_by_default():
+    q = cirq.LineQubit(0)
+    circuits = [cirq.Circuit(cirq.H(q), cirq.measure(q, key='m'))] * 3
+    results = await cirq.Simulator(seed=1234).run_batch_async(circuits, repetitions=20)
+    assert results == cirq.Simulator(seed=1234).run_batch(circuits, repetitions=20)
+
+
+class _UnseedableSampler(cirq.SimulatesSamples):
+    """Samples from a random state that can't be reseeded."""
+
+    def __init__(self):
+        self.random_state = np.random.RandomState(1234)
+
+    def _run(self, circuit, param_resolver, repetitions):
+        return {'m': self.random_state.randint(2, size=(repetitions, 1))}
+
+
+@pytest.mark.asyncio
+async def test_run_batch_async_unseedable_runs_in_process():
+    circuits = [cirq.Circuit(cirq.measure(cirq.LineQubit(0), key='m'))] * 3
+    executor = mock.Mock(spec=concurrent.futures.Executor)
+    results = await _UnseedableSampler().run_batch_async(
+        circuits, repetitions=20, executor=executor
+    )
+    assert not executor.submit.called
+    assert results == _UnseedableSampler().run_batch(circuits, repetitions=20)
+    assert results[0] != results[1]
+
+
+def test_run_sweep_unseedable_runs_in_process():
+    circuit = cirq.Circuit(cirq.measure(cirq.LineQubit(0), key='m'))
+    params = cirq.Points('t', [0, 1, 2])
+    executor = mock.Mock(spec=concurrent.futures.Executor)
+    results = _UnseedableSampler().run_sweep(
+        circuit, params, repetitions=20, max_workers=2, executor=executor
+    )
+    assert not executor.submit.called
+    assert results == _UnseedableSampler().run_sweep(circuit, params, repetitions=20)
+    assert not np.array_equal(results[0].measurements['m'], results[1].measurements['m'])
+
+
+@pytest.mark.asyncio
+async def test_run_batch_async_executor():
+    q = cirq.LineQubit(0)
+    circuit = cirq.Circuit(cirq.X(q), cirq.measure(q, key='m'))
+    with concurrent.futures.ThreadPoolExecutor(max_workers=2) as pool:
+        results = await cirq.Simulator().run_batch_async([circuit] * 3, executor=pool)
+    for result_list in results:
+        np.testing.assert_equal(result_list[0].measurements['m'], [[1]])
+
+
+@pytest.mark.parametrize(
+    'simulator_type', [cirq.Simulator, cirq.DensityMatrixSimulator, cirq.CliffordSimulator]
+)
+def test_run_sweep_parallel(simulator_type):
+    q0, q1 = cirq.LineQubit.range(2)
+    t = sympy.Symbol('t')
+    circuit = cirq.Circuit(
+        cirq.H(q0), cirq.CNOT(q0, q1), cirq.X(q1) ** t, cirq.measure(q0, q1, key='m')
+    )
+    params = cirq.Points('t', [0, 1, 0, 1, 0])
+    results = simulator_type(seed=1234).run_sweep(circuit, params, repetitions=20, max_workers=2)
+    assert [r.params.param_dict for r in results] == [{'t': v} for v in [0, 1, 0, 1, 0]]
+    for result, flipped in zip(results, [0, 1, 0, 1, 0]):
+        m = result.measurements['m']
+        assert np.all(m[:, 0] == m[:, 1] ^ flipped)
+    # Every point has its own random state.
+    assert not np.array_equal(results[0].measurements['m'], results[2].measurements['m'])
+
+    # The results only depend on the simulator seed, not on the sharding.
+    with concurrent.futures.ThreadPoolExecutor(max_workers=3) as pool:
+        again = simulator_type(seed=1234).run_sweep(
+            circuit, params, repetitions=20, max_workers=3, executor=pool
+        )
+    assert again == results
+
+
+def test_run_sweep_parallel_empty_and_invalid():
+    q = cirq.LineQubit(0)
+    circuit = cirq.Circuit(cirq.X(q), cirq.measure(q, key='m'))
+    with concurrent.futures.ThreadPoolExecutor(max_workers=2) as pool:
+        assert cirq.Simulator().run_sweep(circuit, [], executor=pool) == []
+    with pytest.raises(ValueError, match='max_workers'):
+        cirq.Simulator().run_sweep(circuit, None, max_workers=0)
+
+
 def test_simulation_trial_result_qubit_map():
     q = cirq.LineQubit.range(2)
     result = cirq.Simulator().simulate(cirq.Circuit([cirq.CZ(q[0], q[1])]))
@@ -15,6 +15,7 @@
 """A simulator that uses numpy's einsum for sparse matrix operations."""
 
 import collections
+import copy
 from typing import (
     Any,
     Dict,
@@ -166,6 +167,14 @@ class Simulator(
             raise ValueError('noise must be unitary or mixture but was {}'.format(noise_model))
         self.noise = noise_model
 
+    def _random_state(self) -> np.random.RandomState:
+        return self._prng
+
+    def _reseeded(self, seed: int) -> 'cirq.Simulator':
+        simulator = copy.copy(self)
+        simulator._prng = np.random.RandomState(seed)
+        return simulator
+
     def _run(
         self, circuit: circuits.Circuit, param_resolver: study.ParamResolver, repetitions: int
     ) -> Dict[str, np.ndarray]:
@@ -13,8 +13,9 @@
 # limitations under the License.
 
 """Resolves ParameterValues to assigned values."""
+import functools
 import numbers
-from typing import Any, Dict, Iterator, Optional, TYPE_CHECKING, Union, cast
+from typing import Any, Callable, Dict, Iterator, Optional, Tuple, TYPE_CHECKING, Union, cast
 import numpy as np
 import sympy
 from sympy.core import numbers as sympy_numbers
@@ -125,6 +126,13 @@ class ParamResolver:
             if v is not None:
                 return v
 
+        # Formulas are compiled to numpy code once and evaluated with the
+        # values of their symbols, which is much faster than substitution.
+        if isinstance(value, sympy.Basic) and not isinstance(value, sympy.Symbol):
+            v = self._value_of_compiled(value, recursive)
+            if v is not None:
+                return v
+
         # The following resolves common sympy expressions
         # If sympy did its job and wasn't slower than molasses,
         # we wouldn't need the following block.
@@ -181,6 +189,41 @@ class ParamResolver:
             self._deep_eval_map[value] = self.value_of(v, recursive)
         return self._deep_eval_map[value]
 
+    def _value_of_compiled(self, value: sympy.Basic, recursive: bool) -> Optional[Any]:
+        """Evaluates a formula whose symbols all resolve to real numbers.
+
+        Returns None if the formula cannot be compiled, if some of its symbols
+        do not resolve to real numbers, or if the compiled function hits a
+        domain error or produces a non-finite or complex value. Those cases
+        are left to the sympy evaluation path, whose results (e.g. `inf` for
+        division by zero, or `log(-1) == pi*1j`) the compiled code does not
+        reproduce.
+        """
+        compiled = _compile_expression(value)
+        if compiled is None:
+            return None
+        symbols, func = compiled
+        args = []
+        for symbol in symbols:
+            v = self.value_of(symbol, recursive)
+            if not isinstance(v, numbers.Real) or isinstance(v, sympy.Basic):
+                return None
+            args.append(v)
+        try:
+            with np.errstate(divide='raise', over='raise', invalid='raise'):
+                result = func(*args)
+        except (ArithmeticError, NameError, TypeError, ValueError):
+            # Domain errors, functions numpy does not know about, or values
+            # numpy cannot handle.
+            return None
+        if not isinstance(result, numbers.Real) or not np.isfinite(result):
+            return None
+        # Match the result types of the sympy evaluation path: sums and
+        # products of integers stay integers, everything else is a float.
+        if isinstance(result, numbers.Integral) and _is_integer_formula(value):
+            return int(result)
+        return np.float64(result)
+
     def _resolve_parameters_(
         self, param_resolver: 'ParamResolver', recursive: bool
     ) -> 'ParamResolver':
@@ -245,3 +288,33 @@ def _sympy_pass_through(val: Any) -> Optional[Any]:
     if val == sympy.pi:
         return np.pi
     return None
+
+
+@functools.lru_cache(maxsize=4096)
+def _compile_expression(
+    value: sympy.Basic,
+) -> Optional[Tuple[Tuple[sympy.Symbol, ...], Callable[..., Any]]]:
+    """Compiles a formula into a numpy function of its free symbols.
+
+    Returns:
+        The free symbols of the formula, sorted by name, and a function taking
+        their values (as numbers or arrays) in that order. None if the formula
+        has no free symbols or cannot be compiled.
+    """
+    symbols = tuple(sorted(value.free_symbols, key=lambda s: s.name))
+    if not symbols or not all(isinstance(s, sympy.Symbol) for s in symbols):
+        return None
+    try:
+        func = sympy.lambdify(symbols, value, modules='numpy', dummify=True)
+    except (SyntaxError, TypeError, ValueError, NameError):
+        return None
+    return symbols, func
+
+
+@functools.lru_cache(maxsize=4096)
+def _is_integer_formula(value: sympy.Basic) -> bool:
+    """Whether a formula only adds and multiplies symbols and 0, 1 or -1."""
+    return all(
+        isinstance(node, (sympy.Add, sympy.Mul, sympy.Symbol, sympy_numbers.IntegerConstant))
+        for node in sympy.preorder_traversal(value)
+    )
@@ -129,6 +129,55 @@ def test_value_of_calculations():
     assert r.value_of(sympy.Symbol('b') / 0.1 - sympy.Symbol('a')) == 0.5
 
 
+def test_value_of_compiled_formulas():
+    a, b = sympy.Symbol('a'), sympy.Symbol('b')
+    r = cirq.ParamResolver({'a': 0.25, b: 3})
+    formulas = [
+        a + b,
+        a * b - 1,
+        b ** a,
+        sympy.sin(sympy.pi * a) * sympy.cos(b),
+        sympy.exp(sympy.I * sympy.pi * a),
+        sympy.Abs(a - b) / 2,
+    ]
+    for formula in formulas:
+        expected = complex(formula.subs({a: 0.25, b: 3}))
+        assert np.isclose(r.value_of(formula), expected)
+        assert np.isclose(r.value_of(formula, recursive=False), expected)
+    assert cirq.study.resolver._compile_expression(a * b - 1) is (
+        cirq.study.resolver._compile_expression(a * b - 1)
+    )
+
+    # Unresolved symbols are left in place.
+    assert r.value_of(a + sympy.Symbol('c')) == 0.25 + sympy.Symbol('c')
+
+
+def test_value_of_compiled_formulas_match_sympy_path():
+    a, b = sympy.Symbol('a'), sympy.Symbol('b')
+
+    # Domain errors and non-finite or complex results use the sympy path.
+    assert cirq.ParamResolver({'a': 0.0}).value_of(1 / a) == np.inf
+    assert cirq.ParamResolver({'a': 0.0, 'b': 2.0}).value_of(b / a) == np.inf
+    assert cirq.ParamResolver({'a': -1}).value_of(sympy.log(a)) == np.pi * 1j
+    with pytest.warns(RuntimeWarning):
+        assert np.isnan(cirq.ParamResolver({'a': -4}).value_of(a ** 0.5))
+
+    # Result types follow the sympy path.
+    r = cirq.ParamResolver({'a': 2, 'b': 3})
+    assert type(r.value_of(a * b + 1)) is int
+    assert type(r.value_of(a ** 2)) is np.float64
+    assert type(r.value_of(sympy.sin(a) * 2)) is np.float64
+
+
+def test_value_of_formula_not_compilable():
+    class Double(sympy.Function):
+        def _eval_evalf(self, prec):
+            return 2 * self.args[0]._eval_evalf(prec)
+
+    r = cirq.ParamResolver({'a': 1.5})
+    assert r.value_of(Double(sympy.Symbol('a')) + 1) == 4
+
+
 def test_param_dict():
     r = cirq.ParamResolver({'a': 0.5, 'b': 0.1})
     r2 = cirq.ParamResolver(r)
@@ -18,6 +18,7 @@ from typing import (
     Iterable,
     Iterator,
     List,
+    Optional,
     overload,
     Sequence,
     TYPE_CHECKING,
@@ -28,6 +29,8 @@ from typing import (
 import abc
 import collections
 import itertools
+
+import numpy as np
 import sympy
 
 from cirq._doc import document
@@ -153,6 +156,92 @@ class Sweep(metaclass=abc.ABCMeta):
     def param_tuples(self) -> Iterator[Params]:
         """An iterator over (key, value) pairs assigning Symbol key to value."""
 
+    def param_array(self, start: int = 0, stop: Optional[int] = None) -> np.ndarray:
+        """Returns the values of the sweep as a float array.
+
+        Row `i` holds the values of the `i`-th point of the sweep, in the
+        order of `keys`. This is much faster than iterating over the sweep,
+        and only the requested rows are computed, so a slice of a very large
+        sweep is cheap.
+
+        Args:
+            start: The index of the first point to return.
+            stop: The index after the last point to return. Defaults to the
+                length of the sweep. Like `start`, it may be negative and is
+                clipped to the length of the sweep, as for slices.
+
+        Returns:
+            An array of shape `(n, len(self.keys))` with the values of the
+            points `start` to `stop` of the sweep.
+
+        Raises:
+            ValueError: If a value of the sweep is not a real number, or if
+                the points of the sweep do not all have the same keys.
+        """
+        rows = range(len(self))[start:stop]
+        indices = np.arange(rows.start, rows.stop, dtype=np.int64)
+        try:
+            values = self._param_array_at(indices)
+        except TypeError as ex:
+            raise ValueError(f'Sweep values must be real numbers: {ex}') from ex
+        return values.reshape((len(indices), len(self.keys)))
+
+    def _param_array_at(self, indices: np.ndarray) -> np.ndarray:
+        """Returns the rows of `param_array` at the given point indices.
+
+        Subclasses override this to compute the values without iterating
+        over `param_tuples`.
+        """
+        values = [[value for _, value in params] for params in self.param_tuples()]
+        return np.array(values, dtype=float).reshape((len(self), len(self.keys)))[indices]
+
+    def values_of(
+        self, value: 'cirq.TParamVal', start: int = 0, stop: Optional[int] = None
+    ) -> np.ndarray:
+        """Evaluates a parameter or formula at the points of the sweep.
+
+        The formula is compiled once and evaluated on whole columns of
+        `param_array`, instead of being resolved point by point.
+
+        Args:
+            value: A number, a parameter name, a symbol or a sympy formula of
+                the parameters of the sweep.
+            start: The index of the first point to evaluate at.
+            stop: The index after the last point to evaluate at. Defaults to
+                the length of the sweep.
+
+        Returns:
+            An array with the value at each of the points `start` to `stop`.
+
+        Raises:
+            ValueError: If the value depends on symbols that are not keys of
+                the sweep, or if a value of the sweep is not a real number.
+        """
+        params = self.param_array(start, stop)
+        if isinstance(value, str):
+            value = sympy.Symbol(value)
+        if not isinstance(value, sympy.Basic):
+            return np.full(len(params), value)
+        columns = {getattr(key, 'name', key): params[:, i] for i, key in enumerate(self.keys)}
+        missing = sorted(symbol.name for symbol in value.free_symbols if symbol.name not in columns)
+        if missing:
+            raise ValueError(f'Parameters {missing} of {value} are not keys of the sweep.')
+
+        compiled = resolver._compile_expression(value)
+        if compiled is not None:
+            symbols, func = compiled
+            try:
+                result = func(*(columns[symbol.name] for symbol in symbols))
+            except (NameError, TypeError):
+                pass
+            else:
+                return np.array(np.broadcast_to(result, (len(params),)))
+
+        # Constant formulas, and formulas that numpy cannot evaluate.
+        return np.array(
+            [resolver.ParamResolver(dict(zip(self.keys, row))).value_of(value) for row in params]
+        )
+
     def __str__(self) -> str:
         length = len(self)
         max_show = 10
@@ -193,6 +282,9 @@ class _Unit(Sweep):
     def param_tuples(self) -> Iterator[Params]:
         yield ()
 
+    def _param_array_at(self, indices: np.ndarray) -> np.ndarray:
+        return np.empty((len(indices), 0))
+
     def __repr__(self) -> str:
         return 'cirq.UnitSweep'
 
@@ -244,6 +336,17 @@ class Product(Sweep):
 
         return _gen(self.factors)
 
+    def _param_array_at(self, indices: np.ndarray) -> np.ndarray:
+        # The last factor varies fastest, so each index is a mixed radix
+        # number with one digit per factor.
+        columns = []
+        stride = 1
+        for factor in reversed(self.factors):
+            n = len(factor)
+            columns.append(factor._param_array_at((indices // stride) % n))
+            stride *= n
+        return np.hstack(columns[::-1] + [np.empty((len(indices), 0))])
+
     def __repr__(self) -> str:
         factors_repr = ', '.join(repr(f) for f in self.factors)
         return f'cirq.Product({factors_repr})'
@@ -298,6 +401,10 @@ class Zip(Sweep):
         for values in zip(*iters):
             yield sum(values, ())
 
+    def _param_array_at(self, indices: np.ndarray) -> np.ndarray:
+        columns = [sweep._param_array_at(indices) for sweep in self.sweeps]
+        return np.hstack(columns + [np.empty((len(indices), 0))])
+
     def __repr__(self) -> str:
         sweeps_repr = ', '.join(repr(s) for s in self.sweeps)
         return f'cirq.Zip({sweeps_repr})'
@@ -336,6 +443,14 @@ class SingleSweep(Sweep):
         for value in self._values():
             yield ((self.key, value),)
 
+    def _param_array_at(self, indices: np.ndarray) -> np.ndarray:
+        return self._values_at(indices).reshape((len(indices), 1))
+
+    def _values_at(self, indices: np.ndarray) -> np.ndarray:
+        """Returns the values at the given indices as a float array."""
+        values = np.array(list(self._values()), dtype=float)
+        return values[indices]
+
     @abc.abstractmethod
     def _values(self) -> Iterator[float]:
         pass
@@ -357,6 +472,9 @@ class Points(SingleSweep):
     def _values(self) -> Iterator[float]:
         return iter(self.points)
 
+    def _values_at(self, indices: np.ndarray) -> np.ndarray:
+        return np.asarray(self.points, dtype=float)[indices]
+
     def __repr__(self) -> str:
         return f'cirq.Points({self.key!r}, {self.points!r})'
 
@@ -389,6 +507,13 @@ class Linspace(SingleSweep):
                 p = i / (self.length - 1)
                 yield self.start * (1 - p) + self.stop * p
 
+    def _values_at(self, indices: np.ndarray) -> np.ndarray:
+        if self.length == 1:
+            return np.full(len(indices), self.start, dtype=float)
+        # The same operations as in _values, so the values are identical.
+        p = indices / (self.length - 1)
+        return self.start * (1 - p) + self.stop * p
+
     def __repr__(self) -> str:
         return (
             f'cirq.Linspace({self.key!r}, start={self.start!r}, '
@@ -433,6 +558,20 @@ class ListSweep(Sweep):
         for r in self.resolver_list:
             yield tuple(_params_without_symbols(r))
 
+    def _param_array_at(self, indices: np.ndarray) -> np.ndarray:
+        keys = self.keys
+        values = []
+        for i in indices:
+            param_dict = dict(_params_without_symbols(self.resolver_list[i]))
+            if param_dict.keys() != set(keys):
+                differing = sorted(param_dict.keys() ^ set(keys))
+                raise ValueError(
+                    f'All resolvers of a ListSweep must have the same keys, but resolver {i} '
+                    f'differs from the first one in {differing}.'
+                )
+            values.append([param_dict[key] for key in keys])
+        return np.array(values, dtype=float).reshape((len(indices), len(keys)))
+
     def __repr__(self) -> str:
         return f'cirq.ListSweep({self.resolver_list!r})'
 
@@ -11,6 +11,7 @@
 # WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 # See the License for the specific language governing permissions and
 # limitations under the License.
+import numpy as np
 import pytest
 import sympy
 import cirq
@@ -167,6 +168,135 @@ def _values(sweep, key):
     return [resolver.value_of(p) for resolver in sweep]
 
 
+def _param_table(sweep):
+    return np.array(
+        [[dict(params)[key] for key in sweep.keys] for params in sweep.param_tuples()],
+        dtype=float,
+    ).reshape((len(sweep), len(sweep.keys)))
+
+
+@pytest.mark.parametrize(
+    'sweep',
+    [
+        cirq.UnitSweep,
+        cirq.Linspace('a', 0.1, 0.9, 11),
+        cirq.Linspace('a', 3, 3, 1),
+        cirq.Points('b', [1, 2.5, -3]),
+        cirq.Points('b', []),
+        cirq.Linspace('a', 0, 1, 7) * cirq.Points('b', [1, 2, 3]) * cirq.Linspace('c', -1, 2, 2),
+        cirq.Linspace('a', 0, 1, 7) + cirq.Points('b', [1, 2, 3]),
+        (cirq.Linspace('a', 0, 1, 3) + cirq.Points('b', [4, 5, 6])) * cirq.Points('c', [7, 8]),
+        cirq.Product(),
+        cirq.Zip(),
+        cirq.Product(cirq.Points('a', [1, 2]), cirq.Points('b', [])),
+        cirq.ListSweep([{'x': 1, 'y': 2}, {'y': 3, sympy.Symbol('x'): 4}]),
+        cirq.ListSweep([]),
+        cirq.Zip(cirq.ListSweep([{'x': 1}, {'x': 2}]), cirq.Linspace('a', 0, 1, 5)),
+    ],
+)
+def test_param_array(sweep):
+    expected = _param_table(sweep)
+    actual = sweep.param_array()
+    assert actual.dtype == float
+    assert actual.shape == (len(sweep), len(sweep.keys))
+    np.testing.assert_array_equal(actual, expected)
+    for start, stop in [(1, None), (0, 2), (-3, -1), (2, 100), (5, 2)]:
+        np.testing.assert_array_equal(sweep.param_array(start, stop), expected[start:stop])
+
+
+def test_param_array_custom_sweep():
+    class Squares(cirq.study.sweeps.SingleSweep):
+        def _tuple(self):
+            return (self.key,)
+
+        def __len__(self):
+            return 4
+
+        def _values(self):
+            return iter([0, 1, 4, 9])
+
+    class Reversed(cirq.Sweep):
+        def __init__(self, sweep):
+            self.sweep = sweep
+
+        def __eq__(self, other):
+            return NotImplemented  # coverage: ignore
+
+        @property
+        def keys(self):
+            return self.sweep.keys
+
+        def __len__(self):
+            return len(self.sweep)
+
+        def param_tuples(self):
+            return reversed(list(self.sweep.param_tuples()))
+
+    sweep = Reversed(Squares('x') * cirq.Points('y', [1, 2]))
+    np.testing.assert_array_equal(sweep.param_array(), _param_table(sweep))
+    np.testing.assert_array_equal(sweep.param_array(-2), [[0, 2], [0, 1]])
+
+
+def test_param_array_large_product():
+    sweep = cirq.Product(*[cirq.Linspace(key, 0, 1, 101) for key in 'abc'])
+    assert sweep.param_array().shape == (101 ** 3, 3)
+    rows = sweep.param_array(12 * 101 ** 2 + 34 * 101 + 56, 12 * 101 ** 2 + 34 * 101 + 58)
+    np.testing.assert_array_equal(rows, [[0.12, 0.34, 0.56], [0.12, 0.34, 0.57]])
+
+
+def test_param_array_not_a_number():
+    with pytest.raises(ValueError, match='real numbers'):
+        _ = cirq.Points('a', [sympy.Symbol('b')]).param_array()
+    with pytest.raises(ValueError):
+        _ = cirq.ListSweep([{'a': 'x'}]).param_array()
+
+
+def test_param_array_list_sweep_different_keys():
+    with pytest.raises(ValueError, match=r"resolver 1 differs from the first one in \['b'\]"):
+        _ = cirq.ListSweep([{'a': 1, 'b': 2}, {'a': 3}]).param_array()
+    with pytest.raises(ValueError, match=r"resolver 1 differs from the first one in \['c'\]"):
+        _ = cirq.ListSweep([{'a': 1}, {'a': 3, 'c': 4}]).param_array()
+    np.testing.assert_array_equal(
+        cirq.ListSweep([{'a': 1, 'b': 2}, {'a': 3}]).param_array(0, 1), [[1, 2]]
+    )
+
+
+def test_values_of():
+    a, b = sympy.Symbol('a'), sympy.Symbol('b')
+    sweep = cirq.Linspace('a', 0, 1, 5) * cirq.Points(b, [1, 2])
+    expressions = [
+        a,
+        'b',
+        2 * a + b ** 2,
+        sympy.sin(sympy.pi * a) / b,
+        sympy.exp(sympy.I * a),
+        sympy.Symbol('a') * sympy.pi,
+    ]
+    for expression in expressions:
+        expected = [cirq.ParamResolver(r).value_of(expression) for r in sweep]
+        np.testing.assert_allclose(sweep.values_of(expression), expected)
+        np.testing.assert_allclose(sweep.values_of(expression, 3, -2), expected[3:-2])
+
+    np.testing.assert_array_equal(sweep.values_of(1.5), [1.5] * 10)
+    np.testing.assert_allclose(sweep.values_of(2 * sympy.pi, stop=2), [2 * np.pi] * 2)
+    assert sweep.values_of(a, 20).shape == (0,)
+
+
+def test_values_of_not_compilable():
+    class Double(sympy.Function):
+        def _eval_evalf(self, prec):
+            return 2 * self.args[0]._eval_evalf(prec)
+
+    sweep = cirq.Points('a', [1, 2, 3])
+    np.testing.assert_allclose(sweep.values_of(Double(sympy.Symbol('a')) + 1), [3, 5, 7])
+
+
+def test_values_of_unknown_parameter():
+    sweep = cirq.Points('a', [1, 2, 3])
+    with pytest.raises(ValueError, match=r"\['b'\]"):
+        _ = sweep.values_of(sympy.Symbol('a') + sympy.Symbol('b'))
+
+
 def test_equality():
     et = cirq.testing.EqualsTester()
 
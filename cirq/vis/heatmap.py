@@ -17,19 +17,31 @@ See examples/bristlecone_heatmap_example.py for an example usage in
 an interactive session.
 """
 
-from typing import Any, Dict, List, Mapping, Optional, SupportsFloat, Tuple, Union
+from typing import (
+    Any,
+    Dict,
+    List,
+    Mapping,
+    Optional,
+    SupportsFloat,
+    Tuple,
+    TYPE_CHECKING,
+    Union,
+)
 
 import numpy as np
-import matplotlib as mpl
-import matplotlib.pyplot as plt
 import pandas as pd
-from matplotlib import collections as mpl_collections
-from mpl_toolkits import axes_grid1
 
 from cirq._compat import deprecated
 from cirq.devices import grid_qubit
 from cirq.vis import vis_utils
 
+if TYPE_CHECKING:
+    # matplotlib is slow to import, so it is only imported when plotting.
+    import matplotlib as mpl
+    import matplotlib.pyplot as plt
+    from matplotlib import collections as mpl_collections
+
 QubitCoordinate = Union[Tuple[int, int], grid_qubit.GridQubit]
 
 # The value map is qubit coordinate -> a type that supports float conversion.
@@ -149,7 +161,7 @@ class Heatmap:
 
     def set_colormap(
         self,
-        colormap: Union[str, mpl.colors.Colormap] = 'viridis',
+        colormap: Union[str, 'mpl.colors.Colormap'] = 'viridis',
         vmin: Optional[float] = None,
         vmax: Optional[float] = None,
     ) -> 'Heatmap':
@@ -168,8 +180,8 @@ class Heatmap:
         return self
 
     def plot(
-        self, ax: Optional[plt.Axes] = None, **pcolor_options: Any
-    ) -> Tuple[plt.Axes, mpl_collections.Collection, pd.DataFrame]:
+        self, ax: Optional['plt.Axes'] = None, **pcolor_options: Any
+    ) -> Tuple['plt.Axes', 'mpl_collections.Collection', pd.DataFrame]:
         """Plots the heatmap on the given Axes.
 
         Args:
@@ -183,6 +195,8 @@ class Heatmap:
             ``value_table`` is the 2-D pandas DataFrame of values constructed
             from the value_map.
         """
+        import matplotlib.pyplot as plt
+
         show_plot = not ax
         if not ax:
             fig, ax = plt.subplots(figsize=(8, 8))
@@ -239,9 +253,11 @@ class Heatmap:
         return ax, mesh, value_table
 
     def _plot_colorbar(
-        self, mappable: mpl.cm.ScalarMappable, ax: plt.Axes
-    ) -> mpl.colorbar.Colorbar:
+        self, mappable: 'mpl.cm.ScalarMappable', ax: 'plt.Axes'
+    ) -> 'mpl.colorbar.Colorbar':
         """Plots the colorbar. Internal."""
+        from mpl_toolkits import axes_grid1
+
         colorbar_ax = axes_grid1.make_axes_locatable(ax).append_axes(
             **self.colorbar_location_options
         )
@@ -253,7 +269,7 @@ class Heatmap:
         colorbar_ax.tick_params(axis='y', direction='out')
         return colorbar
 
-    def _write_annotations(self, mesh: mpl_collections.Collection, ax: plt.Axes) -> None:
+    def _write_annotations(self, mesh: 'mpl_collections.Collection', ax: 'plt.Axes') -> None:
         """Writes annotations to the center of cells. Internal."""
         for path, facecolor in zip(mesh.get_paths(), mesh.get_facecolors()):
             # Calculate the center of the cell, assuming that it is a square
@@ -16,6 +16,7 @@
 
 from cirq.work.collector import (
     CircuitSampleJob,
+    CollectionStats,
     Collector,
 )
 from cirq.work.pauli_sum_collector import (
@@ -27,6 +28,7 @@ from cirq.work.observable_settings import (
     observables_to_settings,
 )
 from cirq.work.observable_grouping import (
+    group_settings_coloring,
     group_settings_greedy,
 )
 from cirq.work.observable_measurement_data import (
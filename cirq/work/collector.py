@@ -12,9 +12,24 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
-from typing import Any, Iterable, List, Optional, TYPE_CHECKING, Union
+from typing import (
+    Any,
+    Awaitable,
+    Dict,
+    Iterable,
+    List,
+    Optional,
+    Tuple,
+    TYPE_CHECKING,
+    Union,
+    cast,
+)
 import abc
 import asyncio
+import collections
+import concurrent.futures
+import dataclasses
+import time
 
 import numpy as np
 
@@ -29,7 +44,14 @@ if TYPE_CHECKING:
 class CircuitSampleJob:
     """Describes a sampling task."""
 
-    def __init__(self, circuit: circuits.Circuit, *, repetitions: int, tag: Any = None):
+    def __init__(
+        self,
+        circuit: circuits.Circuit,
+        *,
+        repetitions: int,
+        tag: Any = None,
+        params: 'cirq.ParamResolverOrSimilarType' = None,
+    ):
         """
         Args:
             circuit: The circuit to sample from.
@@ -40,24 +62,64 @@ class CircuitSampleJob:
                 string like "main_run" or "calibration_run", or it could be set
                 to the component of the Hamiltonian (e.g. a PauliString) that
                 the circuit is supposed to be helping to estimate.
+            params: Parameters to resolve a parameterized circuit with. Jobs
+                sharing a parameterized circuit can be sampled together as a
+                single sweep.
         """
         self.circuit = circuit
         self.repetitions = repetitions
         self.tag = tag
+        self.params = study.ParamResolver(params)
 
     def _value_equality_values_(self) -> Any:
-        return self.circuit, self.repetitions, self.tag
+        return self.circuit, self.repetitions, self.tag, self.params
 
     def __repr__(self) -> str:
+        params = f', params={self.params!r}' if self.params else ''
         return (
             f'cirq.CircuitSampleJob(tag={self.tag!r}, '
-            f'repetitions={self.repetitions!r}, circuit={self.circuit!r})'
+            f'repetitions={self.repetitions!r}, circuit={self.circuit!r}{params})'
         )
 
 
 CIRCUIT_SAMPLE_JOB_TREE = Union[CircuitSampleJob, Iterable[Any]]
 
 
+@dataclasses.dataclass
+class CollectionStats:
+    """Throughput statistics of `Collector.collect` calls.
+
+    Pass an instance to `collect` or `collect_async` to have it updated as
+    jobs complete. The same instance can be reused to accumulate statistics
+    over several calls.
+
+    Attributes:
+        num_jobs: The number of `CircuitSampleJob`s that were completed.
+        num_batches: The number of batches of jobs dispatched to the sampler.
+            This is smaller than `num_jobs` when jobs are batched. Each batch
+            is sent with one `run_async`, `run_sweep_async` or
+            `run_batch_async` call, but the sampler may run the circuits of a
+            `run_batch_async` call separately.
+        num_samples: The total number of repetitions of completed jobs.
+        elapsed_seconds: The wall-clock time spent collecting.
+    """
+
+    num_jobs: int = 0
+    num_batches: int = 0
+    num_samples: int = 0
+    elapsed_seconds: float = 0.0
+
+    @property
+    def jobs_per_batch(self) -> float:
+        """The average number of jobs served by each batch."""
+        return self.num_jobs / self.num_batches if self.num_batches else 0.0
+
+    @property
+    def samples_per_second(self) -> float:
+        """The average sampling throughput."""
+        return self.num_samples / self.elapsed_seconds if self.elapsed_seconds else 0.0
+
+
 class Collector(metaclass=abc.ABCMeta):
     """Collects data from a sampler, in parallel, towards some purpose.
 
@@ -104,6 +166,10 @@ class Collector(metaclass=abc.ABCMeta):
         *,
         concurrency: int = 2,
         max_total_samples: Optional[int] = None,
+        max_batch_size: int = 1,
+        max_batch_latency: float = 0.0,
+        stats: Optional[CollectionStats] = None,
+        executor: Optional[concurrent.futures.Executor] = None,
     ) -> None:
         """Collects needed samples from a sampler.
 
@@ -121,6 +187,13 @@ class Collector(metaclass=abc.ABCMeta):
                 any given time.
             max_total_samples: Optional limit on the maximum number of samples
                 to collect.
+            max_batch_size: The maximum number of jobs to combine into a
+                single sampler request. See `collect_async`.
+            max_batch_latency: How long, in seconds, to hold back a partial
+                batch while waiting for more jobs. See `collect_async`.
+            stats: If given, updated with throughput statistics.
+            executor: An optional executor that batches of several circuits
+                are run on. See `collect_async`.
 
         Returns:
             The collector's result after all desired samples have been
@@ -132,7 +205,13 @@ class Collector(metaclass=abc.ABCMeta):
         """
         return asyncio.get_event_loop().run_until_complete(
             self.collect_async(
-                sampler, concurrency=concurrency, max_total_samples=max_total_samples
+                sampler,
+                concurrency=concurrency,
+                max_total_samples=max_total_samples,
+                max_batch_size=max_batch_size,
+                max_batch_latency=max_batch_latency,
+                stats=stats,
+                executor=executor,
             )
         )
 
@@ -142,9 +221,20 @@ class Collector(metaclass=abc.ABCMeta):
         *,
         concurrency: int = 2,
         max_total_samples: Optional[int] = None,
+        max_batch_size: int = 1,
+        max_batch_latency: float = 0.0,
+        stats: Optional[CollectionStats] = None,
+        executor: Optional[concurrent.futures.Executor] = None,
     ) -> None:
         """Asynchronously collects needed samples from a sampler.
 
+        Queued jobs are dispatched in batches of up to `max_batch_size` jobs.
+        Within a batch, jobs with the same circuit and parameters are merged
+        into one request for their total number of repetitions, jobs with
+        the same circuit but different parameters are swept together, and
+        the remaining circuits are sent with a single `run_batch_async` call.
+        The sampled repetitions are then split back into one result per job.
+
         Examples:
 
             ```
@@ -156,9 +246,20 @@ class Collector(metaclass=abc.ABCMeta):
         Args:
             sampler: The simulator or service to collect samples from.
             concurrency: Desired number of sampling jobs to have in flight at
-                any given time.
+                any given time. With batching, this is the number of batches.
             max_total_samples: Optional limit on the maximum number of samples
                 to collect.
+            max_batch_size: The maximum number of jobs to combine into a
+                single sampler request. Defaults to 1, i.e. no batching.
+            max_batch_latency: When fewer than `max_batch_size` jobs are
+                available while other batches are in flight, how long (in
+                seconds) to wait for one of them to complete, and possibly
+                produce more jobs, before dispatching the partial batch.
+            stats: If given, updated with throughput statistics.
+            executor: If given, passed to `run_batch_async` for batches of
+                several circuits, e.g. so that local simulators can share one
+                process pool across the whole collection. By default, batches
+                are run as the sampler runs them without an executor.
 
         Returns:
             The collector's result after all desired samples have been
@@ -168,36 +269,132 @@ class Collector(metaclass=abc.ABCMeta):
             Python 3 documentation "Coroutines and Tasks"
             https://docs.python.org/3/library/asyncio-task.html
         """
+        if max_batch_size < 1:
+            raise ValueError(f'max_batch_size must be positive. Got {max_batch_size}.')
         pool = work_pool.CompletionOrderedAsyncWorkPool()
-        queued_jobs: List[CircuitSampleJob] = []
+        queued_jobs: collections.deque = collections.deque()
+        queued_samples = 0
         remaining_samples = np.infty if max_total_samples is None else max_total_samples
-
-        async def _start_async_job(job):
-            return job, await sampler.run_async(job.circuit, repetitions=job.repetitions)
+        start_time = time.monotonic()
+        next_done: Optional[Awaitable[Any]] = None
+        flush_partial_batch = False
 
         # Keep dispatching and processing work.
         while True:
             # Fill up the work pool.
+            hold_partial_batch = False
             while remaining_samples > 0 and pool.num_uncollected < concurrency:
-                if not queued_jobs:
-                    queued_jobs.extend(_flatten_jobs(self.next_job()))
+                # Ask for jobs until a batch can be filled.
+                while len(queued_jobs) < max_batch_size and queued_samples < remaining_samples:
+                    new_jobs = _flatten_jobs(self.next_job())
+                    if not new_jobs:
+                        break
+                    queued_jobs.extend(new_jobs)
+                    queued_samples += sum(job.repetitions for job in new_jobs)
 
                 # If no jobs were given, stop asking until something completes.
                 if not queued_jobs:
                     break
 
-                # Start new sampling job.
-                new_job = queued_jobs.pop(0)
-                remaining_samples -= new_job.repetitions
-                pool.include_work(_start_async_job(new_job))
+                # Give in-flight work a chance to produce more jobs.
+                if (
+                    len(queued_jobs) < max_batch_size
+                    and max_batch_latency > 0
+                    and pool.num_uncollected
+                    and not flush_partial_batch
+                ):
+                    hold_partial_batch = True
+                    break
+                flush_partial_batch = False
+
+                # Start new sampling batch.
+                batch: List[CircuitSampleJob] = []
+                while queued_jobs and len(batch) < max_batch_size and remaining_samples > 0:
+                    new_job = queued_jobs.popleft()
+                    queued_samples -= new_job.repetitions
+                    remaining_samples -= new_job.repetitions
+                    batch.append(new_job)
+                pool.include_work(_run_job_batch(sampler, batch, executor))
+                if stats is not None:
+                    stats.num_batches += 1
 
             # If no jobs were started or running, we're in a steady state. Halt.
             if not pool.num_uncollected:
                 break
 
-            # Forward next job result from pool.
-            done_job, done_val = await pool.__anext__()
-            self.on_job_result(done_job, done_val)
+            # Forward next batch of job results from pool.
+            if next_done is None:
+                next_done = pool.__anext__()
+            if hold_partial_batch:
+                done, _ = await asyncio.wait([next_done], timeout=max_batch_latency)
+                if not done:
+                    flush_partial_batch = True
+                    continue
+            done_batch = await next_done
+            next_done = None
+            for done_job, done_val in done_batch:
+                self.on_job_result(done_job, done_val)
+                if stats is not None:
+                    stats.num_jobs += 1
+                    stats.num_samples += done_job.repetitions
+            if stats is not None:
+                stats.elapsed_seconds += time.monotonic() - start_time
+                start_time = time.monotonic()
+
+
+async def _run_job_batch(
+    sampler: 'cirq.Sampler',
+    jobs: List[CircuitSampleJob],
+    executor: Optional[concurrent.futures.Executor] = None,
+) -> List[Tuple[CircuitSampleJob, study.Result]]:
+    """Samples a batch of jobs with as few sampler requests as possible."""
+    if len(jobs) == 1 and not jobs[0].params:
+        job = jobs[0]
+        return [(job, await sampler.run_async(job.circuit, repetitions=job.repetitions))]
+
+    # Jobs with the same circuit and parameters are sampled together.
+    buckets: Dict[Tuple['cirq.FrozenCircuit', study.ParamResolver], List[int]] = {}
+    for i, job in enumerate(jobs):
+        buckets.setdefault((job.circuit.freeze(), job.params), []).append(i)
+
+    # Buckets with the same circuit and total repetitions form a single sweep.
+    sweeps: Dict[Tuple['cirq.FrozenCircuit', int], List[List[int]]] = {}
+    for (circuit, _), bucket in buckets.items():
+        total_repetitions = sum(jobs[i].repetitions for i in bucket)
+        sweeps.setdefault((circuit, total_repetitions), []).append(bucket)
+
+    programs = [jobs[sweep_buckets[0][0]].circuit for sweep_buckets in sweeps.values()]
+    params_list: List['cirq.Sweepable'] = [
+        study.ListSweep([jobs[bucket[0]].params for bucket in sweep_buckets])
+        for sweep_buckets in sweeps.values()
+    ]
+    repetitions = [total_repetitions for _, total_repetitions in sweeps]
+    if len(programs) == 1:
+        results = [
+            await sampler.run_sweep_async(
+                programs[0], params=params_list[0], repetitions=repetitions[0]
+            )
+        ]
+    else:
+        # Samplers overriding run_batch_async may not accept an executor.
+        kwargs: Dict[str, Any] = {} if executor is None else {'executor': executor}
+        results = await sampler.run_batch_async(
+            programs, params_list=params_list, repetitions=repetitions, **kwargs
+        )
+
+    # Split the sampled repetitions back into one result per job.
+    job_results: List[Optional[study.Result]] = [None] * len(jobs)
+    for sweep_buckets, sweep_results in zip(sweeps.values(), results):
+        for bucket, result in zip(sweep_buckets, sweep_results):
+            start = 0
+            for i in bucket:
+                end = start + jobs[i].repetitions
+                job_results[i] = study.Result.from_single_parameter_set(
+                    params=jobs[i].params,
+                    measurements={k: v[start:end] for k, v in result.measurements.items()},
+                )
+                start = end
+    return list(zip(jobs, cast(List[study.Result], job_results)))
 
 
 def _flatten_jobs(given: Optional[CIRCUIT_SAMPLE_JOB_TREE]) -> List[CircuitSampleJob]:
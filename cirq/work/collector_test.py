@@ -11,7 +11,10 @@
 # WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 # See the License for the specific language governing permissions and
 # limitations under the License.
+import concurrent.futures
+
 import pytest
+import sympy
 
 import cirq
 
@@ -28,12 +31,20 @@ def test_circuit_sample_job_equality():
     eq.add_equality_group(cirq.CircuitSampleJob(c2, repetitions=10))
     eq.add_equality_group(cirq.CircuitSampleJob(c1, repetitions=100))
     eq.add_equality_group(cirq.CircuitSampleJob(c1, repetitions=10, tag='test'))
+    eq.add_equality_group(cirq.CircuitSampleJob(c1, repetitions=10, params={'t': 1}))
 
 
 def test_circuit_sample_job_repr():
     cirq.testing.assert_equivalent_repr(
         cirq.CircuitSampleJob(cirq.Circuit(cirq.H(cirq.LineQubit(0))), repetitions=10, tag='guess')
     )
+    cirq.testing.assert_equivalent_repr(
+        cirq.CircuitSampleJob(
+            cirq.Circuit(cirq.X(cirq.LineQubit(0)) ** sympy.Symbol('t')),
+            repetitions=10,
+            params={'t': 0.5},
+        )
+    )
 
 
 @pytest.mark.asyncio
@@ -123,3 +134,186 @@ def test_flatten_jobs_terminate_from_collector():
 
     TestCollector().collect(sampler=cirq.Simulator(), concurrency=5)
     assert received == ['test'] * 2
+
+
+class _RecordingSampler(cirq.ZerosSampler):
+    def __init__(self):
+        super().__init__()
+        self.calls = []
+
+    async def run_async(self, program, *, repetitions):
+        self.calls.append(('run', repetitions))
+        return await super().run_async(program, repetitions=repetitions)
+
+    async def run_sweep_async(self, program, params, repetitions=1):
+        self.calls.append(('sweep', len(params), repetitions))
+        return await super().run_sweep_async(program, params, repetitions)
+
+    async def run_batch_async(self, programs, params_list=None, repetitions=1, **kwargs):
+        self.calls.append(('batch', len(programs)))
+        return await super().run_batch_async(programs, params_list, repetitions, **kwargs)
+
+
+@pytest.mark.asyncio
+async def test_collect_async_batches_jobs():
+    a, b = cirq.LineQubit.range(2)
+    t = sympy.Symbol('t')
+    circuit1 = cirq.Circuit(cirq.measure(a, key='m'))
+    circuit2 = cirq.Circuit(cirq.measure(a, b, key='m'))
+    circuit3 = cirq.Circuit(cirq.X(a) ** t, cirq.measure(a, key='m'))
+    jobs = [
+        cirq.CircuitSampleJob(circuit1, repetitions=3, tag=0),
+        cirq.CircuitSampleJob(circuit2, repetitions=5, tag=1),
+        cirq.CircuitSampleJob(circuit1.copy(), repetitions=4, tag=2),
+        cirq.CircuitSampleJob(circuit3, repetitions=2, tag=3, params={'t': 0}),
+        cirq.CircuitSampleJob(circuit3, repetitions=2, tag=4, params={'t': 1}),
+    ]
+    received = []
+
+    class TestCollector(cirq.Collector):
+        def next_job(self):
+            return jobs.pop(0) if jobs else None
+
+        def on_job_result(self, job, result):
+            received.append((job.tag, result.repetitions, result.params))
+
+    sampler = _RecordingSampler()
+    stats = cirq.work.CollectionStats()
+    await TestCollector().collect_async(sampler, max_batch_size=5, stats=stats)
+    # One batch: circuit1 merged, circuit3 swept, all circuits batched together.
+    assert sampler.calls[0] == ('batch', 3)
+    assert sorted(sampler.calls[1:]) == [('sweep', 1, 5), ('sweep', 1, 7), ('sweep', 2, 2)]
+    assert received == [
+        (0, 3, cirq.ParamResolver()),
+        (1, 5, cirq.ParamResolver()),
+        (2, 4, cirq.ParamResolver()),
+        (3, 2, cirq.ParamResolver({'t': 0})),
+        (4, 2, cirq.ParamResolver({'t': 1})),
+    ]
+    assert stats.num_jobs == 5
+    assert stats.num_batches == 1
+    assert stats.num_samples == 16
+    assert stats.jobs_per_batch == 5
+    assert stats.elapsed_seconds > 0
+    assert stats.samples_per_second > 0
+
+
+@pytest.mark.asyncio
+async def test_collect_async_batch_single_circuit():
+    q = cirq.LineQubit(0)
+    circuit = cirq.Circuit(cirq.measure(q, key='m'))
+
+    class TestCollector(cirq.Collector):
+        def __init__(self):
+            self.sent = 0
+
+        def next_job(self):
+            self.sent += 1
+            return cirq.CircuitSampleJob(circuit, repetitions=10, tag=self.sent)
+
+        def on_job_result(self, job, result):
+            assert result.repetitions == 10
+
+    sampler = _RecordingSampler()
+    await TestCollector().collect_async(
+        sampler, max_batch_size=4, max_total_samples=100, concurrency=1
+    )
+    assert sampler.calls == [('sweep', 1, 40), ('sweep', 1, 40), ('sweep', 1, 20)]
+
+
+@pytest.mark.asyncio
+async def test_collect_async_batch_latency():
+    q = cirq.LineQubit(0)
+    circuit = cirq.Circuit(cirq.measure(q, key='m'))
+
+    class TestCollector(cirq.Collector):
+        def __init__(self):
+            self.sent = 0
+            self.received = 0
+
+        def next_job(self):
+            # Only one job at a time may be outstanding beyond the first.
+            if self.sent > self.received + 1 or self.sent >= 6:
+                return None
+            self.sent += 1
+            return cirq.CircuitSampleJob(circuit, repetitions=1, tag=self.sent)
+
+        def on_job_result(self, job, result):
+            self.received += 1
+
+    stats = cirq.work.CollectionStats()
+    collector = TestCollector()
+    await collector.collect_async(
+        _RecordingSampler(), max_batch_size=3, max_batch_latency=0.01, stats=stats
+    )
+    assert collector.received == 6
+    assert stats.num_jobs == 6
+    assert stats.num_batches < 6
+
+
+class _ExecutorRecordingSimulator(cirq.Simulator):
+    def __init__(self):
+        super().__init__()
+        self.executors = []
+
+    async def run_batch_async(self, programs, params_list=None, repetitions=1, **kwargs):
+        self.executors.append(kwargs.get('executor'))
+        return await cirq.Sampler.run_batch_async(self, programs, params_list, repetitions)
+
+
+@pytest.mark.asyncio
+async def test_collect_async_batches_use_given_executor():
+    a, b = cirq.LineQubit.range(2)
+    circuits = [cirq.Circuit(cirq.measure(a, key='m')), cirq.Circuit(cirq.measure(a, b, key='m'))]
+
+    class TestCollector(cirq.Collector):
+        def __init__(self):
+            self.sent = 0
+
+        def next_job(self):
+            self.sent += 1
+            return cirq.CircuitSampleJob(circuits[self.sent % 2], repetitions=1)
+
+        def on_job_result(self, job, result):
+            pass
+
+    # By default, no executor is used, even by local simulators.
+    simulator = _ExecutorRecordingSimulator()
+    await TestCollector().collect_async(
+        simulator, max_batch_size=2, max_total_samples=6, concurrency=1
+    )
+    assert simulator.executors == [None] * 3
+
+    # An explicit executor is shared by all batches.
+    simulator = _ExecutorRecordingSimulator()
+    with concurrent.futures.ThreadPoolExecutor() as executor:
+        await TestCollector().collect_async(
+            simulator, max_batch_size=2, max_total_samples=6, concurrency=1, executor=executor
+        )
+    assert simulator.executors == [executor] * 3
+
+    sampler = _RecordingSampler()
+    with concurrent.futures.ThreadPoolExecutor() as executor:
+        await TestCollector().collect_async(
+            sampler, max_batch_size=2, max_total_samples=2, executor=executor
+        )
+    assert sampler.calls[0] == ('batch', 2)
+
+
+@pytest.mark.asyncio
+async def test_collect_async_invalid_batch_size():
+    class TestCollector(cirq.Collector):
+        def next_job(self):
+            pass
+
+        def on_job_result(self, job, result):
+            pass
+
+    with pytest.raises(ValueError, match='max_batch_size'):
+        await TestCollector().collect_async(cirq.ZerosSampler(), max_batch_size=0)
+
+
+def test_collection_stats_empty():
+    stats = cirq.work.CollectionStats()
+    assert stats.jobs_per_batch == 0
+    assert stats.samples_per_second == 0
@@ -12,13 +12,89 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
-from typing import Iterable, Dict, List, TYPE_CHECKING, cast
+from typing import Dict, Hashable, Iterable, List, Set, Tuple, TYPE_CHECKING
+
+import networkx as nx
 
 from cirq import ops, value
-from cirq.work.observable_settings import InitObsSetting, _max_weight_state, _max_weight_observable
+from cirq.work.observable_settings import InitObsSetting
 
 if TYPE_CHECKING:
-    pass
+    import cirq
+    from cirq.value.product_state import _NamedOneQubitState
+
+
+def _setting_letters(setting: InitObsSetting) -> List[Tuple[str, 'cirq.Qid', Hashable]]:
+    """The per-qubit "letters" that must agree for two settings to be grouped.
+
+    Each letter is a tuple of (kind, qubit, value), where kind is 'state' for
+    the single-qubit initial state and 'obs' for the single-qubit Pauli.
+    """
+    letters: List[Tuple[str, 'cirq.Qid', Hashable]] = []
+    for qubit, named_state in setting.init_state:
+        letters.append(('state', qubit, named_state))
+    for qubit, pauli in setting.observable.items():
+        letters.append(('obs', qubit, pauli))
+    return letters
+
+
+class _SettingGroup:
+    """A group of mutually compatible settings.
+
+    The max-weight initial state and observable of the group are maintained
+    incrementally as per-qubit maps, so checking and adding a new setting
+    costs time proportional to the weight of that setting rather than to
+    the size of the group.
+    """
+
+    def __init__(self, setting: InitObsSetting):
+        self.settings = [setting]
+        self.qubit_state_map: Dict['cirq.Qid', '_NamedOneQubitState'] = {}
+        self.qubit_pauli_map: Dict['cirq.Qid', 'cirq.Pauli'] = {}
+        self._absorb(setting)
+
+    def _absorb(self, setting: InitObsSetting) -> None:
+        for qubit, named_state in setting.init_state:
+            self.qubit_state_map.setdefault(qubit, named_state)
+        for qubit, pauli in setting.observable.items():
+            self.qubit_pauli_map.setdefault(qubit, pauli)
+
+    def add(self, setting: InitObsSetting) -> None:
+        self.settings.append(setting)
+        self._absorb(setting)
+
+    def max_setting(self) -> InitObsSetting:
+        if len(self.settings) == 1:
+            # Strip coefficients before using as key
+            (setting,) = self.settings
+            return InitObsSetting(setting.init_state, setting.observable.with_coefficient(1.0))
+        return InitObsSetting(
+            value.ProductState(dict(self.qubit_state_map)),
+            ops.PauliString(dict(self.qubit_pauli_map)),
+        )
+
+
+class _LetterIndex:
+    """Index from per-qubit letters to the ids of the items which contain them.
+
+    Used to find, for a new setting, the set of existing items which disagree
+    with it on some qubit without comparing against every item.
+    """
+
+    def __init__(self):
+        self._by_qubit: Dict[Tuple[str, 'cirq.Qid'], Dict[Hashable, Set[int]]] = {}
+
+    def add(self, item_id: int, letters: Iterable[Tuple[str, 'cirq.Qid', Hashable]]) -> None:
+        for kind, qubit, letter in letters:
+            self._by_qubit.setdefault((kind, qubit), {}).setdefault(letter, set()).add(item_id)
+
+    def conflicts(self, letters: Iterable[Tuple[str, 'cirq.Qid', Hashable]]) -> Set[int]:
+        result: Set[int] = set()
+        for kind, qubit, letter in letters:
+            for other_letter, ids in self._by_qubit.get((kind, qubit), {}).items():
+                if other_letter != letter:
+                    result |= ids
+        return result
 
 
 def group_settings_greedy(
@@ -32,9 +108,16 @@ def group_settings_greedy(
     we try to find an existing group to add it and update `max_setting` for
     that group if necessary. Otherwise, we make a new group.
 
+    Each group keeps its max-weight state and observable as per-qubit maps
+    that are updated incrementally, and groups are indexed by the single-qubit
+    state and Pauli they hold on each qubit. Finding a compatible group for a
+    new setting therefore skips every group that is known to conflict with it
+    without rebuilding any max-weight objects.
+
     In practice, this greedy algorithm performs comparably to something
     more complicated by solving the clique cover problem on a graph
-    of simultaneously-measurable settings.
+    of simultaneously-measurable settings. See `group_settings_coloring`
+    for a graph-coloring based alternative.
 
     Args:
         settings: The settings to group.
@@ -44,33 +127,72 @@ def group_settings_greedy(
         input list of settings. Each dictionary value is a list of
         settings compatible with `max_setting`.
     """
-    grouped_settings = {}  # type: Dict[InitObsSetting, List[InitObsSetting]]
+    # Groups are kept in "most recently updated last" order, which is the
+    # order in which compatible groups are searched.
+    groups: Dict[int, _SettingGroup] = {}
+    index = _LetterIndex()
+    next_group_id = 0
     for setting in settings:
-        for max_setting, simul_settings in grouped_settings.items():
-            trial_grouped_settings = simul_settings + [setting]
-            new_max_weight_state = _max_weight_state(
-                stg.init_state for stg in trial_grouped_settings
-            )
-            new_max_weight_obs = _max_weight_observable(
-                stg.observable for stg in trial_grouped_settings
-            )
-            compatible_init_state = new_max_weight_state is not None
-            compatible_observable = new_max_weight_obs is not None
-            can_be_inserted = compatible_init_state and compatible_observable
-            if can_be_inserted:
-                new_max_weight_state = cast(value.ProductState, new_max_weight_state)
-                new_max_weight_obs = cast(ops.PauliString, new_max_weight_obs)
-                del grouped_settings[max_setting]
-                new_max_setting = InitObsSetting(new_max_weight_state, new_max_weight_obs)
-                grouped_settings[new_max_setting] = trial_grouped_settings
+        letters = _setting_letters(setting)
+        conflicts = index.conflicts(letters)
+        for group_id, group in groups.items():
+            if group_id not in conflicts:
                 break
-
         else:
-            # made it through entire dict without finding a compatible group,
+            # made it through all groups without finding a compatible group,
             # thus a new group needs to be created
-            # Strip coefficients before using as key
-            new_max_weight_obs = setting.observable.with_coefficient(1.0)
-            new_max_setting = InitObsSetting(setting.init_state, new_max_weight_obs)
-            grouped_settings[new_max_setting] = [setting]
+            groups[next_group_id] = _SettingGroup(setting)
+            index.add(next_group_id, letters)
+            next_group_id += 1
+            continue
+
+        group.add(setting)
+        index.add(group_id, letters)
+        del groups[group_id]
+        groups[group_id] = group
+
+    return {group.max_setting(): group.settings for group in groups.values()}
+
+
+def group_settings_coloring(
+    settings: Iterable[InitObsSetting],
+    *,
+    strategy: str = 'largest_first',
+) -> Dict[InitObsSetting, List[InitObsSetting]]:
+    """Group settings which can be simultaneously measured by graph coloring.
 
-    return grouped_settings
+    Two settings conflict if they require a different single-qubit initial
+    state or a different single-qubit Pauli on some qubit. Since compatibility
+    is decided qubit by qubit, any set of pairwise compatible settings can be
+    measured simultaneously, so a proper coloring of the conflict graph is a
+    valid grouping. Conflicts are found through a per-qubit index rather than
+    by comparing every pair of settings.
+
+    Args:
+        settings: The settings to group.
+        strategy: The `networkx.greedy_color` strategy used to order the
+            settings, e.g. 'largest_first' or 'DSATUR'.
+
+    Returns:
+        A dictionary keyed by `max_setting` which need not exist in the
+        input list of settings. Each dictionary value is a list of
+        settings compatible with `max_setting`, in input order.
+    """
+    settings = list(settings)
+    graph = nx.Graph()
+    graph.add_nodes_from(range(len(settings)))
+    index = _LetterIndex()
+    for i, setting in enumerate(settings):
+        letters = _setting_letters(setting)
+        graph.add_edges_from((i, j) for j in index.conflicts(letters))
+        index.add(i, letters)
+
+    coloring = nx.greedy_color(graph, strategy=strategy)
+    groups: Dict[int, _SettingGroup] = {}
+    for i, setting in enumerate(settings):
+        color = coloring[i]
+        if color in groups:
+            groups[color].add(setting)
+        else:
+            groups[color] = _SettingGroup(setting)
+    return {group.max_setting(): group.settings for group in groups.values()}
@@ -12,6 +12,9 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import numpy as np
+import pytest
+
 import cirq
 
 
@@ -155,3 +158,104 @@ def test_group_settings_greedy_hydrogen():
     assert len(groups[2]) == 1
     assert len(groups[3]) == 1
     assert len(groups[4]) == len(terms) - 4
+
+
+def _group_settings_greedy_reference(settings):
+    # The original quadratic implementation, kept to check the indexed one.
+    from cirq.work.observable_settings import _max_weight_state, _max_weight_observable
+
+    grouped_settings = {}
+    for setting in settings:
+        for max_setting, simul_settings in grouped_settings.items():
+            trial_grouped_settings = simul_settings + [setting]
+            new_max_weight_state = _max_weight_state(
+                stg.init_state for stg in trial_grouped_settings
+            )
+            new_max_weight_obs = _max_weight_observable(
+                stg.observable for stg in trial_grouped_settings
+            )
+            if new_max_weight_state is not None and new_max_weight_obs is not None:
+                del grouped_settings[max_setting]
+                new_max_setting = cirq.work.InitObsSetting(new_max_weight_state, new_max_weight_obs)
+                grouped_settings[new_max_setting] = trial_grouped_settings
+                break
+        else:
+            new_max_weight_obs = setting.observable.with_coefficient(1.0)
+            new_max_setting = cirq.work.InitObsSetting(setting.init_state, new_max_weight_obs)
+            grouped_settings[new_max_setting] = [setting]
+    return grouped_settings
+
+
+def _random_settings(n_settings, n_qubits, seed):
+    prng = np.random.RandomState(seed)
+    qubits = cirq.LineQubit.range(n_qubits)
+    states = [cirq.KET_ZERO, cirq.KET_PLUS]
+    settings = []
+    for _ in range(n_settings):
+        init_state = cirq.ProductState(
+            {q: states[prng.randint(2)] for q in qubits if prng.rand() < 0.3}
+        )
+        observable = cirq.PauliString(
+            {
+                q: cirq.Pauli.by_index(prng.randint(3))
+                for q in init_state.qubits
+                if prng.rand() < 0.7
+            }
+        )
+        settings.append(cirq.work.InitObsSetting(init_state, observable))
+    return settings
+
+
+@pytest.mark.parametrize('seed', range(5))
+def test_group_settings_greedy_matches_reference(seed):
+    settings = _random_settings(60, 6, seed)
+    grouped_settings = cirq.work.group_settings_greedy(settings)
+    expected = _group_settings_greedy_reference(settings)
+    assert list(grouped_settings.items()) == list(expected.items())
+
+
+def _assert_valid_grouping(grouped_settings, settings):
+    flat_settings = [s for group in grouped_settings.values() for s in group]
+    assert len(flat_settings) == len(settings)
+    assert set(flat_settings) == set(settings)
+    for max_setting, group in grouped_settings.items():
+        for setting in group:
+            for q, st in setting.init_state:
+                assert max_setting.init_state[q] == st
+            for q, pauli in setting.observable.items():
+                assert max_setting.observable[q] == pauli
+
+
+@pytest.mark.parametrize('strategy', ['largest_first', 'DSATUR'])
+def test_group_settings_coloring(strategy):
+    settings = _random_settings(60, 6, 1234)
+    grouped_settings = cirq.work.group_settings_coloring(settings, strategy=strategy)
+    _assert_valid_grouping(grouped_settings, settings)
+
+
+def test_group_settings_coloring_hydrogen():
+    qubits = cirq.LineQubit.range(4)
+    q0, q1, q2, q3 = qubits
+    terms = [
+        0.17 * cirq.Z(q0),
+        -0.22 * cirq.Z(q2),
+        0.16 * cirq.Z(q0) * cirq.Z(q1),
+        0.04 * cirq.Y(q0) * cirq.X(q1) * cirq.X(q2) * cirq.Y(q3),
+        -0.04 * cirq.X(q0) * cirq.X(q1) * cirq.Y(q2) * cirq.Y(q3),
+        0.12 * cirq.Z(q0) * cirq.Z(q2),
+    ]
+    settings = list(cirq.work.observables_to_settings(terms, qubits))
+    grouped_settings = cirq.work.group_settings_coloring(settings)
+    assert len(grouped_settings) == 3
+    assert (
+        cirq.work.InitObsSetting(
+            cirq.work.observable_settings.zeros_state(qubits),
+            cirq.Z(q0) * cirq.Z(q1) * cirq.Z(q2),
+        )
+        in grouped_settings
+    )
+    _assert_valid_grouping(grouped_settings, settings)
+
+
+def test_group_settings_coloring_empty():
+    assert cirq.work.group_settings_coloring([]) == dict()
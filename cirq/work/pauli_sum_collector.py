@@ -13,7 +13,7 @@
 # limitations under the License.
 
 import collections
-from typing import cast, Dict, Optional, Union, TYPE_CHECKING
+from typing import cast, Dict, List, Optional, Union, TYPE_CHECKING
 
 import numpy as np
 
@@ -25,7 +25,18 @@ if TYPE_CHECKING:
 
 
 class PauliSumCollector(collector.Collector):
-    """Estimates the energy of a linear combination of Pauli observables."""
+    """Estimates the energy of a linear combination of Pauli observables.
+
+    By default, a fixed number of samples is collected for every term. If a
+    `sample_budget` or a `target_standard_error` is given, the collector
+    instead allocates samples adaptively: after a warm-up round of
+    `samples_per_term` samples for every term, further samples are requested
+    in rounds, each distributed so that the number of samples of each term
+    approaches the allocation minimizing the variance of the estimated energy,
+    i.e. proportional to |coefficient| times the estimated standard deviation
+    of the term. Collection stops once the budget is spent or the estimated
+    standard error of the energy is at most `target_standard_error`.
+    """
 
     def __init__(
         self,
@@ -34,6 +45,8 @@ class PauliSumCollector(collector.Collector):
         *,
         samples_per_term: int,
         max_samples_per_job: int = 1000000,
+        sample_budget: Optional[int] = None,
+        target_standard_error: Optional[float] = None,
     ):
         """
         Args:
@@ -43,9 +56,19 @@ class PauliSumCollector(collector.Collector):
                 dictionary weights, and then added up to produce the final
                 result.
             samples_per_term: The number of samples to collect for each
-                PauliString term in order to estimate its expectation.
+                PauliString term in order to estimate its expectation. In
+                adaptive mode, the number of warm-up samples for each term.
             max_samples_per_job: How many samples to request at a time.
+            sample_budget: If given, enables adaptive mode and limits the total
+                number of samples, warm-up included, across all terms.
+            target_standard_error: If given, enables adaptive mode and stops
+                collection once the estimated standard error of the energy is
+                at most this value.
         """
+        if target_standard_error is not None and target_standard_error <= 0:
+            raise ValueError(
+                f'target_standard_error must be positive. Got {target_standard_error}.'
+            )
         observable = ops.PauliSum.wrap(observable)
 
         self._circuit = circuit
@@ -62,13 +85,30 @@ class PauliSumCollector(collector.Collector):
         self._samples_per_term = samples_per_term
         self._total_samples_requested = 0
 
-    def next_job(self) -> Optional['cirq.CircuitSampleJob']:
+        self._adaptive = sample_budget is not None or target_standard_error is not None
+        self._sample_budget = sample_budget
+        self._target_standard_error = target_standard_error
+        self._total_samples_received = 0
+
+    def next_job(self) -> Optional[collector.CIRCUIT_SAMPLE_JOB_TREE]:
+        warm_up_samples = self._samples_per_term * len(self._pauli_coef_terms)
+        if not self._adaptive or self._total_samples_requested < warm_up_samples:
+            return self._next_fixed_job()
+        return self._next_adaptive_jobs()
+
+    def _next_fixed_job(self) -> Optional['cirq.CircuitSampleJob']:
         i = self._total_samples_requested // self._samples_per_term
         if i >= len(self._pauli_coef_terms):
             return None
         pauli, _ = self._pauli_coef_terms[i]
         remaining = self._samples_per_term * (i + 1) - self._total_samples_requested
         amount_to_request = min(remaining, self._samples_per_job)
+        if self._sample_budget is not None:
+            amount_to_request = min(
+                amount_to_request, self._sample_budget - self._total_samples_requested
+            )
+            if amount_to_request <= 0:
+                return None
         self._total_samples_requested += amount_to_request
         return collector.CircuitSampleJob(
             circuit=_circuit_plus_pauli_string_measurements(self._circuit, pauli),
@@ -76,11 +116,89 @@ class PauliSumCollector(collector.Collector):
             tag=pauli,
         )
 
+    def _next_adaptive_jobs(self) -> List['cirq.CircuitSampleJob']:
+        # Allocations are based on the results of all previous rounds.
+        if self._total_samples_received < self._total_samples_requested:
+            return []
+        if (
+            self._target_standard_error is not None
+            and self.estimated_standard_error() <= self._target_standard_error
+        ):
+            return []
+        round_size = self._samples_per_term * len(self._pauli_coef_terms)
+        if self._sample_budget is not None:
+            round_size = min(round_size, self._sample_budget - self._total_samples_requested)
+        if round_size <= 0:
+            return []
+
+        # Move the samples of each term towards the optimal allocation for the
+        # total number of samples after this round.
+        counts = np.array([self._num_samples(p) for p, _ in self._pauli_coef_terms])
+        weights = np.array(
+            [
+                abs(coef) * np.sqrt(self._variance(p, smoothed=True))
+                for p, coef in self._pauli_coef_terms
+            ]
+        )
+        desired = (counts.sum() + round_size) * weights / weights.sum()
+        deficits = np.maximum(desired - counts, 0)
+        allocations = np.floor(round_size * deficits / deficits.sum()).astype(int)
+        # Hand out samples lost to rounding, largest deficit first.
+        for i in np.argsort(-deficits)[: round_size - allocations.sum()]:
+            allocations[i] += 1
+
+        jobs = []
+        for (pauli, _), amount in zip(self._pauli_coef_terms, allocations):
+            circuit = _circuit_plus_pauli_string_measurements(self._circuit, pauli)
+            while amount > 0:
+                amount_to_request = min(int(amount), self._samples_per_job)
+                amount -= amount_to_request
+                self._total_samples_requested += amount_to_request
+                jobs.append(
+                    collector.CircuitSampleJob(
+                        circuit=circuit, repetitions=amount_to_request, tag=pauli
+                    )
+                )
+        return jobs
+
     def on_job_result(self, job: 'cirq.CircuitSampleJob', result: 'cirq.Result'):
         job_id = cast(ops.PauliString, job.tag)
         parities = result.histogram(key='out', fold_func=lambda bits: np.sum(bits) % 2)
         self._zeros[job_id] += parities[0]
         self._ones[job_id] += parities[1]
+        self._total_samples_received += job.repetitions
+
+    def _num_samples(self, pauli_string: 'cirq.PauliString') -> int:
+        return self._zeros[pauli_string] + self._ones[pauli_string]
+
+    def _variance(self, pauli_string: 'cirq.PauliString', *, smoothed: bool = False) -> float:
+        """Estimated variance of a single +1/-1 sample of the given term.
+
+        With `smoothed`, a pseudo-count is added to both outcomes so that terms
+        which have so far always given the same outcome are not assumed to be
+        exactly deterministic.
+        """
+        a = self._zeros[pauli_string]
+        b = self._ones[pauli_string]
+        if smoothed:
+            a, b = a + 1, b + 1
+        if not a + b:
+            return 1.0
+        mean = (a - b) / (a + b)
+        return 1 - mean ** 2
+
+    def estimated_standard_error(self) -> float:
+        """Estimates the standard error of `estimated_energy`.
+
+        Returns infinity if some term has not been sampled yet.
+        """
+        variance = 0.0
+        for pauli_string, coef in self._pauli_coef_terms:
+            n = self._num_samples(pauli_string)
+            if not n:
+                return float('inf')
+            variance += abs(coef) ** 2 * self._variance(pauli_string) / n
+        return float(np.sqrt(variance))
 
     def estimated_energy(self) -> Union[float, complex]:
         """Sums up the sampled expectations, weighted by their coefficients."""
@@ -67,3 +67,63 @@ def test_pauli_string_sample_collector_extra_qubit_x():
     )
     p.collect(sampler=cirq.Simulator())
     assert abs(p.estimated_energy()) < 0.5
+
+
+@pytest.mark.asyncio
+async def test_pauli_string_sample_collector_adaptive_budget():
+    a, b = cirq.LineQubit.range(2)
+    p = cirq.PauliSumCollector(
+        circuit=cirq.Circuit(cirq.H(a), cirq.H(b)),
+        observable=10 * cirq.Z(a) + cirq.Z(b) + 5 * cirq.X(a),
+        samples_per_term=20,
+        max_samples_per_job=50,
+        sample_budget=1000,
+    )
+    await p.collect_async(sampler=cirq.Simulator(seed=1234))
+    counts = {pauli: p._num_samples(pauli) for pauli, _ in p._pauli_coef_terms}
+    assert sum(counts.values()) == 1000
+    # X(a) is deterministic, so beyond the warm-up it only gets a few samples.
+    assert counts[cirq.X(a)] < 100
+    assert counts[cirq.Z(a)] > 5 * counts[cirq.Z(b)]
+    assert abs(p.estimated_energy() - 5) < 3 * p.estimated_standard_error() + 1e-8
+
+
+@pytest.mark.asyncio
+async def test_pauli_string_sample_collector_adaptive_target_standard_error():
+    a, b = cirq.LineQubit.range(2)
+    p = cirq.PauliSumCollector(
+        circuit=cirq.Circuit(cirq.H(a), cirq.H(b)),
+        observable=cirq.Z(a) + 2 * cirq.Z(b),
+        samples_per_term=50,
+        target_standard_error=0.1,
+    )
+    assert p.estimated_standard_error() == float('inf')
+    await p.collect_async(sampler=cirq.Simulator(seed=1234))
+    assert p.estimated_standard_error() <= 0.1
+    # Roughly sum(|c| sigma)^2 / target^2 samples are needed.
+    assert sum(p._num_samples(pauli) for pauli, _ in p._pauli_coef_terms) < 1200
+
+
+@pytest.mark.asyncio
+async def test_pauli_string_sample_collector_adaptive_budget_below_warm_up():
+    a, b = cirq.LineQubit.range(2)
+    p = cirq.PauliSumCollector(
+        circuit=cirq.Circuit(),
+        observable=cirq.Z(a) + cirq.Z(b),
+        samples_per_term=100,
+        sample_budget=150,
+    )
+    await p.collect_async(sampler=cirq.Simulator())
+    assert p._num_samples(cirq.Z(a)) == 100
+    assert p._num_samples(cirq.Z(b)) == 50
+    assert p.estimated_energy() == 2
+
+
+def test_pauli_string_sample_collector_invalid_target():
+    with pytest.raises(ValueError, match='target_standard_error'):
+        cirq.PauliSumCollector(
+            circuit=cirq.Circuit(),
+            observable=cirq.Z(cirq.LineQubit(0)),
+            samples_per_term=10,
+            target_standard_error=0,
+        )
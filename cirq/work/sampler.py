@@ -13,8 +13,10 @@
 # limitations under the License.
 """Abstract base class for things sampling quantum circuits."""
 
-from typing import List, Optional, TYPE_CHECKING, Union
+from typing import List, Optional, Tuple, TYPE_CHECKING, Union
 import abc
+import asyncio
+import concurrent.futures
 
 import pandas as pd
 
@@ -235,21 +237,114 @@ class Sampler(metaclass=abc.ABCMeta):
             for the corresponding circuit, in the order imposed by the
             associated parameter sweep.
         """
-        if params_list is None:
-            params_list = [None] * len(programs)
-        if len(programs) != len(params_list):
-            raise ValueError(
-                'len(programs) and len(params_list) must match. '
-                f'Got {len(programs)} and {len(params_list)}.'
-            )
-        if isinstance(repetitions, int):
-            repetitions = [repetitions] * len(programs)
-        if len(programs) != len(repetitions):
-            raise ValueError(
-                'len(programs) and len(repetitions) must match. '
-                f'Got {len(programs)} and {len(repetitions)}.'
-            )
+        params_list, repetitions = _normalize_batch_args(programs, params_list, repetitions)
         return [
             self.run_sweep(circuit, params=params, repetitions=repetitions)
             for circuit, params, repetitions in zip(programs, params_list, repetitions)
         ]
+
+    async def run_batch_async(
+        self,
+        programs: List['cirq.Circuit'],
+        params_list: Optional[List['cirq.Sweepable']] = None,
+        repetitions: Union[int, List[int]] = 1,
+        *,
+        max_concurrency: Optional[int] = None,
+        executor: Optional[concurrent.futures.Executor] = None,
+    ) -> List[List['cirq.Result']]:
+        """Asynchronously runs the supplied circuits.
+
+        The arguments are paired up as in `run_batch`, but the circuits are
+        dispatched concurrently. Results are collected as they complete and
+        returned in the same order as `programs`.
+
+        By default, each circuit is run by awaiting `run_sweep_async`. If an
+        `executor` is given, each circuit is instead run by calling `run_sweep`
+        on that executor, which lets samplers that are not natively
+        asynchronous (e.g. local simulators) use several threads or processes.
+        When using a `concurrent.futures.ProcessPoolExecutor`, the sampler, the
+        circuits and the parameters must all be picklable.
+
+        Args:
+            programs: The circuits to execute as a batch.
+            params_list: Parameter sweeps to use with the circuits. The number
+                of sweeps should match the number of circuits and will be
+                paired in order with the circuits.
+            repetitions: Number of circuit repetitions to run. Can be specified
+                as a single value to use for all runs, or as a list of values,
+                one for each circuit.
+            max_concurrency: The maximum number of circuits in flight at any
+                time. Defaults to no limit beyond that of the executor.
+            executor: An optional executor on which to run `run_sweep`.
+
+        Returns:
+            An awaitable list of lists of Results, with the same structure as
+            the return value of `run_batch`.
+        """
+        params_list, repetitions = _normalize_batch_args(programs, params_list, repetitions)
+        if max_concurrency is not None and max_concurrency < 1:
+            raise ValueError(f'max_concurrency must be positive. Got {max_concurrency}.')
+        semaphore = asyncio.Semaphore(max_concurrency or len(programs) or 1)
+        loop = asyncio.get_event_loop()
+
+        async def run_one(
+            index: int, sampler: 'Sampler', circuit, params, reps
+        ) -> Tuple[int, List['cirq.Result']]:
+            async with semaphore:
+                if executor is None:
+                    result = await sampler.run_sweep_async(circuit, params=params, repetitions=reps)
+                else:
+                    result = await loop.run_in_executor(
+                        executor, _run_sweep, sampler, circuit, params, reps
+                    )
+            return index, result
+
+        # Scheduled in order, so that items sharing this sampler start in order.
+        tasks = []
+        for i, (circuit, params, reps) in enumerate(zip(programs, params_list, repetitions)):
+            sampler = self if executor is None else self._batch_item_sampler()
+            tasks.append(asyncio.ensure_future(run_one(i, sampler, circuit, params, reps)))
+        results: List[List['cirq.Result']] = [[] for _ in programs]
+        for next_done in asyncio.as_completed(tasks):
+            index, result = await next_done
+            results[index] = result
+        return results
+
+    def _batch_item_sampler(self) -> 'Sampler':
+        """The sampler used to run one item of `run_batch_async` on an executor.
+
+        Called once per item, in order, before any item is dispatched.
+        Samplers with internal random state may return a copy with an
+        independent, reproducibly derived state so that items run in other
+        processes do not all draw the same random numbers.
+        """
+        return self
+
+
+def _run_sweep(
+    sampler: Sampler, program: 'cirq.Circuit', params: 'cirq.Sweepable', repetitions: int
+) -> List['cirq.Result']:
+    # Module level so that it can be pickled and sent to process pools.
+    return sampler.run_sweep(program, params=params, repetitions=repetitions)
+
+
+def _normalize_batch_args(
+    programs: List['cirq.Circuit'],
+    params_list: Optional[List['cirq.Sweepable']],
+    repetitions: Union[int, List[int]],
+) -> Tuple[List['cirq.Sweepable'], List[int]]:
+    if params_list is None:
+        params_list = [None] * len(programs)
+    if len(programs) != len(params_list):
+        raise ValueError(
+            'len(programs) and len(params_list) must match. '
+            f'Got {len(programs)} and {len(params_list)}.'
+        )
+    if isinstance(repetitions, int):
+        repetitions = [repetitions] * len(programs)
+    if len(programs) != len(repetitions):
+        raise ValueError(
+            'len(programs) and len(repetitions) must match. '
+            f'Got {len(programs)} and {len(repetitions)}.'
+        )
+    return params_list, repetitions
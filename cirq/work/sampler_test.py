@@ -12,6 +12,9 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 """Tests for cirq.Sampler."""
+import asyncio
+import concurrent.futures
+
 import pytest
 
 import numpy as np
@@ -198,3 +201,67 @@ def test_sampler_run_batch_bad_input_lengths():
         _ = sampler.run_batch(
             [circuit1, circuit2], params_list=[params1, params2], repetitions=[1, 2, 3]
         )
+
+
+@pytest.mark.asyncio
+async def test_sampler_run_batch_async():
+    sampler = cirq.ZerosSampler()
+    a = cirq.LineQubit(0)
+    circuit1 = cirq.Circuit(cirq.X(a) ** sympy.Symbol('t'), cirq.measure(a, key='m'))
+    circuit2 = cirq.Circuit(cirq.Y(a) ** sympy.Symbol('t'), cirq.measure(a, key='m'))
+    params1 = cirq.Points('t', [0.3, 0.7])
+    params2 = cirq.Points('t', [0.4, 0.6])
+    results = await sampler.run_batch_async(
+        [circuit1, circuit2], params_list=[params1, params2], repetitions=[1, 2]
+    )
+    assert results == sampler.run_batch(
+        [circuit1, circuit2], params_list=[params1, params2], repetitions=[1, 2]
+    )
+    assert await sampler.run_batch_async([]) == []
+
+
+@pytest.mark.asyncio
+async def test_sampler_run_batch_async_preserves_order_and_limits_concurrency():
+    in_flight = 0
+    max_in_flight = 0
+
+    class S(cirq.Sampler):
+        def run_sweep(self, program, params, repetitions: int = 1):
+            pass
+
+        async def run_sweep_async(self, program, params, repetitions: int = 1):
+            nonlocal in_flight, max_in_flight
+            in_flight += 1
+            max_in_flight = max(max_in_flight, in_flight)
+            # Later circuits finish first.
+            await asyncio.sleep(0.001 * (10 - repetitions))
+            in_flight -= 1
+            return [repetitions]
+
+    circuits = [cirq.Circuit()] * 10
+    results = await S().run_batch_async(circuits, repetitions=list(range(10)), max_concurrency=3)
+    assert results == [[i] for i in range(10)]
+    assert max_in_flight == 3
+
+    with pytest.raises(ValueError, match='max_concurrency'):
+        await S().run_batch_async(circuits, max_concurrency=0)
+
+
+@pytest.mark.asyncio
+async def test_sampler_run_batch_async_executor():
+    sampler = cirq.ZerosSampler()
+    a = cirq.LineQubit(0)
+    circuit = cirq.Circuit(cirq.X(a), cirq.measure(a, key='m'))
+    with concurrent.futures.ThreadPoolExecutor(max_workers=2) as pool:
+        results = await sampler.run_batch_async([circuit] * 4, repetitions=3, executor=pool)
+    assert results == [sampler.run_sweep(circuit, None, repetitions=3)] * 4
+
+
+@pytest.mark.asyncio
+async def test_sampler_run_batch_async_bad_input_lengths():
+    sampler = cirq.ZerosSampler()
+    circuit = cirq.Circuit()
+    with pytest.raises(ValueError, match='2 and 1'):
+        _ = await sampler.run_batch_async([circuit, circuit], params_list=[None])
+    with pytest.raises(ValueError, match='2 and 3'):
+        _ = await sampler.run_batch_async([circuit, circuit], repetitions=[1, 2, 3])